@@ -7,8 +7,11 @@ It sets up the FastAPI app, includes routers, and configures middleware.
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from app.routes import auth, jobs_mongo, ai_career
+from app.routes import auth, jobs_mongo, ai_career, metrics
 from app.utils.mongodb import connect_to_mongo
+from app.utils.extraction_service import shutdown_extraction_workers
+from app.utils.idempotency import configure_idempotency_store
+from app.utils.mongodb_service import idempotency_store
 
 # Initialize FastAPI app with metadata
 app = FastAPI(
@@ -38,11 +41,18 @@ app.add_middleware(
 async def startup_event():
     """Initialize MongoDB connection when the application starts"""
     await connect_to_mongo()
+    configure_idempotency_store(idempotency_store)
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Stop the extraction workers and release resident OCR engines"""
+    shutdown_extraction_workers()
 
 # Include API routers
 app.include_router(auth.router, prefix="/auth", tags=["Authentication"])
 app.include_router(jobs_mongo.router, prefix="/api/jobs", tags=["Jobs"])
 app.include_router(ai_career.router, prefix="/api/ai", tags=["AI Career Assistant"])
+app.include_router(metrics.router, prefix="/metrics", tags=["Metrics"])
 
 # Root endpoint
 @app.get("/", tags=["Health Check"])
@@ -79,6 +79,7 @@ class JobCreate(BaseModel):
     applied_date: str = Field(..., description="Date applied (YYYY-MM-DD format)")
     application_link: Optional[str] = Field(None, max_length=500, description="URL to job posting")
     notes: Optional[str] = Field(None, max_length=1000, description="Additional notes")
+    job_description: Optional[str] = Field(None, max_length=5000, description="Job description text")
     
     @field_validator('applied_date')
     def validate_date(cls, v):
@@ -98,6 +99,7 @@ class JobUpdate(BaseModel):
     applied_date: Optional[str] = None
     application_link: Optional[str] = Field(None, max_length=500)
     notes: Optional[str] = Field(None, max_length=1000)
+    job_description: Optional[str] = Field(None, max_length=5000)
     
     @field_validator('applied_date')
     def validate_date(cls, v):
@@ -112,7 +114,7 @@ class JobUpdate(BaseModel):
 
 
 class JobResponse(BaseModel):
-    """Model for job application in responses"""
+    """Model for job application in responses (job_description only when requested)"""
     id: int
     company: str
     position: str
@@ -120,6 +122,7 @@ class JobResponse(BaseModel):
     applied_date: str
     application_link: Optional[str]
     notes: Optional[str]
+    job_description: Optional[str] = None
     created_at: datetime
     updated_at: datetime
     user_id: int
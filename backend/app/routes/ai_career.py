@@ -1,43 +1,14 @@
-from fastapi import APIRouter, HTTPException, Depends, UploadFile, File, Form, Request
+import hashlib
+
+from fastapi import APIRouter, HTTPException, Depends, UploadFile, File, Form, Header, Request
 from pydantic import BaseModel
 from typing import List, Optional
-import io
-import os
-
-# Optional imports with error handling
-try:
-    import fitz  # PyMuPDF for PDF processing
-    PDF_AVAILABLE = True
-except ImportError:
-    PDF_AVAILABLE = False
-    fitz = None
-    print("⚠️ PyMuPDF not available. PDF processing will be disabled.")
-
-try:
-    from PIL import Image
-    IMAGE_AVAILABLE = True
-except ImportError:
-    IMAGE_AVAILABLE = False
-    Image = None
-    print("⚠️ Pillow not available. Image processing will be disabled.")
-
-try:
-    import pytesseract  # For OCR
-    OCR_AVAILABLE = True
-except ImportError:
-    OCR_AVAILABLE = False
-    pytesseract = None
-    print("⚠️ pytesseract not available. OCR processing will be disabled.")
-
-try:
-    from docx import Document  # For Word documents
-    DOCX_AVAILABLE = True
-except ImportError:
-    DOCX_AVAILABLE = False
-    Document = None
-    print("⚠️ python-docx not available. Word document processing will be disabled.")
 
+from ..utils.extraction_service import (
+    ExtractedDocument, ExtractionError, UnsupportedDocumentError, extract_document_async
+)
 from ..utils.gemini_service import GeminiCareerService
+from ..utils.idempotency import IDEMPOTENCY_KEY_HEADER, get_idempotency_store, run_idempotent
 from ..utils.security import get_current_user_id_mongo
 
 router = APIRouter()
@@ -49,103 +20,69 @@ class JobAnalysisRequest(BaseModel):
     resume_text: str
     job_description: str
 
-async def extract_text_from_file(file: UploadFile) -> str:
+async def extract_text_from_file(file: UploadFile) -> ExtractedDocument:
     """
     Extract text from various file formats including PDF, images, Word docs, and text files
+
+    The format is detected from the file content (magic bytes), so a PDF
+    uploaded with the wrong extension is still read as a PDF. Extraction is
+    bounded by page/pixel/time budgets; `truncated` is set on partial text.
     """
     content = await file.read()
-    filename = file.filename.lower() if file.filename else ""
+    filename = file.filename or ""
     
     print(f"🔍 Processing file: {filename}")
     print(f"📊 File size: {len(content)} bytes")
     print(f"📝 Content type: {file.content_type}")
     
     try:
-        if filename.endswith('.txt'):
-            # Plain text file
-            print("✅ Processing as text file")
-            return content.decode('utf-8')
-        
-        elif filename.endswith('.pdf'):
-            # PDF file using PyMuPDF
-            print("✅ Processing as PDF file")
-            if not PDF_AVAILABLE or fitz is None:
-                raise HTTPException(status_code=400, detail="PDF processing not available. Please install PyMuPDF.")
-            pdf_document = fitz.open(stream=content, filetype="pdf")  # type: ignore
-            text = ""
-            for page_num in range(pdf_document.page_count):
-                page = pdf_document[page_num]
-                text += page.get_text()  # type: ignore
-            pdf_document.close()
-            print(f"✅ Extracted {len(text)} characters from PDF")
-            return text
-        
-        elif filename.endswith(('.png', '.jpg', '.jpeg', '.bmp', '.tiff', '.webp')):
-            # Image file using OCR
-            print("🖼️ Processing as image file")
-            if not IMAGE_AVAILABLE or Image is None or pytesseract is None:
-                raise HTTPException(status_code=400, detail="Image OCR processing not available. Please install Pillow and pytesseract.")
-            
-            try:
-                image = Image.open(io.BytesIO(content))
-                print(f"📐 Image size: {image.size}")
-                text = pytesseract.image_to_string(image)
-                print(f"✅ OCR extracted {len(text)} characters")
-                return text
-            except Exception as ocr_error:
-                # Handle Tesseract not being installed
-                error_msg = str(ocr_error)
-                print(f"❌ OCR Error: {error_msg}")
-                if "tesseract" in error_msg.lower() or "not installed" in error_msg.lower():
-                    raise HTTPException(
-                        status_code=400, 
-                        detail="Tesseract OCR is not installed on the system. Please install Tesseract OCR or upload your resume as a PDF or text file instead."
-                    )
-                else:
-                    raise HTTPException(
-                        status_code=400, 
-                        detail=f"Failed to process image file: {error_msg}"
-                    )
-        
-        elif filename.endswith(('.doc', '.docx')):
-            # Word document
-            print("✅ Processing as Word document")
-            if not DOCX_AVAILABLE or Document is None:
-                raise HTTPException(status_code=400, detail="Word document processing not available. Please install python-docx.")
-            doc = Document(io.BytesIO(content))
-            text = ""
-            for paragraph in doc.paragraphs:
-                text += paragraph.text + "\n"
-            print(f"✅ Extracted {len(text)} characters from Word document")
-            return text
-        
-        else:
+        document = await extract_document_async(content, filename)
+    except UnsupportedDocumentError as e:
+        print(f"❌ Unsupported file: {str(e)}")
+        raise HTTPException(status_code=400, detail=str(e))
+    except ExtractionError as e:
+        error_msg = str(e)
+        print(f"❌ File processing error: {error_msg}")
+        # Handle Tesseract not being installed
+        if "not installed" in error_msg.lower():
             raise HTTPException(
                 status_code=400, 
-                detail=f"Unsupported file format. Supported formats: .txt, .pdf, .png, .jpg, .jpeg, .bmp, .tiff, .webp, .doc, .docx"
+                detail="Tesseract OCR is not installed on the system. Please install Tesseract OCR or upload your resume as a PDF or text file instead."
             )
-            
-    except Exception as e:
-        print(f"❌ File processing error: {str(e)}")
         raise HTTPException(
             status_code=400,
-            detail=f"Error processing file: {str(e)}"
+            detail=f"Error processing file: {error_msg}"
         )
+    
+    print(f"✅ Extracted {len(document.text)} characters from {document.document_type} using {document.backend}")
+    return document
 
 @router.post("/analyze-job-fit")
 async def analyze_job_fit(
     request: JobAnalysisRequest,
-    current_user_id: str = Depends(get_current_user_id_mongo)
+    current_user_id: str = Depends(get_current_user_id_mongo),
+    idempotency_key: Optional[str] = Header(None, alias=IDEMPOTENCY_KEY_HEADER)
 ):
     """
     Analyze how well a resume matches a job description
+    
+    A retry with the same Idempotency-Key replays the first analysis
+    instead of calling Gemini again (unless Gemini was unavailable and the
+    placeholder analysis was returned).
     """
-    try:
-        analysis = gemini_service.analyze_resume_job_match(
+    async def analyze():
+        return gemini_service.analyze_resume_job_match(
             request.resume_text, 
             request.job_description
         )
-        return analysis
+    
+    try:
+        return await run_idempotent(
+            get_idempotency_store(), "ai.analyze_job_fit", current_user_id, idempotency_key, request, analyze,
+            store_result=lambda analysis: not analysis.is_fallback
+        )
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Analysis failed: {str(e)}")
 
@@ -153,12 +90,36 @@ async def analyze_job_fit(
 async def analyze_resume_file(
     resume_file: UploadFile = File(...),
     job_description: str = Form(...),
-    current_user_id: str = Depends(get_current_user_id_mongo)
+    current_user_id: str = Depends(get_current_user_id_mongo),
+    idempotency_key: Optional[str] = Header(None, alias=IDEMPOTENCY_KEY_HEADER)
 ):
     """
     Analyze resume from uploaded file against job description
-    Supports: .txt, .pdf, .png, .jpg, .jpeg, .bmp, .tiff, .webp, .doc, .docx
+    Supports: .txt, .pdf, .png, .jpg, .jpeg, .gif, .bmp, .tiff, .webp, .docx
+    
+    A retry with the same Idempotency-Key (same file and job description)
+    replays the first analysis instead of extracting and calling Gemini again
+    (unless Gemini was unavailable and the placeholder analysis was returned).
     """
+    if idempotency_key is not None:
+        # The file is identified by its content hash
+        content = await resume_file.read()
+        await resume_file.seek(0)
+        payload = {
+            "file_sha256": hashlib.sha256(content).hexdigest(),
+            "filename": resume_file.filename,
+            "job_description": job_description
+        }
+        return await run_idempotent(
+            get_idempotency_store(), "ai.analyze_resume_file", current_user_id, idempotency_key, payload,
+            lambda: _analyze_resume_file(resume_file, job_description, current_user_id),
+            store_result=lambda result: not result["analysis"].is_fallback
+        )
+    return await _analyze_resume_file(resume_file, job_description, current_user_id)
+
+
+async def _analyze_resume_file(resume_file: UploadFile, job_description: str, current_user_id: str):
+    """Extract the resume text and analyze it against the job description"""
     print(f"🔍 Debug: Received request from user {current_user_id}")
     print(f"📁 Debug: File - {resume_file.filename}, Type: {resume_file.content_type}")
     print(f"📝 Debug: Job description length: {len(job_description) if job_description else 0}")
@@ -175,7 +136,8 @@ async def analyze_resume_file(
         
         print("✅ Debug: Starting file text extraction...")
         # Extract text from the uploaded file
-        resume_text = await extract_text_from_file(resume_file)
+        document = await extract_text_from_file(resume_file)
+        resume_text = document.text
         print(f"📖 Debug: Extracted text length: {len(resume_text)}")
         
         if not resume_text.strip():
@@ -191,6 +153,7 @@ async def analyze_resume_file(
             "filename": resume_file.filename,
             "file_type": resume_file.content_type,
             "extracted_text_length": len(resume_text),
+            "text_truncated": document.truncated,
             "analysis": analysis
         }
     except HTTPException as he:
@@ -221,7 +184,8 @@ async def test_analyze_resume_file(
     """
     try:
         # Extract text from the uploaded file
-        resume_text = await extract_text_from_file(resume_file)
+        document = await extract_text_from_file(resume_file)
+        resume_text = document.text
         
         if not resume_text.strip():
             raise HTTPException(status_code=400, detail="No text could be extracted from the file")
@@ -233,6 +197,7 @@ async def test_analyze_resume_file(
             "filename": resume_file.filename,
             "file_type": resume_file.content_type,
             "extracted_text_length": len(resume_text),
+            "text_truncated": document.truncated,
             "analysis": analysis
         }
     except HTTPException:
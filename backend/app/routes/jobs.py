@@ -11,14 +11,15 @@ This module handles all CRUD operations for job applications:
 All routes are protected with JWT authentication.
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, Header, HTTPException, status, Query
 from sqlalchemy.orm import Session
 from typing import List, Optional
 from app.models import JobCreate, JobUpdate, JobResponse, MessageResponse, JobListResponse
 from app.utils.database import (
-    get_db, get_user_jobs, get_job_by_id, create_job, 
-    update_job, delete_job, count_user_jobs
+    get_db, get_user_jobs, get_job_by_id, get_job_description, create_job, 
+    update_job, delete_job, count_user_jobs, idempotency_store
 )
+from app.utils.idempotency import IDEMPOTENCY_KEY_HEADER, run_idempotent
 from app.utils.security import get_current_user_id
 import math
 
@@ -29,31 +30,46 @@ router = APIRouter()
 async def create_job_application(
     job_data: JobCreate,
     current_user_id: int = Depends(get_current_user_id),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_db),
+    idempotency_key: Optional[str] = Header(None, alias=IDEMPOTENCY_KEY_HEADER)
 ):
     """
     Create a new job application
     
+    A retry with the same Idempotency-Key gets the job created by the first
+    request instead of a duplicate.
+    
     Args:
         job_data: Job application data
         current_user_id: ID of authenticated user
         db: Database session
+        idempotency_key: Optional client-chosen key identifying this creation
         
     Returns:
         JobResponse: Created job application
         
     Raises:
-        HTTPException: If creation fails
+        HTTPException: If the key is reused or creation fails
     """
-    try:
+    async def create() -> JobResponse:
         # Convert Pydantic model to dict for database
         job_dict = job_data.dict()
         
         # Create job in database
         new_job = create_job(db=db, job_data=job_dict, user_id=current_user_id)
         
-        return JobResponse.from_orm(new_job)
+        response = JobResponse.from_orm(new_job)
+        response.job_description = job_data.job_description
+        return response
+    
+    try:
+        return await run_idempotent(
+            idempotency_store, "jobs.create", current_user_id, idempotency_key, job_data, create,
+            status_code=status.HTTP_201_CREATED
+        )
     
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -115,6 +131,7 @@ async def list_job_applications(
 @router.get("/{job_id}", response_model=JobResponse)
 async def get_job_application(
     job_id: int,
+    include_description: bool = Query(True, description="Include the job description (stored separately)"),
     current_user_id: int = Depends(get_current_user_id),
     db: Session = Depends(get_db)
 ):
@@ -123,6 +140,7 @@ async def get_job_application(
     
     Args:
         job_id: ID of the job application
+        include_description: Also read the job description
         current_user_id: ID of authenticated user
         db: Database session
         
@@ -140,7 +158,10 @@ async def get_job_application(
             detail="Job application not found"
         )
     
-    return JobResponse.from_orm(job)
+    response = JobResponse.from_orm(job)
+    if include_description:
+        response.job_description = get_job_description(db=db, job_id=job_id, user_id=current_user_id)
+    return response
 
 
 @router.put("/{job_id}", response_model=JobResponse)
@@ -192,7 +213,9 @@ async def update_job_application(
                 detail="Failed to update job application"
             )
         
-        return JobResponse.from_orm(updated_job)
+        response = JobResponse.from_orm(updated_job)
+        response.job_description = get_job_description(db=db, job_id=job_id, user_id=current_user_id)
+        return response
     
     except Exception as e:
         raise HTTPException(
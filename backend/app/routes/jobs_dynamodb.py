@@ -5,47 +5,62 @@ This module handles job application CRUD operations using DynamoDB,
 replacing the MongoDB implementation.
 """
 
-from fastapi import APIRouter, HTTPException, Depends, Query
+from fastapi import APIRouter, HTTPException, Depends, Header, Query, Response
 from fastapi import status as http_status
 from typing import List, Optional
 from datetime import datetime
 from app.utils.models_dynamodb import (
-    JobCreateRequest, JobUpdateRequest, JobResponse, 
-    MessageResponse, JobStatus
+    JobCreateRequest, JobUpdateRequest, JobResponse, JobSummary, JobDescriptionResponse,
+    MessageResponse, BulkOperationResponse, JobStatus
 )
 from app.utils.dynamodb_service import (
-    create_job, get_user_jobs, get_job_by_id,
-    update_job, delete_job, get_user_job_stats
+    create_job, get_user_jobs_page, get_user_jobs_by_status_page, get_job_by_id,
+    update_job, delete_job, get_user_job_stats,
+    update_jobs_status, delete_jobs, get_archived_jobs_page, restore_job, idempotency_repository
 )
+from app.utils.idempotency import IDEMPOTENCY_KEY_HEADER, run_idempotent
+from app.utils.pagination import InvalidContinuationToken
+from app.utils.responses import FastJSONResponse
 from app.utils.security_cognito import get_current_user_id
 
-router = APIRouter()
+router = APIRouter(default_response_class=FastJSONResponse)
+
+# Response header carrying the continuation token of paginated lists
+NEXT_TOKEN_HEADER = "X-Next-Token"
 
 
 @router.post("/", response_model=JobResponse, status_code=http_status.HTTP_201_CREATED)
 async def create_job_application(
     job_data: JobCreateRequest,
-    current_user_id: str = Depends(get_current_user_id)
+    current_user_id: str = Depends(get_current_user_id),
+    idempotency_key: Optional[str] = Header(None, alias=IDEMPOTENCY_KEY_HEADER)
 ):
     """
     Create a new job application
     
+    A retry with the same Idempotency-Key gets the job created by the first
+    request instead of a duplicate.
+    
     Args:
         job_data: Job application data
         current_user_id: Current authenticated user ID
+        idempotency_key: Optional client-chosen key identifying this creation
         
     Returns:
         JobResponse: Created job application
         
     Raises:
-        HTTPException: If creation fails
+        HTTPException: If the key is reused or creation fails
     """
     try:
-        # Create job in DynamoDB
-        new_job = await create_job(current_user_id, job_data)
-        
-        return new_job
+        # Create job in DynamoDB (once per Idempotency-Key)
+        return await run_idempotent(
+            idempotency_repository, "jobs.create", current_user_id, idempotency_key, job_data,
+            lambda: create_job(current_user_id, job_data), status_code=http_status.HTTP_201_CREATED
+        )
         
+    except HTTPException:
+        raise
     except Exception as e:
         print(f"Error creating job: {e}")
         raise HTTPException(
@@ -54,36 +69,57 @@ async def create_job_application(
         )
 
 
-@router.get("/", response_model=List[JobResponse])
+@router.get("/", response_model=List[JobSummary])
 async def get_job_applications(
+    response: Response,
     current_user_id: str = Depends(get_current_user_id),
     limit: Optional[int] = Query(None, ge=1, le=100, description="Maximum number of jobs to return"),
-    status_filter: Optional[JobStatus] = Query(None, description="Filter by job status")
+    status_filter: Optional[JobStatus] = Query(None, description="Filter by job status"),
+    next_token: Optional[str] = Query(None, description="Continuation token from the X-Next-Token header"),
+    applied_from: Optional[datetime] = Query(None, description="Only jobs applied at or after this time"),
+    applied_to: Optional[datetime] = Query(None, description="Only jobs applied at or before this time")
 ):
     """
     Get all job applications for the current user
     
+    Returns summaries without job_description; fetch a single job for the
+    full detail. When more jobs are available, the token for
+    the next page is returned in the `X-Next-Token` response header.
+    
     Args:
+        response: Outgoing response (for the continuation header)
         current_user_id: Current authenticated user ID
         limit: Optional limit on number of results
         status_filter: Optional status filter
+        next_token: Continuation token from the previous page
+        applied_from: Optional start of the application date window
+        applied_to: Optional end of the application date window
         
     Returns:
-        List[JobResponse]: List of job applications
+        List[JobSummary]: List of job applications
         
     Raises:
-        HTTPException: If retrieval fails
+        HTTPException: If the token is invalid or retrieval fails
     """
     try:
-        # Get user's jobs from DynamoDB
-        jobs = await get_user_jobs(current_user_id, limit)
-        
-        # Apply status filter if provided
+        # Get one page of the user's jobs, reading only matching items when filtered
         if status_filter:
-            jobs = [job for job in jobs if job.status == status_filter]
+            page = await get_user_jobs_by_status_page(
+                current_user_id, status_filter, limit, next_token, applied_from, applied_to
+            )
+        else:
+            page = await get_user_jobs_page(current_user_id, limit, next_token, applied_from, applied_to)
+        
+        if page.next_token:
+            response.headers[NEXT_TOKEN_HEADER] = page.next_token
         
-        return jobs
+        return page.items
         
+    except InvalidContinuationToken as e:
+        raise HTTPException(
+            status_code=http_status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
     except Exception as e:
         print(f"Error getting jobs: {e}")
         raise HTTPException(
@@ -118,10 +154,135 @@ async def get_job_statistics(current_user_id: str = Depends(get_current_user_id)
         )
 
 
+@router.get("/archived", response_model=List[JobSummary])
+async def get_archived_job_applications(
+    response: Response,
+    current_user_id: str = Depends(get_current_user_id),
+    limit: Optional[int] = Query(None, ge=1, le=100, description="Maximum number of jobs to return"),
+    next_token: Optional[str] = Query(None, description="Continuation token from the X-Next-Token header")
+):
+    """
+    Get the current user's archived job applications (old finished ones)
+    
+    Archived jobs are left out of every other list and of the status
+    counts; fetch one with `GET /{job_id}?include_archived=true` or move it
+    back with `POST /{job_id}/restore`.
+    
+    Args:
+        response: Outgoing response (for the continuation header)
+        current_user_id: Current authenticated user ID
+        limit: Optional limit on number of results
+        next_token: Continuation token from the previous page
+        
+    Returns:
+        List[JobSummary]: Archived job applications, newest first
+        
+    Raises:
+        HTTPException: If the token is invalid or retrieval fails
+    """
+    try:
+        page = await get_archived_jobs_page(current_user_id, limit, next_token)
+        if page.next_token:
+            response.headers[NEXT_TOKEN_HEADER] = page.next_token
+        
+        return page.items
+        
+    except InvalidContinuationToken as e:
+        raise HTTPException(
+            status_code=http_status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    except Exception as e:
+        print(f"Error getting archived jobs: {e}")
+        raise HTTPException(
+            status_code=http_status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to retrieve archived job applications"
+        )
+
+
+# Bulk operations (declared before /{job_id} so "bulk" isn't taken as a job ID)
+@router.post("/bulk/status-update", response_model=BulkOperationResponse)
+async def bulk_update_status(
+    job_ids: List[str],
+    new_status: JobStatus,
+    current_user_id: str = Depends(get_current_user_id)
+):
+    """
+    Update status for multiple job applications
+    
+    Args:
+        job_ids: List of job IDs to update
+        new_status: New status for all jobs
+        current_user_id: Current authenticated user ID
+        
+    Returns:
+        BulkOperationResponse: Summary with the outcome for each job ID
+        
+    Raises:
+        HTTPException: If updates fail
+    """
+    try:
+        results = await update_jobs_status(current_user_id, job_ids, new_status)
+        updated_count = sum(1 for result in results if result.outcome == "updated")
+        failed_count = len(results) - updated_count
+        
+        return BulkOperationResponse(
+            message=f"Updated {updated_count} job(s), {failed_count} failed",
+            success=failed_count == 0,
+            results=results
+        )
+        
+    except Exception as e:
+        print(f"Error in bulk status update: {e}")
+        raise HTTPException(
+            status_code=http_status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to perform bulk status update"
+        )
+
+
+@router.delete("/bulk", response_model=BulkOperationResponse)
+async def bulk_delete_jobs(
+    job_ids: List[str],
+    current_user_id: str = Depends(get_current_user_id)
+):
+    """
+    Delete multiple job applications
+    
+    Args:
+        job_ids: List of job IDs to delete
+        current_user_id: Current authenticated user ID
+        
+    Returns:
+        BulkOperationResponse: Summary with the outcome for each job ID
+        
+    Raises:
+        HTTPException: If deletions fail
+    """
+    try:
+        results = await delete_jobs(current_user_id, job_ids)
+        deleted_count = sum(1 for result in results if result.outcome == "deleted")
+        failed_count = len(results) - deleted_count
+        
+        return BulkOperationResponse(
+            message=f"Deleted {deleted_count} job(s), {failed_count} failed",
+            success=failed_count == 0,
+            results=results
+        )
+        
+    except Exception as e:
+        print(f"Error in bulk delete: {e}")
+        raise HTTPException(
+            status_code=http_status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to perform bulk delete"
+        )
+
+
 @router.get("/{job_id}", response_model=JobResponse)
 async def get_job_application(
     job_id: str,
-    current_user_id: str = Depends(get_current_user_id)
+    current_user_id: str = Depends(get_current_user_id),
+    include_archived: bool = Query(False, description="Also look for the job among archived ones"),
+    include_description: bool = Query(True, description="Include the job description (stored separately)")
 ):
     """
     Get a specific job application by ID
@@ -129,6 +290,8 @@ async def get_job_application(
     Args:
         job_id: Job application ID
         current_user_id: Current authenticated user ID
+        include_archived: Fall back to the archive if the job isn't active
+        include_description: Also read the job description
         
     Returns:
         JobResponse: Job application data
@@ -138,7 +301,7 @@ async def get_job_application(
     """
     try:
         # Get job from DynamoDB
-        job = await get_job_by_id(current_user_id, job_id)
+        job = await get_job_by_id(current_user_id, job_id, include_archived, include_description)
         
         if not job:
             raise HTTPException(
@@ -158,6 +321,45 @@ async def get_job_application(
         )
 
 
+@router.get("/{job_id}/description", response_model=JobDescriptionResponse)
+async def get_job_description(
+    job_id: str,
+    current_user_id: str = Depends(get_current_user_id)
+):
+    """
+    Get only the description of a job application (e.g. for AI analysis)
+    
+    Args:
+        job_id: Job application ID
+        current_user_id: Current authenticated user ID
+        
+    Returns:
+        JobDescriptionResponse: The job description (null if the job has none)
+        
+    Raises:
+        HTTPException: If job not found or access denied
+    """
+    try:
+        job = await get_job_by_id(current_user_id, job_id, include_description=True)
+        
+        if not job:
+            raise HTTPException(
+                status_code=http_status.HTTP_404_NOT_FOUND,
+                detail="Job application not found"
+            )
+        
+        return JobDescriptionResponse(job_id=job.job_id, job_description=job.job_description)
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        print(f"Error getting job description: {e}")
+        raise HTTPException(
+            status_code=http_status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to retrieve job description"
+        )
+
+
 @router.put("/{job_id}", response_model=JobResponse)
 async def update_job_application(
     job_id: str,
@@ -180,7 +382,7 @@ async def update_job_application(
     """
     try:
         # Update job in DynamoDB
-        updated_job = await update_job(current_user_id, job_id, job_update)
+        updated_job = await update_job(current_user_id, job_id, job_update, include_description=True)
         
         if not updated_job:
             raise HTTPException(
@@ -258,7 +460,7 @@ async def update_job_status(
         current_user_id: Current authenticated user ID
         
     Returns:
-        JobResponse: Updated job application
+        JobResponse: Updated job application (without the description)
         
     Raises:
         HTTPException: If job not found or update fails
@@ -288,133 +490,85 @@ async def update_job_status(
         )
 
 
-@router.get("/status/{status}", response_model=List[JobResponse])
-async def get_jobs_by_status(
-    status: JobStatus,
-    current_user_id: str = Depends(get_current_user_id),
-    limit: Optional[int] = Query(None, ge=1, le=100, description="Maximum number of jobs to return")
+@router.post("/{job_id}/restore", response_model=JobResponse)
+async def restore_job_application(
+    job_id: str,
+    current_user_id: str = Depends(get_current_user_id)
 ):
     """
-    Get job applications filtered by status for the current user
+    Move an archived job application back to the active ones
     
     Args:
-        status: Job status to filter by
+        job_id: Job application ID
         current_user_id: Current authenticated user ID
-        limit: Optional limit on number of results
         
     Returns:
-        List[JobResponse]: List of job applications with specified status
+        JobResponse: Restored job application
         
     Raises:
-        HTTPException: If retrieval fails
+        HTTPException: If the job isn't archived or restoring fails
     """
     try:
-        # Get all user jobs and filter by status
-        # Note: This could be optimized with a GSI query in the future
-        all_jobs = await get_user_jobs(current_user_id, limit)
-        filtered_jobs = [job for job in all_jobs if job.status == status]
+        restored_job = await restore_job(current_user_id, job_id)
+        
+        if not restored_job:
+            raise HTTPException(
+                status_code=http_status.HTTP_404_NOT_FOUND,
+                detail="Archived job application not found"
+            )
         
-        return filtered_jobs
+        return restored_job
         
+    except HTTPException:
+        raise
     except Exception as e:
-        print(f"Error getting jobs by status: {e}")
+        print(f"Error restoring job: {e}")
         raise HTTPException(
             status_code=http_status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to retrieve job applications by status"
+            detail="Failed to restore job application"
         )
 
 
-# Bulk operations
-@router.post("/bulk/status-update", response_model=MessageResponse)
-async def bulk_update_status(
-    job_ids: List[str],
-    new_status: JobStatus,
-    current_user_id: str = Depends(get_current_user_id)
+@router.get("/status/{status}", response_model=List[JobSummary])
+async def get_jobs_by_status(
+    status: JobStatus,
+    response: Response,
+    current_user_id: str = Depends(get_current_user_id),
+    limit: Optional[int] = Query(None, ge=1, le=100, description="Maximum number of jobs to return"),
+    next_token: Optional[str] = Query(None, description="Continuation token from the X-Next-Token header")
 ):
     """
-    Update status for multiple job applications
+    Get job applications filtered by status for the current user
     
     Args:
-        job_ids: List of job IDs to update
-        new_status: New status for all jobs
+        status: Job status to filter by
+        response: Outgoing response (for the continuation header)
         current_user_id: Current authenticated user ID
+        limit: Optional limit on number of results
+        next_token: Continuation token from the previous page
         
     Returns:
-        MessageResponse: Success message with count
+        List[JobSummary]: List of job applications with specified status
         
     Raises:
-        HTTPException: If updates fail
+        HTTPException: If the token is invalid or retrieval fails
     """
     try:
-        updated_count = 0
-        failed_count = 0
-        
-        for job_id in job_ids:
-            try:
-                status_update = JobUpdateRequest(status=new_status)
-                updated_job = await update_job(current_user_id, job_id, status_update)
-                if updated_job:
-                    updated_count += 1
-                else:
-                    failed_count += 1
-            except Exception as e:
-                print(f"Failed to update job {job_id}: {e}")
-                failed_count += 1
+        # Query the per-user status index so only matching jobs are read
+        page = await get_user_jobs_by_status_page(current_user_id, status, limit, next_token)
+        if page.next_token:
+            response.headers[NEXT_TOKEN_HEADER] = page.next_token
         
-        return MessageResponse(
-            message=f"Updated {updated_count} job(s), {failed_count} failed",
-            success=failed_count == 0
-        )
+        return page.items
         
-    except Exception as e:
-        print(f"Error in bulk status update: {e}")
+    except InvalidContinuationToken as e:
         raise HTTPException(
-            status_code=http_status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to perform bulk status update"
-        )
-
-
-@router.delete("/bulk", response_model=MessageResponse)
-async def bulk_delete_jobs(
-    job_ids: List[str],
-    current_user_id: str = Depends(get_current_user_id)
-):
-    """
-    Delete multiple job applications
-    
-    Args:
-        job_ids: List of job IDs to delete
-        current_user_id: Current authenticated user ID
-        
-    Returns:
-        MessageResponse: Success message with count
-        
-    Raises:
-        HTTPException: If deletions fail
-    """
-    try:
-        deleted_count = 0
-        failed_count = 0
-        
-        for job_id in job_ids:
-            try:
-                deleted = await delete_job(current_user_id, job_id)
-                if deleted:
-                    deleted_count += 1
-                else:
-                    failed_count += 1
-            except Exception as e:
-                print(f"Failed to delete job {job_id}: {e}")
-                failed_count += 1
-        
-        return MessageResponse(
-            message=f"Deleted {deleted_count} job(s), {failed_count} failed",
-            success=failed_count == 0
+            status_code=http_status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
         )
-        
     except Exception as e:
-        print(f"Error in bulk delete: {e}")
+        print(f"Error getting jobs by status: {e}")
         raise HTTPException(
             status_code=http_status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to perform bulk delete"
+            detail="Failed to retrieve job applications by status"
         )
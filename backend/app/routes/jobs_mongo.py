@@ -9,51 +9,33 @@ This module handles job application management including:
 - Getting job statistics
 """
 
-from typing import List
-from fastapi import APIRouter, HTTPException, Depends, status
-from app.utils.models_mongo import JobCreate, JobUpdate, JobResponse, JobStatsResponse, MessageResponse
-from app.utils.mongodb_service import JobService
+from typing import List, Optional
+from fastapi import APIRouter, HTTPException, Depends, Header, Query, status
+from app.utils.models_mongo import (
+    JobCreate, JobUpdate, JobResponse, JobSummaryResponse, JobStatsResponse, MessageResponse
+)
+from app.utils.mongodb_service import JobService, idempotency_store
+from app.utils.idempotency import IDEMPOTENCY_KEY_HEADER, run_idempotent
 from app.utils.security import get_current_user_id_mongo
 
 router = APIRouter()
 
 
-@router.get("/", response_model=List[JobResponse])
+@router.get("/", response_model=List[JobSummaryResponse])
 async def get_jobs(current_user_id: str = Depends(get_current_user_id_mongo)):
     """
     Get all job applications for the current user
     
+    Only list fields (with notes, without the description) are read from MongoDB.
+    
     Args:
         current_user_id: User ID from JWT token
         
     Returns:
-        List[JobResponse]: List of user's job applications
+        List[JobSummaryResponse]: List of user's job applications
     """
     try:
-        jobs = await JobService.get_jobs_by_user(current_user_id)
-        
-        # Convert to response format
-        job_responses = []
-        for job in jobs:
-            job_responses.append(JobResponse(
-                id=str(job.id),
-                user_id=str(job.user_id),
-                company=job.company,
-                position=job.position,
-                status=job.status,
-                applied_date=job.applied_date,
-                application_link=job.application_link,
-                notes=job.notes,
-                created_at=job.created_at,
-                updated_at=job.updated_at,
-                salary_range=job.salary_range,
-                location=job.location,
-                job_type=job.job_type,
-                interview_date=job.interview_date,
-                follow_up_date=job.follow_up_date
-            ))
-        
-        return job_responses
+        return await JobService.get_job_summaries_by_user(current_user_id)
     
     except Exception as e:
         print(f"Error getting jobs: {e}")
@@ -64,13 +46,18 @@ async def get_jobs(current_user_id: str = Depends(get_current_user_id_mongo)):
 
 
 @router.get("/{job_id}", response_model=JobResponse)
-async def get_job(job_id: str, current_user_id: str = Depends(get_current_user_id_mongo)):
+async def get_job(
+    job_id: str,
+    current_user_id: str = Depends(get_current_user_id_mongo),
+    include_description: bool = Query(True, description="Include the job description (stored separately)")
+):
     """
     Get a specific job application by ID
     
     Args:
         job_id: Job application ID
         current_user_id: User ID from JWT token
+        include_description: Also read the job description
         
     Returns:
         JobResponse: Job application details
@@ -95,6 +82,8 @@ async def get_job(job_id: str, current_user_id: str = Depends(get_current_user_i
         applied_date=job.applied_date,
         application_link=job.application_link,
         notes=job.notes,
+        job_description=(await JobService.get_job_description(job_id, current_user_id)
+                         if include_description else None),
         created_at=job.created_at,
         updated_at=job.updated_at,
         salary_range=job.salary_range,
@@ -106,43 +95,38 @@ async def get_job(job_id: str, current_user_id: str = Depends(get_current_user_i
 
 
 @router.post("/", response_model=JobResponse, status_code=status.HTTP_201_CREATED)
-async def create_job(job_data: JobCreate, current_user_id: str = Depends(get_current_user_id_mongo)):
+async def create_job(
+    job_data: JobCreate,
+    current_user_id: str = Depends(get_current_user_id_mongo),
+    idempotency_key: Optional[str] = Header(None, alias=IDEMPOTENCY_KEY_HEADER)
+):
     """
     Create a new job application
     
+    A retry with the same Idempotency-Key gets the job created by the first
+    request instead of a duplicate.
+    
     Args:
         job_data: Job application data
         current_user_id: User ID from JWT token
+        idempotency_key: Optional client-chosen key identifying this creation
         
     Returns:
         JobResponse: Created job application
         
     Raises:
-        HTTPException: If creation fails
+        HTTPException: If the key is reused or creation fails
     """
     print(f"📝 Job creation request - User ID: {current_user_id}")
     print(f"📝 Job creation request - Job data: {job_data}")
     try:
-        new_job = await JobService.create_job(job_data, current_user_id)
-        
-        return JobResponse(
-            id=str(new_job.id),
-            user_id=str(new_job.user_id),
-            company=new_job.company,
-            position=new_job.position,
-            status=new_job.status,
-            applied_date=new_job.applied_date,
-            application_link=new_job.application_link,
-            notes=new_job.notes,
-            created_at=new_job.created_at,
-            updated_at=new_job.updated_at,
-            salary_range=new_job.salary_range,
-            location=new_job.location,
-            job_type=new_job.job_type,
-            interview_date=new_job.interview_date,
-            follow_up_date=new_job.follow_up_date
+        return await run_idempotent(
+            idempotency_store, "jobs.create", current_user_id, idempotency_key, job_data,
+            lambda: _create_job(job_data, current_user_id), status_code=status.HTTP_201_CREATED
         )
     
+    except HTTPException:
+        raise
     except Exception as e:
         print(f"Error creating job: {e}")
         raise HTTPException(
@@ -151,6 +135,30 @@ async def create_job(job_data: JobCreate, current_user_id: str = Depends(get_cur
         )
 
 
+async def _create_job(job_data: JobCreate, current_user_id: str) -> JobResponse:
+    """Create the job and build its response"""
+    new_job = await JobService.create_job(job_data, current_user_id)
+    
+    return JobResponse(
+        id=str(new_job.id),
+        user_id=str(new_job.user_id),
+        company=new_job.company,
+        position=new_job.position,
+        status=new_job.status,
+        applied_date=new_job.applied_date,
+        application_link=new_job.application_link,
+        notes=new_job.notes,
+        job_description=job_data.job_description,
+        created_at=new_job.created_at,
+        updated_at=new_job.updated_at,
+        salary_range=new_job.salary_range,
+        location=new_job.location,
+        job_type=new_job.job_type,
+        interview_date=new_job.interview_date,
+        follow_up_date=new_job.follow_up_date
+    )
+
+
 @router.put("/{job_id}", response_model=JobResponse)
 async def update_job(
     job_id: str,
@@ -188,6 +196,7 @@ async def update_job(
         applied_date=updated_job.applied_date,
         application_link=updated_job.application_link,
         notes=updated_job.notes,
+        job_description=await JobService.get_job_description(job_id, current_user_id),
         created_at=updated_job.created_at,
         updated_at=updated_job.updated_at,
         salary_range=updated_job.salary_range,
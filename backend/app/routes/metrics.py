@@ -0,0 +1,66 @@
+"""
+Metrics Routes
+
+This module exposes the in-process metrics registry as JSON for dashboards
+and load tests. Metrics reveal traffic and internals, so:
+
+- The routes answer 404 unless METRICS_ENABLED=true
+- When METRICS_TOKEN is set, requests must send it as a bearer token
+"""
+
+import hmac
+import os
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Header, HTTPException, status
+from app.utils.metrics import metrics
+from app.utils.cache import cache_stats
+
+METRICS_ENABLED = os.getenv("METRICS_ENABLED", "false").lower() == "true"
+METRICS_TOKEN = os.getenv("METRICS_TOKEN", "")
+
+
+async def require_metrics_access(authorization: Optional[str] = Header(None)) -> None:
+    """
+    Allow metrics requests only when enabled, with the token if one is set
+
+    Raises:
+        HTTPException: 404 if metrics are disabled, 401 on a missing or
+            wrong token
+    """
+    if not METRICS_ENABLED:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not Found")
+    if METRICS_TOKEN and not hmac.compare_digest((authorization or "").encode("utf-8"),
+                                                 f"Bearer {METRICS_TOKEN}".encode("utf-8")):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid metrics token",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+
+router = APIRouter(dependencies=[Depends(require_metrics_access)])
+
+
+@router.get("/")
+async def get_metrics():
+    """
+    Get a snapshot of all counters and summaries recorded by this process
+
+    Returns:
+        Dict: Counters and summaries keyed by metric name and labels, plus
+            hit ratio and size of each read-through cache
+    """
+    return {**metrics.snapshot(), "caches": cache_stats()}
+
+
+@router.get("/dynamodb")
+async def get_dynamodb_metrics():
+    """
+    Get DynamoDB metrics: consumed RCU/WCU, throttled attempts, errors and
+    latency per operation
+
+    Returns:
+        Dict: Counters and summaries whose names start with "dynamodb_"
+    """
+    return metrics.snapshot(prefix="dynamodb_")
@@ -0,0 +1,241 @@
+"""
+Read-Through Caching
+
+Repositories wrap hot single-key lookups (job by ID, user metadata, user
+documents) in a `ReadThroughCache`:
+
+- In-process LRU with a TTL; entries are model instances shared between
+  callers, so callers must copy before mutating
+- Optional shared tier in Redis (CACHE_REDIS_URL) so workers warm each
+  other; local entries use the shorter TTL to bound cross-process staleness
+- Concurrent misses for the same key share one load
+- Writers call `set`/`invalidate` after a successful write; a load that
+  raced with a write is returned but not stored
+- Hits, misses and the age of served entries are recorded in the metrics
+  registry, and `/metrics` reports every cache's hit ratio
+
+Caches are used from the event loop only (no locking).
+"""
+
+import asyncio
+import json
+import os
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Generic, Optional, Tuple, Type, TypeVar
+
+from pydantic import BaseModel
+
+from app.utils.metrics import metrics
+
+try:
+    import redis.asyncio as redis_asyncio
+except ImportError:
+    redis_asyncio = None
+
+# Local entries expire after CACHE_TTL_SECONDS (0 disables caching)
+CACHE_TTL_SECONDS = float(os.getenv("CACHE_TTL_SECONDS", "30"))
+CACHE_MAX_ENTRIES = int(os.getenv("CACHE_MAX_ENTRIES", "10000"))
+
+# Optional shared tier
+CACHE_REDIS_URL = os.getenv("CACHE_REDIS_URL", "")
+CACHE_SHARED_TTL_SECONDS = int(os.getenv("CACHE_SHARED_TTL_SECONDS", "300"))
+
+ModelType = TypeVar("ModelType", bound=BaseModel)
+
+# Every cache by name, for /metrics
+_caches: Dict[str, "ReadThroughCache"] = {}
+
+
+class SharedStore:
+    """Redis-backed shared tier; failures are logged and treated as misses"""
+
+    def __init__(self, url: str, ttl_seconds: int):
+        self.ttl_seconds = ttl_seconds
+        self.client = redis_asyncio.from_url(url)
+
+    async def get(self, key: str) -> Optional[str]:
+        try:
+            return await self.client.get(key)
+        except Exception as e:
+            print(f"⚠️ Shared cache read failed: {e}")
+            return None
+
+    async def set(self, key: str, value: str) -> None:
+        try:
+            await self.client.set(key, value, ex=self.ttl_seconds)
+        except Exception as e:
+            print(f"⚠️ Shared cache write failed: {e}")
+
+    async def delete(self, key: str) -> None:
+        try:
+            await self.client.delete(key)
+        except Exception as e:
+            print(f"⚠️ Shared cache invalidation failed: {e}")
+
+
+def _create_shared_store() -> Optional[SharedStore]:
+    if not CACHE_REDIS_URL:
+        return None
+    if redis_asyncio is None:
+        print("⚠️ CACHE_REDIS_URL is set but redis is not installed - using the in-process cache only")
+        return None
+    return SharedStore(CACHE_REDIS_URL, CACHE_SHARED_TTL_SECONDS)
+
+
+shared_store = _create_shared_store()
+
+
+class ReadThroughCache(Generic[ModelType]):
+    """TTL/LRU cache of pydantic models in front of a repository lookup"""
+
+    def __init__(self, name: str, model: Type[ModelType], shared: bool = True,
+                 ttl_seconds: float = CACHE_TTL_SECONDS, max_entries: int = CACHE_MAX_ENTRIES):
+        """
+        Args:
+            name: Cache name (metric label and shared key prefix)
+            model: Model type of the cached values (used to decode shared entries)
+            shared: Whether the shared tier may hold these values (disable for
+                values that must not leave the process, e.g. password hashes)
+            ttl_seconds: Lifetime of local entries
+            max_entries: Local entries kept before evicting the least recently used
+        """
+        self.name = name
+        self.model = model
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.shared = shared_store if shared else None
+        self._entries: "OrderedDict[str, Tuple[float, ModelType]]" = OrderedDict()
+        self._loading: Dict[str, asyncio.Future] = {}
+        self._writes = 0
+        _caches[name] = self
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl_seconds > 0 and self.max_entries > 0
+
+    def _shared_key(self, key: str) -> str:
+        return f"careervault:{self.name}:{key}"
+
+    def _record(self, result: str, age: Optional[float] = None) -> None:
+        metrics.increment("cache_requests", cache=self.name, result=result)
+        if age is not None:
+            metrics.observe("cache_hit_age_seconds", age, cache=self.name)
+
+    def _get_local(self, key: str) -> Optional[Tuple[float, ModelType]]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if time.time() - entry[0] > self.ttl_seconds:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def _put_local(self, key: str, value: ModelType, loaded_at: float) -> None:
+        self._entries[key] = (loaded_at, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def get(self, key: str, loader: Callable[[], Awaitable[Optional[ModelType]]]) -> Optional[ModelType]:
+        """
+        Get a value, loading (and caching) it on a miss
+
+        Args:
+            key: Cache key
+            loader: Coroutine function reading the value from the database
+                (None results are returned but not cached)
+
+        Returns:
+            Optional[ModelType]: Cached or freshly loaded value
+        """
+        if not self.enabled:
+            return await loader()
+
+        entry = self._get_local(key)
+        if entry is not None:
+            self._record("hit", time.time() - entry[0])
+            return entry[1]
+
+        pending = self._loading.get(key)
+        if pending is not None:
+            self._record("hit")
+            return await asyncio.shield(pending)
+
+        future = asyncio.ensure_future(self._load(key, loader))
+        self._loading[key] = future
+        try:
+            return await asyncio.shield(future)
+        finally:
+            if self._loading.get(key) is future:
+                del self._loading[key]
+
+    async def _load(self, key: str, loader: Callable[[], Awaitable[Optional[ModelType]]]) -> Optional[ModelType]:
+        writes = self._writes
+
+        if self.shared:
+            raw = await self.shared.get(self._shared_key(key))
+            if raw is not None:
+                payload = json.loads(raw)
+                value = self.model.model_validate(payload["value"])
+                if writes == self._writes:
+                    self._put_local(key, value, payload["loaded_at"])
+                self._record("shared_hit", time.time() - payload["loaded_at"])
+                return value
+
+        self._record("miss")
+        value = await loader()
+        if value is not None and writes == self._writes:
+            await self._store(key, value)
+        return value
+
+    async def _store(self, key: str, value: ModelType) -> None:
+        loaded_at = time.time()
+        self._put_local(key, value, loaded_at)
+        if self.shared:
+            payload = {"loaded_at": loaded_at, "value": value.model_dump(mode="json")}
+            await self.shared.set(self._shared_key(key), json.dumps(payload))
+
+    async def set(self, key: str, value: ModelType) -> None:
+        """Store the value just written to the database"""
+        if not self.enabled:
+            return
+        self._writes += 1
+        self._loading.pop(key, None)
+        await self._store(key, value)
+
+    async def invalidate(self, key: str) -> None:
+        """Drop a key after the database copy changed or was deleted"""
+        if not self.enabled:
+            return
+        self._writes += 1
+        self._loading.pop(key, None)
+        self._entries.pop(key, None)
+        metrics.increment("cache_invalidations", cache=self.name)
+        if self.shared:
+            await self.shared.delete(self._shared_key(key))
+
+    def clear(self) -> None:
+        """Drop every local entry (used by benchmarks between runs)"""
+        self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit ratio and size of this cache"""
+        hits = (metrics.get_counter("cache_requests", cache=self.name, result="hit")
+                + metrics.get_counter("cache_requests", cache=self.name, result="shared_hit"))
+        misses = metrics.get_counter("cache_requests", cache=self.name, result="miss")
+        requests = hits + misses
+        return {
+            "entries": len(self._entries),
+            "hits": hits,
+            "misses": misses,
+            "hit_ratio": hits / requests if requests else 0.0,
+            "ttl_seconds": self.ttl_seconds,
+            "shared": self.shared is not None,
+        }
+
+
+def cache_stats() -> Dict[str, Dict[str, Any]]:
+    """Stats of every cache created in this process"""
+    return {name: cache.stats() for name, cache in _caches.items()}
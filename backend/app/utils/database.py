@@ -6,12 +6,20 @@ It includes database models and session management for the Job Tracker API.
 Later this can be easily swapped with DynamoDB for production.
 """
 
-from sqlalchemy import create_engine, Column, Integer, String, DateTime, Text, ForeignKey
+from sqlalchemy import (
+    create_engine, Column, Integer, String, DateTime, Text, ForeignKey, UniqueConstraint, or_, and_
+)
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, Session, relationship
-from datetime import datetime
-from typing import Generator
+from datetime import datetime, timedelta
+from typing import Generator, Optional
 import os
+import time
+
+from app.utils.idempotency import (
+    IdempotencyStore, StoredResponse, IDEMPOTENCY_LOCK_SECONDS, IDEMPOTENCY_TTL_SECONDS, replay
+)
 
 # Database configuration
 DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./job_tracker.db")
@@ -22,6 +30,9 @@ engine = create_engine(
     connect_args={"check_same_thread": False} if "sqlite" in DATABASE_URL else {}
 )
 
+# Expired Idempotency-Key rows are deleted at most this often (by reservations)
+IDEMPOTENCY_PURGE_INTERVAL_SECONDS = 3600
+
 # Create session factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
@@ -69,6 +80,7 @@ class Job(Base):
         updated_at: Record last update timestamp
         user_id: Foreign key to user
         user: Related user object
+        description: Related job description (loaded only when accessed)
     """
     __tablename__ = "jobs"
     
@@ -87,6 +99,58 @@ class Job(Base):
     
     # Relationship with user
     user = relationship("User", back_populates="jobs")
+    
+    # Description lives in its own table so job lists and stats don't read it
+    description = relationship(
+        "JobDescription", back_populates="job", uselist=False, cascade="all, delete-orphan", lazy="select"
+    )
+
+
+class JobDescription(Base):
+    """
+    Job description database model (one row per job that has one)
+    
+    Attributes:
+        job_id: Primary key and foreign key to job
+        job_description: Job posting text
+        job: Related job object
+    """
+    __tablename__ = "job_descriptions"
+    
+    job_id = Column(Integer, ForeignKey("jobs.id", ondelete="CASCADE"), primary_key=True)
+    job_description = Column(Text, nullable=False)
+    
+    # Relationship with job
+    job = relationship("Job", back_populates="description")
+
+
+class IdempotencyKey(Base):
+    """
+    Idempotency-Key reservation and stored response (see app.utils.idempotency)
+    
+    Attributes:
+        id: Primary key
+        user_id: Owner of the key
+        scope: Route the key is used for
+        key: Client-supplied key (unique per user and scope)
+        fingerprint: Hash of the request payload
+        status_code: Status code of the stored response (None while running)
+        response: Stored JSON response body
+        locked_until: When a reservation without response counts as abandoned
+        expires_at: When the key can be used again
+    """
+    __tablename__ = "idempotency_keys"
+    __table_args__ = (UniqueConstraint("user_id", "scope", "key", name="uq_idempotency_key"),)
+    
+    id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(String(64), nullable=False)
+    scope = Column(String(50), nullable=False)
+    key = Column(String(255), nullable=False)
+    fingerprint = Column(String(64), nullable=False)
+    status_code = Column(Integer, nullable=True)
+    response = Column(Text, nullable=True)
+    locked_until = Column(DateTime, nullable=False)
+    expires_at = Column(DateTime, nullable=False, index=True)
 
 
 def create_tables():
@@ -213,19 +277,54 @@ def get_job_by_id(db: Session, job_id: int, user_id: int) -> Job:
     return db.query(Job).filter(Job.id == job_id, Job.user_id == user_id).first()
 
 
+def get_job_description(db: Session, job_id: int, user_id: int) -> Optional[str]:
+    """
+    Get the description of a job
+    
+    Args:
+        db: Database session
+        job_id: Job's ID
+        user_id: User's ID (for security)
+        
+    Returns:
+        str: Job description or None if the job has none
+    """
+    row = (
+        db.query(JobDescription.job_description)
+        .join(Job, Job.id == JobDescription.job_id)
+        .filter(Job.id == job_id, Job.user_id == user_id)
+        .first()
+    )
+    return row[0] if row else None
+
+
+def _set_job_description(db_job: Job, text: Optional[str]) -> None:
+    """Attach, change or (for an empty text) drop the description row of a job"""
+    if not text:
+        db_job.description = None
+    elif db_job.description is None:
+        db_job.description = JobDescription(job_description=text)
+    else:
+        db_job.description.job_description = text
+
+
 def create_job(db: Session, job_data: dict, user_id: int) -> Job:
     """
     Create a new job application
     
     Args:
         db: Database session
-        job_data: Job data dictionary
+        job_data: Job data dictionary (job_description goes to its own table)
         user_id: User's ID
         
     Returns:
         Job: Created job object
     """
+    job_data = dict(job_data)
+    description = job_data.pop("job_description", None)
     db_job = Job(**job_data, user_id=user_id)
+    if description:
+        db_job.description = JobDescription(job_description=description)
     db.add(db_job)
     db.commit()
     db.refresh(db_job)
@@ -248,7 +347,11 @@ def update_job(db: Session, job_id: int, job_data: dict, user_id: int) -> Job:
     db_job = get_job_by_id(db, job_id, user_id)
     if db_job:
         for key, value in job_data.items():
-            if value is not None:
+            if value is None:
+                continue
+            if key == "job_description":
+                _set_job_description(db_job, value)
+            else:
                 setattr(db_job, key, value)
         setattr(db_job, 'updated_at', datetime.utcnow())
         db.commit()
@@ -288,3 +391,116 @@ def count_user_jobs(db: Session, user_id: int) -> int:
         int: Total number of jobs
     """
     return db.query(Job).filter(Job.user_id == user_id).count()
+
+
+class SQLIdempotencyStore(IdempotencyStore):
+    """
+    Idempotency-Key store in the idempotency_keys table
+    
+    Reserving is an insert guarded by the unique (user_id, scope, key)
+    constraint; an expired or abandoned row is taken over with a
+    conditional UPDATE. Expired rows are deleted with
+    `delete_expired_idempotency_keys` by the first reservation after
+    IDEMPOTENCY_PURGE_INTERVAL_SECONDS.
+    """
+    
+    def __init__(self, session_factory=SessionLocal):
+        self.session_factory = session_factory
+        self._next_purge = 0.0
+    
+    def _purge_expired(self, db: Session) -> None:
+        """Delete expired rows if the last purge was long enough ago"""
+        if time.monotonic() < self._next_purge:
+            return
+        self._next_purge = time.monotonic() + IDEMPOTENCY_PURGE_INTERVAL_SECONDS
+        try:
+            deleted = delete_expired_idempotency_keys(db)
+            if deleted:
+                print(f"🧹 Deleted {deleted} expired Idempotency-Key(s)")
+        except Exception as e:
+            db.rollback()
+            print(f"⚠️ Failed to delete expired Idempotency-Keys: {e}")
+    
+    def _filter(self, db: Session, user_id: str, scope: str, key: str):
+        return db.query(IdempotencyKey).filter(
+            IdempotencyKey.user_id == user_id, IdempotencyKey.scope == scope, IdempotencyKey.key == key
+        )
+    
+    async def reserve(self, user_id: str, scope: str, key: str, fingerprint: str) -> Optional[StoredResponse]:
+        db = self.session_factory()
+        try:
+            self._purge_expired(db)
+            for _ in range(3):
+                now = datetime.utcnow()
+                fields = {
+                    "fingerprint": fingerprint,
+                    "status_code": None,
+                    "response": None,
+                    "locked_until": now + timedelta(seconds=IDEMPOTENCY_LOCK_SECONDS),
+                    "expires_at": now + timedelta(seconds=IDEMPOTENCY_TTL_SECONDS)
+                }
+                try:
+                    db.add(IdempotencyKey(user_id=user_id, scope=scope, key=key, **fields))
+                    db.commit()
+                    return None
+                except IntegrityError:
+                    db.rollback()
+                
+                taken = self._filter(db, user_id, scope, key).filter(or_(
+                    IdempotencyKey.expires_at < now,
+                    and_(IdempotencyKey.status_code.is_(None), IdempotencyKey.locked_until < now)
+                )).update(fields, synchronize_session=False)
+                db.commit()
+                if taken:
+                    return None
+                
+                record = self._filter(db, user_id, scope, key).first()
+                if record is not None:
+                    return replay(record.fingerprint, record.status_code, record.response, fingerprint)
+            
+            raise Exception(f"Idempotency-Key {key} of {user_id} kept changing")
+        finally:
+            db.close()
+    
+    async def complete(self, user_id: str, scope: str, key: str, response: StoredResponse) -> None:
+        db = self.session_factory()
+        try:
+            self._filter(db, user_id, scope, key).update({
+                "status_code": response.status_code,
+                "response": response.body,
+                "expires_at": datetime.utcnow() + timedelta(seconds=IDEMPOTENCY_TTL_SECONDS)
+            }, synchronize_session=False)
+            db.commit()
+        finally:
+            db.close()
+    
+    async def release(self, user_id: str, scope: str, key: str) -> None:
+        db = self.session_factory()
+        try:
+            self._filter(db, user_id, scope, key).filter(
+                IdempotencyKey.status_code.is_(None)
+            ).delete(synchronize_session=False)
+            db.commit()
+        finally:
+            db.close()
+
+
+def delete_expired_idempotency_keys(db: Session) -> int:
+    """
+    Delete Idempotency-Key rows whose expiry has passed
+    
+    Args:
+        db: Database session
+        
+    Returns:
+        int: Number of rows deleted
+    """
+    deleted = db.query(IdempotencyKey).filter(
+        IdempotencyKey.expires_at < datetime.utcnow()
+    ).delete(synchronize_session=False)
+    db.commit()
+    return deleted
+
+
+# Shared instance
+idempotency_store = SQLIdempotencyStore()
@@ -0,0 +1,143 @@
+"""
+Streaming DOCX Text Extraction
+
+This module reads the text of a Word (.docx) document by streaming
+`word/document.xml` straight out of the zip archive with an iterparse parser,
+instead of building the full python-docx object model.
+
+- Paragraphs and table cells are emitted in document order
+- Table rows are emitted as one line with cells separated by " | "
+- Elements are cleared as soon as they are consumed to keep memory flat
+"""
+
+import io
+import zipfile
+from typing import IO, Iterator, List, Union
+from xml.etree.ElementTree import iterparse
+
+# WordprocessingML namespaces
+W_NS = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+MC_NS = "{http://schemas.openxmlformats.org/markup-compatibility/2006}"
+
+DOCUMENT_PART = "word/document.xml"
+
+# Element tags used while streaming
+_P = W_NS + "p"
+_T = W_NS + "t"
+_TAB = W_NS + "tab"
+_BR = W_NS + "br"
+_CR = W_NS + "cr"
+_TR = W_NS + "tr"
+_TC = W_NS + "tc"
+_BODY = W_NS + "body"
+_FALLBACK = MC_NS + "Fallback"
+
+CELL_SEPARATOR = " | "
+
+
+def iter_docx_blocks(source: Union[bytes, IO[bytes]]) -> Iterator[str]:
+    """
+    Stream the text blocks of a .docx document in reading order
+
+    Args:
+        source: Raw .docx bytes or a binary file object
+
+    Yields:
+        str: One non-empty paragraph or table row at a time
+
+    Raises:
+        ValueError: If the file is not a valid .docx document
+    """
+    if isinstance(source, (bytes, bytearray)):
+        source = io.BytesIO(source)
+
+    try:
+        archive = zipfile.ZipFile(source)
+        document = archive.open(DOCUMENT_PART)
+    except (zipfile.BadZipFile, KeyError) as e:
+        raise ValueError(f"Not a valid .docx document: {e}")
+
+    with archive, document:
+        run_text: List[str] = []      # Text of the paragraph being read
+        cell_stack: List[List[str]] = []  # Paragraphs of each open table cell
+        row_stack: List[List[str]] = []   # Cells of each open table row
+        fallback_depth = 0  # Inside mc:Fallback (duplicate of mc:Choice content)
+        depth = 0
+        body = None
+
+        for event, elem in iterparse(document, events=("start", "end")):
+            tag = elem.tag
+
+            if event == "start":
+                depth += 1
+                if tag == _BODY:
+                    body = elem
+                elif tag == _FALLBACK:
+                    fallback_depth += 1
+                elif fallback_depth:
+                    continue
+                elif tag == _TR:
+                    row_stack.append([])
+                elif tag == _TC:
+                    cell_stack.append([])
+                continue
+
+            # event == "end"
+            depth -= 1
+            if tag == _FALLBACK:
+                fallback_depth -= 1
+                elem.clear()
+                continue
+            if fallback_depth:
+                continue
+
+            if tag == _T:
+                if elem.text:
+                    run_text.append(elem.text)
+            elif tag == _TAB:
+                run_text.append("\t")
+            elif tag == _BR or tag == _CR:
+                run_text.append("\n")
+            elif tag == _P:
+                text = "".join(run_text).strip()
+                run_text.clear()
+                if cell_stack:
+                    if text:
+                        cell_stack[-1].append(text)
+                elif text:
+                    yield text
+                elem.clear()
+            elif tag == _TC:
+                cell_text = " ".join(cell_stack.pop())
+                if row_stack:
+                    row_stack[-1].append(cell_text)
+                elif cell_text:
+                    yield cell_text
+                elem.clear()
+            elif tag == _TR:
+                cells = [cell for cell in row_stack.pop() if cell]
+                if cells:
+                    row_text = CELL_SEPARATOR.join(cells)
+                    # Rows of a nested table belong to the enclosing cell
+                    if cell_stack:
+                        cell_stack[-1].append(row_text)
+                    else:
+                        yield row_text
+                elem.clear()
+
+            # Drop finished top-level blocks so the tree never grows
+            if depth == 2 and body is not None:
+                body.clear()
+
+
+def extract_docx_text(content: bytes) -> str:
+    """
+    Extract all paragraph and table text from a .docx document
+
+    Args:
+        content: Raw .docx bytes
+
+    Returns:
+        str: Document text, one paragraph or table row per line
+    """
+    return "\n".join(iter_docx_blocks(content))
@@ -0,0 +1,471 @@
+"""
+Async DynamoDB Table Access
+
+boto3 is blocking, so calling `table.query()` from an `async def` stalls the
+event loop for the whole DynamoDB round trip. This module provides an
+`AsyncTable` with the same call signatures as a boto3 `Table` resource that:
+
+- Uses the shared low-level client (clients are thread-safe, resources are not)
+- Runs every call on a bounded worker pool sized to the client connection pool
+- Follows `LastEvaluatedKey` for callers that need every page
+- Chunks batch reads/writes to the API limits and retries unprocessed items
+- Exposes TransactWriteItems for writes that must succeed or fail together
+- Coalesces concurrent point reads into BatchGetItem calls (`load_item`)
+- Accepts boto3 condition objects (`Key(...)`, `Attr(...)`) and plain Python
+  values, serializing/deserializing items the same way the resource layer does
+- Requests consumed capacity on every call and records it, together with
+  latency and errors per operation, in the metrics registry (throttled
+  attempts are counted by `instrument_client`)
+"""
+
+import asyncio
+import os
+import time
+import weakref
+from concurrent.futures import Executor
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence, Union
+
+from boto3.dynamodb.conditions import ConditionBase, ConditionExpressionBuilder
+from boto3.dynamodb.types import TypeDeserializer, TypeSerializer
+from botocore import xform_name
+from botocore.exceptions import ClientError
+
+from app.utils.metrics import metrics
+
+# Stateless, safe to share between worker threads
+_serializer = TypeSerializer()
+_deserializer = TypeDeserializer()
+
+# Request parameters holding a single item/key map
+_ITEM_PARAMETERS = ("Item", "Key", "ExclusiveStartKey")
+
+# Request parameters that accept boto3 condition objects
+_CONDITION_PARAMETERS = ("KeyConditionExpression", "FilterExpression", "ConditionExpression")
+
+# Response fields holding a single item/key map
+_ITEM_RESPONSES = ("Item", "Attributes", "LastEvaluatedKey")
+
+# DynamoDB batch/transaction API limits
+BATCH_GET_LIMIT = 100
+BATCH_WRITE_LIMIT = 25
+TRANSACT_WRITE_LIMIT = 100
+
+# Retries for unprocessed batch items and conflicting transactions
+# (exponential backoff from 50 ms)
+BATCH_MAX_RETRIES = 5
+BATCH_RETRY_BASE_DELAY = 0.05
+
+# How long `load_item` waits for more lookups before sending a BatchGetItem
+# while another one is in flight (0 only batches lookups made in the same
+# event loop iteration)
+DYNAMODB_BATCH_WINDOW_MS = float(os.getenv("DYNAMODB_BATCH_WINDOW_MS", "2"))
+
+# Operations that consume read capacity (every other operation consumes write capacity)
+_READ_OPERATIONS = ("get_item", "query", "scan", "batch_get_item")
+
+# Error codes of throttled requests (botocore retries these before giving up)
+THROTTLING_ERROR_CODES = ("ProvisionedThroughputExceededException", "ThrottlingException", "RequestLimitExceeded")
+
+
+def serialize_item(item: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert a Python dict into DynamoDB attribute values"""
+    return {key: _serializer.serialize(value) for key, value in item.items()}
+
+
+def deserialize_item(item: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert DynamoDB attribute values into a Python dict"""
+    return {key: _deserializer.deserialize(value) for key, value in item.items()}
+
+
+def cancellation_reasons(error: ClientError) -> List[str]:
+    """Per-action reason codes of a TransactionCanceledException ("None" = no problem)"""
+    if error.response.get("Error", {}).get("Code") != "TransactionCanceledException":
+        return []
+    return [reason.get("Code", "None") for reason in error.response.get("CancellationReasons", [])]
+
+
+def record_consumed_capacity(operation: str, consumed: Optional[Union[Dict[str, Any], List[Dict[str, Any]]]]) -> None:
+    """
+    Add a response's ConsumedCapacity to the RCU/WCU counters
+
+    Args:
+        operation: Client method name (e.g. "query")
+        consumed: ConsumedCapacity of the response (one entry, or one per table)
+    """
+    if not consumed:
+        return
+    if isinstance(consumed, dict):
+        consumed = [consumed]
+    name = "dynamodb_consumed_rcu" if operation in _READ_OPERATIONS else "dynamodb_consumed_wcu"
+    for entry in consumed:
+        metrics.increment(name, entry.get("CapacityUnits", 0), operation=operation, table=entry.get("TableName"))
+
+
+def instrument_client(client) -> None:
+    """
+    Count throttled attempts of a DynamoDB client
+
+    botocore retries throttled requests internally, so they never reach
+    `AsyncTable`; this hooks the retry check that sees every attempt.
+    """
+    def count_throttle(response=None, operation=None, **kwargs):
+        if response is None:
+            return None
+        code = response[1].get("Error", {}).get("Code")
+        if code in THROTTLING_ERROR_CODES:
+            metrics.increment("dynamodb_throttles", operation=xform_name(operation.name))
+        return None
+
+    client.meta.events.register("needs-retry.dynamodb", count_throttle)
+
+
+def prepare_request(params: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Translate resource-style parameters into low-level client parameters
+
+    Args:
+        params: Parameters as accepted by a boto3 `Table` method
+
+    Returns:
+        Dict[str, Any]: Parameters for the matching client method
+    """
+    params = dict(params)
+
+    for name in _ITEM_PARAMETERS:
+        if name in params:
+            params[name] = serialize_item(params[name])
+
+    names = dict(params.pop("ExpressionAttributeNames", None) or {})
+    values = serialize_item(params.pop("ExpressionAttributeValues", None) or {})
+
+    # A new builder per request: it keeps placeholder counters and isn't thread-safe
+    builder = ConditionExpressionBuilder()
+    for name in _CONDITION_PARAMETERS:
+        condition = params.get(name)
+        if isinstance(condition, ConditionBase):
+            expression = builder.build_expression(condition, is_key_condition=(name == "KeyConditionExpression"))
+            params[name] = expression.condition_expression
+            names.update(expression.attribute_name_placeholders)
+            values.update(serialize_item(expression.attribute_value_placeholders))
+
+    if names:
+        params["ExpressionAttributeNames"] = names
+    if values:
+        params["ExpressionAttributeValues"] = values
+    return params
+
+
+def parse_response(response: Dict[str, Any]) -> Dict[str, Any]:
+    """Deserialize the items contained in a client response"""
+    for name in _ITEM_RESPONSES:
+        if name in response:
+            response[name] = deserialize_item(response[name])
+    if "Items" in response:
+        response["Items"] = [deserialize_item(item) for item in response["Items"]]
+    return response
+
+
+class BatchGetLoader:
+    """
+    Collects point lookups of one table and fetches them with BatchGetItem
+
+    While another batch of the same event loop is in flight, lookups
+    arriving within `window_seconds` of the first one (or until 100 keys are
+    waiting) share one `AsyncTable.batch_get`, which retries unprocessed
+    keys; each caller gets its own item back. When nothing is in flight the
+    batch is sent on the next loop iteration, so an idle server adds no
+    delay but still batches lookups started together (e.g. by
+    `asyncio.gather`). Identical keys in a batch are fetched once.
+    """
+
+    def __init__(self, table: "AsyncTable", window_seconds: float = DYNAMODB_BATCH_WINDOW_MS / 1000,
+                 max_keys: int = BATCH_GET_LIMIT):
+        self.table = table
+        self.window_seconds = window_seconds
+        self.max_keys = max_keys
+        # Event loop -> (futures by key, timer handle) of the batch being collected
+        self._batches = weakref.WeakKeyDictionary()
+        # In-flight fetches (the loop only keeps weak references to tasks)
+        self._fetches = set()
+
+    @staticmethod
+    def _identity(key: Dict[str, Any]):
+        return tuple(sorted(key.items()))
+
+    async def load(self, key: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Get one item as part of the next batch
+
+        Args:
+            key: Primary key of the item
+
+        Returns:
+            Optional[Dict[str, Any]]: The item, None if it doesn't exist
+        """
+        loop = asyncio.get_running_loop()
+        batch = self._batches.get(loop)
+        if batch is None:
+            futures = {}
+            busy = any(fetch.get_loop() is loop for fetch in self._fetches)
+            if busy and self.window_seconds > 0:
+                handle = loop.call_later(self.window_seconds, self._dispatch, loop)
+            else:
+                handle = loop.call_soon(self._dispatch, loop)
+            batch = self._batches[loop] = (futures, handle)
+
+        futures = batch[0]
+        identity = self._identity(key)
+        future = futures.get(identity)
+        if future is None:
+            future = futures[identity] = loop.create_future()
+            if len(futures) >= self.max_keys:
+                self._dispatch(loop)
+        return await asyncio.shield(future)
+
+    def _dispatch(self, loop) -> None:
+        """Send the batch being collected on `loop`"""
+        batch = self._batches.pop(loop, None)
+        if batch is None:
+            return
+        futures, handle = batch
+        handle.cancel()
+        task = loop.create_task(self._fetch(futures))
+        self._fetches.add(task)
+        task.add_done_callback(self._fetches.discard)
+
+    async def _fetch(self, futures: Dict[tuple, asyncio.Future]) -> None:
+        keys = [dict(identity) for identity in futures]
+        metrics.observe("dynamodb_batch_get_keys", len(keys), table=self.table.table_name)
+        try:
+            items = await self.table.batch_get(keys)
+        except Exception as e:
+            for future in futures.values():
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        names = list(keys[0])
+        found = {self._identity({name: item[name] for name in names}): item for item in items}
+        for identity, future in futures.items():
+            if not future.done():
+                future.set_result(found.get(identity))
+
+
+class AsyncTable:
+    """
+    Non-blocking counterpart of a boto3 `Table` resource
+
+    Methods take the same keyword arguments as the resource methods and
+    return the same (deserialized) responses, but must be awaited.
+    """
+
+    def __init__(self, client, table_name: str, executor: Executor):
+        self.client = client
+        self.table_name = table_name
+        self.executor = executor
+        self.loader = BatchGetLoader(self)
+
+    def _invoke(self, operation: str, **request) -> Dict[str, Any]:
+        """Call the client with capacity reporting; records latency, capacity and errors"""
+        request["ReturnConsumedCapacity"] = "TOTAL"
+        start = time.perf_counter()
+        try:
+            response = getattr(self.client, operation)(**request)
+        except ClientError as e:
+            metrics.increment("dynamodb_errors", operation=operation, code=e.response["Error"]["Code"])
+            raise
+        finally:
+            metrics.observe("dynamodb_latency_ms", (time.perf_counter() - start) * 1000, operation=operation)
+        record_consumed_capacity(operation, response.get("ConsumedCapacity"))
+        return response
+
+    def _call_sync(self, operation: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Serialize, call the client and deserialize (runs on a worker thread)"""
+        request = prepare_request(params)
+        request["TableName"] = self.table_name
+        response = self._invoke(operation, **request)
+        return parse_response(response)
+
+    async def _run(self, function, *args):
+        """Run a blocking function on the DynamoDB worker pool"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, function, *args)
+
+    async def _call(self, operation: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        return await self._run(self._call_sync, operation, params)
+
+    async def get_item(self, **kwargs) -> Dict[str, Any]:
+        return await self._call("get_item", kwargs)
+
+    async def load_item(self, key: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Get a whole item by key, batched with concurrent lookups (see `BatchGetLoader`)"""
+        return await self.loader.load(key)
+
+    async def put_item(self, **kwargs) -> Dict[str, Any]:
+        return await self._call("put_item", kwargs)
+
+    async def update_item(self, **kwargs) -> Dict[str, Any]:
+        return await self._call("update_item", kwargs)
+
+    async def delete_item(self, **kwargs) -> Dict[str, Any]:
+        return await self._call("delete_item", kwargs)
+
+    async def query(self, **kwargs) -> Dict[str, Any]:
+        return await self._call("query", kwargs)
+
+    async def scan(self, **kwargs) -> Dict[str, Any]:
+        return await self._call("scan", kwargs)
+
+    async def iterate_pages(self, operation: str = "query", **kwargs) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Run a query/scan and yield every page, following `LastEvaluatedKey`
+
+        Args:
+            operation: "query" or "scan"
+            **kwargs: Parameters for the first page
+
+        Yields:
+            Dict[str, Any]: One deserialized response per page
+        """
+        params = dict(kwargs)
+        while True:
+            response = await self._call(operation, params)
+            yield response
+            last_key = response.get("LastEvaluatedKey")
+            if not last_key:
+                break
+            params["ExclusiveStartKey"] = last_key
+
+    async def iterate_items(self, operation: str = "query", **kwargs) -> AsyncIterator[Dict[str, Any]]:
+        """Yield every item of a query/scan across all pages"""
+        async for page in self.iterate_pages(operation, **kwargs):
+            for item in page.get("Items", []):
+                yield item
+
+    def _batch_get_sync(self, keys: List[Dict[str, Any]], projection: Dict[str, Any]):
+        """One BatchGetItem call; returns (items, unprocessed keys)"""
+        request = {"Keys": [serialize_item(key) for key in keys], **projection}
+        response = self._invoke("batch_get_item", RequestItems={self.table_name: request})
+        items = [deserialize_item(item) for item in response.get("Responses", {}).get(self.table_name, [])]
+        unprocessed = response.get("UnprocessedKeys", {}).get(self.table_name, {}).get("Keys", [])
+        return items, [deserialize_item(key) for key in unprocessed]
+
+    def _batch_write_sync(self, requests: List[Dict[str, Any]]):
+        """One BatchWriteItem call; returns the unprocessed write requests"""
+        serialized = []
+        for request in requests:
+            if "PutRequest" in request:
+                serialized.append({"PutRequest": {"Item": serialize_item(request["PutRequest"]["Item"])}})
+            else:
+                serialized.append({"DeleteRequest": {"Key": serialize_item(request["DeleteRequest"]["Key"])}})
+        response = self._invoke("batch_write_item", RequestItems={self.table_name: serialized})
+        unprocessed = response.get("UnprocessedItems", {}).get(self.table_name, [])
+        result = []
+        for request in unprocessed:
+            if "PutRequest" in request:
+                result.append({"PutRequest": {"Item": deserialize_item(request["PutRequest"]["Item"])}})
+            else:
+                result.append({"DeleteRequest": {"Key": deserialize_item(request["DeleteRequest"]["Key"])}})
+        return result
+
+    async def batch_get(self, keys: Sequence[Dict[str, Any]], **projection) -> List[Dict[str, Any]]:
+        """
+        Fetch many items by key with BatchGetItem
+
+        Keys are split into chunks of 100 that are fetched concurrently;
+        unprocessed keys are retried with exponential backoff.
+
+        Args:
+            keys: Primary keys to fetch (duplicates are not allowed)
+            **projection: Optional ProjectionExpression/ExpressionAttributeNames
+
+        Returns:
+            List[Dict[str, Any]]: Found items (in no particular order)
+        """
+        async def fetch_chunk(chunk):
+            found = []
+            for attempt in range(BATCH_MAX_RETRIES + 1):
+                items, chunk = await self._run(self._batch_get_sync, chunk, projection)
+                found.extend(items)
+                if not chunk:
+                    return found
+                metrics.increment("dynamodb_unprocessed_keys", len(chunk), table=self.table_name)
+                if attempt < BATCH_MAX_RETRIES:
+                    await asyncio.sleep(BATCH_RETRY_BASE_DELAY * 2 ** attempt)
+            raise RuntimeError(f"{len(chunk)} key(s) still unprocessed after {BATCH_MAX_RETRIES} retries")
+
+        chunks = [list(keys[i:i + BATCH_GET_LIMIT]) for i in range(0, len(keys), BATCH_GET_LIMIT)]
+        results = await asyncio.gather(*(fetch_chunk(chunk) for chunk in chunks))
+        return [item for items in results for item in items]
+
+    async def batch_write(self, put_items: Sequence[Dict[str, Any]] = (),
+                          delete_keys: Sequence[Dict[str, Any]] = ()) -> List[Dict[str, Any]]:
+        """
+        Put and delete many items with BatchWriteItem
+
+        Requests are split into chunks of 25 that are written concurrently;
+        unprocessed requests are retried with exponential backoff.
+
+        Args:
+            put_items: Items to write
+            delete_keys: Primary keys to delete
+
+        Returns:
+            List[Dict[str, Any]]: Write requests still unprocessed after every retry
+        """
+        requests = [{"PutRequest": {"Item": item}} for item in put_items]
+        requests += [{"DeleteRequest": {"Key": key}} for key in delete_keys]
+
+        async def write_chunk(chunk):
+            for attempt in range(BATCH_MAX_RETRIES + 1):
+                chunk = await self._run(self._batch_write_sync, chunk)
+                if not chunk:
+                    return []
+                if attempt < BATCH_MAX_RETRIES:
+                    await asyncio.sleep(BATCH_RETRY_BASE_DELAY * 2 ** attempt)
+            return chunk
+
+        chunks = [requests[i:i + BATCH_WRITE_LIMIT] for i in range(0, len(requests), BATCH_WRITE_LIMIT)]
+        results = await asyncio.gather(*(write_chunk(chunk) for chunk in chunks))
+        return [request for unprocessed in results for request in unprocessed]
+
+    def _transact_write_sync(self, actions: List[Dict[str, Dict[str, Any]]]) -> None:
+        """One TransactWriteItems call (runs on a worker thread)"""
+        transact_items = []
+        for action in actions:
+            (kind, params), = action.items()
+            request = prepare_request(params)
+            request.setdefault("TableName", self.table_name)
+            transact_items.append({kind: request})
+        self._invoke("transact_write_items", TransactItems=transact_items)
+
+    async def transact_write(self, actions: List[Dict[str, Dict[str, Any]]]) -> None:
+        """
+        Apply several writes atomically with TransactWriteItems
+
+        Transactions cancelled only because another transaction was touching
+        the same items (TransactionConflict) are retried with exponential
+        backoff; any other cancellation is raised immediately.
+
+        Args:
+            actions: Up to TRANSACT_WRITE_LIMIT actions such as `{"Put": {"Item": ...}}`,
+                `{"Delete": {"Key": ...}}`, `{"Update": {...}}` or
+                `{"ConditionCheck": {...}}`, using resource-style parameters
+                (TableName defaults to this table)
+
+        Raises:
+            ClientError: TransactionCanceledException if any condition failed
+                (see `cancellation_reasons`) or conflicts outlasted the retries
+        """
+        for attempt in range(BATCH_MAX_RETRIES + 1):
+            try:
+                return await self._run(self._transact_write_sync, actions)
+            except ClientError as e:
+                reasons = cancellation_reasons(e)
+                conflict_only = "TransactionConflict" in reasons and set(reasons) <= {"TransactionConflict", "None"}
+                if not conflict_only or attempt == BATCH_MAX_RETRIES:
+                    raise
+            await asyncio.sleep(BATCH_RETRY_BASE_DELAY * 2 ** attempt)
+
+    def __repr__(self):
+        return f"<AsyncTable {self.table_name}>"
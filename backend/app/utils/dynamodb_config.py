@@ -2,18 +2,76 @@
 DynamoDB Configuration and Connection Management
 
 This module handles DynamoDB connection and configuration using boto3.
+
+Request-path code uses the `AsyncTable` wrappers (`get_async_jobs_table`,
+`get_async_users_table`, `get_async_archive_table`), which share one thread-safe client and run calls
+on a bounded worker pool instead of blocking the event loop.
+
+Nothing connects at import time: the boto3 session, client and worker pool
+are created on first use, or ahead of traffic by `warm_up` in the app's
+lifespan.
 """
 
+import asyncio
 import os
+import threading
 import boto3
 from boto3.dynamodb.conditions import Key, Attr
+from botocore.config import Config
 from botocore.exceptions import ClientError
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Dict, Optional
 from dotenv import load_dotenv
 
+from app.utils.dynamodb_async import AsyncTable, instrument_client
+from app.utils.models_dynamodb import JOB_SUMMARY_ATTRIBUTES
+
 # Load environment variables
 load_dotenv()
 
+# Concurrent DynamoDB calls; the HTTP connection pool defaults to the same
+# size so workers never wait for a connection
+DYNAMODB_MAX_WORKERS = int(os.getenv("DYNAMODB_MAX_WORKERS", "32"))
+DYNAMODB_MAX_POOL_CONNECTIONS = int(os.getenv("DYNAMODB_MAX_POOL_CONNECTIONS", str(DYNAMODB_MAX_WORKERS)))
+
+# Fail fast on unreachable or stalled connections instead of botocore's
+# 60 s defaults; the retry mode then retries them
+DYNAMODB_CONNECT_TIMEOUT = float(os.getenv("DYNAMODB_CONNECT_TIMEOUT", "2"))
+DYNAMODB_READ_TIMEOUT = float(os.getenv("DYNAMODB_READ_TIMEOUT", "5"))
+
+# "adaptive" adds client-side rate limiting when DynamoDB throttles
+DYNAMODB_RETRY_MODE = os.getenv("DYNAMODB_RETRY_MODE", "adaptive")
+DYNAMODB_MAX_ATTEMPTS = int(os.getenv("DYNAMODB_MAX_ATTEMPTS", "5"))
+
+# Keep idle pooled connections alive between bursts
+DYNAMODB_TCP_KEEPALIVE = os.getenv("DYNAMODB_TCP_KEEPALIVE", "true").lower() == "true"
+
+# Connections opened in parallel by `warm_up` at startup
+DYNAMODB_WARMUP_CONNECTIONS = int(os.getenv("DYNAMODB_WARMUP_CONNECTIONS", "4"))
+
+# Per-user status index: gsi1_pk = "user_id#status", gsi1_sk = created_at.
+# It only serves list queries, so it projects just the summary attributes:
+# index items stay small and reading them costs less capacity.
+USER_STATUS_INDEX = "user-status-index"
+USER_STATUS_INDEX_DEFINITION = {
+    'IndexName': USER_STATUS_INDEX,
+    'KeySchema': [
+        {
+            'AttributeName': 'gsi1_pk',
+            'KeyType': 'HASH'
+        },
+        {
+            'AttributeName': 'gsi1_sk',
+            'KeyType': 'RANGE'
+        }
+    ],
+    'Projection': {
+        'ProjectionType': 'INCLUDE',
+        'NonKeyAttributes': [name for name in JOB_SUMMARY_ATTRIBUTES if name not in ('user_id', 'job_id')]
+    }
+}
+
 class DynamoDBConfig:
     """DynamoDB configuration and connection management"""
     
@@ -23,18 +81,37 @@ class DynamoDBConfig:
         self.aws_secret_access_key = os.getenv("AWS_SECRET_ACCESS_KEY")
         self.aws_region = os.getenv("AWS_DEFAULT_REGION", "ap-south-1")
         
+        # Local DynamoDB (DynamoDB Local, moto server, ...) for development and benchmarks
+        use_local = os.getenv("USE_LOCAL_DYNAMODB", "false").lower() == "true"
+        self.endpoint_url = os.getenv("DYNAMODB_ENDPOINT_URL") if use_local else None
+        self.max_workers = DYNAMODB_MAX_WORKERS
+        
         # Table names
         self.jobs_table_name = os.getenv("DYNAMODB_JOBS_TABLE", "CareerVault-Jobs")
         self.users_table_name = os.getenv("DYNAMODB_USERS_TABLE", "CareerVault-Users")
+        # Cold store for old finished jobs (see app.utils.job_archive)
+        self.archive_table_name = os.getenv("DYNAMODB_JOBS_ARCHIVE_TABLE", "CareerVault-JobsArchive")
         
-        # Initialize DynamoDB resources
-        self.dynamodb_resource = None
-        self.dynamodb_client = None
-        self.jobs_table = None
-        self.users_table = None
+        # Created on first use (see `connect`), so importing the app stays cheap
+        self._dynamodb_resource = None
+        self._dynamodb_client = None
+        self._jobs_table = None
+        self._users_table = None
         
-        # Initialize connection
-        self._connect()
+        # Non-blocking access for request handlers
+        self._executor = None
+        self._async_jobs_table = None
+        self._async_users_table = None
+        self._async_archive_table = None
+        
+        self._connect_lock = threading.Lock()
+    
+    def connect(self):
+        """Create the DynamoDB client, resources and worker pool if not done yet (thread-safe)"""
+        if self._dynamodb_client is None:
+            with self._connect_lock:
+                if self._dynamodb_client is None:
+                    self._connect()
     
     def _connect(self):
         """Initialize DynamoDB connection"""
@@ -46,12 +123,29 @@ class DynamoDBConfig:
                 region_name=self.aws_region
             )
             
-            self.dynamodb_client = session.client('dynamodb')
-            self.dynamodb_resource = session.resource('dynamodb')
+            client_config = Config(
+                max_pool_connections=DYNAMODB_MAX_POOL_CONNECTIONS,
+                connect_timeout=DYNAMODB_CONNECT_TIMEOUT,
+                read_timeout=DYNAMODB_READ_TIMEOUT,
+                retries={'mode': DYNAMODB_RETRY_MODE, 'total_max_attempts': DYNAMODB_MAX_ATTEMPTS},
+                tcp_keepalive=DYNAMODB_TCP_KEEPALIVE
+            )
+            client = session.client('dynamodb', endpoint_url=self.endpoint_url, config=client_config)
+            self._dynamodb_resource = session.resource('dynamodb', endpoint_url=self.endpoint_url, config=client_config)
+            instrument_client(client)
             
             # Get table references
-            self.jobs_table = self.dynamodb_resource.Table(self.jobs_table_name)
-            self.users_table = self.dynamodb_resource.Table(self.users_table_name)
+            self._jobs_table = self._dynamodb_resource.Table(self.jobs_table_name)
+            self._users_table = self._dynamodb_resource.Table(self.users_table_name)
+            
+            # Worker pool shared by the async tables
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="dynamodb")
+            self._async_jobs_table = AsyncTable(client, self.jobs_table_name, self._executor)
+            self._async_users_table = AsyncTable(client, self.users_table_name, self._executor)
+            self._async_archive_table = AsyncTable(client, self.archive_table_name, self._executor)
+            
+            # Set last: `connect` checks it to see whether everything exists
+            self._dynamodb_client = client
             
             print(f"✅ Connected to DynamoDB in region {self.aws_region}")
             
@@ -59,6 +153,94 @@ class DynamoDBConfig:
             print(f"❌ Error connecting to DynamoDB: {e}")
             raise e
     
+    @property
+    def dynamodb_client(self):
+        self.connect()
+        return self._dynamodb_client
+    
+    @property
+    def dynamodb_resource(self):
+        self.connect()
+        return self._dynamodb_resource
+    
+    @property
+    def jobs_table(self):
+        self.connect()
+        return self._jobs_table
+    
+    @property
+    def users_table(self):
+        self.connect()
+        return self._users_table
+    
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        self.connect()
+        return self._executor
+    
+    @property
+    def async_jobs_table(self) -> AsyncTable:
+        self.connect()
+        return self._async_jobs_table
+    
+    @property
+    def async_users_table(self) -> AsyncTable:
+        self.connect()
+        return self._async_users_table
+    
+    @property
+    def async_archive_table(self) -> AsyncTable:
+        self.connect()
+        return self._async_archive_table
+    
+    async def warm_up(self, create_tables: bool = False) -> Dict[str, Any]:
+        """
+        Connect and open pooled connections without blocking the event loop
+        
+        Runs `connect` (and optionally table creation) on a thread, then
+        describes the tables with DYNAMODB_WARMUP_CONNECTIONS concurrent
+        calls so that many HTTPS connections are established before the
+        first request needs them. Without `create_tables`, a jobs table
+        without TTL is only reported. Failures are logged, not raised.
+        
+        Args:
+            create_tables: Create missing tables first (development)
+        
+        Returns:
+            Dict[str, Any]: Table descriptions by table name (missing on failure)
+        """
+        await asyncio.to_thread(self.connect)
+        if create_tables:
+            await asyncio.to_thread(self.create_tables_if_not_exist)
+        else:
+            try:
+                await asyncio.to_thread(self.ensure_time_to_live, False)
+            except Exception as e:
+                print(f"⚠️ Could not check TTL on {self.jobs_table_name}: {e}")
+        
+        table_names = [self.jobs_table_name, self.users_table_name, self.archive_table_name]
+        calls = max(len(table_names), min(DYNAMODB_WARMUP_CONNECTIONS, DYNAMODB_MAX_POOL_CONNECTIONS))
+        loop = asyncio.get_running_loop()
+        results = await asyncio.gather(*(
+            loop.run_in_executor(self._executor, partial(self._dynamodb_client.describe_table,
+                                                         TableName=table_names[index % len(table_names)]))
+            for index in range(calls)
+        ), return_exceptions=True)
+        
+        descriptions = {}
+        for result in results:
+            if isinstance(result, Exception):
+                print(f"⚠️ DynamoDB warm-up call failed: {result}")
+            else:
+                descriptions[result['Table']['TableName']] = result['Table']
+        print(f"✅ DynamoDB warmed up ({calls} connections, {len(descriptions)} tables described)")
+        return descriptions
+    
+    def shutdown(self):
+        """Wait for in-flight DynamoDB calls and stop the worker pool"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+    
     def create_tables_if_not_exist(self):
         """Create DynamoDB tables if they don't exist (for development)"""
         try:
@@ -66,6 +248,8 @@ class DynamoDBConfig:
             self._create_jobs_table()
             # Create Users table (for Cognito user metadata)
             self._create_users_table()
+            # Create the jobs archive table
+            self._create_archive_table()
             
         except ClientError as e:
             if e.response['Error']['Code'] != 'ResourceInUseException':
@@ -103,9 +287,18 @@ class DynamoDBConfig:
                     {
                         'AttributeName': 'created_at',
                         'AttributeType': 'S'
+                    },
+                    {
+                        'AttributeName': 'gsi1_pk',
+                        'AttributeType': 'S'
+                    },
+                    {
+                        'AttributeName': 'gsi1_sk',
+                        'AttributeType': 'S'
                     }
                 ],
                 GlobalSecondaryIndexes=[
+                    USER_STATUS_INDEX_DEFINITION,
                     {
                         'IndexName': 'status-created_at-index',
                         'KeySchema': [
@@ -140,14 +333,87 @@ class DynamoDBConfig:
             table_resource = self.dynamodb_resource.Table(self.jobs_table_name)
             table_resource.wait_until_exists()
             
+            self.ensure_time_to_live()
+            
             print(f"✅ Created jobs table: {self.jobs_table_name}")
             
         except ClientError as e:
             if e.response['Error']['Code'] == 'ResourceInUseException':
                 print(f"ℹ️ Jobs table {self.jobs_table_name} already exists")
+                self.ensure_user_status_index()
+                self.ensure_time_to_live()
             else:
                 raise e
     
+    def ensure_user_status_index(self):
+        """
+        Add the per-user status index to a jobs table created before it existed
+        
+        Items written before the index existed need their gsi1 keys backfilled
+        (python -m app.utils.dynamodb_migrations backfill-status-index).
+        """
+        description = self.dynamodb_client.describe_table(TableName=self.jobs_table_name)['Table']
+        indexes = {index['IndexName']: index for index in description.get('GlobalSecondaryIndexes', [])}
+        if USER_STATUS_INDEX in indexes:
+            projection = indexes[USER_STATUS_INDEX]['Projection']
+            wanted = USER_STATUS_INDEX_DEFINITION['Projection']['NonKeyAttributes']
+            missing = [name for name in wanted if name not in projection.get('NonKeyAttributes', [])]
+            if projection['ProjectionType'] == 'INCLUDE' and missing:
+                # A projection can't be changed in place, only by rebuilding the index
+                print(f"⚠️ {USER_STATUS_INDEX} does not project {', '.join(missing)}; status-filtered "
+                      f"lists return them empty until the index is rebuilt")
+            return
+        
+        self.dynamodb_client.update_table(
+            TableName=self.jobs_table_name,
+            AttributeDefinitions=[
+                {'AttributeName': 'gsi1_pk', 'AttributeType': 'S'},
+                {'AttributeName': 'gsi1_sk', 'AttributeType': 'S'}
+            ],
+            GlobalSecondaryIndexUpdates=[{'Create': USER_STATUS_INDEX_DEFINITION}]
+        )
+        print(f"✅ Creating index {USER_STATUS_INDEX} on {self.jobs_table_name}")
+    
+    def ensure_time_to_live(self, enable: bool = True) -> bool:
+        """
+        Check that TTL on the `ttl` attribute is on for the jobs table
+        
+        Idempotency-Key items (and jobs given a `ttl`) are only purged by
+        DynamoDB TTL, so without it they pile up.
+        
+        Args:
+            enable: Turn TTL on if it is off (otherwise only warn)
+        
+        Returns:
+            bool: Whether TTL on `ttl` is enabled (or being enabled)
+        """
+        description = self.dynamodb_client.describe_time_to_live(
+            TableName=self.jobs_table_name
+        )['TimeToLiveDescription']
+        status = description.get('TimeToLiveStatus', 'DISABLED')
+        if status in ('ENABLED', 'ENABLING'):
+            if description.get('AttributeName') == 'ttl':
+                return True
+            print(f"⚠️ TTL on {self.jobs_table_name} uses '{description.get('AttributeName')}', not 'ttl' - "
+                  f"Idempotency-Key items will not expire")
+            return False
+        
+        if not enable:
+            print(f"⚠️ TTL is {status.lower()} on {self.jobs_table_name} - Idempotency-Key items will not expire")
+            return False
+        
+        try:
+            self.dynamodb_client.update_time_to_live(
+                TableName=self.jobs_table_name,
+                TimeToLiveSpecification={'Enabled': True, 'AttributeName': 'ttl'}
+            )
+        except ClientError as e:
+            # Raced with another process enabling it
+            if 'already enabled' not in e.response['Error'].get('Message', ''):
+                raise
+        print(f"✅ Enabled TTL on {self.jobs_table_name}.ttl")
+        return True
+    
     def _create_users_table(self):
         """Create the users metadata table (for additional user data beyond Cognito)"""
         try:
@@ -208,7 +474,63 @@ class DynamoDBConfig:
             else:
                 raise e
 
-# Global DynamoDB instance
+    def _create_archive_table(self):
+        """Create the jobs archive table (same keys as the jobs table, TTL on `ttl`)"""
+        try:
+            self.dynamodb_client.create_table(
+                TableName=self.archive_table_name,
+                KeySchema=[
+                    {
+                        'AttributeName': 'user_id',
+                        'KeyType': 'HASH'  # Partition key
+                    },
+                    {
+                        'AttributeName': 'job_id',
+                        'KeyType': 'RANGE'  # Sort key
+                    }
+                ],
+                AttributeDefinitions=[
+                    {
+                        'AttributeName': 'user_id',
+                        'AttributeType': 'S'
+                    },
+                    {
+                        'AttributeName': 'job_id',
+                        'AttributeType': 'S'
+                    }
+                ],
+                BillingMode='PAY_PER_REQUEST',
+                Tags=[
+                    {
+                        'Key': 'Application',
+                        'Value': 'CareerVault'
+                    },
+                    {
+                        'Key': 'Environment',
+                        'Value': os.getenv('ENVIRONMENT', 'development')
+                    }
+                ]
+            )
+            
+            # Wait for table to be created
+            table_resource = self.dynamodb_resource.Table(self.archive_table_name)
+            table_resource.wait_until_exists()
+            
+            # Archived jobs with a retention period expire through DynamoDB TTL
+            self.dynamodb_client.update_time_to_live(
+                TableName=self.archive_table_name,
+                TimeToLiveSpecification={'Enabled': True, 'AttributeName': 'ttl'}
+            )
+            
+            print(f"✅ Created jobs archive table: {self.archive_table_name}")
+            
+        except ClientError as e:
+            if e.response['Error']['Code'] == 'ResourceInUseException':
+                print(f"ℹ️ Jobs archive table {self.archive_table_name} already exists")
+            else:
+                raise e
+
+# Global DynamoDB instance (connects on first use)
 dynamodb_config = DynamoDBConfig()
 
 # Convenience functions for getting table references
@@ -220,6 +542,18 @@ def get_users_table():
     """Get users table reference"""
     return dynamodb_config.users_table
 
+def get_async_jobs_table() -> AsyncTable:
+    """Get non-blocking jobs table"""
+    return dynamodb_config.async_jobs_table
+
+def get_async_users_table() -> AsyncTable:
+    """Get non-blocking users table"""
+    return dynamodb_config.async_users_table
+
+def get_async_archive_table() -> AsyncTable:
+    """Get non-blocking jobs archive table"""
+    return dynamodb_config.async_archive_table
+
 def get_dynamodb_client():
     """Get DynamoDB client"""
     return dynamodb_config.dynamodb_client
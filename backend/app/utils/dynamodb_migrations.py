@@ -0,0 +1,298 @@
+"""
+DynamoDB Data Migrations
+
+One-off backfills for job items written before a schema change. Each
+migration is idempotent (already migrated items are skipped), so it can be
+re-run after an interruption. The table is read with a parallel segmented
+scan (`app.utils.dynamodb_scan`); with --checkpoint an interrupted run
+resumes from the saved scan position instead of re-reading everything.
+
+Usage (from the backend directory):
+    python -m app.utils.dynamodb_migrations backfill-status-index --segments 16 --checkpoint backfill.json
+    python -m app.utils.dynamodb_migrations migrate-job-ids
+    python -m app.utils.dynamodb_migrations reconcile-job-counters
+    python -m app.utils.dynamodb_migrations compress-job-texts
+    python -m app.utils.dynamodb_migrations split-job-descriptions
+"""
+
+import argparse
+import asyncio
+from datetime import datetime
+from typing import Optional
+
+from boto3.dynamodb.conditions import Attr
+from botocore.exceptions import ClientError
+
+from app.utils.dynamodb_async import AsyncTable
+from app.utils.dynamodb_config import get_async_jobs_table
+from app.utils.dynamodb_scan import (
+    DYNAMODB_SCAN_SEGMENTS, AggregateSink, MigrationSink, ParallelScan, ScanCheckpoint
+)
+from app.utils.ids import is_ulid, new_ulid
+from app.utils.dynamodb_service import JobRepository
+from app.utils.models_dynamodb import COMPRESSED_TEXT_FIELDS, JobItem, description_key, is_job_id
+from app.utils.text_compression import load_text, stored_text
+
+# Concurrent item updates per migration
+MIGRATION_CONCURRENCY = 16
+
+
+async def backfill_status_index(table: Optional[AsyncTable] = None, segments: int = DYNAMODB_SCAN_SEGMENTS,
+                                checkpoint: Optional[ScanCheckpoint] = None) -> int:
+    """
+    Populate gsi1_pk/gsi1_sk (`user_id#status`, `created_at`) on every job
+
+    Args:
+        table: Jobs table (defaults to the configured one)
+        segments: Parallel scan segments
+        checkpoint: Scan progress to resume from / save to
+
+    Returns:
+        int: Number of items updated
+    """
+    table = table or get_async_jobs_table()
+
+    async def update(item) -> int:
+        if not is_job_id(item['job_id']):
+            return 0
+        expected_pk = JobItem.status_key(item['user_id'], item['status'])
+        if item.get('gsi1_pk') == expected_pk and item.get('gsi1_sk') == item['created_at']:
+            return 0
+
+        await table.update_item(
+            Key={'user_id': item['user_id'], 'job_id': item['job_id']},
+            UpdateExpression='SET gsi1_pk = :pk, gsi1_sk = :sk',
+            ExpressionAttributeValues={
+                ':pk': JobItem.status_key(item['user_id'], item['status']),
+                ':sk': item['created_at']
+            }
+        )
+        return 1
+
+    sink = MigrationSink(update, MIGRATION_CONCURRENCY)
+    await ParallelScan(
+        table, segments, checkpoint=checkpoint,
+        ProjectionExpression='user_id, job_id, #status, created_at, gsi1_pk, gsi1_sk',
+        ExpressionAttributeNames={'#status': 'status'}
+    ).run(sink)
+    return sink.updated
+
+
+async def migrate_job_ids(table: Optional[AsyncTable] = None, segments: int = DYNAMODB_SCAN_SEGMENTS,
+                          checkpoint: Optional[ScanCheckpoint] = None) -> int:
+    """
+    Re-key jobs created with uuid4 IDs to time-ordered ULIDs
+
+    The new ID encodes the job's `created_at`, so migrated jobs sort among
+    new ones by creation time. Each job is copied to its new key and the old
+    item deleted in one transaction; the old ID is kept as `legacy_job_id`.
+    A description already split into its `#DESC#` item is moved to the new
+    ID in the same transaction.
+
+    Args:
+        table: Jobs table (defaults to the configured one)
+        segments: Parallel scan segments
+        checkpoint: Scan progress to resume from / save to
+
+    Returns:
+        int: Number of items re-keyed
+    """
+    table = table or get_async_jobs_table()
+
+    async def rekey(item) -> int:
+        if is_ulid(item['job_id']) or not is_job_id(item['job_id']):
+            return 0
+
+        created_at = datetime.fromisoformat(item['created_at'].replace('Z', '+00:00'))
+        new_item = {**item, 'job_id': new_ulid(created_at), 'legacy_job_id': item['job_id']}
+        actions = [
+            {'Put': {'Item': new_item, 'ConditionExpression': 'attribute_not_exists(job_id)'}},
+            {'Delete': {
+                'Key': {'user_id': item['user_id'], 'job_id': item['job_id']},
+                'ConditionExpression': 'attribute_exists(job_id)'
+            }}
+        ]
+        old_description_key = {'user_id': item['user_id'], 'job_id': description_key(item['job_id'])}
+        description = (await table.get_item(Key=old_description_key, ConsistentRead=True)).get('Item')
+        if description is not None:
+            actions += [
+                {'Put': {'Item': {**description, 'job_id': description_key(new_item['job_id'])}}},
+                {'Delete': {
+                    'Key': old_description_key,
+                    'ConditionExpression': 'updated_at = :seen',
+                    'ExpressionAttributeValues': {':seen': description['updated_at']}
+                }}
+            ]
+        try:
+            await table.transact_write(actions)
+            return 1
+        except ClientError as e:
+            # Deleted, description edited, or already migrated by a concurrent run
+            if e.response['Error']['Code'] == 'TransactionCanceledException':
+                return 0
+            raise
+
+    sink = MigrationSink(rekey, MIGRATION_CONCURRENCY)
+    await ParallelScan(table, segments, checkpoint=checkpoint).run(sink)
+    return sink.updated
+
+
+async def reconcile_job_counters(table: Optional[AsyncTable] = None, segments: int = DYNAMODB_SCAN_SEGMENTS,
+                                 checkpoint: Optional[ScanCheckpoint] = None) -> int:
+    """
+    Rebuild every user's status counters item from their jobs
+
+    Run once after deploying the counters, and whenever drift is suspected.
+
+    Args:
+        table: Jobs table (defaults to the configured one)
+        segments: Parallel scan segments
+        checkpoint: Scan progress to resume from / save to
+
+    Returns:
+        int: Number of users reconciled
+    """
+    repository = JobRepository(table)
+    users = AggregateSink('user_id')
+    await ParallelScan(repository.table, segments, checkpoint=checkpoint, ProjectionExpression='user_id').run(users)
+
+    user_ids = sorted(users.counts)
+    for start in range(0, len(user_ids), MIGRATION_CONCURRENCY):
+        batch = user_ids[start:start + MIGRATION_CONCURRENCY]
+        await asyncio.gather(*(repository.reconcile_user_counters(user_id) for user_id in batch))
+    return len(user_ids)
+
+
+async def compress_job_texts(table: Optional[AsyncTable] = None, segments: int = DYNAMODB_SCAN_SEGMENTS,
+                             checkpoint: Optional[ScanCheckpoint] = None) -> int:
+    """
+    Rewrite long job_description/notes strings in their compressed form
+
+    Each update is conditional on the text still being the one read, so a
+    concurrent edit (which is written compressed anyway) is left alone.
+
+    Args:
+        table: Jobs table (defaults to the configured one)
+        segments: Parallel scan segments
+        checkpoint: Scan progress to resume from / save to
+
+    Returns:
+        int: Number of items updated
+    """
+    table = table or get_async_jobs_table()
+
+    async def compress(item) -> int:
+        if not is_job_id(item['job_id']):
+            return 0
+        names, values, assignments, conditions = {}, {}, [], []
+        for index, field in enumerate(COMPRESSED_TEXT_FIELDS):
+            text = item.get(field)
+            compressed = stored_text(text) if isinstance(text, str) else None
+            if not isinstance(compressed, bytes):
+                continue
+            names[f'#t{index}'] = field
+            values[f':new{index}'] = compressed
+            values[f':old{index}'] = text
+            assignments.append(f'#t{index} = :new{index}')
+            conditions.append(f'#t{index} = :old{index}')
+        if not assignments:
+            return 0
+        try:
+            await table.update_item(
+                Key={'user_id': item['user_id'], 'job_id': item['job_id']},
+                UpdateExpression='SET ' + ', '.join(assignments),
+                ConditionExpression=' AND '.join(conditions),
+                ExpressionAttributeNames=names,
+                ExpressionAttributeValues=values
+            )
+            return 1
+        except ClientError as e:
+            if e.response['Error']['Code'] == 'ConditionalCheckFailedException':
+                return 0
+            raise
+
+    sink = MigrationSink(compress, MIGRATION_CONCURRENCY)
+    await ParallelScan(
+        table, segments, checkpoint=checkpoint,
+        ProjectionExpression='user_id, job_id, ' + ', '.join(COMPRESSED_TEXT_FIELDS)
+    ).run(sink)
+    return sink.updated
+
+
+async def split_job_descriptions(table: Optional[AsyncTable] = None, segments: int = DYNAMODB_SCAN_SEGMENTS,
+                                 checkpoint: Optional[ScanCheckpoint] = None) -> int:
+    """
+    Move job descriptions stored on job items to their own `#DESC#<job_id>` items
+
+    The description item is written and the attribute removed from the job
+    in one transaction, conditional on the job being unchanged since it was
+    read; a job edited meanwhile is picked up by the next run. Until then
+    reads fall back to the inline description.
+
+    Args:
+        table: Jobs table (defaults to the configured one)
+        segments: Parallel scan segments
+        checkpoint: Scan progress to resume from / save to
+
+    Returns:
+        int: Number of jobs split
+    """
+    table = table or get_async_jobs_table()
+
+    async def split(item) -> int:
+        if not is_job_id(item['job_id']):
+            return 0
+        try:
+            await table.transact_write([
+                {'Put': {'Item': {
+                    'user_id': item['user_id'],
+                    'job_id': description_key(item['job_id']),
+                    'job_description': stored_text(load_text(item['job_description'])),
+                    'updated_at': item['updated_at']
+                }}},
+                {'Update': {
+                    'Key': {'user_id': item['user_id'], 'job_id': item['job_id']},
+                    'UpdateExpression': 'REMOVE job_description',
+                    'ConditionExpression': 'updated_at = :seen',
+                    'ExpressionAttributeValues': {':seen': item['updated_at']}
+                }}
+            ])
+            return 1
+        except ClientError as e:
+            # Changed or deleted since it was read
+            if e.response['Error']['Code'] == 'TransactionCanceledException':
+                return 0
+            raise
+
+    sink = MigrationSink(split, MIGRATION_CONCURRENCY)
+    await ParallelScan(
+        table, segments, checkpoint=checkpoint,
+        ProjectionExpression='user_id, job_id, job_description, updated_at',
+        FilterExpression=Attr('job_description').attribute_type('S') | Attr('job_description').attribute_type('B')
+    ).run(sink)
+    return sink.updated
+
+
+MIGRATIONS = {
+    "backfill-status-index": backfill_status_index,
+    "migrate-job-ids": migrate_job_ids,
+    "reconcile-job-counters": reconcile_job_counters,
+    "compress-job-texts": compress_job_texts,
+    "split-job-descriptions": split_job_descriptions,
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run a DynamoDB data migration")
+    parser.add_argument("migration", choices=sorted(MIGRATIONS))
+    parser.add_argument("--segments", type=int, default=DYNAMODB_SCAN_SEGMENTS, help="Parallel scan segments")
+    parser.add_argument("--checkpoint", help="Scan progress file; an existing one is resumed (delete it to start over)")
+    args = parser.parse_args()
+
+    checkpoint = ScanCheckpoint(args.checkpoint) if args.checkpoint else None
+    updated = asyncio.run(MIGRATIONS[args.migration](segments=args.segments, checkpoint=checkpoint))
+    print(f"✅ {args.migration}: updated {updated} item(s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,419 @@
+"""
+Parallel DynamoDB Table Scans
+
+Whole-table work (backfills, reindexing, global stats, exports) has no key
+to query by, and a plain Scan reads one page at a time from one partition.
+`ParallelScan` splits the table into `Segment`/`TotalSegments` slices and
+reads them concurrently:
+
+- A pool of workers takes segments from a queue (more segments than
+  workers is fine: each worker scans its segments one after another)
+- Consumed read capacity of every page is charged to a limiter shared by
+  all segments, keeping the scan under `max_rcu_per_second` so it doesn't
+  starve (or throttle) the application's own reads
+- Pages are handed to a sink: `AggregateSink` (counts per attribute value),
+  `JsonLinesExportSink` (export file) or `MigrationSink` (per-item writes)
+- With a `ScanCheckpoint`, each segment's position and the sink's state are
+  saved after every page, so an interrupted scan resumes where it stopped
+  instead of starting over
+
+Usage (from the backend directory):
+    python -m app.utils.dynamodb_scan stats --group-by status --segments 8 --max-rcu 100
+    python -m app.utils.dynamodb_scan export --output jobs.jsonl --checkpoint jobs-export.json
+"""
+
+import argparse
+import asyncio
+import base64
+import json
+import os
+import time
+from collections import Counter
+from decimal import Decimal
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from boto3.dynamodb.conditions import Attr
+
+from app.utils.dynamodb_async import AsyncTable, deserialize_item, serialize_item
+from app.utils.metrics import metrics
+from app.utils.models_dynamodb import AUXILIARY_KEY_PREFIX
+
+# Segments a table is split into, and scan pages read concurrently
+DYNAMODB_SCAN_SEGMENTS = int(os.getenv("DYNAMODB_SCAN_SEGMENTS", "8"))
+DYNAMODB_SCAN_CONCURRENCY = int(os.getenv("DYNAMODB_SCAN_CONCURRENCY", str(DYNAMODB_SCAN_SEGMENTS)))
+
+# Read capacity units per second a scan may consume (0 = unlimited)
+DYNAMODB_SCAN_MAX_RCU = float(os.getenv("DYNAMODB_SCAN_MAX_RCU", "0"))
+
+
+class CapacityLimiter:
+    """
+    Rate limit on consumed capacity, shared by concurrent requests
+
+    Capacity is only known once a page comes back, so it is charged after
+    the fact: each charge pushes back the time the next request may start by
+    `units / units_per_second`. Requests already in flight aren't held back,
+    so the rate can briefly overshoot by one page per worker.
+    """
+
+    def __init__(self, units_per_second: float):
+        self.units_per_second = units_per_second
+        self._available_at = time.monotonic()
+
+    async def wait(self) -> None:
+        """Sleep until the capacity consumed so far has been paid off"""
+        if self.units_per_second <= 0:
+            return
+        delay = self._available_at - time.monotonic()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def consume(self, units: float) -> None:
+        if self.units_per_second > 0:
+            self._available_at = max(self._available_at, time.monotonic()) + units / self.units_per_second
+
+
+class ScanSink:
+    """
+    Receives the items of a scan, one page at a time
+
+    Pages of different segments arrive concurrently and in no particular
+    order. `state`/`restore` let a checkpointed scan resume with the results
+    of the pages already processed.
+    """
+
+    async def write(self, items: List[Dict[str, Any]]) -> None:
+        raise NotImplementedError
+
+    async def close(self) -> None:
+        pass
+
+    def state(self) -> Any:
+        """JSON-serializable progress, saved in checkpoints"""
+        return None
+
+    def restore(self, state: Any) -> None:
+        """Continue from the `state` of a checkpoint"""
+
+
+class AggregateSink(ScanSink):
+    """Counts items per value of an attribute (or of a key function)"""
+
+    def __init__(self, group_by: str = None, key: Callable[[Dict[str, Any]], Any] = None):
+        """
+        Args:
+            group_by: Attribute to count by (missing values count as None)
+            key: Function returning the group of an item (instead of `group_by`)
+        """
+        self.key = key or (lambda item: item.get(group_by))
+        self.counts = Counter()
+
+    async def write(self, items: List[Dict[str, Any]]) -> None:
+        self.counts.update(str(self.key(item)) for item in items)
+
+    def state(self) -> Any:
+        return dict(self.counts)
+
+    def restore(self, state: Any) -> None:
+        self.counts = Counter(state or {})
+
+
+def _json_default(value: Any) -> Any:
+    """JSON form of the non-JSON types boto3 deserializes to"""
+    if isinstance(value, Decimal):
+        return int(value) if value == value.to_integral_value() else float(value)
+    if isinstance(value, (set, frozenset)):
+        return sorted(value, key=str)
+    if hasattr(value, "value") or isinstance(value, (bytes, bytearray)):
+        return base64.b64encode(bytes(getattr(value, "value", value))).decode("ascii")
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+class JsonLinesExportSink(ScanSink):
+    """
+    Writes every item as one JSON line
+
+    Numbers are written as JSON numbers, binary values base64-encoded and
+    sets as lists. The saved state is the file size after the last
+    checkpointed page; on resume the file is truncated back to it, so lines
+    of pages that will be read again aren't duplicated.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = None
+        self.written = 0
+
+    def _open(self, offset: int = 0):
+        if self._file is None:
+            self._file = open(self.path, "r+b" if offset else "wb")
+            self._file.truncate(offset)
+            self._file.seek(offset)
+        return self._file
+
+    async def write(self, items: List[Dict[str, Any]]) -> None:
+        lines = "".join(json.dumps(item, default=_json_default, ensure_ascii=False) + "\n" for item in items)
+        file = self._open()
+        file.write(lines.encode("utf-8"))
+        file.flush()
+        self.written += len(items)
+
+    async def close(self) -> None:
+        self._open().close()
+        self._file = None
+
+    def state(self) -> Any:
+        return {"offset": self._file.tell() if self._file else 0, "written": self.written}
+
+    def restore(self, state: Any) -> None:
+        state = state or {}
+        self.written = state.get("written", 0)
+        self._open(state.get("offset", 0))
+
+
+class MigrationSink(ScanSink):
+    """
+    Applies a write to every scanned item (backfills, reindexing)
+
+    `apply` returns the number of items it changed (0 for items that need
+    nothing). Items of a page resumed from a checkpoint may be applied
+    twice, so `apply` must be idempotent (conditional writes, or a check of
+    the item's current state).
+    """
+
+    def __init__(self, apply: Callable[[Dict[str, Any]], Awaitable[int]], concurrency: int = 16):
+        """
+        Args:
+            apply: Coroutine function writing one item's migration
+            concurrency: Items applied concurrently (across all segments)
+        """
+        self.apply = apply
+        self.semaphore = asyncio.Semaphore(concurrency)
+        self.updated = 0
+
+    async def _apply(self, item: Dict[str, Any]) -> int:
+        async with self.semaphore:
+            return await self.apply(item)
+
+    async def write(self, items: List[Dict[str, Any]]) -> None:
+        # Add after the await: segments write concurrently, so `+=` around it would lose updates
+        updated = sum(await asyncio.gather(*(self._apply(item) for item in items)))
+        self.updated += updated
+
+    def state(self) -> Any:
+        return {"updated": self.updated}
+
+    def restore(self, state: Any) -> None:
+        self.updated = (state or {}).get("updated", 0)
+
+
+class ScanCheckpoint:
+    """
+    Progress of a parallel scan in a JSON file
+
+    Holds the segment count, each segment's last evaluated key (DynamoDB
+    JSON) or completion, and the sink's state. Written atomically (temporary
+    file + rename), so a crash mid-write leaves the previous checkpoint.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.total_segments = None
+        self.segments: Dict[int, Dict[str, Any]] = {}
+        self.sink_state = None
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as file:
+                saved = json.load(file)
+            self.total_segments = saved["total_segments"]
+            self.segments = {int(segment): state for segment, state in saved["segments"].items()}
+            self.sink_state = saved.get("sink")
+
+    @property
+    def resumed(self) -> bool:
+        return self.total_segments is not None
+
+    def start(self, total_segments: int) -> None:
+        """Begin a new scan, or check that a resumed one has the same layout"""
+        if self.total_segments is None:
+            self.total_segments = total_segments
+        elif self.total_segments != total_segments:
+            raise ValueError(
+                f"Checkpoint {self.path} is for {self.total_segments} segments, not {total_segments}"
+            )
+
+    def is_done(self, segment: int) -> bool:
+        return self.segments.get(segment, {}).get("done", False)
+
+    def last_key(self, segment: int) -> Optional[Dict[str, Any]]:
+        key = self.segments.get(segment, {}).get("last_key")
+        return deserialize_item(key) if key else None
+
+    def update(self, segment: int, last_key: Optional[Dict[str, Any]], sink_state: Any) -> None:
+        """Record a processed page and save"""
+        self.segments[segment] = {"last_key": serialize_item(last_key) if last_key else None, "done": not last_key}
+        self.sink_state = sink_state
+        self.save()
+
+    def save(self) -> None:
+        temporary = f"{self.path}.tmp"
+        with open(temporary, "w", encoding="utf-8") as file:
+            json.dump({
+                "total_segments": self.total_segments,
+                "segments": {str(segment): state for segment, state in sorted(self.segments.items())},
+                "sink": self.sink_state
+            }, file)
+        os.replace(temporary, self.path)
+
+
+class ParallelScan:
+    """Scans a table in concurrent segments into a sink (see module docstring)"""
+
+    def __init__(self, table: AsyncTable, segments: int = DYNAMODB_SCAN_SEGMENTS,
+                 concurrency: int = None, max_rcu_per_second: float = DYNAMODB_SCAN_MAX_RCU,
+                 checkpoint: Optional[ScanCheckpoint] = None, **scan_kwargs):
+        """
+        Args:
+            table: Table to scan
+            segments: TotalSegments the table is split into
+            concurrency: Segments scanned at the same time (defaults to
+                DYNAMODB_SCAN_CONCURRENCY, at most `segments`)
+            max_rcu_per_second: Consumed read capacity limit (0 = unlimited)
+            checkpoint: Saves progress after every page and resumes from it
+            **scan_kwargs: Scan parameters (ProjectionExpression,
+                FilterExpression, Limit for the page size, ...)
+        """
+        self.table = table
+        self.segments = segments
+        self.concurrency = min(concurrency or DYNAMODB_SCAN_CONCURRENCY, segments)
+        self.limiter = CapacityLimiter(max_rcu_per_second)
+        self.checkpoint = checkpoint
+        self.scan_kwargs = scan_kwargs
+        self.stats = {"pages": 0, "items": 0, "scanned": 0, "consumed_rcu": 0.0}
+
+    async def _scan_segment(self, segment: int, sink: ScanSink) -> None:
+        params = dict(self.scan_kwargs, Segment=segment, TotalSegments=self.segments)
+        last_key = self.checkpoint.last_key(segment) if self.checkpoint else None
+        while True:
+            if last_key:
+                params["ExclusiveStartKey"] = last_key
+            await self.limiter.wait()
+            response = await self.table.scan(**params)
+            consumed = response.get("ConsumedCapacity", {}).get("CapacityUnits", 0)
+            self.limiter.consume(consumed)
+
+            items = response.get("Items", [])
+            if items:
+                await sink.write(items)
+            last_key = response.get("LastEvaluatedKey")
+            if self.checkpoint:
+                self.checkpoint.update(segment, last_key, sink.state())
+
+            self.stats["pages"] += 1
+            self.stats["items"] += len(items)
+            self.stats["scanned"] += response.get("ScannedCount", len(items))
+            self.stats["consumed_rcu"] += consumed
+            metrics.increment("dynamodb_scan_items", len(items), table=self.table.table_name)
+            if not last_key:
+                return
+
+    async def run(self, sink: ScanSink) -> Dict[str, float]:
+        """
+        Scan every (remaining) segment into `sink` and close it
+
+        Args:
+            sink: Receives the items page by page
+
+        Returns:
+            Dict[str, float]: Pages, items returned, items scanned, consumed
+            RCU and seconds taken by this run (not counting resumed work)
+
+        Raises:
+            ValueError: If the checkpoint was made with another segment count
+        """
+        start = time.perf_counter()
+        pending = list(range(self.segments))
+        if self.checkpoint:
+            if self.checkpoint.resumed:
+                sink.restore(self.checkpoint.sink_state)
+            self.checkpoint.start(self.segments)
+            pending = [segment for segment in pending if not self.checkpoint.is_done(segment)]
+
+        queue = asyncio.Queue()
+        for segment in pending:
+            queue.put_nowait(segment)
+
+        async def worker():
+            while not queue.empty():
+                await self._scan_segment(queue.get_nowait(), sink)
+
+        workers = [asyncio.create_task(worker()) for _ in range(self.concurrency)]
+        try:
+            await asyncio.gather(*workers)
+        except BaseException:
+            # Stop the other segments; the checkpoint keeps what was processed
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+            raise
+        finally:
+            await sink.close()
+        self.stats["seconds"] = time.perf_counter() - start
+        return self.stats
+
+
+def job_items_filter():
+    """Filter for job items only (skips counters and other auxiliary items of the jobs table)"""
+    return Attr('job_id').not_exists() | ~Attr('job_id').begins_with(AUXILIARY_KEY_PREFIX)
+
+
+def main():
+    from app.utils.dynamodb_config import dynamodb_config
+
+    tables = {
+        "jobs": lambda: dynamodb_config.async_jobs_table,
+        "users": lambda: dynamodb_config.async_users_table,
+        "archive": lambda: dynamodb_config.async_archive_table,
+    }
+    parser = argparse.ArgumentParser(description="Scan a DynamoDB table in parallel segments")
+    parser.add_argument("command", choices=["stats", "export"])
+    parser.add_argument("--table", choices=sorted(tables), default="jobs")
+    parser.add_argument("--group-by", default="status", help="Attribute to count by (stats)")
+    parser.add_argument("--output", help="JSON lines file (export)")
+    parser.add_argument("--segments", type=int, default=DYNAMODB_SCAN_SEGMENTS)
+    parser.add_argument("--concurrency", type=int, default=DYNAMODB_SCAN_CONCURRENCY)
+    parser.add_argument("--max-rcu", type=float, default=DYNAMODB_SCAN_MAX_RCU,
+                        help="Consumed read capacity per second (0 = unlimited)")
+    parser.add_argument("--checkpoint", help="Progress file; an existing one is resumed (delete it to start over)")
+    args = parser.parse_args()
+    if args.command == "export" and not args.output:
+        parser.error("export needs --output")
+
+    scan_kwargs = {}
+    if args.table == "jobs":
+        scan_kwargs["FilterExpression"] = job_items_filter()
+    if args.command == "stats":
+        sink = AggregateSink(args.group_by)
+        scan_kwargs.update(ProjectionExpression="#group", ExpressionAttributeNames={"#group": args.group_by})
+    else:
+        sink = JsonLinesExportSink(args.output)
+
+    scan = ParallelScan(
+        tables[args.table](), segments=args.segments, concurrency=args.concurrency, max_rcu_per_second=args.max_rcu,
+        checkpoint=ScanCheckpoint(args.checkpoint) if args.checkpoint else None, **scan_kwargs
+    )
+    try:
+        stats = asyncio.run(scan.run(sink))
+    finally:
+        dynamodb_config.shutdown()
+
+    if args.command == "stats":
+        for value, count in sink.counts.most_common():
+            print(f"{value:<30} {count:>10}")
+    else:
+        print(f"📦 Exported {sink.written} item(s) to {args.output}")
+    print(f"✅ {stats['items']} item(s) of {stats['scanned']} scanned in {stats['seconds']:.1f}s "
+          f"({stats['consumed_rcu']:.1f} RCU, {args.segments} segments)")
+
+
+if __name__ == "__main__":
+    main()
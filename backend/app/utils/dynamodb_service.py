@@ -3,25 +3,170 @@ DynamoDB Repository Services
 
 This module provides repository patterns for DynamoDB operations,
 replacing the MongoDB services with DynamoDB-compatible implementations.
+
+Repositories talk to `AsyncTable`s, so every DynamoDB round trip runs on the
+DynamoDB worker pool and never blocks the event loop. Tables can be passed
+in explicitly (e.g. pointing at a local DynamoDB for benchmarks); otherwise
+the shared tables are looked up on first use, so creating the module-level
+repositories doesn't connect to DynamoDB.
 """
 
-from typing import List, Optional, Dict, Any
-from datetime import datetime
+import asyncio
+import time
+from typing import List, Optional, Dict, Any, AsyncIterator, Union
+from collections import Counter
+from datetime import datetime, timezone
 from boto3.dynamodb.conditions import Key, Attr
 from botocore.exceptions import ClientError
-from app.utils.dynamodb_config import get_jobs_table, get_users_table
+from app.utils.dynamodb_async import AsyncTable, TRANSACT_WRITE_LIMIT, cancellation_reasons
+from app.utils.dynamodb_config import (
+    get_async_jobs_table, get_async_users_table, get_async_archive_table, USER_STATUS_INDEX
+)
 from app.utils.models_dynamodb import (
-    JobItem, JobCreateRequest, JobUpdateRequest, JobResponse,
-    UserMetadata, JobStatus
+    JobItem, ArchivedJobItem, JobCreateRequest, JobUpdateRequest, JobResponse, JobSummary, JobPage,
+    UserMetadata, JobStatus, BulkItemResult, COUNTERS_JOB_ID, JOB_ID_MIN, JOB_SUMMARY_ATTRIBUTES,
+    JOB_SUMMARY_LIST_ADAPTER, description_key, idempotency_key, is_job_id
+)
+from app.utils.pagination import encode_continuation_token, decode_continuation_token
+from app.utils.ids import ulid_range
+from app.utils.cache import ReadThroughCache
+from app.utils.idempotency import (
+    IdempotencyStore, StoredResponse, IDEMPOTENCY_TTL_SECONDS, replay, reservation_times
 )
-import uuid
+from app.utils.text_compression import CompressedText, load_text, stored_text, text_value
+from app.utils.write_behind import PartialFlushError, WriteBehindBuffer
+
+# Attempts at a conditional write when the item changes between read and write
+STATUS_WRITE_ATTEMPTS = 3
+
+# List queries only read the JobSummary attributes (placeholders avoid reserved words)
+SUMMARY_PROJECTION = {
+    'ProjectionExpression': ', '.join(f'#a{index}' for index in range(len(JOB_SUMMARY_ATTRIBUTES))),
+    'ExpressionAttributeNames': {f'#a{index}': name for index, name in enumerate(JOB_SUMMARY_ATTRIBUTES)}
+}
+
+# Read-through caches for single-item lookups (writes below keep them current)
+job_cache = ReadThroughCache("dynamodb_jobs", JobItem)
+user_metadata_cache = ReadThroughCache("dynamodb_user_metadata", UserMetadata)
+
+
+def _iso_bound(value: Optional[datetime], default: str) -> str:
+    """Format a datetime like stored timestamps (naive UTC ISO) for key conditions"""
+    if value is None:
+        return default
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value.isoformat()
+
+
+def _condition_failed(error: ClientError) -> bool:
+    """Check whether a write (or a transaction) failed on a condition check"""
+    return (error.response['Error']['Code'] == 'ConditionalCheckFailedException'
+            or 'ConditionalCheckFailed' in cancellation_reasons(error))
+
+
+# Errors a retry can't fix: the deferred update is logged and dropped
+_NON_RETRYABLE_UPDATE_ERRORS = {'ValidationException', 'SerializationException'}
 
 
 class JobRepository:
-    """Repository for job-related DynamoDB operations"""
+    """
+    Repository for job-related DynamoDB operations
+    
+    Each user's partition also holds a counters item (sort key `#COUNTERS`)
+    with one attribute per status plus `total`. Every write that creates,
+    deletes or re-statuses a job updates it in the same transaction, so
+    stats are a single GetItem.
+    
+    A job's description lives in its own item (sort key `#DESC#<job_id>`),
+    written and deleted in the same transaction as the job. Lists, stats
+    and updates never read it; single-job reads fetch it only when asked
+    (`include_description`), in the same BatchGetItem as the job.
+    
+    Single-job reads go through `job_cache`; writes store or invalidate the
+    cached item (without the description) once they succeed.
+    
+    Old finished jobs can be moved to the archive table (`archive_jobs`,
+    driven by app.utils.job_archive), which keeps them out of every hot
+    query; the counters item counts them under `archived`. They are read on
+    demand (`get_archived_jobs_page`, `get_job_by_id(include_archived=True)`)
+    and can be moved back with `restore_job`.
+    """
+    
+    def __init__(self, table: Optional[AsyncTable] = None, archive_table: Optional[AsyncTable] = None):
+        self._table = table
+        self._archive_table = archive_table
     
-    def __init__(self):
-        self.table = get_jobs_table()
+    @property
+    def table(self) -> AsyncTable:
+        """The table passed in, or the shared jobs table (connects on first use)"""
+        return self._table or get_async_jobs_table()
+    
+    @property
+    def archive_table(self) -> AsyncTable:
+        """The archive table passed in, or the shared jobs archive table"""
+        return self._archive_table or get_async_archive_table()
+    
+    @staticmethod
+    def _counters_key(user_id: str) -> Dict[str, str]:
+        return {'user_id': user_id, 'job_id': COUNTERS_JOB_ID}
+    
+    def _counters_update(self, user_id: str, deltas: Dict[str, int]) -> Dict[str, Any]:
+        """
+        Build the transaction action that applies count changes to a user's counters
+        
+        Args:
+            user_id: Cognito user ID
+            deltas: Change per status value (and 'total')
+        
+        Returns:
+            Dict[str, Any]: `Update` action for AsyncTable.transact_write
+        """
+        names = {'#version': 'version'}
+        values = {':one': 1, ':now': datetime.utcnow().isoformat()}
+        additions = ['#version :one']
+        for index, (field, delta) in enumerate(deltas.items()):
+            if delta:
+                names[f'#f{index}'] = field
+                values[f':d{index}'] = delta
+                additions.append(f'#f{index} :d{index}')
+        
+        return {'Update': {
+            'Key': self._counters_key(user_id),
+            'UpdateExpression': f"ADD {', '.join(additions)} SET updated_at = :now",
+            'ExpressionAttributeNames': names,
+            'ExpressionAttributeValues': values
+        }}
+    
+    @staticmethod
+    def _expect_status(params: Dict[str, Any], status: str) -> Dict[str, Any]:
+        """Make a job write conditional on the job still having `status`"""
+        params['ConditionExpression'] = '#status = :expected_status'
+        params.setdefault('ExpressionAttributeNames', {})['#status'] = 'status'
+        params.setdefault('ExpressionAttributeValues', {})[':expected_status'] = status
+        return params
+    
+    @classmethod
+    def _expect_unchanged(cls, params: Dict[str, Any], item: JobItem) -> Dict[str, Any]:
+        """Make a job write conditional on the job being unchanged since `item` was read"""
+        cls._expect_status(params, item.status)
+        params['ConditionExpression'] += ' AND updated_at = :expected_updated_at'
+        params['ExpressionAttributeValues'][':expected_updated_at'] = item.updated_at
+        return params
+    
+    @staticmethod
+    def _cache_key(user_id: str, job_id: str) -> str:
+        return f"{user_id}:{job_id}"
+    
+    @staticmethod
+    def _description_write(job_item: JobItem) -> List[Dict[str, Any]]:
+        """Transaction actions storing the description of `job_item` (none without one)"""
+        item = job_item.description_item()
+        return [{'Put': {'Item': item}}] if item else []
+    
+    @staticmethod
+    def _description_delete(user_id: str, job_id: str) -> Dict[str, Any]:
+        return {'Delete': {'Key': {'user_id': user_id, 'job_id': description_key(job_id)}}}
     
     async def create_job(self, user_id: str, job_request: JobCreateRequest) -> JobResponse:
         """
@@ -41,8 +186,13 @@ class JobRepository:
             # Create job item from request
             job_item = JobItem.from_create_request(user_id, job_request)
             
-            # Save to DynamoDB
-            self.table.put_item(Item=job_item.dict())
+            # Save to DynamoDB together with the description and the user's counters
+            await self.table.transact_write(
+                [{'Put': {'Item': job_item.to_item(), 'ConditionExpression': 'attribute_not_exists(job_id)'}}]
+                + self._description_write(job_item)
+                + [self._counters_update(user_id, {job_item.status: 1, 'total': 1})]
+            )
+            await job_cache.set(self._cache_key(user_id, job_item.job_id), job_item.without_description())
             
             # Return response model
             return job_item.to_response()
@@ -50,119 +200,289 @@ class JobRepository:
         except ClientError as e:
             raise Exception(f"Failed to create job: {e.response['Error']['Message']}")
     
-    async def get_user_jobs(self, user_id: str, limit: Optional[int] = None) -> List[JobResponse]:
+    async def _query_page(self, query_kwargs: Dict[str, Any], scope: str,
+                          limit: Optional[int] = None, next_token: Optional[str] = None) -> JobPage:
         """
-        Get all jobs for a user
+        Run a list query, following DynamoDB pages until `limit` jobs are collected
+
+        Only the summary attributes are requested, so large fields such as
+        job_description never leave DynamoDB.
+
+        Args:
+            query_kwargs: Query parameters
+            scope: Continuation token scope (ties tokens to the user and query)
+            limit: Maximum number of jobs (None reads every page)
+            next_token: Continuation token from a previous page
+
+        Returns:
+            JobPage: Job summaries and a continuation token if more may follow
+
+        Raises:
+            InvalidContinuationToken: If `next_token` is invalid for this scope
+        """
+        query_kwargs = dict(query_kwargs)
+        query_kwargs['ProjectionExpression'] = SUMMARY_PROJECTION['ProjectionExpression']
+        query_kwargs['ExpressionAttributeNames'] = {
+            **query_kwargs.get('ExpressionAttributeNames', {}), **SUMMARY_PROJECTION['ExpressionAttributeNames']
+        }
+        if next_token:
+            query_kwargs['ExclusiveStartKey'] = decode_continuation_token(next_token, scope)
+        
+        jobs = []
+        while True:
+            if limit:
+                query_kwargs['Limit'] = limit - len(jobs)
+            
+            response = await self.table.query(**query_kwargs)
+            jobs.extend(JOB_SUMMARY_LIST_ADAPTER.validate_python(response['Items']))
+            
+            last_key = response.get('LastEvaluatedKey')
+            if not last_key or (limit and len(jobs) >= limit):
+                break
+            query_kwargs['ExclusiveStartKey'] = last_key
+        
+        next_token = encode_continuation_token(last_key, scope) if last_key else None
+        return JobPage(items=jobs, next_token=next_token)
+    
+    async def get_user_jobs_page(self, user_id: str, limit: Optional[int] = None,
+                                 next_token: Optional[str] = None,
+                                 applied_from: Optional[datetime] = None,
+                                 applied_to: Optional[datetime] = None) -> JobPage:
+        """
+        Get one page of a user's jobs, newest first
+        
+        Job IDs are ULIDs, so ordering and the optional date window are
+        resolved by the sort key condition: only returned items are read.
         
         Args:
             user_id: Cognito user ID
-            limit: Optional limit on number of results
+            limit: Optional page size (None returns every job)
+            next_token: Continuation token from the previous page
+            applied_from: Only jobs created at or after this time
+            applied_to: Only jobs created at or before this time
             
         Returns:
-            List[JobResponse]: List of user's job applications
+            JobPage: Job summaries and the token for the next page
         """
         try:
+            # Tokens are tied to the window: a key outside another window's range fails the query
+            scope = f"jobs:{user_id}"
+            if applied_from or applied_to:
+                bounds = ulid_range(applied_from, applied_to)
+                job_ids = Key('job_id').between(*bounds)
+                scope = f"{scope}:{bounds[0]}:{bounds[1]}"
+            else:
+                job_ids = Key('job_id').gte(JOB_ID_MIN)  # Skips the counters item
+            key_condition = Key('user_id').eq(user_id) & job_ids
+            
             query_kwargs = {
-                'KeyConditionExpression': Key('user_id').eq(user_id) & Key('sk').begins_with('JOB'),
-                'ScanIndexForward': False  # Sort by created_at descending
+                'KeyConditionExpression': key_condition,
+                'ScanIndexForward': False  # ULIDs sort by creation time: newest first
             }
+            return await self._query_page(query_kwargs, scope, limit, next_token)
             
-            if limit:
-                query_kwargs['Limit'] = limit
+        except ClientError as e:
+            raise Exception(f"Failed to get user jobs: {e.response['Error']['Message']}")
+    
+    async def get_user_jobs(self, user_id: str, limit: Optional[int] = None) -> List[JobSummary]:
+        """
+        Get all jobs for a user
+        
+        Args:
+            user_id: Cognito user ID
+            limit: Optional limit on number of results
             
-            response = self.table.query(**query_kwargs)
+        Returns:
+            List[JobSummary]: List of user's job applications
+        """
+        page = await self.get_user_jobs_page(user_id, limit)
+        return page.items
+    
+    async def get_user_jobs_by_status_page(self, user_id: str, status: JobStatus,
+                                           limit: Optional[int] = None,
+                                           next_token: Optional[str] = None,
+                                           applied_from: Optional[datetime] = None,
+                                           applied_to: Optional[datetime] = None) -> JobPage:
+        """
+        Get one page of a user's jobs with a given status, newest first
+        
+        Reads only matching items through the per-user status index
+        (`user_id#status` partition, `created_at` sort key).
+        
+        Args:
+            user_id: Cognito user ID
+            status: Job status to filter by
+            limit: Optional page size (None returns every matching job)
+            next_token: Continuation token from the previous page
+            applied_from: Only jobs created at or after this time
+            applied_to: Only jobs created at or before this time
             
-            # Convert DynamoDB items to JobResponse objects
-            jobs = []
-            for item in response['Items']:
-                job_item = JobItem(**item)
-                jobs.append(job_item.to_response())
+        Returns:
+            JobPage: Matching job summaries and the token for the next page
+        """
+        try:
+            key_condition = Key('gsi1_pk').eq(JobItem.status_key(user_id, status.value))
+            scope = f"jobs:{user_id}:{status.value}"
+            if applied_from or applied_to:
+                bounds = (_iso_bound(applied_from, "0"), _iso_bound(applied_to, "~"))
+                key_condition = key_condition & Key('gsi1_sk').between(*bounds)
+                scope = f"{scope}:{bounds[0]}:{bounds[1]}"
             
-            return jobs
+            query_kwargs = {
+                'IndexName': USER_STATUS_INDEX,
+                'KeyConditionExpression': key_condition,
+                'ScanIndexForward': False  # Sort by created_at descending
+            }
+            return await self._query_page(query_kwargs, scope, limit, next_token)
             
         except ClientError as e:
-            raise Exception(f"Failed to get user jobs: {e.response['Error']['Message']}")
+            raise Exception(f"Failed to get user jobs by status: {e.response['Error']['Message']}")
+    
+    async def iterate_user_jobs(self, user_id: str, **query_kwargs) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream every raw job item of a user across all DynamoDB pages
+        
+        Used by internal consumers (stats, exports) that need the whole
+        partition without holding it in memory at once.
+        
+        Args:
+            user_id: Cognito user ID
+            **query_kwargs: Extra query parameters (e.g. ProjectionExpression)
+            
+        Yields:
+            Dict[str, Any]: One job item at a time
+        """
+        async for item in self.table.iterate_items(
+            KeyConditionExpression=Key('user_id').eq(user_id) & Key('job_id').gte(JOB_ID_MIN), **query_kwargs
+        ):
+            yield item
     
-    async def get_job_by_id(self, user_id: str, job_id: str) -> Optional[JobResponse]:
+    async def _get_job_item(self, user_id: str, job_id: str) -> Optional[JobItem]:
+        """Read a job item through the job cache (the returned item is shared, copy before mutating)"""
+        async def load() -> Optional[JobItem]:
+            # Batched with concurrent lookups into one BatchGetItem
+            item = await self.table.load_item({'user_id': user_id, 'job_id': job_id})
+            return JobItem(**item) if item else None
+        
+        return await job_cache.get(self._cache_key(user_id, job_id), load)
+    
+    async def _get_description(self, user_id: str, job_id: str) -> Optional[Union[str, CompressedText]]:
+        """Read a job's description item (batched with concurrent lookups, e.g. of the job itself)"""
+        item = await self.table.load_item({'user_id': user_id, 'job_id': description_key(job_id)})
+        return load_text(item['job_description']) if item else None
+    
+    async def get_job_by_id(self, user_id: str, job_id: str, include_archived: bool = False,
+                            include_description: bool = False) -> Optional[JobResponse]:
         """
         Get a specific job by user_id and job_id
         
+        Reads go through the job cache, so repeated detail views within the
+        cache TTL skip DynamoDB. The description is only read when asked
+        for, in the same BatchGetItem as the job.
+        
         Args:
             user_id: Cognito user ID
             job_id: Job ID
+            include_archived: Fall back to the archive table if the job isn't in the jobs table
+            include_description: Also return the job description
             
         Returns:
             Optional[JobResponse]: Job data if found, None otherwise
         """
+        if not is_job_id(job_id):
+            return None
+        
         try:
-            response = self.table.get_item(
-                Key={
-                    'user_id': user_id,
-                    'job_id': job_id
-                }
-            )
-            
-            if 'Item' in response:
-                job_item = JobItem(**response['Item'])
-                return job_item.to_response()
+            description = None
+            if include_description:
+                job_item, description = await asyncio.gather(
+                    self._get_job_item(user_id, job_id), self._get_description(user_id, job_id)
+                )
+            else:
+                job_item = await self._get_job_item(user_id, job_id)
             
+            if job_item:
+                if description is None and include_description:
+                    # Jobs written before descriptions moved out still carry it inline
+                    description = job_item.job_description
+                return job_item.model_copy(update={'job_description': description}).to_response()
+            if include_archived:
+                job = await self.get_archived_job(user_id, job_id)
+                if job and not include_description:
+                    job.job_description = None
+                return job
             return None
             
         except ClientError as e:
             raise Exception(f"Failed to get job: {e.response['Error']['Message']}")
     
-    async def update_job(self, user_id: str, job_id: str, job_update: JobUpdateRequest) -> Optional[JobResponse]:
+    async def update_job(self, user_id: str, job_id: str, job_update: JobUpdateRequest,
+                         include_description: bool = False) -> Optional[JobResponse]:
         """
         Update an existing job application
         
+        The current item comes from the job cache; the write only succeeds
+        if the job is still unchanged since that read (same status and
+        `updated_at`), so a stale cache entry is dropped and re-read instead
+        of overwriting newer data. A status change also moves the user's
+        counters, and a new description is written to its item, in the same
+        transaction.
+        
         Args:
             user_id: Cognito user ID
             job_id: Job ID
             job_update: Update request data
+            include_description: Return the description even if it wasn't updated
             
         Returns:
             Optional[JobResponse]: Updated job data if found, None otherwise
         """
+        if not is_job_id(job_id):
+            return None
+        
+        cache_key = self._cache_key(user_id, job_id)
         try:
-            # First, get the existing job
-            existing_job = await self.get_job_by_id(user_id, job_id)
-            if not existing_job:
-                return None
+            for _ in range(STATUS_WRITE_ATTEMPTS):
+                # First, get the existing job
+                existing_item = await self._get_job_item(user_id, job_id)
+                if not existing_item:
+                    return None
+                previous_status = existing_item.status
+                
+                # Update a copy of the item (the cached one is shared)
+                updated_item = existing_item.model_copy(deep=True).update_from_request(job_update)
+                put = self._expect_unchanged({'Item': updated_item.to_item()}, existing_item)
+                
+                # A new description (or one still stored inline) goes to its own item
+                actions = [{'Put': put}] + self._description_write(updated_item)
+                if updated_item.status != previous_status:
+                    actions.append(self._counters_update(user_id, {previous_status: -1, updated_item.status: 1}))
+                
+                # Save to DynamoDB
+                try:
+                    if len(actions) == 1:
+                        await self.table.put_item(**put)
+                    else:
+                        await self.table.transact_write(actions)
+                    await job_cache.set(cache_key, updated_item.without_description())
+                except ClientError as e:
+                    if not _condition_failed(e):
+                        raise
+                    await job_cache.invalidate(cache_key)
+                    continue
+                
+                if updated_item.job_description is None and include_description:
+                    updated_item.job_description = await self._get_description(user_id, job_id)
+                return updated_item.to_response()
             
-            # Convert to JobItem for updating
-            existing_item = JobItem(
-                user_id=existing_job.user_id,
-                job_id=existing_job.job_id,
-                company=existing_job.company,
-                position=existing_job.position,
-                status=existing_job.status.value,
-                applied_date=existing_job.applied_date.isoformat(),
-                application_link=existing_job.application_link,
-                salary_range=existing_job.salary_range,
-                location=existing_job.location,
-                job_type=existing_job.job_type.value if existing_job.job_type else None,
-                job_description=existing_job.job_description,
-                notes=existing_job.notes,
-                interview_date=existing_job.interview_date.isoformat() if existing_job.interview_date else None,
-                follow_up_date=existing_job.follow_up_date.isoformat() if existing_job.follow_up_date else None,
-                created_at=existing_job.created_at.isoformat(),
-                updated_at=existing_job.updated_at.isoformat()
-            )
-            
-            # Update the item
-            updated_item = existing_item.update_from_request(job_update)
-            
-            # Save to DynamoDB
-            self.table.put_item(Item=updated_item.dict())
-            
-            return updated_item.to_response()
+            raise Exception("Job kept changing concurrently")
             
         except ClientError as e:
             raise Exception(f"Failed to update job: {e.response['Error']['Message']}")
     
     async def delete_job(self, user_id: str, job_id: str) -> bool:
         """
-        Delete a job application
+        Delete a job application and decrement the user's counters
         
         Args:
             user_id: Cognito user ID
@@ -171,21 +491,335 @@ class JobRepository:
         Returns:
             bool: True if deleted, False if not found
         """
+        if not is_job_id(job_id):
+            return False
+        
         try:
-            response = self.table.delete_item(
-                Key={
-                    'user_id': user_id,
-                    'job_id': job_id
-                },
-                ReturnValues='ALL_OLD'
-            )
+            key = {'user_id': user_id, 'job_id': job_id}
+            for _ in range(STATUS_WRITE_ATTEMPTS):
+                item = await self.table.load_item(key)
+                if not item:
+                    await job_cache.invalidate(self._cache_key(user_id, job_id))
+                    return False
+                
+                status = item['status']
+                try:
+                    await self.table.transact_write([
+                        {'Delete': self._expect_status({'Key': key}, status)},
+                        self._description_delete(user_id, job_id),
+                        self._counters_update(user_id, {status: -1, 'total': -1})
+                    ])
+                    await job_cache.invalidate(self._cache_key(user_id, job_id))
+                    return True
+                except ClientError as e:
+                    if not _condition_failed(e):
+                        raise
             
-            return 'Attributes' in response
+            raise Exception("Job status kept changing concurrently")
             
         except ClientError as e:
             raise Exception(f"Failed to delete job: {e.response['Error']['Message']}")
     
-    async def get_jobs_by_status(self, status: JobStatus, limit: Optional[int] = None) -> List[JobResponse]:
+    async def _bulk_write(self, user_id: str, job_ids: List[str], status: Optional[str]) -> List[BulkItemResult]:
+        """
+        Change the status of (or with `status=None`, delete) many jobs
+        
+        Current statuses are read with BatchGetItem (100 keys per call), then
+        jobs are written in transactions of up to 99 status-conditional writes
+        (49 deletes, each with the delete of the job's description item)
+        plus one counters update. Transactions run one after another since
+        they all touch the counters item. Jobs whose status changed since they
+        were read are re-read and retried.
+        
+        Args:
+            user_id: Cognito user ID
+            job_ids: Job IDs (duplicates are ignored)
+            status: New status value, None to delete
+            
+        Returns:
+            List[BulkItemResult]: One outcome per unique job ID
+        """
+        job_ids = list(dict.fromkeys(job_ids))
+        done = "updated" if status else "deleted"
+        outcomes = {job_id: BulkItemResult(job_id=job_id, outcome="not_found")
+                    for job_id in job_ids if not is_job_id(job_id)}
+        pending = [job_id for job_id in job_ids if job_id not in outcomes]
+        now = datetime.utcnow().isoformat()
+        # One action is the counters update; deletes take two actions per job
+        chunk_size = (TRANSACT_WRITE_LIMIT - 1) // (1 if status else 2)
+        
+        def write_actions(job_id: str, current_status: str) -> List[Dict[str, Any]]:
+            key = {'user_id': user_id, 'job_id': job_id}
+            if not status:
+                return [
+                    {'Delete': self._expect_status({'Key': key}, current_status)},
+                    self._description_delete(user_id, job_id)
+                ]
+            return [{'Update': self._expect_status({
+                'Key': key,
+                'UpdateExpression': 'SET #status = :status, gsi1_pk = :gsi1_pk, updated_at = :now',
+                'ExpressionAttributeValues': {
+                    ':status': status,
+                    ':gsi1_pk': JobItem.status_key(user_id, status),
+                    ':now': now
+                }
+            }, current_status)}]
+        
+        for _ in range(STATUS_WRITE_ATTEMPTS):
+            if not pending:
+                break
+            
+            try:
+                found = await self.table.batch_get(
+                    [{'user_id': user_id, 'job_id': job_id} for job_id in pending],
+                    ProjectionExpression='job_id, #status',
+                    ExpressionAttributeNames={'#status': 'status'}
+                )
+            except (ClientError, RuntimeError) as e:
+                error = e.response['Error']['Message'] if isinstance(e, ClientError) else str(e)
+                outcomes.update({job_id: BulkItemResult(job_id=job_id, outcome="failed", error=error)
+                                 for job_id in pending})
+                pending = []
+                break
+            
+            current = {item['job_id']: item['status'] for item in found}
+            changes = []
+            for job_id in pending:
+                if job_id not in current:
+                    outcomes[job_id] = BulkItemResult(job_id=job_id, outcome="not_found")
+                elif current[job_id] == status:
+                    outcomes[job_id] = BulkItemResult(job_id=job_id, outcome=done)
+                else:
+                    changes.append((job_id, current[job_id]))
+            
+            pending = []
+            for start in range(0, len(changes), chunk_size):
+                chunk = changes[start:start + chunk_size]
+                deltas = Counter()
+                for _, current_status in chunk:
+                    deltas[current_status] -= 1
+                    if status:
+                        deltas[status] += 1
+                    else:
+                        deltas['total'] -= 1
+                
+                try:
+                    await self.table.transact_write(
+                        [action for job_id, current_status in chunk for action in write_actions(job_id, current_status)]
+                        + [self._counters_update(user_id, deltas)]
+                    )
+                    outcomes.update({job_id: BulkItemResult(job_id=job_id, outcome=done) for job_id, _ in chunk})
+                    for job_id, _ in chunk:
+                        await job_cache.invalidate(self._cache_key(user_id, job_id))
+                except ClientError as e:
+                    if _condition_failed(e):
+                        pending.extend(job_id for job_id, _ in chunk)
+                    else:
+                        outcomes.update({
+                            job_id: BulkItemResult(job_id=job_id, outcome="failed", error=e.response['Error']['Message'])
+                            for job_id, _ in chunk
+                        })
+        
+        outcomes.update({job_id: BulkItemResult(job_id=job_id, outcome="failed", error="Status kept changing concurrently")
+                         for job_id in pending})
+        return [outcomes[job_id] for job_id in job_ids]
+    
+    async def bulk_delete_jobs(self, user_id: str, job_ids: List[str]) -> List[BulkItemResult]:
+        """
+        Delete many job applications with batched transactions
+        
+        Args:
+            user_id: Cognito user ID
+            job_ids: Job IDs to delete (duplicates are ignored)
+            
+        Returns:
+            List[BulkItemResult]: One outcome per unique job ID
+        """
+        return await self._bulk_write(user_id, job_ids, None)
+    
+    async def bulk_update_status(self, user_id: str, job_ids: List[str], status: JobStatus) -> List[BulkItemResult]:
+        """
+        Change the status of many job applications with batched transactions
+        
+        Args:
+            user_id: Cognito user ID
+            job_ids: Job IDs to update (duplicates are ignored)
+            status: New status
+            
+        Returns:
+            List[BulkItemResult]: One outcome per unique job ID
+        """
+        return await self._bulk_write(user_id, job_ids, status.value)
+    
+    async def archive_jobs(self, user_id: str, jobs: List[JobItem], retention_days: int = 0) -> int:
+        """
+        Move jobs of one user from the jobs table to the archive table
+        
+        Each job is written (compressed) to the archive table and deleted from
+        the jobs table, together with its description item, in the same
+        transaction as the counters update, with up to 33 jobs per
+        transaction. A delete only succeeds if the job is unchanged since
+        `jobs` were read; changed jobs stay where they are and the rest of
+        their transaction is retried without them.
+        
+        Args:
+            user_id: Cognito user ID (every job must belong to it)
+            jobs: Full job items to archive, descriptions included
+            retention_days: Purge archived jobs this long after archiving (0 keeps them)
+            
+        Returns:
+            int: Number of jobs archived
+        """
+        archive_table_name = self.archive_table.table_name
+        chunk_size = (TRANSACT_WRITE_LIMIT - 1) // 3  # Three actions per job, one counters update
+        archived = 0
+        
+        for start in range(0, len(jobs), chunk_size):
+            chunk = jobs[start:start + chunk_size]
+            for _ in range(STATUS_WRITE_ATTEMPTS):
+                if not chunk:
+                    break
+                
+                actions = []
+                deltas = Counter()
+                for job in chunk:
+                    actions.append({'Put': {
+                        'TableName': archive_table_name,
+                        'Item': ArchivedJobItem.from_job_item(job, retention_days).dict(exclude_none=True)
+                    }})
+                    actions.append({'Delete': self._expect_unchanged(
+                        {'Key': {'user_id': user_id, 'job_id': job.job_id}}, job
+                    )})
+                    actions.append(self._description_delete(user_id, job.job_id))
+                    deltas[job.status] -= 1
+                    deltas['total'] -= 1
+                    deltas['archived'] += 1
+                
+                try:
+                    await self.table.transact_write(actions + [self._counters_update(user_id, deltas)])
+                except ClientError as e:
+                    if not _condition_failed(e):
+                        raise
+                    # Drop the jobs whose delete failed (action 3 * i + 1 belongs to job i)
+                    deletes = cancellation_reasons(e)[1::3]
+                    chunk = [job for index, job in enumerate(chunk)
+                             if index >= len(deletes) or deletes[index] != 'ConditionalCheckFailed']
+                    continue
+                
+                archived += len(chunk)
+                for job in chunk:
+                    await job_cache.invalidate(self._cache_key(user_id, job.job_id))
+                break
+        
+        return archived
+    
+    async def get_archived_job(self, user_id: str, job_id: str) -> Optional[JobResponse]:
+        """
+        Get one archived job
+        
+        Args:
+            user_id: Cognito user ID
+            job_id: Job ID
+            
+        Returns:
+            Optional[JobResponse]: Job data if archived, None otherwise
+        """
+        try:
+            item = await self.archive_table.load_item({'user_id': user_id, 'job_id': job_id})
+            return ArchivedJobItem(**item).to_job_item().to_response() if item else None
+            
+        except ClientError as e:
+            raise Exception(f"Failed to get archived job: {e.response['Error']['Message']}")
+    
+    async def get_archived_jobs_page(self, user_id: str, limit: Optional[int] = None,
+                                     next_token: Optional[str] = None) -> JobPage:
+        """
+        Get one page of a user's archived jobs, newest first
+        
+        Args:
+            user_id: Cognito user ID
+            limit: Optional page size (None returns every archived job)
+            next_token: Continuation token from the previous page
+            
+        Returns:
+            JobPage: Archived job summaries and the token for the next page
+            
+        Raises:
+            InvalidContinuationToken: If `next_token` is invalid for this user
+        """
+        scope = f"archive:{user_id}"
+        query_kwargs = {
+            'KeyConditionExpression': Key('user_id').eq(user_id),
+            'ScanIndexForward': False  # ULIDs sort by creation time: newest first
+        }
+        if next_token:
+            query_kwargs['ExclusiveStartKey'] = decode_continuation_token(next_token, scope)
+        
+        try:
+            jobs = []
+            while True:
+                if limit:
+                    query_kwargs['Limit'] = limit - len(jobs)
+                
+                response = await self.archive_table.query(**query_kwargs)
+                jobs.extend(ArchivedJobItem(**item).to_job_item().to_summary() for item in response['Items'])
+                
+                last_key = response.get('LastEvaluatedKey')
+                if not last_key or (limit and len(jobs) >= limit):
+                    break
+                query_kwargs['ExclusiveStartKey'] = last_key
+            
+            next_token = encode_continuation_token(last_key, scope) if last_key else None
+            return JobPage(items=jobs, next_token=next_token)
+            
+        except ClientError as e:
+            raise Exception(f"Failed to get archived jobs: {e.response['Error']['Message']}")
+    
+    async def restore_job(self, user_id: str, job_id: str) -> Optional[JobResponse]:
+        """
+        Move an archived job back to the jobs table
+        
+        Args:
+            user_id: Cognito user ID
+            job_id: Job ID
+            
+        Returns:
+            Optional[JobResponse]: Restored job data, None if the job isn't archived
+        """
+        if not is_job_id(job_id):
+            return None
+        
+        key = {'user_id': user_id, 'job_id': job_id}
+        try:
+            item = await self.archive_table.get_item(Key=key, ConsistentRead=True)
+            if 'Item' not in item:
+                return None
+            
+            job_item = ArchivedJobItem(**item['Item']).to_job_item()
+            try:
+                await self.table.transact_write(
+                    [{'Put': {'Item': job_item.to_item(), 'ConditionExpression': 'attribute_not_exists(job_id)'}}]
+                    + self._description_write(job_item)
+                    + [{'Delete': {
+                        'TableName': self.archive_table.table_name,
+                        'Key': key,
+                        'ConditionExpression': 'attribute_exists(job_id)'
+                    }},
+                    self._counters_update(user_id, {job_item.status: 1, 'total': 1, 'archived': -1})]
+                )
+            except ClientError as e:
+                if not _condition_failed(e):
+                    raise
+                # Restored by a concurrent request
+                return None
+            
+            await job_cache.set(self._cache_key(user_id, job_id), job_item.without_description())
+            return job_item.to_response()
+            
+        except ClientError as e:
+            raise Exception(f"Failed to restore job: {e.response['Error']['Message']}")
+    
+    async def get_jobs_by_status(self, status: JobStatus, limit: Optional[int] = None) -> List[JobSummary]:
         """
         Get jobs by status using Global Secondary Index
         
@@ -194,7 +828,7 @@ class JobRepository:
             limit: Optional limit on number of results
             
         Returns:
-            List[JobResponse]: List of jobs with specified status
+            List[JobSummary]: List of jobs with specified status
         """
         try:
             query_kwargs = {
@@ -203,18 +837,8 @@ class JobRepository:
                 'ScanIndexForward': False  # Sort by created_at descending
             }
             
-            if limit:
-                query_kwargs['Limit'] = limit
-            
-            response = self.table.query(**query_kwargs)
-            
-            # Convert DynamoDB items to JobResponse objects
-            jobs = []
-            for item in response['Items']:
-                job_item = JobItem(**item)
-                jobs.append(job_item.to_response())
-            
-            return jobs
+            page = await self._query_page(query_kwargs, f"status:{status.value}", limit)
+            return page.items
             
         except ClientError as e:
             raise Exception(f"Failed to get jobs by status: {e.response['Error']['Message']}")
@@ -223,6 +847,11 @@ class JobRepository:
         """
         Get job application statistics for a user
         
+        Reads the user's counters item; if it doesn't exist yet, or was
+        only created by job writes and never counted (no `reconciled_at`,
+        e.g. a user whose jobs predate the counters), it is built from the
+        jobs first.
+        
         Args:
             user_id: Cognito user ID
             
@@ -230,28 +859,106 @@ class JobRepository:
             Dict[str, int]: Statistics by status
         """
         try:
-            # Get all user jobs
-            jobs = await self.get_user_jobs(user_id)
-            
-            # Count by status
-            stats = {status.value: 0 for status in JobStatus}
-            for job in jobs:
-                stats[job.status.value] += 1
-            
-            # Add total count
-            stats['total'] = len(jobs)
+            counters = await self.table.load_item(self._counters_key(user_id))
+            if not counters or 'reconciled_at' not in counters:
+                return await self.reconcile_user_counters(user_id)
             
+            stats = {status.value: int(counters.get(status.value, 0)) for status in JobStatus}
+            stats['total'] = int(counters.get('total', 0))
+            stats['archived'] = int(counters.get('archived', 0))
             return stats
             
         except Exception as e:
             raise Exception(f"Failed to get job stats: {str(e)}")
+    
+    async def reconcile_user_counters(self, user_id: str) -> Dict[str, int]:
+        """
+        Rebuild a user's counters item by counting their jobs
+        
+        Status counts and `total` cover the jobs table; `archived` counts the
+        user's jobs in the archive table. Jobs with a status outside
+        JobStatus (legacy data) count towards `total` only. Every counters
+        update bumps `version`, so the rebuilt item is only written if no job
+        write happened while counting; otherwise the count is repeated. The
+        item is marked with `reconciled_at`.
+        
+        Args:
+            user_id: Cognito user ID
+            
+        Returns:
+            Dict[str, int]: Statistics by status
+        """
+        for _ in range(STATUS_WRITE_ATTEMPTS):
+            response = await self.table.get_item(Key=self._counters_key(user_id), ConsistentRead=True)
+            version = response.get('Item', {}).get('version')
+            
+            # Count by status, streaming every page of the user's jobs
+            stats = {status.value: 0 for status in JobStatus}
+            total = unknown = 0
+            async for item in self.iterate_user_jobs(
+                user_id,
+                ProjectionExpression='#status',
+                ExpressionAttributeNames={'#status': 'status'},
+                ConsistentRead=True
+            ):
+                if item.get('status') in stats:
+                    stats[item['status']] += 1
+                else:
+                    unknown += 1
+                total += 1
+            stats['total'] = total
+            if unknown:
+                print(f"⚠️ {unknown} job(s) of {user_id} have an unknown status; counted in total only")
+            
+            stats['archived'] = 0
+            async for page in self.archive_table.iterate_pages(
+                KeyConditionExpression=Key('user_id').eq(user_id), Select='COUNT', ConsistentRead=True
+            ):
+                stats['archived'] += page['Count']
+            
+            if version is None:
+                condition = {'ConditionExpression': 'attribute_not_exists(job_id)'}
+            else:
+                condition = {
+                    'ConditionExpression': '#version = :version',
+                    'ExpressionAttributeNames': {'#version': 'version'},
+                    'ExpressionAttributeValues': {':version': version}
+                }
+            try:
+                await self.table.put_item(
+                    Item={
+                        **self._counters_key(user_id), **stats,
+                        'version': (version or 0) + 1,
+                        'updated_at': datetime.utcnow().isoformat(),
+                        'reconciled_at': datetime.utcnow().isoformat()
+                    },
+                    **condition
+                )
+                return stats
+            except ClientError as e:
+                if not _condition_failed(e):
+                    raise
+        
+        raise Exception(f"Jobs of {user_id} kept changing while counting")
 
 
 class UserRepository:
-    """Repository for user metadata operations"""
+    """
+    Repository for user metadata operations
+    
+    Reads go through `user_metadata_cache`. Non-critical updates (last
+    login) are queued in a write-behind buffer and written in the
+    background, coalesced per user.
+    """
+    
+    def __init__(self, table: Optional[AsyncTable] = None):
+        self._table = table
+        self.deferred_updates = WriteBehindBuffer("user_metadata", self._write_deferred_updates)
     
-    def __init__(self):
-        self.table = get_users_table()
+    @property
+    def table(self) -> AsyncTable:
+        """The table passed in, or the shared users table (connects on first use)"""
+        return self._table or get_async_users_table()
     
     async def create_user_metadata(self, user_id: str, email: str, username: str) -> UserMetadata:
         """
@@ -272,7 +979,8 @@ class UserRepository:
                 username=username
             )
             
-            self.table.put_item(Item=user_metadata.dict())
+            await self.table.put_item(Item=user_metadata.dict())
+            await user_metadata_cache.set(user_id, user_metadata)
             
             return user_metadata
             
@@ -289,15 +997,12 @@ class UserRepository:
         Returns:
             Optional[UserMetadata]: User metadata if found
         """
+        async def load() -> Optional[UserMetadata]:
+            item = await self.table.load_item({'user_id': user_id})
+            return UserMetadata(**item) if item else None
+        
         try:
-            response = self.table.get_item(
-                Key={'user_id': user_id}
-            )
-            
-            if 'Item' in response:
-                return UserMetadata(**response['Item'])
-            
-            return None
+            return await user_metadata_cache.get(user_id, load)
             
         except ClientError as e:
             raise Exception(f"Failed to get user metadata: {e.response['Error']['Message']}")
@@ -306,6 +1011,10 @@ class UserRepository:
         """
         Update user metadata
         
+        The write is conditional on the metadata being unchanged since it was
+        read (`updated_at`), so a stale cached copy is re-read rather than
+        written back.
+        
         Args:
             user_id: Cognito user ID
             **kwargs: Fields to update
@@ -314,74 +1023,246 @@ class UserRepository:
             Optional[UserMetadata]: Updated metadata if found
         """
         try:
-            # Get existing metadata
-            existing = await self.get_user_metadata(user_id)
-            if not existing:
-                return None
-            
-            # Update fields
-            update_data = existing.dict()
-            update_data.update(kwargs)
-            update_data['updated_at'] = datetime.utcnow().isoformat()
-            
-            updated_metadata = UserMetadata(**update_data)
-            
-            # Save to DynamoDB
-            self.table.put_item(Item=updated_metadata.dict())
+            for _ in range(STATUS_WRITE_ATTEMPTS):
+                # Get existing metadata
+                existing = await self.get_user_metadata(user_id)
+                if not existing:
+                    return None
+                
+                # Update fields
+                update_data = existing.dict()
+                update_data.update(kwargs)
+                update_data['updated_at'] = datetime.utcnow().isoformat()
+                
+                updated_metadata = UserMetadata(**update_data)
+                
+                # Save to DynamoDB
+                try:
+                    await self.table.put_item(
+                        Item=updated_metadata.dict(),
+                        ConditionExpression='updated_at = :expected_updated_at',
+                        ExpressionAttributeValues={':expected_updated_at': existing.updated_at}
+                    )
+                    await user_metadata_cache.set(user_id, updated_metadata)
+                    return updated_metadata
+                except ClientError as e:
+                    if not _condition_failed(e):
+                        raise
+                    await user_metadata_cache.invalidate(user_id)
             
-            return updated_metadata
+            raise Exception("User metadata kept changing concurrently")
             
         except ClientError as e:
             raise Exception(f"Failed to update user metadata: {e.response['Error']['Message']}")
     
+    def defer_user_metadata_update(self, user_id: str, **fields) -> None:
+        """
+        Queue a non-critical metadata update without waiting for DynamoDB
+        
+        Updates for the same user are merged (later values win) and written
+        within WRITE_BEHIND_WINDOW_SECONDS; users that no longer exist are
+        skipped.
+        
+        Args:
+            user_id: Cognito user ID
+            **fields: Fields to set
+        """
+        self.deferred_updates.put(user_id, fields)
+    
+    async def _write_deferred_updates(self, updates: Dict[str, Dict[str, Any]]) -> None:
+        """
+        Write queued updates, one UpdateItem per user in parallel (DynamoDB has no batch update)
+        
+        Updates DynamoDB rejects as invalid are logged and dropped rather
+        than retried.
+        
+        Raises:
+            PartialFlushError: Some users' updates failed (the buffer keeps those)
+        """
+        now = datetime.utcnow().isoformat()
+        
+        async def write(user_id: str, fields: Dict[str, Any]) -> None:
+            names = {f'#f{index}': field for index, field in enumerate(fields)}
+            values = {f':v{index}': value for index, value in enumerate(fields.values())}
+            assignments = [f'#f{index} = :v{index}' for index in range(len(fields))]
+            try:
+                await self.table.update_item(
+                    Key={'user_id': user_id},
+                    UpdateExpression=f"SET {', '.join(assignments)}, updated_at = :now",
+                    ConditionExpression='attribute_exists(user_id)',
+                    ExpressionAttributeNames=names,
+                    ExpressionAttributeValues={**values, ':now': now}
+                )
+                await user_metadata_cache.invalidate(user_id)
+            except ClientError as e:
+                code = e.response['Error']['Code']
+                if code in _NON_RETRYABLE_UPDATE_ERRORS:
+                    print(f"❌ Dropped deferred update of user {user_id} ({', '.join(fields)}): {code}: "
+                          f"{e.response['Error']['Message']}")
+                elif not _condition_failed(e):
+                    raise
+        
+        # One user's failure doesn't stop the others; only the failed ones are retried
+        results = await asyncio.gather(*(write(user_id, fields) for user_id, fields in updates.items()),
+                                       return_exceptions=True)
+        failed = {user_id: fields for (user_id, fields), result in zip(updates.items(), results)
+                  if isinstance(result, Exception)}
+        if failed:
+            first = next(result for result in results if isinstance(result, Exception))
+            raise PartialFlushError(failed, f"{len(failed)} of {len(updates)} user(s) failed: {first}")
+    
     async def update_last_login(self, user_id: str) -> None:
         """
         Update user's last login timestamp
         
+        The write is deferred (see `defer_user_metadata_update`), so logins
+        and token refreshes don't wait for DynamoDB and repeated logins of a
+        user within the flush window become one write.
+        
         Args:
             user_id: Cognito user ID
         """
-        try:
-            now = datetime.utcnow().isoformat()
+        self.defer_user_metadata_update(user_id, last_login=datetime.utcnow().isoformat())
+
+
+class IdempotencyRepository(IdempotencyStore):
+    """
+    Idempotency-Key store in the jobs table
+    
+    A key is an item in its user's partition (sort key `#IDEM#<scope>#<key>`,
+    outside every job query), reserved with a conditional put: it only
+    succeeds if the item doesn't exist, has expired, or was reserved by a
+    request that never completed. Stored responses are compressed like job
+    texts. `ttl` lets DynamoDB TTL delete expired items; until it does, they
+    are treated as free.
+    """
+    
+    def __init__(self, table: Optional[AsyncTable] = None):
+        self._table = table
+    
+    @property
+    def table(self) -> AsyncTable:
+        """The table passed in, or the shared jobs table (connects on first use)"""
+        return self._table or get_async_jobs_table()
+    
+    async def reserve(self, user_id: str, scope: str, key: str, fingerprint: str) -> Optional[StoredResponse]:
+        item_key = {'user_id': user_id, 'job_id': idempotency_key(scope, key)}
+        for _ in range(STATUS_WRITE_ATTEMPTS):
+            now = time.time()
+            locked_until, expires_at = reservation_times(now)
+            try:
+                await self.table.put_item(
+                    Item={**item_key, 'fingerprint': fingerprint, 'locked_until': int(locked_until),
+                          'ttl': int(expires_at), 'created_at': datetime.utcnow().isoformat()},
+                    ConditionExpression=(
+                        'attribute_not_exists(job_id) OR #ttl < :now '
+                        'OR (attribute_not_exists(status_code) AND locked_until < :now)'
+                    ),
+                    ExpressionAttributeNames={'#ttl': 'ttl'},
+                    ExpressionAttributeValues={':now': int(now)}
+                )
+                return None
+            except ClientError as e:
+                if not _condition_failed(e):
+                    raise
             
-            self.table.update_item(
-                Key={'user_id': user_id},
-                UpdateExpression='SET last_login = :timestamp, updated_at = :timestamp',
-                ExpressionAttributeValues={
-                    ':timestamp': now
-                }
+            item = (await self.table.get_item(Key=item_key, ConsistentRead=True)).get('Item')
+            if item is not None:
+                status_code = item.get('status_code')
+                return replay(item['fingerprint'], None if status_code is None else int(status_code),
+                              text_value(load_text(item.get('response'))), fingerprint)
+            # Deleted (released) in between: try to reserve again
+        
+        raise Exception(f"Idempotency-Key {key} of {user_id} kept changing")
+    
+    async def complete(self, user_id: str, scope: str, key: str, response: StoredResponse) -> None:
+        await self.table.update_item(
+            Key={'user_id': user_id, 'job_id': idempotency_key(scope, key)},
+            UpdateExpression='SET status_code = :status_code, #response = :response, #ttl = :ttl',
+            ConditionExpression='attribute_exists(job_id)',
+            ExpressionAttributeNames={'#response': 'response', '#ttl': 'ttl'},
+            ExpressionAttributeValues={
+                ':status_code': response.status_code,
+                ':response': stored_text(response.body),
+                ':ttl': int(time.time()) + IDEMPOTENCY_TTL_SECONDS
+            }
+        )
+    
+    async def release(self, user_id: str, scope: str, key: str) -> None:
+        try:
+            await self.table.delete_item(
+                Key={'user_id': user_id, 'job_id': idempotency_key(scope, key)},
+                ConditionExpression='attribute_not_exists(status_code)'
             )
-            
         except ClientError as e:
-            # Don't raise exception for last login update failures
-            print(f"Warning: Failed to update last login: {e.response['Error']['Message']}")
+            if not _condition_failed(e):
+                raise
 
 
 # Singleton instances
 job_repository = JobRepository()
 user_repository = UserRepository()
+idempotency_repository = IdempotencyRepository()
 
 # Convenience functions
 async def create_job(user_id: str, job_request: JobCreateRequest) -> JobResponse:
     """Create a new job application"""
     return await job_repository.create_job(user_id, job_request)
 
-async def get_user_jobs(user_id: str, limit: Optional[int] = None) -> List[JobResponse]:
+async def get_user_jobs(user_id: str, limit: Optional[int] = None) -> List[JobSummary]:
     """Get all jobs for a user"""
     return await job_repository.get_user_jobs(user_id, limit)
 
-async def get_job_by_id(user_id: str, job_id: str) -> Optional[JobResponse]:
-    """Get a specific job by ID"""
-    return await job_repository.get_job_by_id(user_id, job_id)
+async def get_user_jobs_page(user_id: str, limit: Optional[int] = None, next_token: Optional[str] = None,
+                             applied_from: Optional[datetime] = None,
+                             applied_to: Optional[datetime] = None) -> JobPage:
+    """Get one page of a user's jobs with a continuation token"""
+    return await job_repository.get_user_jobs_page(user_id, limit, next_token, applied_from, applied_to)
+
+async def get_user_jobs_by_status_page(user_id: str, status: JobStatus, limit: Optional[int] = None,
+                                       next_token: Optional[str] = None,
+                                       applied_from: Optional[datetime] = None,
+                                       applied_to: Optional[datetime] = None) -> JobPage:
+    """Get one page of a user's jobs with a given status"""
+    return await job_repository.get_user_jobs_by_status_page(
+        user_id, status, limit, next_token, applied_from, applied_to
+    )
+
+async def get_job_by_id(user_id: str, job_id: str, include_archived: bool = False,
+                        include_description: bool = False) -> Optional[JobResponse]:
+    """Get a specific job by ID (optionally also looking in the archive, and with its description)"""
+    return await job_repository.get_job_by_id(user_id, job_id, include_archived, include_description)
+
+async def get_archived_jobs_page(user_id: str, limit: Optional[int] = None,
+                                 next_token: Optional[str] = None) -> JobPage:
+    """Get one page of a user's archived jobs"""
+    return await job_repository.get_archived_jobs_page(user_id, limit, next_token)
 
-async def update_job(user_id: str, job_id: str, job_update: JobUpdateRequest) -> Optional[JobResponse]:
+async def restore_job(user_id: str, job_id: str) -> Optional[JobResponse]:
+    """Move an archived job back to the jobs table"""
+    return await job_repository.restore_job(user_id, job_id)
+
+async def update_job(user_id: str, job_id: str, job_update: JobUpdateRequest,
+                     include_description: bool = False) -> Optional[JobResponse]:
     """Update an existing job"""
-    return await job_repository.update_job(user_id, job_id, job_update)
+    return await job_repository.update_job(user_id, job_id, job_update, include_description)
 
 async def delete_job(user_id: str, job_id: str) -> bool:
     """Delete a job application"""
     return await job_repository.delete_job(user_id, job_id)
 
+async def delete_jobs(user_id: str, job_ids: List[str]) -> List[BulkItemResult]:
+    """Delete many job applications"""
+    return await job_repository.bulk_delete_jobs(user_id, job_ids)
+
+async def update_jobs_status(user_id: str, job_ids: List[str], status: JobStatus) -> List[BulkItemResult]:
+    """Change the status of many job applications"""
+    return await job_repository.bulk_update_status(user_id, job_ids, status)
+
 async def get_user_job_stats(user_id: str) -> Dict[str, int]:
     """Get job statistics for a user"""
     return await job_repository.get_user_job_stats(user_id)
+
+async def reconcile_user_counters(user_id: str) -> Dict[str, int]:
+    """Rebuild a user's job counters from their jobs"""
+    return await job_repository.reconcile_user_counters(user_id)
@@ -0,0 +1,470 @@
+"""
+Document Text Extraction Service
+
+This module is the single extraction pipeline used by every resume upload
+entry point (`ai_career` routes and `simple_main`):
+
+- The document type is detected from magic bytes, not from the filename
+- Backends are registered per document type and ranked by speed/quality;
+  the best available backend is tried first, the next one on failure
+- Optional dependencies (PyMuPDF, PyPDF2, Pillow, Tesseract) are only
+  imported the first time a backend that needs them actually runs
+- Every extraction runs under a page/pixel/wall-clock budget; backends stop
+  cooperatively when it is exhausted and return partial, flagged text
+"""
+
+import asyncio
+import importlib.util
+import io
+import os
+import struct
+import sys
+import time
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Sequence
+
+from pydantic import BaseModel
+
+from .metrics import metrics
+
+# Document types
+PDF = "pdf"
+IMAGE = "image"
+DOCX = "docx"
+DOC = "doc"
+TEXT = "text"
+
+# Pages of multi-page documents are separated by form feeds so later stages
+# (e.g. text compaction) can tell page headers/footers apart from content
+PAGE_SEPARATOR = "\f"
+
+EXTRACTION_WORKERS = int(os.getenv("EXTRACTION_WORKERS", str(min(4, os.cpu_count() or 1))))
+
+# Per-extraction budgets
+EXTRACTION_MAX_PAGES = int(os.getenv("EXTRACTION_MAX_PAGES", "30"))
+EXTRACTION_MAX_PIXELS = int(os.getenv("EXTRACTION_MAX_PIXELS", "16000000"))  # 16 megapixels
+EXTRACTION_TIMEOUT_SECONDS = float(os.getenv("EXTRACTION_TIMEOUT_SECONDS", "15"))
+
+# Magic byte signatures (checked at offset 0). Formats with short, textual
+# signatures (BMP, TIFF) are checked against their headers instead, see
+# _is_bmp/_is_tiff
+_SIGNATURES = [
+    (b"\x89PNG\r\n\x1a\n", IMAGE),
+    (b"\xff\xd8\xff", IMAGE),                # JPEG
+    (b"GIF87a", IMAGE),
+    (b"GIF89a", IMAGE),
+    (b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1", DOC),  # OLE2 (legacy .doc)
+]
+
+# Bytes allowed before a PDF header: a UTF-8 BOM, then whitespace
+_UTF8_BOM = b"\xef\xbb\xbf"
+_PDF_LEADING_WHITESPACE = b" \t\r\n\f\x00"
+
+# BITMAPCOREHEADER, BITMAPINFOHEADER, V2/V3 (56), V4 and V5 header sizes
+_BMP_DIB_HEADER_SIZES = {12, 40, 56, 108, 124}
+
+
+class ExtractionError(Exception):
+    """Raised when no backend could extract text from a document"""
+
+
+class UnsupportedDocumentError(ExtractionError):
+    """Raised when the document type is not supported"""
+
+
+class ExtractedDocument(BaseModel):
+    """Result of a text extraction"""
+    text: str
+    document_type: str
+    backend: str
+    truncated: bool = False
+    truncation_reasons: List[str] = []
+    elapsed_seconds: float = 0.0
+
+
+class ExtractionBudget:
+    """
+    Resource limits for a single extraction
+
+    Backends check the budget cooperatively (between pages, blocks, ...) and
+    stop early once it is exhausted. Every overrun is recorded so the caller
+    can flag the text as partial, and counted in the metrics registry.
+    """
+
+    def __init__(self, max_pages: int = EXTRACTION_MAX_PAGES,
+                 max_pixels: int = EXTRACTION_MAX_PIXELS,
+                 max_seconds: float = EXTRACTION_TIMEOUT_SECONDS):
+        self.max_pages = max_pages
+        self.max_pixels = max_pixels
+        self.max_seconds = max_seconds
+        self.started_at = time.monotonic()
+        self.reasons: List[str] = []
+
+    @property
+    def truncated(self) -> bool:
+        return bool(self.reasons)
+
+    @property
+    def elapsed_seconds(self) -> float:
+        return time.monotonic() - self.started_at
+
+    def remaining_seconds(self) -> float:
+        """Wall-clock time left (never negative)"""
+        return max(0.0, self.max_seconds - self.elapsed_seconds)
+
+    def exceeded(self, limit: str) -> None:
+        """Record that a limit ("pages", "pixels" or "time") cut the extraction short"""
+        if limit not in self.reasons:
+            self.reasons.append(limit)
+            metrics.increment("extraction_budget_exceeded", limit=limit)
+
+    def out_of_time(self) -> bool:
+        """Check the wall-clock budget, recording an overrun if it is spent"""
+        if self.max_seconds and self.elapsed_seconds >= self.max_seconds:
+            self.exceeded("time")
+            return True
+        return False
+
+    def allow_page(self, page_index: int) -> bool:
+        """Check whether the page at `page_index` (0-based) may still be processed"""
+        if self.max_pages and page_index >= self.max_pages:
+            self.exceeded("pages")
+            return False
+        return not self.out_of_time()
+
+
+class ExtractionBackend:
+    """
+    A registered extraction backend
+
+    Attributes:
+        name: Backend name (e.g. "pymupdf")
+        document_type: Document type handled by this backend
+        rank: Lower ranks are faster/better and are tried first
+        requires: Top-level modules that must be importable
+        function: Callable taking the raw bytes and the budget, returning the text
+    """
+
+    def __init__(self, name: str, document_type: str, rank: int,
+                 requires: Sequence[str], function: Callable[[bytes, ExtractionBudget], str]):
+        self.name = name
+        self.document_type = document_type
+        self.rank = rank
+        self.requires = tuple(requires)
+        self.function = function
+        self._available: Optional[bool] = None
+
+    @property
+    def available(self) -> bool:
+        """Check that the optional dependencies are installed (without importing them)"""
+        if self._available is None:
+            self._available = all(importlib.util.find_spec(module) is not None for module in self.requires)
+        return self._available
+
+    def extract(self, content: bytes, budget: Optional[ExtractionBudget] = None) -> str:
+        return self.function(content, budget or ExtractionBudget())
+
+    def __repr__(self):
+        return f"<ExtractionBackend {self.document_type}:{self.name} rank={self.rank}>"
+
+
+# Registered backends by document type
+_backends: Dict[str, List[ExtractionBackend]] = {}
+
+
+def register_backend(document_type: str, name: str, rank: int, requires: Sequence[str] = ()):
+    """
+    Decorator registering an extraction backend
+
+    Args:
+        document_type: Document type handled by the backend
+        name: Unique backend name for the document type
+        rank: Preference order (lower is tried first)
+        requires: Modules the backend imports lazily when it runs
+    """
+    def decorator(function):
+        backends = [b for b in _backends.get(document_type, []) if b.name != name]
+        backends.append(ExtractionBackend(name, document_type, rank, requires, function))
+        backends.sort(key=lambda backend: backend.rank)
+        _backends[document_type] = backends
+        return function
+    return decorator
+
+
+def get_backends(document_type: str, available_only: bool = True) -> List[ExtractionBackend]:
+    """Get the backends for a document type in rank order"""
+    backends = _backends.get(document_type, [])
+    if available_only:
+        backends = [backend for backend in backends if backend.available]
+    return backends
+
+
+def get_backend(document_type: str, name: str) -> ExtractionBackend:
+    """Get a specific backend by name (used by benchmarks)"""
+    for backend in _backends.get(document_type, []):
+        if backend.name == name:
+            return backend
+    raise KeyError(f"No {document_type} backend named {name!r}")
+
+
+def detect_document_type(content: bytes) -> Optional[str]:
+    """
+    Detect the document type from its magic bytes
+
+    Args:
+        content: Raw file bytes
+
+    Returns:
+        Optional[str]: Document type, or None if it can't be identified
+    """
+    if _is_pdf(content):
+        return PDF
+
+    for signature, document_type in _SIGNATURES:
+        if content.startswith(signature):
+            return document_type
+
+    if _is_bmp(content) or _is_tiff(content):
+        return IMAGE
+
+    if content[:4] == b"RIFF" and content[8:12] == b"WEBP":
+        return IMAGE
+
+    if content.startswith(b"PK\x03\x04"):
+        try:
+            with zipfile.ZipFile(io.BytesIO(content)) as archive:
+                if "word/document.xml" in archive.namelist():
+                    return DOCX
+        except zipfile.BadZipFile:
+            pass
+        return None
+
+    # Anything else is treated as text unless it looks binary
+    sample = content[:4096]
+    if sample.startswith((b"\xff\xfe", b"\xfe\xff")) or b"\x00" not in sample:
+        return TEXT
+
+    return None
+
+
+def _is_pdf(content: bytes) -> bool:
+    """A PDF header at offset 0, or after a BOM and/or whitespace"""
+    head = content[:1024]
+    if head.startswith(_UTF8_BOM):
+        head = head[len(_UTF8_BOM):]
+    return head.lstrip(_PDF_LEADING_WHITESPACE).startswith(b"%PDF-")
+
+
+def _is_bmp(content: bytes) -> bool:
+    """
+    A BMP file header: "BM", a file size matching the content and a known
+    DIB header size. "BM" alone also starts text such as "BMW Group ..."
+    """
+    if len(content) < 18 or not content.startswith(b"BM"):
+        return False
+    file_size, = struct.unpack_from("<I", content, 2)
+    dib_header_size, = struct.unpack_from("<I", content, 14)
+    return file_size == len(content) and dib_header_size in _BMP_DIB_HEADER_SIZES
+
+
+def _is_tiff(content: bytes) -> bool:
+    """A TIFF header whose first IFD offset points inside the content"""
+    if content.startswith(b"II*\x00"):
+        byte_order = "<"
+    elif content.startswith(b"MM\x00*"):
+        byte_order = ">"
+    else:
+        return False
+    if len(content) < 8:
+        return False
+    first_ifd, = struct.unpack_from(byte_order + "I", content, 4)
+    return 8 <= first_ifd < len(content)
+
+
+def extract_document(content: bytes, filename: str = "",
+                     budget: Optional[ExtractionBudget] = None) -> ExtractedDocument:
+    """
+    Extract text from an uploaded document
+
+    Args:
+        content: Raw file bytes
+        filename: Original filename (only used in error messages)
+        budget: Page/pixel/time limits (defaults from environment variables)
+
+    Returns:
+        ExtractedDocument: Extracted text with the detected type, backend used
+        and whether the budget cut it short
+
+    Raises:
+        UnsupportedDocumentError: If the type is unknown or no backend is installed
+        ExtractionError: If every available backend failed
+    """
+    document_type = detect_document_type(content)
+    if document_type is None:
+        raise UnsupportedDocumentError(
+            f"Unsupported file format for {filename or 'upload'}. "
+            "Supported formats: PDF, PNG, JPEG, GIF, BMP, TIFF, WEBP, DOCX and plain text"
+        )
+    if document_type == DOC:
+        raise UnsupportedDocumentError(
+            "Legacy Word (.doc) files are not supported. Please save the resume as .docx or PDF."
+        )
+
+    backends = get_backends(document_type)
+    if not backends:
+        missing = ", ".join(sorted({m for b in get_backends(document_type, False) for m in b.requires}))
+        raise UnsupportedDocumentError(
+            f"{document_type.upper()} processing not available. Please install: {missing}"
+        )
+
+    budget = budget or ExtractionBudget()
+    errors = []
+    for backend in backends:
+        try:
+            text = backend.extract(content, budget)
+        except Exception as e:
+            print(f"⚠️ {backend.name} failed on {filename or 'upload'}: {e}")
+            errors.append(f"{backend.name}: {e}")
+            # Don't start the next backend on an exhausted budget
+            if budget.out_of_time():
+                break
+            continue
+
+        metrics.observe("extraction_seconds", budget.elapsed_seconds, document_type=document_type)
+        if budget.truncated:
+            print(f"✂️ Extraction of {filename or 'upload'} truncated by budget: {', '.join(budget.reasons)}")
+        return ExtractedDocument(
+            text=text,
+            document_type=document_type,
+            backend=backend.name,
+            truncated=budget.truncated,
+            truncation_reasons=list(budget.reasons),
+            elapsed_seconds=budget.elapsed_seconds
+        )
+
+    raise ExtractionError("; ".join(errors))
+
+
+# Extraction worker pool (CPU-bound work stays off the event loop)
+_executor: Optional[ThreadPoolExecutor] = None
+
+
+def get_executor() -> ThreadPoolExecutor:
+    """Get the extraction worker pool (created on first use)"""
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=EXTRACTION_WORKERS, thread_name_prefix="extraction-worker")
+    return _executor
+
+
+async def extract_document_async(content: bytes, filename: str = "",
+                                 budget: Optional[ExtractionBudget] = None) -> ExtractedDocument:
+    """Run `extract_document` on an extraction worker without blocking the event loop"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_executor(), extract_document, content, filename, budget)
+
+
+def shutdown_extraction_workers():
+    """Stop the worker pool and release resident OCR engines"""
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=True)
+        _executor = None
+
+    ocr_service = sys.modules.get("app.utils.ocr_service")
+    if ocr_service is not None:
+        ocr_service.ocr_engine.close()
+
+
+# ---------------------------------------------------------------------------
+# Built-in backends
+# ---------------------------------------------------------------------------
+
+@register_backend(PDF, "pymupdf", rank=10, requires=("fitz",))
+def _extract_pdf_pymupdf(content: bytes, budget: ExtractionBudget) -> str:
+    """PyMuPDF: C library, fastest and best layout handling"""
+    import fitz
+
+    pages = []
+    with fitz.open(stream=content, filetype="pdf") as pdf_document:
+        for index, page in enumerate(pdf_document):
+            if not budget.allow_page(index):
+                break
+            pages.append(page.get_text())
+    return PAGE_SEPARATOR.join(pages)
+
+
+@register_backend(PDF, "pypdf2", rank=20, requires=("PyPDF2",))
+def _extract_pdf_pypdf2(content: bytes, budget: ExtractionBudget) -> str:
+    """PyPDF2: pure Python fallback"""
+    import PyPDF2
+
+    pages = []
+    pdf_reader = PyPDF2.PdfReader(io.BytesIO(content))
+    for index, page in enumerate(pdf_reader.pages):
+        if not budget.allow_page(index):
+            break
+        pages.append(page.extract_text() or "")
+    return PAGE_SEPARATOR.join(pages)
+
+
+def _ocr_within_budget(content: bytes, budget: ExtractionBudget, backend: str) -> str:
+    """Open an image, shrink it to the pixel budget and OCR it before the deadline"""
+    from PIL import Image
+    from .ocr_service import OCRTimeoutError, ocr_engine
+
+    # Opening only reads the header, so the size is known before decoding
+    image = Image.open(io.BytesIO(content))
+    width, height = image.size
+    if budget.max_pixels and width * height > budget.max_pixels:
+        budget.exceeded("pixels")
+        scale = (budget.max_pixels / (width * height)) ** 0.5
+        target = (max(1, int(width * scale)), max(1, int(height * scale)))
+        image.draft("L", target)  # JPEG: decode at reduced scale
+        image = image.resize(target) if image.size != target else image
+
+    if budget.out_of_time():
+        return ""
+
+    try:
+        return ocr_engine.image_to_string(image, backend=backend, timeout=budget.remaining_seconds())
+    except OCRTimeoutError:
+        budget.exceeded("time")
+        return ""
+
+
+@register_backend(IMAGE, "tesserocr", rank=10, requires=("PIL", "tesserocr"))
+def _extract_image_tesserocr(content: bytes, budget: ExtractionBudget) -> str:
+    """OCR on a Tesseract engine kept resident in this worker"""
+    return _ocr_within_budget(content, budget, "tesserocr")
+
+
+@register_backend(IMAGE, "pytesseract", rank=20, requires=("PIL", "pytesseract"))
+def _extract_image_pytesseract(content: bytes, budget: ExtractionBudget) -> str:
+    """OCR through a `tesseract` subprocess per image"""
+    return _ocr_within_budget(content, budget, "pytesseract")
+
+
+@register_backend(DOCX, "docx-stream", rank=10)
+def _extract_docx_stream(content: bytes, budget: ExtractionBudget) -> str:
+    """Streaming word/document.xml reader (standard library only)"""
+    from .docx_reader import iter_docx_blocks
+
+    blocks = []
+    for block in iter_docx_blocks(content):
+        if budget.out_of_time():
+            break
+        blocks.append(block)
+    return "\n".join(blocks)
+
+
+@register_backend(TEXT, "text", rank=10)
+def _extract_plain_text(content: bytes, budget: ExtractionBudget) -> str:
+    """Plain text with BOM detection and a lenient UTF-8 fallback"""
+    if content.startswith((b"\xff\xfe", b"\xfe\xff")):
+        return content.decode("utf-16")
+    try:
+        return content.decode("utf-8-sig")
+    except UnicodeDecodeError:
+        return content.decode("utf-8", errors="ignore")
@@ -12,9 +12,11 @@ import json
 import re
 from typing import Dict, List, Any, Optional
 import google.generativeai as genai
-from pydantic import BaseModel
+from pydantic import BaseModel, PrivateAttr
 from dotenv import load_dotenv
 
+from .text_compaction import compact_resume_text
+
 # Load environment variables
 load_dotenv()
 
@@ -38,6 +40,13 @@ class CareerAnalysis(BaseModel):
     interview_questions: List[InterviewQuestion]
     match_score: float
     analysis_summary: str
+    # Set on the placeholder returned when Gemini could not be used (not serialized)
+    _fallback: bool = PrivateAttr(default=False)
+
+    @property
+    def is_fallback(self) -> bool:
+        """Whether this is the placeholder analysis rather than Gemini's"""
+        return self._fallback
 
 class GeminiCareerService:
     def __init__(self):
@@ -58,6 +67,11 @@ class GeminiCareerService:
         """
         print(f"🤖 Starting Gemini analysis...")
         print(f"📄 Resume length: {len(resume_text)} characters")
+
+        # Strip page furniture and whitespace so the prompt only carries content
+        compacted = compact_resume_text(resume_text)
+        resume_text = compacted.text
+        print(f"🗜️ Compacted resume to {compacted.compacted_length} characters ({compacted.reduction:.0%} smaller)")
         print(f"💼 Job description length: {len(job_description)} characters")
         
         # Check if Gemini model is available
@@ -229,7 +243,7 @@ Respond with valid JSON only:
         print("🚨 Creating emergency fallback - AI generation failed")
         
         # Even in emergency, try to be somewhat dynamic
-        return CareerAnalysis(
+        analysis = CareerAnalysis(
             matched_keywords=["General Skills"],
             missing_keywords=["Specific technical analysis unavailable"],
             match_score=0.0,
@@ -249,6 +263,8 @@ Respond with valid JSON only:
                 )
             ]
         )
+        analysis._fallback = True
+        return analysis
 
 # Create a singleton instance
 gemini_service = GeminiCareerService()
@@ -0,0 +1,270 @@
+"""
+Idempotency Keys
+
+Clients retry requests that timed out without knowing whether the first
+attempt went through. Requests carrying an `Idempotency-Key` header are
+run at most once per user, key and route (`scope`):
+
+- The first request reserves the key in an `IdempotencyStore`, runs, and
+  stores its response (status code + JSON body)
+- A retry with the same key and the same payload gets the stored response
+  back (`Idempotent-Replayed: true` header) without the work being redone
+- A retry while the first attempt is still running gets 409; reusing a key
+  with a different payload gets 422
+- A failed attempt releases the key so the client can retry it; an attempt
+  whose process died is taken over after IDEMPOTENCY_LOCK_SECONDS
+- Routes can decline to store a response that a retry should redo (e.g. a
+  placeholder AI analysis during a Gemini outage); the key is released
+- Stored responses expire after IDEMPOTENCY_TTL_SECONDS
+- Outcomes are counted in the metrics registry as
+  `idempotency_requests{outcome=...,scope=...}` (new, replayed,
+  in_progress, mismatch, store_error, not_stored)
+
+Stores: `MemoryIdempotencyStore` (this process only) here, and one per
+backend next to its repositories - a conditional put on a `#IDEM#` item in
+the DynamoDB jobs table, a unique index in MongoDB and in SQL. Routes that
+are mounted by several apps (AI analysis) use the store the app configures
+at startup (`configure_idempotency_store`).
+
+Requests without the header are not affected. If the store fails, the
+request runs unprotected rather than failing.
+"""
+
+import hashlib
+import json
+import os
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Optional, Tuple
+
+from fastapi import HTTPException, Response, status
+from fastapi.encoders import jsonable_encoder
+from pydantic import BaseModel
+
+from app.utils.metrics import metrics
+
+# How long a stored response is replayed
+IDEMPOTENCY_TTL_SECONDS = int(os.getenv("IDEMPOTENCY_TTL_SECONDS", "86400"))
+
+# A reservation without a response is considered abandoned after this long
+IDEMPOTENCY_LOCK_SECONDS = int(os.getenv("IDEMPOTENCY_LOCK_SECONDS", "120"))
+
+# Keys kept by the in-process store
+IDEMPOTENCY_MEMORY_MAX_ENTRIES = int(os.getenv("IDEMPOTENCY_MEMORY_MAX_ENTRIES", "10000"))
+
+IDEMPOTENCY_KEY_HEADER = "Idempotency-Key"
+IDEMPOTENT_REPLAY_HEADER = "Idempotent-Replayed"
+IDEMPOTENCY_KEY_MAX_LENGTH = 255
+
+
+class IdempotencyKeyInUse(Exception):
+    """The first request with this key is still running"""
+
+
+class IdempotencyKeyMismatch(Exception):
+    """The key was used before for a request with a different payload"""
+
+
+class StoredResponse(BaseModel):
+    """Response of a completed request, replayed for retries"""
+    status_code: int
+    body: str  # JSON
+
+
+def request_fingerprint(payload: Any) -> str:
+    """Hash of a request payload (anything jsonable_encoder accepts)"""
+    document = json.dumps(jsonable_encoder(payload), sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(document.encode("utf-8")).hexdigest()
+
+
+def reservation_times(now: Optional[float] = None) -> Tuple[float, float]:
+    """(locked_until, expires_at) epoch seconds for a new reservation"""
+    now = time.time() if now is None else now
+    return now + IDEMPOTENCY_LOCK_SECONDS, now + IDEMPOTENCY_TTL_SECONDS
+
+
+def replay(stored_fingerprint: str, status_code: Optional[int], body: Optional[str],
+           fingerprint: str) -> StoredResponse:
+    """
+    Decide what a request gets for a key that is already taken
+
+    Raises:
+        IdempotencyKeyMismatch: The key belongs to a different payload
+        IdempotencyKeyInUse: The first request has no response yet
+    """
+    if stored_fingerprint != fingerprint:
+        raise IdempotencyKeyMismatch()
+    if status_code is None:
+        raise IdempotencyKeyInUse()
+    return StoredResponse(status_code=status_code, body=body)
+
+
+class IdempotencyStore(ABC):
+    """Where keys are reserved and responses kept (one implementation per backend)"""
+
+    @abstractmethod
+    async def reserve(self, user_id: str, scope: str, key: str, fingerprint: str) -> Optional[StoredResponse]:
+        """
+        Reserve a key for a request about to run
+
+        Free, expired and abandoned keys are taken atomically, so of several
+        concurrent requests with one key only one runs.
+
+        Args:
+            user_id: Owner of the key
+            scope: Route the key is used for (e.g. "jobs.create")
+            key: Client-supplied Idempotency-Key
+            fingerprint: `request_fingerprint` of the payload
+
+        Returns:
+            Optional[StoredResponse]: None if reserved (run the request),
+                the stored response if the request already completed
+
+        Raises:
+            IdempotencyKeyInUse: The first request is still running
+            IdempotencyKeyMismatch: The key was used for a different payload
+        """
+
+    @abstractmethod
+    async def complete(self, user_id: str, scope: str, key: str, response: StoredResponse) -> None:
+        """Store the response of a reserved key (kept for IDEMPOTENCY_TTL_SECONDS)"""
+
+    @abstractmethod
+    async def release(self, user_id: str, scope: str, key: str) -> None:
+        """Free a reserved key whose request failed (completed keys are kept)"""
+
+
+class MemoryIdempotencyStore(IdempotencyStore):
+    """Keys of this process only (single worker deployments, tests, benchmarks)"""
+
+    def __init__(self, max_entries: int = IDEMPOTENCY_MEMORY_MAX_ENTRIES):
+        self.max_entries = max_entries
+        # (user_id, scope, key) -> [fingerprint, status_code, body, locked_until, expires_at]
+        self._entries: "OrderedDict[Tuple[str, str, str], list]" = OrderedDict()
+
+    async def reserve(self, user_id: str, scope: str, key: str, fingerprint: str) -> Optional[StoredResponse]:
+        now = time.time()
+        entry = self._entries.get((user_id, scope, key))
+        if entry is not None and entry[4] > now and (entry[1] is not None or entry[3] > now):
+            return replay(entry[0], entry[1], entry[2], fingerprint)
+
+        if len(self._entries) >= self.max_entries:
+            for expired in [k for k, value in self._entries.items() if value[4] <= now]:
+                del self._entries[expired]
+            while len(self._entries) >= self.max_entries:
+                self._entries.popitem(last=False)
+        locked_until, expires_at = reservation_times(now)
+        self._entries[(user_id, scope, key)] = [fingerprint, None, None, locked_until, expires_at]
+        return None
+
+    async def complete(self, user_id: str, scope: str, key: str, response: StoredResponse) -> None:
+        entry = self._entries.get((user_id, scope, key))
+        if entry is not None:
+            entry[1], entry[2], entry[4] = response.status_code, response.body, time.time() + IDEMPOTENCY_TTL_SECONDS
+
+    async def release(self, user_id: str, scope: str, key: str) -> None:
+        entry = self._entries.get((user_id, scope, key))
+        if entry is not None and entry[1] is None:
+            del self._entries[(user_id, scope, key)]
+
+
+_store: IdempotencyStore = MemoryIdempotencyStore()
+
+
+def configure_idempotency_store(store: IdempotencyStore) -> None:
+    """Set the store of routes shared between apps (called at app startup)"""
+    global _store
+    _store = store
+
+
+def get_idempotency_store() -> IdempotencyStore:
+    """The configured store (in-process until an app configures one)"""
+    return _store
+
+
+async def run_idempotent(store: IdempotencyStore, scope: str, user_id: Any, key: Optional[str], payload: Any,
+                         call: Callable[[], Awaitable[Any]], status_code: int = status.HTTP_200_OK,
+                         store_result: Optional[Callable[[Any], bool]] = None) -> Any:
+    """
+    Run a route body at most once per Idempotency-Key
+
+    Args:
+        store: Where keys and responses are kept
+        scope: Route name, so one key can't replay another route's response
+        user_id: Current user (keys are per user)
+        key: Idempotency-Key header value (None runs `call` as is)
+        payload: What identifies the request (body, form fields, file hash)
+        call: Coroutine function producing the response
+        status_code: Status code of the route's successful response
+        store_result: Whether a result may be replayed (False releases the
+            key so a retry runs again); all results are stored if None
+
+    Returns:
+        Any: The result of `call`, or a JSON Response replaying the stored one
+
+    Raises:
+        HTTPException: 400 for an invalid key, 409 while the first request
+            is running, 422 if the key was used for a different payload
+    """
+    if key is None:
+        return await call()
+    if not key.strip() or len(key) > IDEMPOTENCY_KEY_MAX_LENGTH:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"{IDEMPOTENCY_KEY_HEADER} must be 1-{IDEMPOTENCY_KEY_MAX_LENGTH} characters"
+        )
+
+    user_id = str(user_id)
+    try:
+        stored = await store.reserve(user_id, scope, key, request_fingerprint(payload))
+    except IdempotencyKeyInUse:
+        metrics.increment("idempotency_requests", scope=scope, outcome="in_progress")
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="A request with this Idempotency-Key is still being processed",
+            headers={"Retry-After": "1"}
+        )
+    except IdempotencyKeyMismatch:
+        metrics.increment("idempotency_requests", scope=scope, outcome="mismatch")
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="This Idempotency-Key was already used for a different request"
+        )
+    except Exception as e:
+        print(f"⚠️ Idempotency store unavailable, running {scope} unprotected: {e}")
+        metrics.increment("idempotency_requests", scope=scope, outcome="store_error")
+        return await call()
+
+    if stored is not None:
+        metrics.increment("idempotency_requests", scope=scope, outcome="replayed")
+        return Response(
+            content=stored.body, status_code=stored.status_code, media_type="application/json",
+            headers={IDEMPOTENT_REPLAY_HEADER: "true"}
+        )
+
+    metrics.increment("idempotency_requests", scope=scope, outcome="new")
+    try:
+        result = await call()
+    except BaseException:
+        try:
+            await store.release(user_id, scope, key)
+        except Exception as e:
+            print(f"⚠️ Failed to release Idempotency-Key of {scope}: {e}")
+        raise
+
+    if store_result is not None and not store_result(result):
+        metrics.increment("idempotency_requests", scope=scope, outcome="not_stored")
+        try:
+            await store.release(user_id, scope, key)
+        except Exception as e:
+            print(f"⚠️ Failed to release Idempotency-Key of {scope}: {e}")
+        return result
+
+    try:
+        body = json.dumps(jsonable_encoder(result), separators=(",", ":"))
+        await store.complete(user_id, scope, key, StoredResponse(status_code=status_code, body=body))
+    except Exception as e:
+        # The work is done; a retry waits for the reservation to be abandoned
+        print(f"⚠️ Failed to store the response of {scope}: {e}")
+    return result
@@ -0,0 +1,113 @@
+"""
+Time-Ordered Identifiers
+
+Job IDs are ULIDs: 26 Crockford base32 characters encoding a 48-bit
+millisecond timestamp followed by 80 random bits. Because the timestamp
+comes first, IDs sort lexicographically in creation order, so a DynamoDB
+sort key made of them supports "newest N" and date-range key conditions.
+
+- IDs created in the same millisecond by this process stay ordered
+  (the random part is incremented instead of redrawn)
+- `ulid_range` turns a time window into the smallest/largest possible IDs
+- `ulid_at` builds an ID from given random bits (reproducible datasets)
+"""
+
+import os
+import re
+import threading
+from datetime import datetime, timezone
+from typing import Optional, Tuple
+
+_ALPHABET = "0123456789ABCDEFGHJKMNPQRSTVWXYZ"
+_ULID_PATTERN = re.compile(r"^[0-7][0-9A-HJKMNP-TV-Z]{25}$")
+_RANDOM_BITS = 80
+_RANDOM_MAX = (1 << _RANDOM_BITS) - 1
+
+_lock = threading.Lock()
+_last_millis = -1
+_last_random = 0
+
+
+def _encode(value: int) -> str:
+    characters = []
+    for _ in range(26):
+        characters.append(_ALPHABET[value & 31])
+        value >>= 5
+    return "".join(reversed(characters))
+
+
+def _to_millis(timestamp: datetime) -> int:
+    """Milliseconds since the epoch; naive datetimes are UTC (as stored by the app)"""
+    if timestamp.tzinfo is None:
+        timestamp = timestamp.replace(tzinfo=timezone.utc)
+    return int(timestamp.timestamp() * 1000)
+
+
+def new_ulid(timestamp: Optional[datetime] = None) -> str:
+    """
+    Create a new ULID
+
+    Args:
+        timestamp: Time to encode (defaults to now; used by migrations to keep
+            old items in creation order)
+
+    Returns:
+        str: 26-character ULID
+    """
+    global _last_millis, _last_random
+
+    millis = _to_millis(timestamp) if timestamp else _to_millis(datetime.now(timezone.utc))
+    with _lock:
+        if millis == _last_millis and _last_random < _RANDOM_MAX:
+            _last_random += 1
+        else:
+            _last_millis = millis
+            _last_random = int.from_bytes(os.urandom(10), "big")
+        random_part = _last_random
+
+    return _encode((millis << _RANDOM_BITS) | random_part)
+
+
+def ulid_at(timestamp: datetime, randomness: int) -> str:
+    """
+    Create a ULID from a timestamp and caller-supplied random bits
+
+    For reproducible IDs (generated datasets); application code uses `new_ulid`.
+
+    Args:
+        timestamp: Time to encode
+        randomness: Random part (only the low 80 bits are used)
+
+    Returns:
+        str: 26-character ULID
+    """
+    return _encode((_to_millis(timestamp) << _RANDOM_BITS) | (randomness & _RANDOM_MAX))
+
+
+def is_ulid(value: str) -> bool:
+    """Check whether a string is a ULID (as opposed to a legacy uuid4 job ID)"""
+    return bool(_ULID_PATTERN.match(value or ""))
+
+
+def ulid_timestamp(value: str) -> datetime:
+    """Get the creation time encoded in a ULID (naive UTC, like stored timestamps)"""
+    number = 0
+    for character in value[:10]:
+        number = number * 32 + _ALPHABET.index(character)
+    return datetime.fromtimestamp(number / 1000, tz=timezone.utc).replace(tzinfo=None)
+
+
+def ulid_range(start: Optional[datetime] = None, end: Optional[datetime] = None) -> Tuple[str, str]:
+    """
+    Get the smallest and largest ULIDs created within a time window
+
+    Args:
+        start: Window start (inclusive, None = beginning of time)
+        end: Window end (inclusive, None = end of time)
+
+    Returns:
+        Tuple[str, str]: Bounds for a `between` key condition
+    """
+    low = _to_millis(start) << _RANDOM_BITS if start else 0
+    high = (_to_millis(end) << _RANDOM_BITS) | _RANDOM_MAX if end else (1 << 128) - 1
+    return _encode(max(low, 0)), _encode(high)
@@ -0,0 +1,123 @@
+"""
+Job Archival (Hot/Cold Tiering)
+
+Finished applications from long ago (rejected, withdrawn) are rarely looked
+at again but sit in every per-user query and stats recount. The archival
+sweep moves them to the jobs archive table:
+
+- Candidates come from the `status-created_at-index` (one query per
+  archivable status, `created_at` before the cutoff), so no table scan
+- Jobs updated within the cutoff stay, even if created before it
+- Candidates are re-read from the jobs table (consistent BatchGetItem, with
+  their description items) before archiving, since the index may lag behind
+- Each job is compressed into one archive item and deleted from the jobs
+  table with its description in the same transaction as the user's counters
+  update
+  (`JobRepository.archive_jobs`); jobs changed since they were read stay
+- With JOB_ARCHIVE_RETENTION_DAYS set, archived jobs get a `ttl` and
+  DynamoDB TTL purges them after that long
+
+Archived jobs are read on demand (GET /api/jobs/archived,
+GET /api/jobs/{job_id}?include_archived=true) and can be restored.
+
+Usage (from the backend directory), e.g. nightly:
+    python -m app.utils.job_archive --older-than-days 365
+"""
+
+import argparse
+import asyncio
+import os
+from collections import defaultdict
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Optional
+
+from boto3.dynamodb.conditions import Attr, Key
+
+from app.utils.dynamodb_service import JobRepository
+from app.utils.models_dynamodb import DESCRIPTION_KEY_PREFIX, JobItem, JobStatus, description_key
+
+# Jobs in these statuses, untouched for this many days, are archived
+JOB_ARCHIVE_AFTER_DAYS = int(os.getenv("JOB_ARCHIVE_AFTER_DAYS", "365"))
+JOB_ARCHIVE_STATUSES = [
+    status.strip() for status in os.getenv("JOB_ARCHIVE_STATUSES", "Rejected,Withdrawn").split(",") if status.strip()
+]
+
+# Days archived jobs are kept before DynamoDB TTL deletes them (0 keeps them forever)
+JOB_ARCHIVE_RETENTION_DAYS = int(os.getenv("JOB_ARCHIVE_RETENTION_DAYS", "0"))
+
+# Users whose jobs are archived concurrently
+ARCHIVE_CONCURRENCY = 8
+
+
+async def archive_old_jobs(older_than_days: int = JOB_ARCHIVE_AFTER_DAYS,
+                           statuses: Iterable[str] = JOB_ARCHIVE_STATUSES,
+                           retention_days: int = JOB_ARCHIVE_RETENTION_DAYS,
+                           repository: Optional[JobRepository] = None) -> int:
+    """
+    Move finished jobs older than `older_than_days` to the archive table
+
+    The candidates' keys for a status are collected before anything is
+    archived (archiving deletes from the index being paged through); each
+    user's candidates are then re-read consistently, so only jobs still
+    eligible in the jobs table are archived. Safe to re-run at any time:
+    a job that changes mid-sweep is left for the next one.
+
+    Args:
+        older_than_days: Minimum age (by `created_at` and `updated_at`)
+        statuses: Archivable status values
+        retention_days: Purge archived jobs this long after archiving (0 keeps them)
+        repository: Job repository (defaults to one on the configured tables)
+
+    Returns:
+        int: Number of jobs archived
+    """
+    repository = repository or JobRepository()
+    statuses = [JobStatus(status).value for status in statuses]  # Reject unknown statuses up front
+    cutoff = (datetime.utcnow() - timedelta(days=older_than_days)).isoformat()
+
+    async def archive_user(user_id: str, job_ids: List[str]) -> int:
+        keys = [{'user_id': user_id, 'job_id': key}
+                for job_id in job_ids for key in (job_id, description_key(job_id))]
+        items = await repository.table.batch_get(keys, ConsistentRead=True)
+        descriptions = {item['job_id'][len(DESCRIPTION_KEY_PREFIX):]: item['job_description']
+                        for item in items if item['job_id'].startswith(DESCRIPTION_KEY_PREFIX)}
+        jobs = [
+            JobItem(**{**item, 'job_description': descriptions.get(item['job_id'], item.get('job_description'))})
+            for item in items
+            if not item['job_id'].startswith(DESCRIPTION_KEY_PREFIX)
+            and item['status'] in statuses and item['created_at'] < cutoff and item['updated_at'] < cutoff
+        ]
+        return await repository.archive_jobs(user_id, jobs, retention_days)
+
+    archived = 0
+    for status in statuses:
+        candidates: Dict[str, List[str]] = defaultdict(list)
+        async for item in repository.table.iterate_items(
+            IndexName='status-created_at-index',
+            KeyConditionExpression=Key('status').eq(status) & Key('created_at').lt(cutoff),
+            FilterExpression=Attr('updated_at').lt(cutoff),
+            ProjectionExpression='user_id, job_id'
+        ):
+            candidates[item['user_id']].append(item['job_id'])
+
+        users = list(candidates.items())
+        for start in range(0, len(users), ARCHIVE_CONCURRENCY):
+            batch = users[start:start + ARCHIVE_CONCURRENCY]
+            archived += sum(await asyncio.gather(*(archive_user(user_id, job_ids) for user_id, job_ids in batch)))
+    return archived
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Move old finished job applications to the archive table")
+    parser.add_argument("--older-than-days", type=int, default=JOB_ARCHIVE_AFTER_DAYS)
+    parser.add_argument("--statuses", nargs="+", default=JOB_ARCHIVE_STATUSES, help="Archivable status values")
+    parser.add_argument("--retention-days", type=int, default=JOB_ARCHIVE_RETENTION_DAYS,
+                        help="Purge archived jobs after this many days (0 keeps them)")
+    args = parser.parse_args()
+
+    archived = asyncio.run(archive_old_jobs(args.older_than_days, args.statuses, args.retention_days))
+    print(f"✅ Archived {archived} job(s) older than {args.older_than_days} days")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""
+In-Process Metrics
+
+This module provides a small thread-safe registry of counters and timing
+summaries. Services record into the shared `metrics` instance and the
+values are exposed as JSON by the `/metrics` route.
+
+Metric names can carry labels, which are folded into the key:
+    metrics.increment("extraction_budget_exceeded", limit="pages")
+    -> "extraction_budget_exceeded{limit=pages}"
+"""
+
+import threading
+from typing import Any, Dict
+
+
+def _metric_key(name: str, labels: Dict[str, Any]) -> str:
+    """Build the registry key for a metric name and its labels"""
+    if not labels:
+        return name
+    label_text = ",".join(f"{key}={value}" for key, value in sorted(labels.items()))
+    return f"{name}{{{label_text}}}"
+
+
+class MetricsRegistry:
+    """Thread-safe counters and timing/size summaries"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters: Dict[str, float] = {}
+        self._summaries: Dict[str, Dict[str, float]] = {}
+
+    def increment(self, name: str, value: float = 1, **labels) -> None:
+        """
+        Add to a counter
+
+        Args:
+            name: Metric name
+            value: Amount to add
+            **labels: Optional labels (e.g. operation="query")
+        """
+        key = _metric_key(name, labels)
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def observe(self, name: str, value: float, **labels) -> None:
+        """
+        Record one observation (latency, size, ...) in a summary
+
+        Args:
+            name: Metric name
+            value: Observed value
+            **labels: Optional labels
+        """
+        key = _metric_key(name, labels)
+        with self._lock:
+            summary = self._summaries.get(key)
+            if summary is None:
+                self._summaries[key] = {"count": 1, "sum": value, "min": value, "max": value}
+            else:
+                summary["count"] += 1
+                summary["sum"] += value
+                summary["min"] = min(summary["min"], value)
+                summary["max"] = max(summary["max"], value)
+
+    def get_counter(self, name: str, **labels) -> float:
+        """Get the current value of a counter"""
+        with self._lock:
+            return self._counters.get(_metric_key(name, labels), 0)
+
+    def snapshot(self, prefix: str = "") -> Dict[str, Any]:
+        """
+        Get a copy of every metric
+
+        Args:
+            prefix: Only include metrics whose name starts with this
+
+        Returns:
+            Dict[str, Any]: {"counters": {...}, "summaries": {...}} where each
+            summary also carries its average
+        """
+        with self._lock:
+            counters = {key: value for key, value in self._counters.items() if key.startswith(prefix)}
+            summaries = {
+                key: {**summary, "avg": summary["sum"] / summary["count"]}
+                for key, summary in self._summaries.items() if key.startswith(prefix)
+            }
+        return {"counters": counters, "summaries": summaries}
+
+    def reset(self) -> None:
+        """Clear every metric (used by benchmarks between runs)"""
+        with self._lock:
+            self._counters.clear()
+            self._summaries.clear()
+
+
+# Global metrics registry
+metrics = MetricsRegistry()
@@ -5,11 +5,14 @@ This module defines the data models for DynamoDB using Pydantic for validation.
 These models replace the MongoDB Beanie models with DynamoDB-compatible structures.
 """
 
-from datetime import datetime
-from typing import Optional, List, Dict, Any
-from pydantic import BaseModel, EmailStr, Field, field_validator
+import zlib
+from datetime import datetime, timezone
+from typing import Optional, List, Dict, Any, Union
+from pydantic import BaseModel, ConfigDict, EmailStr, Field, TypeAdapter, field_serializer, field_validator
 from enum import Enum
-import uuid
+
+from app.utils.ids import new_ulid
+from app.utils.text_compression import CompressedText, load_text, stored_text, text_value
 
 
 class JobStatus(str, Enum):
@@ -77,8 +80,8 @@ class JobUpdateRequest(BaseModel):
     follow_up_date: Optional[datetime] = None
 
 
-class JobResponse(BaseModel):
-    """Response model for job application data"""
+class JobSummary(BaseModel):
+    """Job application fields shown in lists (description via GET /api/jobs/{job_id})"""
     user_id: str
     job_id: str
     company: str
@@ -89,24 +92,103 @@ class JobResponse(BaseModel):
     salary_range: Optional[str] = None
     location: Optional[str] = None
     job_type: Optional[JobType] = None
-    job_description: Optional[str] = None
-    notes: Optional[str] = None
     interview_date: Optional[datetime] = None
     follow_up_date: Optional[datetime] = None
+    notes: Optional[str] = None  # Shown on the job cards
     created_at: datetime
     updated_at: datetime
     
+    @field_validator('notes', mode='before')
+    def decompress_notes(cls, v):
+        # Raw list items carry long notes as compressed Binary
+        return text_value(load_text(v))
+    
     class Config:
         json_encoders = {
             datetime: lambda v: v.isoformat() if v else None
         }
 
 
+class JobResponse(JobSummary):
+    """Response model for job application data (job_description only when requested)"""
+    job_description: Optional[str] = None
+    
+    @field_validator('job_description', mode='before')
+    def decompress_text(cls, v):
+        # JobItem keeps long texts compressed until they are needed here
+        return text_value(v)
+
+
+class JobDescriptionResponse(BaseModel):
+    """Response model for a job's description"""
+    job_id: str
+    job_description: Optional[str] = None
+
+
+# Attributes read by list queries; index keys and other bookkeeping are left in DynamoDB
+JOB_SUMMARY_ATTRIBUTES = tuple(JobSummary.model_fields)
+
+
+class JobPage(BaseModel):
+    """One page of job application summaries with the token for the next page"""
+    items: List[JobSummary]
+    next_token: Optional[str] = None
+
+
+# Validates a page of raw DynamoDB items into summaries in one call (the
+# ISO timestamps are parsed by pydantic-core; index keys etc. are ignored)
+JOB_SUMMARY_LIST_ADAPTER = TypeAdapter(List[JobSummary])
+
+
 # DynamoDB Item Models (internal use)
+# Long free-text attributes are stored compressed (see app.utils.text_compression)
+COMPRESSED_TEXT_FIELDS = ('job_description', 'notes')
+
+# Non-job items in a user's partition (e.g. the status counters) have sort keys
+# starting with "#", which sorts before every job ID; job queries start at JOB_ID_MIN
+AUXILIARY_KEY_PREFIX = "#"
+JOB_ID_MIN = "0"
+COUNTERS_JOB_ID = "#COUNTERS"
+
+# A job's description is kept in its own item (sort key `#DESC#<job_id>`), so
+# the job item that lists, stats and updates read stays small
+DESCRIPTION_KEY_PREFIX = "#DESC#"
+
+# Idempotency-Key reservations and stored responses (see app.utils.idempotency);
+# DynamoDB TTL removes them through the `ttl` attribute
+IDEMPOTENCY_KEY_PREFIX = "#IDEM#"
+
+
+def is_job_id(job_id: str) -> bool:
+    """Check whether a sort key belongs to a job (rather than an auxiliary item)"""
+    return not job_id.startswith(AUXILIARY_KEY_PREFIX)
+
+
+def description_key(job_id: str) -> str:
+    """Sort key of the item holding a job's description"""
+    return f"{DESCRIPTION_KEY_PREFIX}{job_id}"
+
+
+def idempotency_key(scope: str, key: str) -> str:
+    """Sort key of the item holding an Idempotency-Key of a user"""
+    return f"{IDEMPOTENCY_KEY_PREFIX}{scope}#{key}"
+
+
 class JobItem(BaseModel):
-    """DynamoDB item model for job applications"""
+    """
+    DynamoDB item model for job applications
+    
+    `job_description` and `notes` hold a `CompressedText` when read from a
+    compressed attribute; write items with `to_item()`.
+    
+    The description is stored in a separate item (`description_item()`);
+    the job item only carries it if it was written before the split
+    (`split-job-descriptions` migration).
+    """
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+    
     user_id: str = Field(..., description="Cognito user ID (sub)")
-    job_id: str = Field(default_factory=lambda: str(uuid.uuid4()), description="Unique job ID")
+    job_id: str = Field(default_factory=new_ulid, description="Unique, time-ordered job ID (ULID)")
     company: str
     position: str
     status: str = JobStatus.APPLIED.value
@@ -115,8 +197,8 @@ class JobItem(BaseModel):
     salary_range: Optional[str] = None
     location: Optional[str] = None
     job_type: Optional[str] = None
-    job_description: Optional[str] = None
-    notes: Optional[str] = None
+    job_description: Optional[Union[str, CompressedText]] = None
+    notes: Optional[Union[str, CompressedText]] = None
     interview_date: Optional[str] = None
     follow_up_date: Optional[str] = None
     created_at: str = Field(default_factory=lambda: datetime.utcnow().isoformat())
@@ -124,18 +206,39 @@ class JobItem(BaseModel):
     
     # DynamoDB specific fields for indexing
     sk: str = Field(default="JOB", description="Sort key for single table design")
-    gsi1_pk: Optional[str] = None  # Global Secondary Index partition key
-    gsi1_sk: Optional[str] = None  # Global Secondary Index sort key
+    gsi1_pk: Optional[str] = None  # Per-user status index partition key (user_id#status)
+    gsi1_sk: Optional[str] = None  # Per-user status index sort key (created_at)
     ttl: Optional[int] = None  # Time to live for automatic deletion
     
+    @field_validator(*COMPRESSED_TEXT_FIELDS, mode='before')
+    def wrap_compressed_text(cls, v):
+        return load_text(v)
+    
+    @field_serializer(*COMPRESSED_TEXT_FIELDS, when_used='json')
+    def serialize_text(self, v):
+        return text_value(v)
+    
+    @staticmethod
+    def status_key(user_id: str, status: str) -> str:
+        """Partition key of the per-user status index (`user_id#status`)"""
+        return f"{user_id}#{status}"
+    
+    def set_index_keys(self) -> "JobItem":
+        """Populate the per-user status index keys from the current status"""
+        self.gsi1_pk = self.status_key(self.user_id, self.status)
+        self.gsi1_sk = self.created_at
+        return self
+    
     @classmethod
     def from_create_request(cls, user_id: str, request: JobCreateRequest) -> "JobItem":
         """Create JobItem from JobCreateRequest"""
-        job_id = str(uuid.uuid4())
-        now = datetime.utcnow().isoformat()
+        created = datetime.utcnow()
+        job_id = new_ulid(created)  # Sorts by creation time within the user's partition
+        now = created.isoformat()
+        status = request.status.value if request.status else JobStatus.APPLIED.value
         
-        # Set GSI keys for status-based queries
-        gsi1_pk = request.status.value if request.status else JobStatus.APPLIED.value
+        # Set GSI keys for per-user status queries
+        gsi1_pk = cls.status_key(user_id, status)
         gsi1_sk = now
         
         return cls(
@@ -143,7 +246,7 @@ class JobItem(BaseModel):
             job_id=job_id,
             company=request.company,
             position=request.position,
-            status=request.status.value if request.status else JobStatus.APPLIED.value,
+            status=status,
             applied_date=now,
             application_link=request.application_link,
             salary_range=request.salary_range,
@@ -173,34 +276,87 @@ class JobItem(BaseModel):
                 else:
                     setattr(self, field, value)
         
-        # Update GSI keys if status changed
-        if 'status' in update_data:
-            self.gsi1_pk = update_data['status'].value if hasattr(update_data['status'], 'value') else update_data['status']
-            self.gsi1_sk = now
+        # Keep the per-user status index keys in step with the status
+        self.set_index_keys()
         
         self.updated_at = now
         return self
     
+    def to_item(self) -> Dict[str, Any]:
+        """The job item to write (without the description; notes compressed if long)"""
+        item = self.dict(exclude={'job_description'})
+        item['notes'] = stored_text(item['notes'])
+        return item
+    
+    def description_item(self) -> Optional[Dict[str, Any]]:
+        """The description item to write next to the job item (None without a description)"""
+        if self.job_description is None:
+            return None
+        return {
+            'user_id': self.user_id,
+            'job_id': description_key(self.job_id),
+            'job_description': stored_text(self.job_description),
+            'updated_at': self.updated_at
+        }
+    
+    def without_description(self) -> "JobItem":
+        """A copy without the description (what the job cache holds)"""
+        return self.model_copy(update={'job_description': None})
+    
+    def to_summary(self) -> JobSummary:
+        """Convert JobItem (possibly read with the summary projection) to JobSummary"""
+        return JobSummary.model_validate(self, from_attributes=True)
+    
     def to_response(self) -> JobResponse:
         """Convert JobItem to JobResponse"""
-        return JobResponse(
-            user_id=self.user_id,
-            job_id=self.job_id,
-            company=self.company,
-            position=self.position,
-            status=JobStatus(self.status),
-            applied_date=datetime.fromisoformat(self.applied_date.replace('Z', '+00:00')) if 'Z' in self.applied_date else datetime.fromisoformat(self.applied_date),
-            application_link=self.application_link,
-            salary_range=self.salary_range,
-            location=self.location,
-            job_type=JobType(self.job_type) if self.job_type else None,
-            job_description=self.job_description,
-            notes=self.notes,
-            interview_date=datetime.fromisoformat(self.interview_date.replace('Z', '+00:00')) if self.interview_date and 'Z' in self.interview_date else datetime.fromisoformat(self.interview_date) if self.interview_date else None,
-            follow_up_date=datetime.fromisoformat(self.follow_up_date.replace('Z', '+00:00')) if self.follow_up_date and 'Z' in self.follow_up_date else datetime.fromisoformat(self.follow_up_date) if self.follow_up_date else None,
-            created_at=datetime.fromisoformat(self.created_at.replace('Z', '+00:00')) if 'Z' in self.created_at else datetime.fromisoformat(self.created_at),
-            updated_at=datetime.fromisoformat(self.updated_at.replace('Z', '+00:00')) if 'Z' in self.updated_at else datetime.fromisoformat(self.updated_at)
+        return JobResponse.model_validate(self, from_attributes=True)
+
+
+# Index keys are rebuilt on restore, so archived payloads leave them out
+ARCHIVE_EXCLUDED_FIELDS = {'gsi1_pk', 'gsi1_sk', 'ttl'}
+ARCHIVE_COMPRESSION_LEVEL = 6
+
+
+class ArchivedJobItem(BaseModel):
+    """
+    Cold-store item of an archived job (jobs archive table)
+    
+    The whole job is kept as zlib-compressed JSON in `payload`; only the keys
+    and what the archive lists sort or expire by are plain attributes.
+    """
+    user_id: str
+    job_id: str
+    status: str
+    archived_at: str
+    payload: bytes
+    ttl: Optional[int] = None  # Epoch seconds when DynamoDB TTL purges it (None keeps it)
+    
+    @field_validator('payload', mode='before')
+    def unwrap_binary(cls, v):
+        # boto3 returns Binary attributes wrapped in boto3.dynamodb.types.Binary
+        return getattr(v, 'value', v)
+    
+    @classmethod
+    def from_job_item(cls, job: JobItem, retention_days: int = 0) -> "ArchivedJobItem":
+        """Compress a job for the archive (retention_days > 0 sets the TTL)"""
+        archived = datetime.utcnow()
+        document = job.model_dump_json(exclude=ARCHIVE_EXCLUDED_FIELDS)
+        ttl = None
+        if retention_days > 0:
+            ttl = int(archived.replace(tzinfo=timezone.utc).timestamp()) + retention_days * 86400
+        
+        return cls(
+            user_id=job.user_id,
+            job_id=job.job_id,
+            status=job.status,
+            archived_at=archived.isoformat(),
+            payload=zlib.compress(document.encode(), ARCHIVE_COMPRESSION_LEVEL),
+            ttl=ttl
         )
+    
+    def to_job_item(self) -> JobItem:
+        """Decompress the archived job (index keys set again)"""
+        return JobItem.model_validate_json(zlib.decompress(self.payload)).set_index_keys()
 
 
 # User Models for Cognito + DynamoDB
@@ -304,6 +460,18 @@ class MessageResponse(BaseModel):
         }
 
 
+class BulkItemResult(BaseModel):
+    """Outcome of a bulk operation for one job"""
+    job_id: str
+    outcome: str  # "updated", "deleted", "not_found" or "failed"
+    error: Optional[str] = None
+
+
+class BulkOperationResponse(MessageResponse):
+    """Bulk operation summary with per-job outcomes"""
+    results: List[BulkItemResult] = []
+
+
 class ErrorResponse(BaseModel):
     """Error response model"""
     error: str
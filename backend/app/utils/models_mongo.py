@@ -7,9 +7,12 @@ This module defines the database models for MongoDB using Beanie ODM.
 from datetime import datetime, date
 from typing import Optional, List, Union
 from beanie import Document
-from pydantic import EmailStr, BaseModel, Field, field_serializer, field_validator
+from pydantic import EmailStr, BaseModel, Field, field_serializer, field_validator, model_validator
 from bson import ObjectId
 from pydantic import ConfigDict
+from pymongo import ASCENDING, IndexModel
+
+from .text_compression import CompressedText, load_text, text_value
 
 
 class User(Document):
@@ -55,14 +58,19 @@ class User(Document):
 
 
 class Job(Document):
-    """Job application model for MongoDB"""
+    """
+    Job application model for MongoDB
+    
+    Long notes are stored compressed (BSON Binary, see text_compression);
+    `notes` then holds a CompressedText, use `text_value(job.notes)`.
+    """
     user_id: str  # Store as string instead of ObjectId
     company: str
     position: str
     status: str = "Applied"  # Applied, Interview, Offer, Rejected
     applied_date: datetime  # Changed from date to datetime
     application_link: Optional[str] = None
-    notes: Optional[str] = None
+    notes: Optional[Union[str, CompressedText]] = None
     created_at: datetime = Field(default_factory=datetime.utcnow)
     updated_at: datetime = Field(default_factory=datetime.utcnow)
     
@@ -86,8 +94,18 @@ class Job(Document):
         }
     )
     
+    @field_validator('notes', mode='before')
+    @classmethod
+    def wrap_compressed_notes(cls, v):
+        return load_text(v)
+    
+    @field_serializer('notes', when_used='json')
+    def serialize_notes(self, v):
+        return text_value(v)
+    
     class Settings:
         name = "jobs"
+        bson_encoders = {CompressedText: lambda value: value.data}
         
     def __repr__(self):
         return f"<Job {self.position} at {self.company}>"
@@ -102,7 +120,7 @@ class Job(Document):
             "status": self.status,
             "applied_date": self.applied_date.isoformat() if self.applied_date else None,
             "application_link": self.application_link,
-            "notes": self.notes,
+            "notes": text_value(self.notes),
             "created_at": self.created_at,
             "updated_at": self.updated_at,
             "salary_range": self.salary_range,
@@ -113,6 +131,71 @@ class Job(Document):
         }
 
 
+class JobDescription(Document):
+    """
+    Job posting description, kept in its own collection
+    
+    Descriptions are the largest part of a job, and only the detail view
+    shows them; keeping them out of `jobs` keeps list, stats and update
+    reads small. The document shares its `_id` with the job it belongs to.
+    Long texts are stored compressed like job notes.
+    """
+    user_id: str
+    job_description: Union[str, CompressedText]
+    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+    
+    @field_validator('job_description', mode='before')
+    @classmethod
+    def wrap_compressed_description(cls, v):
+        return load_text(v)
+    
+    @field_serializer('job_description', when_used='json')
+    def serialize_description(self, v):
+        return text_value(v)
+    
+    class Settings:
+        name = "job_descriptions"
+        bson_encoders = {CompressedText: lambda value: value.data}
+        indexes = [
+            "user_id"
+        ]
+
+
+class IdempotencyRecord(Document):
+    """
+    Idempotency-Key reservation and stored response (see app.utils.idempotency)
+    
+    The unique index on (user_id, scope, key) makes reserving a key an
+    insert that only one request wins; the TTL index removes records once
+    `expires_at` has passed.
+    """
+    user_id: str
+    scope: str
+    key: str
+    fingerprint: str
+    status_code: Optional[int] = None
+    response: Optional[Union[str, CompressedText]] = None
+    locked_until: datetime
+    expires_at: datetime
+    
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+    
+    @field_validator('response', mode='before')
+    @classmethod
+    def wrap_compressed_response(cls, v):
+        return load_text(v)
+    
+    class Settings:
+        name = "idempotency_keys"
+        bson_encoders = {CompressedText: lambda value: value.data}
+        indexes = [
+            IndexModel([("user_id", ASCENDING), ("scope", ASCENDING), ("key", ASCENDING)], unique=True),
+            IndexModel([("expires_at", ASCENDING)], expireAfterSeconds=0)
+        ]
+
+
 # Pydantic models for API requests/responses
 class UserSignup(BaseModel):
     """User signup request model"""
@@ -144,6 +227,7 @@ class JobCreate(BaseModel):
     applied_date: Union[datetime, str]  # Allow both datetime and string
     application_link: Optional[str] = None
     notes: Optional[str] = None
+    job_description: Optional[str] = None
     salary_range: Optional[str] = None
     location: Optional[str] = None
     job_type: Optional[str] = None
@@ -191,6 +275,7 @@ class JobUpdate(BaseModel):
     applied_date: Optional[Union[datetime, str]] = None  # Allow both datetime and string
     application_link: Optional[str] = None
     notes: Optional[str] = None
+    job_description: Optional[str] = None
     salary_range: Optional[str] = None
     location: Optional[str] = None
     job_type: Optional[str] = None
@@ -216,7 +301,7 @@ class JobUpdate(BaseModel):
 
 
 class JobResponse(BaseModel):
-    """Job response model"""
+    """Job response model (job_description only when requested)"""
     id: str
     user_id: str
     company: str
@@ -225,6 +310,7 @@ class JobResponse(BaseModel):
     applied_date: datetime  # Changed from date to datetime
     application_link: Optional[str] = None
     notes: Optional[str] = None
+    job_description: Optional[str] = None
     created_at: datetime
     updated_at: datetime
     salary_range: Optional[str] = None
@@ -233,6 +319,58 @@ class JobResponse(BaseModel):
     interview_date: Optional[datetime] = None  # Changed from date to datetime
     follow_up_date: Optional[datetime] = None  # Changed from date to datetime
 
+    @field_validator('notes', 'job_description', mode='before')
+    @classmethod
+    def decompress_notes(cls, v):
+        # Job keeps long notes compressed until they are needed here
+        return text_value(v)
+
+
+class JobSummaryResponse(BaseModel):
+    """
+    Job fields shown in job lists (description via GET /api/jobs/{job_id})
+    
+    Also the Beanie projection model for list queries, so MongoDB only
+    returns these fields: Job.find(...).project(JobSummaryResponse)
+    """
+    id: str
+    user_id: str
+    company: str
+    position: str
+    status: str
+    applied_date: datetime
+    application_link: Optional[str] = None
+    created_at: datetime
+    updated_at: datetime
+    salary_range: Optional[str] = None
+    location: Optional[str] = None
+    job_type: Optional[str] = None
+    interview_date: Optional[datetime] = None
+    follow_up_date: Optional[datetime] = None
+    notes: Optional[str] = None  # Shown on the job cards
+    
+    class Settings:
+        projection = {
+            "_id": 1, "user_id": 1, "company": 1, "position": 1, "status": 1, "applied_date": 1,
+            "application_link": 1, "created_at": 1, "updated_at": 1, "salary_range": 1,
+            "location": 1, "job_type": 1, "interview_date": 1, "follow_up_date": 1, "notes": 1
+        }
+    
+    @field_validator('notes', mode='before')
+    @classmethod
+    def decompress_notes(cls, v):
+        # Projected documents carry long notes as compressed BSON Binary
+        return text_value(load_text(v))
+    
+    @model_validator(mode='before')
+    @classmethod
+    def map_document_id(cls, data):
+        """Projected documents carry the ObjectId as `_id`"""
+        if isinstance(data, dict) and "_id" in data:
+            data = {**data, "id": str(data["_id"])}
+            del data["_id"]
+        return data
+
 
 class Token(BaseModel):
     """JWT Token response model"""
@@ -14,7 +14,7 @@ from dotenv import load_dotenv
 load_dotenv()
 
 # MongoDB Models
-from .models_mongo import User, Job
+from .models_mongo import User, Job, JobDescription, IdempotencyRecord
 
 class MongoDB:
     client: Optional[AsyncIOMotorClient] = None
@@ -39,7 +39,7 @@ async def connect_to_mongo():
         # Initialize Beanie with the Product document class and a database
         await init_beanie(
             database=mongodb.database,
-            document_models=[User, Job]
+            document_models=[User, Job, JobDescription, IdempotencyRecord]
         )
         
         print("✅ Connected to MongoDB successfully!")
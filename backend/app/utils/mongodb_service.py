@@ -4,12 +4,24 @@ MongoDB Service Layer
 This module handles all database operations for MongoDB using Beanie ODM.
 """
 
-from datetime import datetime, date
+from datetime import datetime, date, timedelta
 from typing import Optional, List
+from beanie import UpdateResponse
 from bson import ObjectId
+from pymongo.errors import DuplicateKeyError
 
-from .models_mongo import User, Job, UserSignup, JobCreate, JobUpdate
+from .models_mongo import (
+    User, Job, JobDescription, IdempotencyRecord, UserSignup, JobCreate, JobUpdate, JobSummaryResponse
+)
 from .security import hash_password
+from .cache import ReadThroughCache
+from .idempotency import (
+    IdempotencyStore, StoredResponse, IDEMPOTENCY_LOCK_SECONDS, IDEMPOTENCY_TTL_SECONDS, replay
+)
+from .text_compression import compress_text, stored_text, text_value
+
+# User documents carry password hashes, so they are only cached in-process
+user_cache = ReadThroughCache("mongo_users", User, shared=False)
 
 
 class UserService:
@@ -27,9 +39,9 @@ class UserService:
     
     @staticmethod
     async def get_user_by_id(user_id: str) -> Optional[User]:
-        """Get user by ID"""
+        """Get user by ID (cached; /auth/me and /auth/refresh look it up on every call)"""
         try:
-            return await User.get(ObjectId(user_id))
+            return await user_cache.get(user_id, lambda: User.get(ObjectId(user_id)))
         except:
             return None
     
@@ -51,6 +63,7 @@ class UserService:
         
         # Save to database
         await user.insert()
+        await user_cache.set(str(user.id), user)
         return user
 
 
@@ -65,6 +78,14 @@ class JobService:
         except:
             return []
     
+    @staticmethod
+    async def get_job_summaries_by_user(user_id: str) -> List[JobSummaryResponse]:
+        """Get the list view of all jobs for a user (job descriptions are not read)"""
+        try:
+            return await Job.find(Job.user_id == user_id).project(JobSummaryResponse).to_list()
+        except:
+            return []
+    
     @staticmethod
     async def get_job_by_id(job_id: str, user_id: str) -> Optional[Job]:
         """Get a specific job by ID for a user"""
@@ -74,6 +95,30 @@ class JobService:
         except:
             return None
     
+    @staticmethod
+    async def get_job_description(job_id: str, user_id: str) -> Optional[str]:
+        """Get the description of a job (kept in the job_descriptions collection)"""
+        try:
+            description = await JobDescription.find_one(
+                JobDescription.id == ObjectId(job_id), JobDescription.user_id == user_id
+            )
+        except:
+            return None
+        return text_value(description.job_description) if description else None
+    
+    @staticmethod
+    async def set_job_description(job: Job, job_description: Optional[str]) -> None:
+        """Write (or with an empty text remove) the description of a job"""
+        if job_description:
+            await JobDescription(
+                id=job.id,
+                user_id=job.user_id,
+                job_description=compress_text(job_description),
+                updated_at=datetime.utcnow()
+            ).save()
+        else:
+            await JobDescription.find_one(JobDescription.id == job.id).delete()
+    
     @staticmethod
     async def create_job(job_data: JobCreate, user_id: str) -> Job:
         """Create a new job application"""
@@ -102,7 +147,7 @@ class JobService:
                 "status": job_data.status,
                 "applied_date": applied_date,
                 "application_link": job_data.application_link,
-                "notes": job_data.notes,
+                "notes": compress_text(job_data.notes),
                 "salary_range": job_data.salary_range,
                 "location": job_data.location,
                 "job_type": job_data.job_type,
@@ -117,6 +162,8 @@ class JobService:
             
             # Save to database
             await job.insert()
+            if job_data.job_description:
+                await JobService.set_job_description(job, job_data.job_description)
             return job
         except Exception as e:
             print(f"Error in create_job service: {e}")
@@ -139,6 +186,10 @@ class JobService:
                 for field, value in update_data.dict(exclude_unset=True).items():
                     if value is not None:
                         update_dict[field] = value
+                if "notes" in update_dict:
+                    update_dict["notes"] = stored_text(update_dict["notes"])
+                if "job_description" in update_dict:
+                    await JobService.set_job_description(job, update_dict.pop("job_description"))
                 
                 update_dict["updated_at"] = datetime.utcnow()
                 
@@ -157,6 +208,7 @@ class JobService:
             job = await Job.find_one(Job.id == job_obj_id, Job.user_id == user_id)
             if job:
                 await job.delete()
+                await JobDescription.find_one(JobDescription.id == job_obj_id).delete()
                 return True
             return False
         except:
@@ -216,3 +268,63 @@ class JobService:
                 "application_rate": 0.0,
                 "success_rate": 0.0
             }
+
+
+class MongoIdempotencyStore(IdempotencyStore):
+    """
+    Idempotency-Key store in the idempotency_keys collection
+    
+    Reserving is an insert guarded by the unique (user_id, scope, key)
+    index; an expired or abandoned record is taken over with a conditional
+    update instead.
+    """
+    
+    async def reserve(self, user_id: str, scope: str, key: str, fingerprint: str) -> Optional[StoredResponse]:
+        for _ in range(3):
+            now = datetime.utcnow()
+            fields = {
+                "fingerprint": fingerprint,
+                "status_code": None,
+                "response": None,
+                "locked_until": now + timedelta(seconds=IDEMPOTENCY_LOCK_SECONDS),
+                "expires_at": now + timedelta(seconds=IDEMPOTENCY_TTL_SECONDS)
+            }
+            try:
+                await IdempotencyRecord(user_id=user_id, scope=scope, key=key, **fields).insert()
+                return None
+            except DuplicateKeyError:
+                pass
+            
+            taken = await IdempotencyRecord.find_one({
+                "user_id": user_id, "scope": scope, "key": key,
+                "$or": [{"expires_at": {"$lt": now}}, {"status_code": None, "locked_until": {"$lt": now}}]
+            }).update({"$set": fields}, response_type=UpdateResponse.NEW_DOCUMENT)
+            if taken is not None:
+                return None
+            
+            record = await IdempotencyRecord.find_one(
+                IdempotencyRecord.user_id == user_id, IdempotencyRecord.scope == scope, IdempotencyRecord.key == key
+            )
+            if record is not None:
+                return replay(record.fingerprint, record.status_code, text_value(record.response), fingerprint)
+        
+        raise Exception(f"Idempotency-Key {key} of {user_id} kept changing")
+    
+    async def complete(self, user_id: str, scope: str, key: str, response: StoredResponse) -> None:
+        await IdempotencyRecord.find_one(
+            IdempotencyRecord.user_id == user_id, IdempotencyRecord.scope == scope, IdempotencyRecord.key == key
+        ).update({"$set": {
+            "status_code": response.status_code,
+            "response": stored_text(response.body),
+            "expires_at": datetime.utcnow() + timedelta(seconds=IDEMPOTENCY_TTL_SECONDS)
+        }})
+    
+    async def release(self, user_id: str, scope: str, key: str) -> None:
+        await IdempotencyRecord.find_one(
+            IdempotencyRecord.user_id == user_id, IdempotencyRecord.scope == scope,
+            IdempotencyRecord.key == key, IdempotencyRecord.status_code == None  # noqa: E711 - query expression
+        ).delete()
+
+
+# Shared instance
+idempotency_store = MongoIdempotencyStore()
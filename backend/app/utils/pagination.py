@@ -0,0 +1,88 @@
+"""
+Continuation Tokens for Paginated API Responses
+
+DynamoDB pages are resumed from a `LastEvaluatedKey`, which contains raw key
+attributes. Instead of handing those to API clients, list endpoints return
+an opaque token that:
+
+- Is URL-safe base64 JSON signed with HMAC-SHA256, so it can't be forged
+- Is bound to a scope (user and query), so it can't be replayed against
+  another user's partition or a different query
+"""
+
+import base64
+import hashlib
+import hmac
+import json
+import os
+import secrets
+from typing import Any, Dict
+
+# Signing secret (shared by all API workers so tokens survive load balancing)
+PAGINATION_TOKEN_SECRET = os.getenv("PAGINATION_TOKEN_SECRET") or os.getenv("JWT_SECRET_KEY")
+if not PAGINATION_TOKEN_SECRET:
+    print("⚠️ PAGINATION_TOKEN_SECRET not set - continuation tokens are only valid in this process")
+    PAGINATION_TOKEN_SECRET = secrets.token_hex(32)
+
+
+class InvalidContinuationToken(ValueError):
+    """Raised when a continuation token is malformed, tampered with or used out of scope"""
+
+
+def _b64encode(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode("ascii")
+
+
+def _b64decode(text: str) -> bytes:
+    return base64.urlsafe_b64decode(text + "=" * (-len(text) % 4))
+
+
+def _sign(payload: str, scope: str) -> str:
+    message = f"{scope}\n{payload}".encode("utf-8")
+    return _b64encode(hmac.new(PAGINATION_TOKEN_SECRET.encode("utf-8"), message, hashlib.sha256).digest())
+
+
+def encode_continuation_token(last_evaluated_key: Dict[str, Any], scope: str) -> str:
+    """
+    Create an opaque token for resuming a query
+
+    Args:
+        last_evaluated_key: DynamoDB `LastEvaluatedKey` (string/number attributes)
+        scope: What the token may be used for (e.g. "jobs:<user_id>")
+
+    Returns:
+        str: Signed, URL-safe continuation token
+    """
+    payload = _b64encode(json.dumps(last_evaluated_key, separators=(",", ":"), sort_keys=True).encode("utf-8"))
+    return f"{payload}.{_sign(payload, scope)}"
+
+
+def decode_continuation_token(token: str, scope: str) -> Dict[str, Any]:
+    """
+    Verify a continuation token and get the key to resume from
+
+    Args:
+        token: Token returned by a previous page
+        scope: Scope the token must have been issued for
+
+    Returns:
+        Dict[str, Any]: `ExclusiveStartKey` for the next query
+
+    Raises:
+        InvalidContinuationToken: If the token is malformed, forged or out of scope
+    """
+    try:
+        payload, signature = token.split(".", 1)
+    except (AttributeError, ValueError):
+        raise InvalidContinuationToken("Malformed continuation token")
+
+    if not hmac.compare_digest(signature, _sign(payload, scope)):
+        raise InvalidContinuationToken("Invalid continuation token")
+
+    try:
+        key = json.loads(_b64decode(payload))
+    except (ValueError, UnicodeDecodeError):
+        raise InvalidContinuationToken("Malformed continuation token")
+    if not isinstance(key, dict):
+        raise InvalidContinuationToken("Malformed continuation token")
+    return key
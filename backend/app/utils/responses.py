@@ -0,0 +1,18 @@
+"""
+JSON Response Rendering
+
+`FastJSONResponse` renders response bodies with orjson when it is installed
+(several times faster than the standard library `json` for large job lists)
+and falls back to FastAPI's `JSONResponse` otherwise. Routers opt in with
+`APIRouter(default_response_class=FastJSONResponse)`.
+"""
+
+from fastapi.responses import JSONResponse, ORJSONResponse
+
+try:
+    import orjson  # noqa: F401 - required by ORJSONResponse
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+FastJSONResponse = ORJSONResponse if ORJSON_AVAILABLE else JSONResponse
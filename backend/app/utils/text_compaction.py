@@ -0,0 +1,221 @@
+"""
+Resume Text Compaction
+
+This module cleans extracted resume text before it is put into an AI prompt.
+Raw PDF text carries a lot of tokens that add nothing to the analysis:
+
+- Unicode NFKC normalization (ligatures, full-width and compatibility characters)
+- Bullet glyphs mapped to "-", soft hyphens and zero-width characters removed
+- Words hyphenated across a line break joined back together; compounds
+  broken at their own hyphen ("self-motivated", "full-stack") keep it
+- Headers, footers and page numbers repeated on every page removed
+- Runs of spaces/tabs collapsed and blank lines dropped
+- Section headings (Experience, Education, Skills, ...) detected and marked
+"""
+
+import re
+import unicodedata
+from collections import Counter
+from typing import Dict, List
+
+from pydantic import BaseModel
+
+from .extraction_service import PAGE_SEPARATOR
+
+# Only the first/last lines of a page are considered header/footer candidates
+EDGE_LINES = 3
+
+# Canonical section names and the headings that map to them
+SECTION_HEADINGS: Dict[str, List[str]] = {
+    "Summary": ["summary", "professional summary", "profile", "about me", "objective", "career objective"],
+    "Experience": ["experience", "work experience", "professional experience", "employment",
+                   "employment history", "work history"],
+    "Education": ["education", "academic background", "qualifications", "academics"],
+    "Skills": ["skills", "technical skills", "core skills", "key skills", "technologies",
+               "core competencies", "competencies"],
+    "Projects": ["projects", "personal projects", "key projects", "academic projects"],
+    "Certifications": ["certifications", "certificates", "licenses", "licenses and certifications"],
+    "Achievements": ["achievements", "awards", "honors", "honours", "accomplishments"],
+    "Publications": ["publications", "research"],
+    "Languages": ["languages"],
+    "Interests": ["interests", "hobbies"],
+}
+
+_HEADING_LOOKUP = {alias: name for name, aliases in SECTION_HEADINGS.items() for alias in aliases}
+
+# Words that start or end hyphenated compounds common in resumes; a line
+# break after "self-" or before "-oriented" is the compound's own hyphen
+COMPOUND_HEADS = {
+    "self", "full", "cross", "well", "end", "real", "high", "low", "long", "short", "front", "back",
+    "open", "client", "server", "test", "data", "detail", "results", "team", "fast", "part", "non",
+    "multi", "cloud", "user", "customer", "mission", "business", "object", "event", "state", "web",
+    "machine", "peer", "one", "two", "three", "first", "hands", "top", "large", "small", "mid",
+    "entry", "senior", "co", "ex", "fine", "problem", "deep", "cutting", "go", "hard",
+}
+COMPOUND_TAILS = {
+    "motivated", "oriented", "driven", "based", "focused", "minded", "facing", "stack", "end",
+    "time", "level", "scale", "source", "world", "depth", "house", "native", "critical", "solving",
+    "starter", "learner", "working", "paced", "edge", "grained", "functional", "tuning", "sensitive",
+    "ready", "aware", "on", "to", "up", "out",
+}
+
+_BULLETS = "•◦▪▫■□●○►▶➢➤✓✔❖◆◇·∙"
+_BULLET_PATTERN = re.compile(rf"^[{_BULLETS}*]\s*")
+_INVISIBLE_PATTERN = re.compile("[\u00ad\u200b\u200c\u200d\u2060\ufeff]")
+_HYPHENATION_PATTERN = re.compile(r"(\w[\w-]*)-[ \t]*\n[ \t]*([a-z]\w*)")
+_SPACES_PATTERN = re.compile(r"[^\S\n]+")
+_DIGITS_PATTERN = re.compile(r"\d+")
+_PAGE_NUMBER_PATTERN = re.compile(r"^(page\s*)?\d{1,3}(\s*(of|/)\s*\d{1,3})?$|^-\s*\d{1,3}\s*-$", re.IGNORECASE)
+
+
+class CompactedText(BaseModel):
+    """Result of compacting a resume"""
+    text: str
+    sections: List[str] = []
+    original_length: int = 0
+    compacted_length: int = 0
+    removed_lines: int = 0
+
+    @property
+    def reduction(self) -> float:
+        """Fraction of characters removed (0.0 - 1.0)"""
+        if not self.original_length:
+            return 0.0
+        return 1 - self.compacted_length / self.original_length
+
+
+def normalize_unicode(text: str) -> str:
+    """Apply NFKC and drop invisible characters (soft hyphens, zero-width spaces, BOMs)"""
+    text = unicodedata.normalize("NFKC", text)
+    return _INVISIBLE_PATTERN.sub("", text)
+
+
+def _join_hyphenated(match: "re.Match") -> str:
+    """
+    Join a word hyphenated across a line break unless it is a compound
+
+    The hyphen is kept when the first part holds a digit or another hyphen
+    ("24-", "state-of-"), or either part is a known compound word
+    (COMPOUND_HEADS / COMPOUND_TAILS, e.g. "Self-", "-oriented").
+    """
+    head, tail = match.group(1), match.group(2)
+    last = head.rsplit("-", 1)[-1]
+    if ("-" in head or any(char.isdigit() for char in last)
+            or last.lower() in COMPOUND_HEADS or tail in COMPOUND_TAILS):
+        return f"{head}-{tail}"
+    return head + tail
+
+
+def _clean_line(line: str) -> str:
+    """Collapse whitespace inside a line and normalize its bullet"""
+    line = _SPACES_PATTERN.sub(" ", line).strip()
+    return _BULLET_PATTERN.sub("- ", line) if line else line
+
+
+def _line_signature(line: str) -> str:
+    """Key used to find repeated lines (page numbers inside headers/footers vary)"""
+    return _DIGITS_PATTERN.sub("#", line.lower())
+
+
+def _remove_page_furniture(pages: List[List[str]]) -> int:
+    """
+    Remove page numbers and headers/footers repeated across pages, in place
+
+    A line is furniture when it sits in the first or last EDGE_LINES lines of
+    a page and the same line (ignoring digits) sits at an edge of at least
+    half of the pages. The first occurrence is kept so a name/contact header
+    repeated on every page still appears once.
+
+    Returns:
+        int: Number of lines removed
+    """
+    def edge_indexes(lines: List[str]) -> List[int]:
+        count = len(lines)
+        return sorted(set(range(min(EDGE_LINES, count))) | set(range(max(0, count - EDGE_LINES), count)))
+
+    repeated = set()
+    if len(pages) > 1:
+        edge_counts = Counter()
+        for lines in pages:
+            edge_counts.update({_line_signature(lines[i]) for i in edge_indexes(lines)})
+        threshold = max(2, (len(pages) + 1) // 2)
+        repeated = {signature for signature, count in edge_counts.items() if count >= threshold}
+
+    removed = 0
+    seen = set()
+    for lines in pages:
+        drop = set()
+        for i in edge_indexes(lines):
+            signature = _line_signature(lines[i])
+            if _PAGE_NUMBER_PATTERN.match(lines[i]) or signature in seen:
+                drop.add(i)
+            elif signature in repeated:
+                seen.add(signature)
+        if drop:
+            lines[:] = [line for i, line in enumerate(lines) if i not in drop]
+            removed += len(drop)
+    return removed
+
+
+def detect_section(line: str) -> str:
+    """
+    Get the canonical section name if the line is a section heading
+
+    Args:
+        line: A cleaned line of text
+
+    Returns:
+        str: Section name (e.g. "Experience"), or "" if the line isn't a heading
+    """
+    if len(line) > 40:
+        return ""
+    key = re.sub(r"[^a-z ]", "", line.lower().replace("&", "and")).strip()
+    return _HEADING_LOOKUP.get(re.sub(r"\s+", " ", key), "")
+
+
+def compact_resume_text(text: str, mark_sections: bool = True) -> CompactedText:
+    """
+    Compact extracted resume text for prompting
+
+    Args:
+        text: Extracted text (pages separated by form feeds)
+        mark_sections: Rewrite detected section headings as "## <Section>"
+
+    Returns:
+        CompactedText: Compacted text, detected sections and size statistics
+    """
+    original_length = len(text)
+    text = normalize_unicode(text).replace("\r\n", "\n").replace("\r", "\n")
+
+    # Join words split across lines ("develop-\nment" -> "development", "self-\nmotivated" stays)
+    text = _HYPHENATION_PATTERN.sub(_join_hyphenated, text)
+
+    pages = []
+    for page in text.split(PAGE_SEPARATOR):
+        lines = [_clean_line(line) for line in page.split("\n")]
+        pages.append([line for line in lines if line])
+    removed_lines = _remove_page_furniture(pages)
+
+    output: List[str] = []
+    sections: List[str] = []
+    for line in (line for lines in pages for line in lines):
+        section = detect_section(line)
+        if section:
+            if section not in sections:
+                sections.append(section)
+            if mark_sections:
+                line = f"## {section}"
+        # Drop lines duplicated back to back (e.g. the same header on a page join)
+        if output and output[-1] == line:
+            removed_lines += 1
+            continue
+        output.append(line)
+
+    compacted = "\n".join(output)
+    return CompactedText(
+        text=compacted,
+        sections=sections,
+        original_length=original_length,
+        compacted_length=len(compacted),
+        removed_lines=removed_lines
+    )
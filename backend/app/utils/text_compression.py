@@ -0,0 +1,119 @@
+"""
+Compression of Long Stored Texts
+
+Free-text job fields (job_description, notes) make up most of a stored job,
+and with it most of the read/write capacity and bytes of every item access.
+They are stored compressed:
+
+- Texts of at least TEXT_COMPRESSION_MIN_BYTES (UTF-8) are written as binary
+  values (DynamoDB B / BSON Binary): one codec byte + the compressed text
+- zstd (zstandard package) when installed, zlib otherwise; the codec byte
+  keeps values written with either readable (zstd ones need zstandard)
+- Shorter texts, and texts that don't get smaller, stay plain strings
+- Read values are wrapped in `CompressedText`, which only decompresses when
+  the text is used, so reads that never look at it (updates of other
+  fields, stats, cache storage) don't pay for it
+
+Plain strings written before compression existed are read unchanged.
+"""
+
+import os
+import zlib
+from typing import Optional, Union
+
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+# Shorter texts are stored as is (compression overhead outweighs the savings)
+TEXT_COMPRESSION_MIN_BYTES = int(os.getenv("TEXT_COMPRESSION_MIN_BYTES", "256"))
+
+# "zstd" or "zlib" for new writes (zstd needs the zstandard package)
+TEXT_COMPRESSION_CODEC = os.getenv("TEXT_COMPRESSION_CODEC", "zstd" if ZSTD_AVAILABLE else "zlib")
+
+_ZLIB = 1
+_ZSTD = 2
+
+
+class CompressedText:
+    """A stored compressed text; decompressed (once) when `text` is first used"""
+    __slots__ = ("data", "_text")
+
+    def __init__(self, data: bytes):
+        self.data = data
+        self._text = None
+
+    @property
+    def text(self) -> str:
+        if self._text is None:
+            self._text = _decompress(self.data)
+        return self._text
+
+    def __str__(self) -> str:
+        return self.text
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, CompressedText):
+            return self.data == other.data
+        return isinstance(other, str) and self.text == other
+
+    def __hash__(self) -> int:
+        return hash(self.data)
+
+    def __deepcopy__(self, memo) -> "CompressedText":
+        return self  # Immutable
+
+    def __repr__(self) -> str:
+        return f"<CompressedText {len(self.data)} bytes>"
+
+
+def _compress(text: str) -> Optional[bytes]:
+    """Codec byte + compressed text, or None when not worth it"""
+    raw = text.encode("utf-8")
+    if len(raw) < TEXT_COMPRESSION_MIN_BYTES:
+        return None
+    if TEXT_COMPRESSION_CODEC == "zstd" and ZSTD_AVAILABLE:
+        data = bytes([_ZSTD]) + zstandard.ZstdCompressor(level=6).compress(raw)
+    else:
+        data = bytes([_ZLIB]) + zlib.compress(raw, 6)
+    return data if len(data) < len(raw) else None
+
+
+def _decompress(data: bytes) -> str:
+    codec, body = data[0], data[1:]
+    if codec == _ZSTD:
+        if not ZSTD_AVAILABLE:
+            raise RuntimeError("Text was stored with zstd - install the zstandard package to read it")
+        return zstandard.ZstdDecompressor().decompress(body).decode("utf-8")
+    return zlib.decompress(body).decode("utf-8")
+
+
+def compress_text(value: Union[str, CompressedText, None]) -> Union[str, CompressedText, None]:
+    """Compress a text about to be stored if it is long enough (stored values pass through)"""
+    if isinstance(value, str):
+        data = _compress(value)
+        if data is not None:
+            compressed = CompressedText(data)
+            compressed._text = value
+            return compressed
+    return value
+
+
+def load_text(value) -> Union[str, CompressedText, None]:
+    """Wrap a binary value read from storage (bytes, boto3 Binary, bson Binary) without decompressing"""
+    if isinstance(value, (str, CompressedText)) or value is None:
+        return value
+    return CompressedText(bytes(getattr(value, "value", value)))
+
+
+def stored_text(value: Union[str, CompressedText, None]) -> Union[str, bytes, None]:
+    """The value to write: compressed bytes for long texts, the text otherwise"""
+    value = compress_text(value)
+    return value.data if isinstance(value, CompressedText) else value
+
+
+def text_value(value: Union[str, CompressedText, None]) -> Optional[str]:
+    """The plain text (decompresses stored values)"""
+    return value.text if isinstance(value, CompressedText) else value
@@ -0,0 +1,151 @@
+"""
+Write-Behind Buffering
+
+Non-critical writes (last login timestamps and similar bookkeeping) don't
+need to finish inside the request that triggers them. A `WriteBehindBuffer`:
+
+- Takes updates synchronously (`put` returns immediately)
+- Coalesces updates per key until the next flush; later values win
+- Flushes every WRITE_BEHIND_WINDOW_SECONDS in a background task, or early
+  once WRITE_BEHIND_MAX_PENDING keys are waiting
+- Keeps the updates of a failed flush for the next one (unless newer
+  values replaced them); a flush that wrote some keys raises
+  `PartialFlushError` with the rest, and only those are kept
+- Drops (and logs) a key's updates after WRITE_BEHIND_MAX_ATTEMPTS failed
+  flushes in a row, so a permanently failing key isn't retried forever
+- Drains on shutdown (`drain_write_buffers` in the app lifespan)
+
+Updates still buffered when a process dies are lost, so only use it for
+data that may lag or go missing.
+"""
+
+import asyncio
+import os
+from typing import Any, Awaitable, Callable, Dict, Hashable, List
+
+from app.utils.metrics import metrics
+
+WRITE_BEHIND_WINDOW_SECONDS = float(os.getenv("WRITE_BEHIND_WINDOW_SECONDS", "5"))
+WRITE_BEHIND_MAX_PENDING = int(os.getenv("WRITE_BEHIND_MAX_PENDING", "1000"))
+WRITE_BEHIND_MAX_ATTEMPTS = int(os.getenv("WRITE_BEHIND_MAX_ATTEMPTS", "5"))
+
+Updates = Dict[Hashable, Dict[str, Any]]
+
+# Every buffer created in this process, for draining on shutdown
+_buffers: List["WriteBehindBuffer"] = []
+
+
+class PartialFlushError(Exception):
+    """Raised by a flush function that wrote some updates but not `failed`"""
+
+    def __init__(self, failed: Updates, message: str = ""):
+        super().__init__(message or f"{len(failed)} update(s) failed")
+        self.failed = failed
+
+
+class WriteBehindBuffer:
+    """Coalesces updates per key and writes them in the background"""
+
+    def __init__(self, name: str, flush: Callable[[Updates], Awaitable[None]],
+                 window_seconds: float = WRITE_BEHIND_WINDOW_SECONDS, max_pending: int = WRITE_BEHIND_MAX_PENDING,
+                 max_attempts: int = WRITE_BEHIND_MAX_ATTEMPTS):
+        """
+        Args:
+            name: Buffer name (metric label)
+            flush: Coroutine function writing {key: {field: value}}; raising
+                keeps every update for the next flush (PartialFlushError:
+                only its `failed` ones)
+            window_seconds: Time between background flushes
+            max_pending: Keys that trigger an early flush
+            max_attempts: Failed flushes in a row after which a key's
+                updates are dropped
+        """
+        self.name = name
+        self._flush = flush
+        self.window_seconds = window_seconds
+        self.max_pending = max_pending
+        self.max_attempts = max_attempts
+        self._pending: Updates = {}
+        self._attempts: Dict[Hashable, int] = {}
+        self._task = None
+        self._wake = None
+        self._stopping = False
+        _buffers.append(self)
+
+    @property
+    def pending(self) -> int:
+        return len(self._pending)
+
+    def put(self, key: Hashable, values: Dict[str, Any]) -> None:
+        """
+        Queue an update (must be called from the event loop)
+
+        Args:
+            key: What the update applies to (e.g. a user ID)
+            values: Field values; merged over values already queued for the key
+        """
+        self._pending.setdefault(key, {}).update(values)
+        metrics.increment("write_behind_updates", buffer=self.name)
+        self._ensure_running()
+        if len(self._pending) >= self.max_pending:
+            self._wake.set()
+
+    def _ensure_running(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._task is None or self._task.done() or self._task.get_loop() is not loop:
+            self._wake = asyncio.Event()
+            self._task = loop.create_task(self._run())
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=self.window_seconds)
+            except asyncio.TimeoutError:
+                pass
+            self._wake.clear()
+            await self.flush()
+            if self._stopping:
+                return
+
+    async def flush(self) -> None:
+        """Write everything queued so far"""
+        pending, self._pending = self._pending, {}
+        if not pending:
+            return
+
+        metrics.observe("write_behind_flush_keys", len(pending), buffer=self.name)
+        failed: Updates = {}
+        try:
+            await self._flush(pending)
+        except Exception as e:
+            print(f"⚠️ Write-behind flush of {self.name} failed, retrying with the next flush: {e}")
+            metrics.increment("write_behind_flush_failures", buffer=self.name)
+            failed = e.failed if isinstance(e, PartialFlushError) else pending
+
+        for key in pending.keys() - failed.keys():
+            self._attempts.pop(key, None)
+        for key, values in failed.items():
+            attempts = self._attempts.get(key, 0) + 1
+            if attempts >= self.max_attempts:
+                print(f"❌ Write-behind of {self.name} dropped the updates of {key!r} after {attempts} failed flushes")
+                metrics.increment("write_behind_dropped", buffer=self.name)
+                self._attempts.pop(key, None)
+                continue
+            self._attempts[key] = attempts
+            self._pending[key] = {**values, **self._pending.get(key, {})}
+
+    async def drain(self) -> None:
+        """Let the background task finish its last flush, then flush what is left"""
+        if self._task is not None and not self._task.done():
+            self._stopping = True
+            self._wake.set()
+            await self._task
+        self._stopping = False
+        self._task = None
+        await self.flush()
+
+
+async def drain_write_buffers() -> None:
+    """Flush every write-behind buffer (call on shutdown, before closing connections)"""
+    for buffer in _buffers:
+        await buffer.drain()
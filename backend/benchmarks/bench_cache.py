@@ -0,0 +1,111 @@
+"""
+Read-Through Cache Benchmark
+
+Seeds one user with jobs, then replays a detail-view workload (skewed
+towards a few recently viewed jobs, with an edit every few reads, the way a
+user moves between the list and job pages) against JobRepository with the
+job cache disabled and enabled. Reports GetItem calls, hit ratio and
+latency.
+
+Usage (from the backend directory, with a local DynamoDB running):
+    python -m benchmarks.bench_cache --endpoint-url http://localhost:8000 --jobs 200 --requests 2000
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import time
+
+from benchmarks.bench_dynamodb import add_simulated_latency, configure_environment
+
+
+class GetItemCalls:
+    """Counts GetItem requests via botocore events"""
+
+    def __init__(self, client):
+        self.total = 0
+        client.meta.events.register("before-call.dynamodb.GetItem", self._count)
+
+    def _count(self, **kwargs):
+        self.total += 1
+
+    def take(self) -> int:
+        total, self.total = self.total, 0
+        return total
+
+
+async def replay(repository, user_id: str, job_ids, requests: int, write_every: int, seed: int):
+    """Run the workload; returns per-request latencies in ms"""
+    from app.utils.models_dynamodb import JobUpdateRequest
+
+    rng = random.Random(seed)
+    latencies = []
+    for index in range(requests):
+        # Pareto-skewed choice: a handful of jobs get most of the views
+        job_id = job_ids[min(int(rng.paretovariate(1.2)) - 1, len(job_ids) - 1)]
+        start = time.perf_counter()
+        if write_every and index % write_every == write_every - 1:
+            await repository.update_job(user_id, job_id, JobUpdateRequest(notes=f"Edit {index}"))
+        else:
+            await repository.get_job_by_id(user_id, job_id)
+        latencies.append((time.perf_counter() - start) * 1000)
+    return latencies
+
+
+async def main_async(args):
+    from app.utils.dynamodb_config import dynamodb_config
+    from app.utils.dynamodb_service import JobRepository, job_cache
+    from app.utils.models_dynamodb import JobCreateRequest
+
+    dynamodb_config.create_tables_if_not_exist()
+    repository = JobRepository()
+    user_id = "cache-user"
+    jobs = [await repository.create_job(user_id, JobCreateRequest(company=f"Company {index}", position="Engineer"))
+            for index in range(args.jobs)]
+    job_ids = [job.job_id for job in jobs]
+
+    client = dynamodb_config.dynamodb_client
+    if args.latency_ms:
+        add_simulated_latency(client, args.latency_ms)
+    calls = GetItemCalls(client)
+    ttl_seconds = job_cache.ttl_seconds
+
+    print(f"📂 {args.jobs} jobs, {args.requests} requests, an edit every {args.write_every}\n")
+    print(f"{'cache':<9} {'GetItem':>8} {'hit ratio':>10} {'avg ms':>8} {'p95 ms':>8}")
+    try:
+        for label, ttl in (("disabled", 0), ("enabled", ttl_seconds)):
+            job_cache.clear()
+            job_cache.ttl_seconds = ttl
+            before = job_cache.stats()
+            calls.take()
+            latencies = sorted(await replay(repository, user_id, job_ids, args.requests, args.write_every, args.seed))
+            after = job_cache.stats()
+            lookups = after["hits"] + after["misses"] - before["hits"] - before["misses"]
+            hit_ratio = (after["hits"] - before["hits"]) / lookups if lookups else 0.0
+            print(f"{label:<9} {calls.take():>8} {hit_ratio:>10.2f} "
+                  f"{sum(latencies) / len(latencies):>8.1f} {latencies[int(len(latencies) * 0.95)]:>8.1f}")
+    finally:
+        job_cache.ttl_seconds = ttl_seconds
+        client.delete_table(TableName=dynamodb_config.jobs_table_name)
+        client.delete_table(TableName=dynamodb_config.users_table_name)
+        client.delete_table(TableName=dynamodb_config.archive_table_name)
+        dynamodb_config.shutdown()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark job lookups with and without the read-through cache")
+    parser.add_argument("--endpoint-url", default=os.getenv("DYNAMODB_ENDPOINT_URL", "http://localhost:8000"))
+    parser.add_argument("--jobs", type=int, default=200)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--write-every", type=int, default=10, help="Every Nth request is an update (0 for none)")
+    parser.add_argument("--latency-ms", type=float, default=10, help="Simulated round trip per request (0 to disable)")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    configure_environment(args.endpoint_url)
+    asyncio.run(main_async(args))
+
+
+if __name__ == "__main__":
+    main()
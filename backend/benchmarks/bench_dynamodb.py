@@ -0,0 +1,127 @@
+"""
+DynamoDB Repository Concurrency Benchmark
+
+Compares the old blocking access pattern (boto3 `Table` calls made directly
+inside `async def` handlers) with the `AsyncTable`-based `JobRepository` at
+increasing request concurrency, against a local DynamoDB stand-in.
+
+A local stand-in answers in well under a millisecond, so `--latency-ms`
+adds a simulated network round trip (default 15 ms, typical for DynamoDB
+from an app server) to every request before it is sent.
+
+Start a local DynamoDB first, for example one of:
+    docker run -p 8000:8000 amazon/dynamodb-local
+    moto_server -p 8000
+
+Usage (from the backend directory):
+    python -m benchmarks.bench_dynamodb --endpoint-url http://localhost:8000
+    python -m benchmarks.bench_dynamodb --requests 2000 --concurrency 1 8 32 64
+"""
+
+import argparse
+import asyncio
+import os
+import time
+import uuid
+
+
+def configure_environment(endpoint_url: str):
+    """Point the app's DynamoDB config at the local stand-in (before importing it)"""
+    os.environ["USE_LOCAL_DYNAMODB"] = "true"
+    os.environ["DYNAMODB_ENDPOINT_URL"] = endpoint_url
+    os.environ.setdefault("AWS_ACCESS_KEY_ID", "local")
+    os.environ.setdefault("AWS_SECRET_ACCESS_KEY", "local")
+    # Local emulators can queue requests for seconds under load and ignore the
+    # idempotency token of retried transactions, so don't time out early
+    os.environ.setdefault("DYNAMODB_READ_TIMEOUT", "60")
+    suffix = uuid.uuid4().hex[:8]
+    os.environ["DYNAMODB_JOBS_TABLE"] = f"bench-jobs-{suffix}"
+    os.environ["DYNAMODB_USERS_TABLE"] = f"bench-users-{suffix}"
+    os.environ["DYNAMODB_JOBS_ARCHIVE_TABLE"] = f"bench-archive-{suffix}"
+
+
+def add_simulated_latency(client, latency_ms: float):
+    """
+    Sleep before every request a client sends, like a network round trip would
+
+    Returns the handler so it can be removed with
+    `client.meta.events.unregister("before-send.dynamodb", handler)`.
+    """
+    def delay(**kwargs):
+        time.sleep(latency_ms / 1000)
+
+    # First, so it also runs for in-process stand-ins (moto) that answer from before-send
+    client.meta.events.register_first("before-send.dynamodb", delay)
+    return delay
+
+
+async def run_requests(fetch, keys, concurrency: int) -> float:
+    """Issue one lookup per key with at most `concurrency` in flight; returns requests/second"""
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one(user_id, job_id):
+        async with semaphore:
+            await fetch(user_id, job_id)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one(user_id, job_id) for user_id, job_id in keys))
+    return len(keys) / (time.perf_counter() - start)
+
+
+async def main_async(args):
+    from app.utils.dynamodb_config import dynamodb_config
+    from app.utils.dynamodb_service import JobRepository, job_cache
+    from app.utils.models_dynamodb import JobCreateRequest
+
+    # Measure DynamoDB round trips, not cache hits (concurrent lookups are still batched)
+    job_cache.ttl_seconds = 0
+    dynamodb_config.create_tables_if_not_exist()
+    if args.latency_ms:
+        add_simulated_latency(dynamodb_config.dynamodb_client, args.latency_ms)
+        add_simulated_latency(dynamodb_config.dynamodb_resource.meta.client, args.latency_ms)
+    repository = JobRepository()
+    blocking_table = dynamodb_config.jobs_table
+
+    print(f"🌱 Seeding {args.jobs} jobs into {dynamodb_config.jobs_table_name}...")
+    users = [f"bench-user-{index}" for index in range(args.users)]
+    created = await asyncio.gather(*(
+        repository.create_job(users[index % len(users)], JobCreateRequest(company=f"Company {index}", position="Engineer"))
+        for index in range(args.jobs)
+    ))
+    keys = [(job.user_id, job.job_id) for job in created]
+    keys = [keys[index % len(keys)] for index in range(args.requests)]
+
+    async def blocking_fetch(user_id, job_id):
+        # What the repository used to do: a blocking call on the event loop
+        blocking_table.get_item(Key={"user_id": user_id, "job_id": job_id})
+
+    print(f"🔌 Worker pool / connection pool size: {dynamodb_config.max_workers}\n")
+    print(f"{'concurrency':>11} {'blocking req/s':>15} {'async req/s':>12} {'speedup':>8}")
+    try:
+        for concurrency in args.concurrency:
+            blocking = await run_requests(blocking_fetch, keys, concurrency)
+            non_blocking = await run_requests(repository.get_job_by_id, keys, concurrency)
+            print(f"{concurrency:>11} {blocking:>15.0f} {non_blocking:>12.0f} {non_blocking / blocking:>7.1f}x")
+    finally:
+        dynamodb_config.dynamodb_client.delete_table(TableName=dynamodb_config.jobs_table_name)
+        dynamodb_config.dynamodb_client.delete_table(TableName=dynamodb_config.users_table_name)
+        dynamodb_config.dynamodb_client.delete_table(TableName=dynamodb_config.archive_table_name)
+        dynamodb_config.shutdown()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark blocking vs async DynamoDB repository access")
+    parser.add_argument("--endpoint-url", default=os.getenv("DYNAMODB_ENDPOINT_URL", "http://localhost:8000"))
+    parser.add_argument("--users", type=int, default=20, help="Users to spread the seeded jobs over")
+    parser.add_argument("--jobs", type=int, default=200, help="Jobs to seed")
+    parser.add_argument("--requests", type=int, default=1000, help="Lookups per run")
+    parser.add_argument("--latency-ms", type=float, default=15, help="Simulated round trip per request (0 to disable)")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 16, 32])
+    args = parser.parse_args()
+
+    configure_environment(args.endpoint_url)
+    asyncio.run(main_async(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+DynamoDB Point-Read Batching Benchmark
+
+Seeds one user with jobs, then fetches N of them concurrently (like the
+frontend fanning out detail requests) two ways: one GetItem per job, and
+through `AsyncTable.load_item`, which coalesces the lookups into
+BatchGetItem calls. Reports DynamoDB requests sent and wall time per
+fan-out size. The job cache is not involved.
+
+Usage (from the backend directory, with a local DynamoDB running):
+    python -m benchmarks.bench_dynamodb_batching --endpoint-url http://localhost:8000 --fan-out 10 50 200
+"""
+
+import argparse
+import asyncio
+import os
+import time
+
+from benchmarks.bench_dynamodb import add_simulated_latency, configure_environment
+
+
+class RequestCount:
+    """Counts DynamoDB requests via botocore events"""
+
+    def __init__(self, client):
+        self.total = 0
+        client.meta.events.register("before-call.dynamodb", self._count)
+
+    def _count(self, **kwargs):
+        self.total += 1
+
+    def take(self) -> int:
+        total, self.total = self.total, 0
+        return total
+
+
+async def main_async(args):
+    from app.utils.dynamodb_config import dynamodb_config
+    from app.utils.models_dynamodb import JobItem
+
+    dynamodb_config.create_tables_if_not_exist()
+    table = dynamodb_config.async_jobs_table
+    user_id = "batching-user"
+    items = [JobItem(user_id=user_id, company=f"Company {index}", position="Engineer").set_index_keys().dict()
+             for index in range(max(args.fan_out))]
+    await table.batch_write(put_items=items)
+    keys = [{"user_id": user_id, "job_id": item["job_id"]} for item in items]
+
+    client = dynamodb_config.dynamodb_client
+    if args.latency_ms:
+        add_simulated_latency(client, args.latency_ms)
+    requests = RequestCount(client)
+
+    async def get_items(batch):
+        return await asyncio.gather(*(table.get_item(Key=key) for key in batch))
+
+    async def load_items(batch):
+        return await asyncio.gather(*(table.load_item(key) for key in batch))
+
+    print(f"🔌 Worker pool size {dynamodb_config.max_workers}, batch window {table.loader.window_seconds * 1000:.0f} ms\n")
+    print(f"{'fan-out':>7} {'GetItem reqs':>13} {'ms':>7} {'batched reqs':>13} {'ms':>7}")
+    try:
+        for size in args.fan_out:
+            row = []
+            for fetch in (get_items, load_items):
+                requests.take()
+                start = time.perf_counter()
+                await fetch(keys[:size])
+                row += [requests.take(), (time.perf_counter() - start) * 1000]
+            print(f"{size:>7} {row[0]:>13} {row[1]:>7.0f} {row[2]:>13} {row[3]:>7.0f}")
+    finally:
+        client.delete_table(TableName=dynamodb_config.jobs_table_name)
+        client.delete_table(TableName=dynamodb_config.users_table_name)
+        client.delete_table(TableName=dynamodb_config.archive_table_name)
+        dynamodb_config.shutdown()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark per-key GetItem vs batched point reads")
+    parser.add_argument("--endpoint-url", default=os.getenv("DYNAMODB_ENDPOINT_URL", "http://localhost:8000"))
+    parser.add_argument("--fan-out", type=int, nargs="+", default=[10, 50, 200], help="Concurrent lookups per run")
+    parser.add_argument("--latency-ms", type=float, default=10, help="Simulated round trip per request (0 to disable)")
+    args = parser.parse_args()
+
+    configure_environment(args.endpoint_url)
+    asyncio.run(main_async(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""
+DynamoDB Bulk Operations Benchmark
+
+Measures `/api/jobs/bulk` latency for 25/100/500 job IDs, comparing the old
+per-id loop (read + conditional write per job) with the batched repository
+paths (one BatchGetItem for the current statuses, then transactions of up to
+99 job writes plus the counters update).
+
+Usage (from the backend directory, with a local DynamoDB running):
+    python -m benchmarks.bench_dynamodb_bulk --endpoint-url http://localhost:8000
+    python -m benchmarks.bench_dynamodb_bulk --sizes 25 100 500 --latency-ms 10
+"""
+
+import argparse
+import asyncio
+import os
+import time
+
+from benchmarks.bench_dynamodb import add_simulated_latency, configure_environment
+
+
+async def seed(repository, user_id: str, count: int):
+    """Create `count` jobs for one user and return their IDs"""
+    from app.utils.models_dynamodb import JobCreateRequest
+
+    semaphore = asyncio.Semaphore(32)
+
+    async def create(index):
+        async with semaphore:
+            return await repository.create_job(user_id, JobCreateRequest(company=f"Company {index}", position="Engineer"))
+
+    jobs = await asyncio.gather(*(create(index) for index in range(count)))
+    return [job.job_id for job in jobs]
+
+
+async def timed(coroutine) -> float:
+    start = time.perf_counter()
+    await coroutine
+    return (time.perf_counter() - start) * 1000
+
+
+async def main_async(args):
+    from app.utils.dynamodb_config import dynamodb_config
+    from app.utils.dynamodb_service import JobRepository
+    from app.utils.models_dynamodb import JobStatus, JobUpdateRequest
+
+    dynamodb_config.create_tables_if_not_exist()
+    repository = JobRepository()
+
+    async def sequential_update(user_id, job_ids):
+        for job_id in job_ids:
+            await repository.update_job(user_id, job_id, JobUpdateRequest(status=JobStatus.REJECTED))
+
+    async def sequential_delete(user_id, job_ids):
+        for job_id in job_ids:
+            await repository.delete_job(user_id, job_id)
+
+    print(f"{'ids':>5} {'operation':<14} {'sequential ms':>14} {'batched ms':>11} {'speedup':>8}")
+    try:
+        for size in args.sizes:
+            # Seed without simulated latency, then measure with it
+            user_id = f"bulk-user-{size}"
+            job_ids = await seed(repository, user_id, size * 2)
+            old_ids, new_ids = job_ids[:size], job_ids[size:]
+
+            client = dynamodb_config.dynamodb_client
+            handler = add_simulated_latency(client, args.latency_ms) if args.latency_ms else None
+
+            before = await timed(sequential_update(user_id, old_ids))
+            after = await timed(repository.bulk_update_status(user_id, new_ids, JobStatus.REJECTED))
+            print(f"{size:>5} {'status update':<14} {before:>14.0f} {after:>11.0f} {before / after:>7.1f}x")
+
+            before = await timed(sequential_delete(user_id, old_ids))
+            after = await timed(repository.bulk_delete_jobs(user_id, new_ids))
+            print(f"{size:>5} {'delete':<14} {before:>14.0f} {after:>11.0f} {before / after:>7.1f}x")
+
+            if handler:
+                client.meta.events.unregister("before-send.dynamodb", handler)
+    finally:
+        dynamodb_config.dynamodb_client.delete_table(TableName=dynamodb_config.jobs_table_name)
+        dynamodb_config.dynamodb_client.delete_table(TableName=dynamodb_config.users_table_name)
+        dynamodb_config.dynamodb_client.delete_table(TableName=dynamodb_config.archive_table_name)
+        dynamodb_config.shutdown()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark sequential vs batched bulk job operations")
+    parser.add_argument("--endpoint-url", default=os.getenv("DYNAMODB_ENDPOINT_URL", "http://localhost:8000"))
+    parser.add_argument("--sizes", type=int, nargs="+", default=[25, 100, 500])
+    parser.add_argument("--latency-ms", type=float, default=10, help="Simulated round trip per request (0 to disable)")
+    args = parser.parse_args()
+
+    configure_environment(args.endpoint_url)
+    asyncio.run(main_async(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""
+DynamoDB List Projection Benchmark
+
+Seeds one user with jobs carrying realistic job descriptions and notes, then
+lists them twice: reading full items into JobResponse (the old list path)
+and reading only the JobSummary attributes (ProjectionExpression) into
+JobSummary. Reports response bytes received from DynamoDB, client CPU time
+(response parsing, deserialization, model validation) and wall time. Wall time against a
+DynamoDB emulator mostly reflects the emulator's own projection cost.
+
+Usage (from the backend directory, with a local DynamoDB running):
+    python -m benchmarks.bench_dynamodb_projection --endpoint-url http://localhost:8000 --jobs 500
+"""
+
+import argparse
+import asyncio
+import os
+import time
+
+from benchmarks.bench_dynamodb import add_simulated_latency, configure_environment
+
+DESCRIPTION = "We are looking for an engineer to design, build and operate distributed services. " * 55
+NOTES = "Referred by a former colleague; follow up with the recruiter after the onsite. " * 12
+
+
+async def seed(repository, user_id: str, count: int):
+    from app.utils.models_dynamodb import JobCreateRequest
+
+    semaphore = asyncio.Semaphore(16)
+
+    async def create(index):
+        async with semaphore:
+            await repository.create_job(user_id, JobCreateRequest(
+                company=f"Company {index}", position="Software Engineer", location="Remote",
+                job_description=DESCRIPTION[:5000], notes=NOTES[:1000]
+            ))
+
+    await asyncio.gather(*(create(index) for index in range(count)))
+
+
+class ResponseBytes:
+    """Counts DynamoDB response bytes of one operation (Query by default) via botocore events"""
+
+    def __init__(self, client, operation: str = "Query"):
+        self.total = 0
+        client.meta.events.register(f"after-call.dynamodb.{operation}", self._count)
+
+    def _count(self, http_response, **kwargs):
+        self.total += len(http_response.content)
+
+    def take(self) -> int:
+        total, self.total = self.total, 0
+        return total
+
+
+async def main_async(args):
+    from boto3.dynamodb.conditions import Key
+    from app.utils.dynamodb_config import dynamodb_config
+    from app.utils.dynamodb_service import JobRepository
+    from app.utils.models_dynamodb import JobItem, JobStatus, JOB_ID_MIN
+
+    dynamodb_config.create_tables_if_not_exist()
+    repository = JobRepository()
+    user_id = "projection-user"
+    await seed(repository, user_id, args.jobs)
+
+    client = dynamodb_config.dynamodb_client
+    if args.latency_ms:
+        add_simulated_latency(client, args.latency_ms)
+    received = ResponseBytes(client)
+
+    async def full_list(**query_kwargs):
+        # The old list path: full items converted to JobResponse
+        return [JobItem(**item).to_response() async for item in repository.table.iterate_items(**query_kwargs)]
+
+    rows = [
+        ("partition", "full",
+         lambda: full_list(KeyConditionExpression=Key("user_id").eq(user_id) & Key("job_id").gte(JOB_ID_MIN))),
+        ("partition", "summary", lambda: repository.get_user_jobs_page(user_id)),
+        # The index only projects the summary attributes, so there is no full read to compare with
+        ("status index", "summary", lambda: repository.get_user_jobs_by_status_page(user_id, JobStatus.APPLIED)),
+    ]
+
+    print(f"📂 {args.jobs} jobs, ~{len(DESCRIPTION[:5000]) + len(NOTES[:1000])} chars of description + notes each\n")
+    print(f"{'query':<13} {'read':<8} {'KB received':>12} {'client CPU ms':>14} {'wall ms':>8}")
+    try:
+        for name, label, run in rows:
+            cpu, wall = [], []
+            for _ in range(args.repeat):
+                received.take()
+                cpu_start, wall_start = time.process_time(), time.perf_counter()
+                await run()
+                cpu.append((time.process_time() - cpu_start) * 1000)
+                wall.append((time.perf_counter() - wall_start) * 1000)
+            print(f"{name:<13} {label:<8} {received.take() / 1024:>12.0f} {min(cpu):>14.0f} {min(wall):>8.0f}")
+    finally:
+        client.delete_table(TableName=dynamodb_config.jobs_table_name)
+        client.delete_table(TableName=dynamodb_config.users_table_name)
+        client.delete_table(TableName=dynamodb_config.archive_table_name)
+        dynamodb_config.shutdown()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark full-item vs summary-projection job lists")
+    parser.add_argument("--endpoint-url", default=os.getenv("DYNAMODB_ENDPOINT_URL", "http://localhost:8000"))
+    parser.add_argument("--jobs", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per query (best is reported)")
+    parser.add_argument("--latency-ms", type=float, default=10, help="Simulated round trip per request (0 to disable)")
+    args = parser.parse_args()
+
+    configure_environment(args.endpoint_url)
+    asyncio.run(main_async(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""
+DynamoDB Job ID Ordering Benchmark
+
+Seeds one user with jobs spread over two years twice: once keyed by legacy
+uuid4 job IDs and once by time-ordered ULIDs. For "newest N" and "applied
+between X and Y" it reports the items DynamoDB read (ScannedCount) and the
+latency of each approach:
+
+- uuid4: the partition is unordered, so every job is read and sorted or
+  filtered in Python
+- ULID: ordering and the date window are part of the key condition
+
+Usage (from the backend directory, with a local DynamoDB running):
+    python -m benchmarks.bench_dynamodb_ranges --endpoint-url http://localhost:8000 --jobs 2000
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import time
+import uuid
+from datetime import datetime, timedelta
+
+from benchmarks.bench_dynamodb import add_simulated_latency, configure_environment
+
+
+def build_items(user_id: str, count: int, time_ordered: bool, seed: int):
+    """Jobs created at random times over the last two years"""
+    from app.utils.ids import new_ulid
+    from app.utils.models_dynamodb import JobItem
+
+    rng = random.Random(seed)
+    now = datetime.utcnow()
+    items = []
+    for index in range(count):
+        created = now - timedelta(minutes=rng.randint(0, 2 * 365 * 24 * 60))
+        job_id = new_ulid(created) if time_ordered else str(uuid.uuid4())
+        item = JobItem(
+            user_id=user_id, job_id=job_id, company=f"Company {index}", position="Engineer",
+            applied_date=created.isoformat(), created_at=created.isoformat(), updated_at=created.isoformat()
+        ).set_index_keys()
+        items.append(item.dict(exclude_none=True))
+    return items
+
+
+async def measure(table, first_page_only: bool = False, **query_kwargs):
+    """Run a query (to completion unless first_page_only); returns (items returned, items read, ms)"""
+    start = time.perf_counter()
+    returned = scanned = 0
+    async for page in table.iterate_pages(**query_kwargs):
+        returned += page["Count"]
+        scanned += page["ScannedCount"]
+        if first_page_only:
+            break
+    return returned, scanned, (time.perf_counter() - start) * 1000
+
+
+async def main_async(args):
+    from boto3.dynamodb.conditions import Key
+    from app.utils.dynamodb_config import dynamodb_config
+    from app.utils.ids import ulid_range
+
+    dynamodb_config.create_tables_if_not_exist()
+    table = dynamodb_config.async_jobs_table
+
+    legacy_items = build_items("legacy-user", args.jobs, time_ordered=False, seed=args.seed)
+    ordered_items = build_items("ulid-user", args.jobs, time_ordered=True, seed=args.seed)
+    await table.batch_write(put_items=legacy_items + ordered_items)
+    if args.latency_ms:
+        add_simulated_latency(dynamodb_config.dynamodb_client, args.latency_ms)
+
+    window_end = datetime.utcnow()
+    window_start = window_end - timedelta(days=args.window_days)
+
+    print(f"📂 {args.jobs} jobs per user, newest {args.newest}, window {args.window_days} days\n")
+    print(f"{'query':<22} {'ids':<6} {'returned':>9} {'items read':>11} {'ms':>8}")
+    try:
+        # Newest N
+        returned, scanned, elapsed = await measure(table, KeyConditionExpression=Key("user_id").eq("legacy-user"))
+        print(f"{'newest N':<22} {'uuid4':<6} {args.newest:>9} {scanned:>11} {elapsed:>8.0f}")
+        # One page of Limit=N is what /api/jobs?limit=N reads
+        returned, scanned, elapsed = await measure(
+            table, first_page_only=True,
+            KeyConditionExpression=Key("user_id").eq("ulid-user"), ScanIndexForward=False, Limit=args.newest
+        )
+        print(f"{'newest N':<22} {'ULID':<6} {returned:>9} {scanned:>11} {elapsed:>8.0f}")
+
+        # Applied between X and Y
+        returned, scanned, elapsed = await measure(
+            table,
+            KeyConditionExpression=Key("user_id").eq("legacy-user"),
+            FilterExpression="created_at BETWEEN :start AND :end",
+            ExpressionAttributeValues={":start": window_start.isoformat(), ":end": window_end.isoformat()}
+        )
+        print(f"{'applied between X, Y':<22} {'uuid4':<6} {returned:>9} {scanned:>11} {elapsed:>8.0f}")
+        returned, scanned, elapsed = await measure(
+            table,
+            KeyConditionExpression=Key("user_id").eq("ulid-user") & Key("job_id").between(*ulid_range(window_start, window_end))
+        )
+        print(f"{'applied between X, Y':<22} {'ULID':<6} {returned:>9} {scanned:>11} {elapsed:>8.0f}")
+    finally:
+        dynamodb_config.dynamodb_client.delete_table(TableName=dynamodb_config.jobs_table_name)
+        dynamodb_config.dynamodb_client.delete_table(TableName=dynamodb_config.users_table_name)
+        dynamodb_config.dynamodb_client.delete_table(TableName=dynamodb_config.archive_table_name)
+        dynamodb_config.shutdown()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark uuid4 vs ULID job IDs for ordered and ranged queries")
+    parser.add_argument("--endpoint-url", default=os.getenv("DYNAMODB_ENDPOINT_URL", "http://localhost:8000"))
+    parser.add_argument("--jobs", type=int, default=2000, help="Jobs per user")
+    parser.add_argument("--newest", type=int, default=20, help="N for the newest-N query")
+    parser.add_argument("--window-days", type=int, default=30, help="Length of the date window")
+    parser.add_argument("--latency-ms", type=float, default=10, help="Simulated round trip per request (0 to disable)")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    configure_environment(args.endpoint_url)
+    asyncio.run(main_async(args))
+
+
+if __name__ == "__main__":
+    main()
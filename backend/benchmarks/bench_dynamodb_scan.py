@@ -0,0 +1,106 @@
+"""
+Parallel Scan Benchmark
+
+Seeds the jobs table (job and description items), then reads it whole
+with the same status aggregation (`AggregateSink`) in several ways:
+
+- sequential: one `iterate_items("scan")` loop (how the migrations read
+  the table before)
+- `ParallelScan` with 1, 2, 4, 8 and 16 segments
+- `ParallelScan` with 8 segments held to --max-rcu consumed RCU per second
+
+Reports pages, items, consumed RCU, wall time and items per second.
+
+DynamoDB Local supports Segment/TotalSegments; emulators that ignore it
+(moto returns the whole table for every segment) are reported and give
+meaningless numbers.
+
+Usage (from the backend directory, with a local DynamoDB running):
+    python -m benchmarks.bench_dynamodb_scan --endpoint-url http://localhost:8000 --jobs 5000
+"""
+
+import argparse
+import asyncio
+import os
+import time
+
+from benchmarks.bench_dynamodb import add_simulated_latency, configure_environment
+from benchmarks.bench_dynamodb_projection import DESCRIPTION
+
+
+async def main_async(args):
+    from app.utils.dynamodb_config import dynamodb_config
+    from app.utils.dynamodb_scan import AggregateSink, ParallelScan
+    from app.utils.models_dynamodb import JobItem, JobStatus
+
+    dynamodb_config.create_tables_if_not_exist()
+    table = dynamodb_config.async_jobs_table
+    statuses = list(JobStatus)
+    jobs = [
+        JobItem(user_id=f"scan-user-{index % args.users}", company=f"Company {index}", position="Software Engineer",
+                status=statuses[index % len(statuses)].value, location="Remote",
+                job_description=DESCRIPTION[:args.description_chars]).set_index_keys()
+        for index in range(args.jobs)
+    ]
+    items = [item for job in jobs for item in (job.to_item(), job.description_item())]
+    await table.batch_write(put_items=items)
+
+    client = dynamodb_config.dynamodb_client
+    if args.latency_ms:
+        add_simulated_latency(client, args.latency_ms)
+
+    async def sequential():
+        sink = AggregateSink("status")
+        stats = {"pages": 0, "items": 0, "consumed_rcu": 0.0}
+        start = time.perf_counter()
+        async for page in table.iterate_pages("scan", Limit=args.page_size):
+            await sink.write(page["Items"])
+            stats["pages"] += 1
+            stats["items"] += page["Count"]
+            stats["consumed_rcu"] += page.get("ConsumedCapacity", {}).get("CapacityUnits", 0)
+        stats["seconds"] = time.perf_counter() - start
+        return stats
+
+    runs = [("sequential", sequential)]
+    for segments in (1, 2, 4, 8, 16):
+        runs.append((f"{segments} segments", lambda segments=segments: ParallelScan(
+            table, segments, concurrency=segments, max_rcu_per_second=0, Limit=args.page_size
+        ).run(AggregateSink("status"))))
+    runs.append((f"8 @ {args.max_rcu:g} RCU/s", lambda: ParallelScan(
+        table, 8, concurrency=8, max_rcu_per_second=args.max_rcu, Limit=args.page_size
+    ).run(AggregateSink("status"))))
+
+    print(f"🔎 {args.jobs} jobs ({args.description_chars} char descriptions), page size {args.page_size}, "
+          f"{args.latency_ms:g} ms simulated latency\n")
+    print(f"{'scan':<18} {'pages':>6} {'items':>7} {'RCU':>8} {'seconds':>8} {'items/s':>9}")
+    try:
+        for label, run in runs:
+            stats = await run()
+            print(f"{label:<18} {stats['pages']:>6} {stats['items']:>7} {stats['consumed_rcu']:>8.1f} "
+                  f"{stats['seconds']:>8.2f} {stats['items'] / stats['seconds']:>9.0f}")
+            if stats["items"] > len(items):
+                print("⚠️ More items than the table holds - this endpoint ignores Segment/TotalSegments")
+    finally:
+        client.delete_table(TableName=dynamodb_config.jobs_table_name)
+        client.delete_table(TableName=dynamodb_config.users_table_name)
+        client.delete_table(TableName=dynamodb_config.archive_table_name)
+        dynamodb_config.shutdown()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark sequential vs. parallel segmented table scans")
+    parser.add_argument("--endpoint-url", default=os.getenv("DYNAMODB_ENDPOINT_URL", "http://localhost:8000"))
+    parser.add_argument("--jobs", type=int, default=5000)
+    parser.add_argument("--users", type=int, default=200)
+    parser.add_argument("--description-chars", type=int, default=2000)
+    parser.add_argument("--page-size", type=int, default=100, help="Scan Limit per page")
+    parser.add_argument("--max-rcu", type=float, default=50, help="Consumed RCU per second of the limited run")
+    parser.add_argument("--latency-ms", type=float, default=10, help="Simulated round trip per request (0 to disable)")
+    args = parser.parse_args()
+
+    configure_environment(args.endpoint_url)
+    asyncio.run(main_async(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+DynamoDB Cold-Start Benchmark
+
+Starts fresh Python processes that do what a worker (or a test run) does on
+startup and reports the median time of each phase:
+
+- import: importing the DynamoDB repositories (what test collection pays)
+- startup: the app lifespan's DynamoDB work (`dynamodb_config.warm_up` when
+  available; older trees connected during import instead)
+- first request: one job lookup through the repository
+
+Usage (from the backend directory, with a local DynamoDB running):
+    python -m benchmarks.bench_dynamodb_startup --endpoint-url http://localhost:8000 --runs 7
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+from benchmarks.bench_dynamodb import configure_environment
+
+
+def child():
+    """One cold start; prints the phase timings as JSON"""
+    start = time.perf_counter()
+    from app.utils.dynamodb_config import dynamodb_config
+    from app.utils.dynamodb_service import job_repository
+    from app.utils.ids import new_ulid
+    imported = time.perf_counter()
+
+    async def serve():
+        if hasattr(dynamodb_config, "warm_up"):
+            await dynamodb_config.warm_up()
+        started = time.perf_counter()
+        await job_repository.get_job_by_id("startup-user", new_ulid())
+        return started
+
+    started = asyncio.run(serve())
+    served = time.perf_counter()
+    dynamodb_config.shutdown()
+    print(json.dumps({
+        "import": (imported - start) * 1000,
+        "startup": (started - imported) * 1000,
+        "first request": (served - started) * 1000,
+    }))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark DynamoDB cold-start phases")
+    parser.add_argument("--endpoint-url", default=os.getenv("DYNAMODB_ENDPOINT_URL", "http://localhost:8000"))
+    parser.add_argument("--runs", type=int, default=7, help="Cold starts to run (median is reported)")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        child()
+        return
+
+    configure_environment(args.endpoint_url)
+    from app.utils.dynamodb_config import dynamodb_config
+
+    dynamodb_config.create_tables_if_not_exist()
+    try:
+        runs = []
+        for _ in range(args.runs):
+            output = subprocess.run(
+                [sys.executable, "-m", "benchmarks.bench_dynamodb_startup", "--child"],
+                capture_output=True, text=True, check=True, env=os.environ
+            ).stdout
+            runs.append(json.loads(output.strip().splitlines()[-1]))
+    finally:
+        dynamodb_config.dynamodb_client.delete_table(TableName=dynamodb_config.jobs_table_name)
+        dynamodb_config.dynamodb_client.delete_table(TableName=dynamodb_config.users_table_name)
+        dynamodb_config.dynamodb_client.delete_table(TableName=dynamodb_config.archive_table_name)
+        dynamodb_config.shutdown()
+
+    print(f"\n🧊 {args.runs} cold starts (median ms)\n")
+    total = 0
+    for phase in ("import", "startup", "first request"):
+        median = statistics.median(run[phase] for run in runs)
+        total += median
+        print(f"{phase:<14} {median:>8.0f}")
+    print(f"{'total':<14} {total:>8.0f}")
+
+
+if __name__ == "__main__":
+    main()
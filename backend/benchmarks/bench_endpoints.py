@@ -0,0 +1,366 @@
+"""
+End-to-end Endpoint Benchmark
+
+Boots the apps in-process against the local stand-ins (`benchmarks.standins`)
+and drives them through their ASGI interface with httpx, so a run measures
+routing, validation, auth, the data layer and serialization together
+without a network, credentials or running databases:
+
+- simple: `simple_main` with its SQLite file in a temporary directory
+- mongo: `main_mongo` on the in-memory Motor-compatible store
+- dynamodb: `main_dynamodb` on moto's in-memory DynamoDB (users are picked
+  per request with an `X-Bench-User` header instead of Cognito tokens)
+
+Users of simple and mongo get JWTs minted with the app's own token helpers,
+so token validation is measured but signup/login (bcrypt) are not.
+
+Stores start empty unless --dataset-users preloads each app's store with a
+synthetic dataset (`benchmarks.synthetic_dataset`, same seed for every
+app); the workload then runs as the first --users synthetic users, so list
+and stats requests see their full job histories. moto deep-copies every
+table for each TransactWriteItems (its rollback), so DynamoDB writes slow
+down with the dataset size there - only its reads are representative.
+
+Gemini is replaced by `FakeGeminiModel` in every app (--gemini-latency-ms,
+--gemini-failure-rate). Each app gets the same workload, one phase per
+endpoint: create, list, detail, update, stats, AI analysis, delete.
+
+Reports requests, errors (non-2xx), throughput and p50/p95/p99 latency per
+endpoint; --json writes the numbers for comparing runs.
+
+Usage (from the backend directory):
+    python -m benchmarks.bench_endpoints --apps simple mongo dynamodb --requests 500 --concurrency 16
+    python -m benchmarks.bench_endpoints --apps mongo --gemini-latency-ms 1500 --gemini-failure-rate 0.1
+    python -m benchmarks.bench_endpoints --dataset-users 5000 --dataset-jobs-per-user 60 --ai-requests 0
+"""
+
+import argparse
+import asyncio
+import contextlib
+import functools
+import json
+import math
+import os
+import random
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from typing import Any, Callable, Dict, List, Optional
+from unittest import mock
+
+import httpx
+from bson import ObjectId
+
+from benchmarks.bench_text_compression import NOTE_PHRASES, generate_text
+from benchmarks.standins import FakeGeminiModel, InMemoryMongoClient, in_memory_dynamodb
+
+APPS = ("simple", "mongo", "dynamodb")
+RESUME_TEXT = ("Senior software engineer with 7 years of Python, AWS and REST API experience. "
+               "Built event-driven services, led a migration to DynamoDB and mentored four engineers.")
+
+
+def percentile(ordered: List[float], p: float) -> float:
+    """Nearest-rank percentile of an ascending list"""
+    if not ordered:
+        return 0.0
+    return ordered[max(0, math.ceil(p / 100 * len(ordered)) - 1)]
+
+
+class Recorder:
+    """Latencies, errors and wall time per endpoint"""
+
+    def __init__(self):
+        self.latencies: Dict[str, List[float]] = defaultdict(list)
+        self.errors: Dict[str, int] = defaultdict(int)
+        self.seconds: Dict[str, float] = defaultdict(float)
+
+    async def run(self, endpoint: str, calls: List[Callable[[], Any]], concurrency: int) -> List[Any]:
+        """Run one phase (`calls` return httpx responses) with at most `concurrency` in flight"""
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def one(call):
+            async with semaphore:
+                start = time.perf_counter()
+                try:
+                    response = await call()
+                except Exception as e:
+                    print(f"⚠️ {endpoint}: {type(e).__name__}: {e}", file=sys.stderr)
+                    response = None
+                self.latencies[endpoint].append((time.perf_counter() - start) * 1000)
+                if response is None or response.status_code >= 300:
+                    self.errors[endpoint] += 1
+                return response
+
+        start = time.perf_counter()
+        responses = await asyncio.gather(*(one(call) for call in calls))
+        self.seconds[endpoint] += time.perf_counter() - start
+        return responses
+
+    def summary(self) -> List[Dict[str, Any]]:
+        rows = []
+        for endpoint, latencies in self.latencies.items():
+            ordered = sorted(latencies)
+            rows.append({
+                "endpoint": endpoint,
+                "requests": len(ordered),
+                "errors": self.errors[endpoint],
+                "requests_per_second": len(ordered) / self.seconds[endpoint] if self.seconds[endpoint] else 0.0,
+                "p50_ms": percentile(ordered, 50),
+                "p95_ms": percentile(ordered, 95),
+                "p99_ms": percentile(ordered, 99),
+            })
+        return rows
+
+
+class Target:
+    """How the benchmark talks to one app: paths, id field and per-user auth headers"""
+
+    def __init__(self, name: str, app, jobs_path: str, stats_path: str, ai_path: str, id_field: str,
+                 ai_payload: Callable[[str], Dict[str, Any]]):
+        self.name = name
+        self.app = app
+        self.jobs_path = jobs_path
+        self.stats_path = stats_path
+        self.ai_path = ai_path
+        self.id_field = id_field
+        self.ai_payload = ai_payload
+        self.users: List[Dict[str, str]] = []  # request headers per user
+
+    def job_path(self, job_id) -> str:
+        return f"{self.jobs_path.rstrip('/')}/{job_id}"
+
+
+async def preload(args, name: str, sink) -> list:
+    """
+    Load the synthetic dataset into a started app's store
+
+    Returns:
+        list: The SyntheticUsers the workload runs as
+    """
+    # Imported here: synthetic_dataset imports this module
+    from benchmarks.synthetic_dataset import DatasetSpec, load_dataset, synthetic_user
+
+    spec = DatasetSpec(args.dataset_users, args.dataset_jobs_per_user, seed=args.seed)
+    start = time.perf_counter()
+    summary = await load_dataset(spec, [sink])
+    # stdout belongs to the apps' logs here (see main_async)
+    print(f"📦 {name}: preloaded {summary.users} users, {summary.jobs} jobs in {time.perf_counter() - start:.1f} s",
+          file=sys.stderr)
+    return [synthetic_user(spec, index) for index in range(min(args.users, spec.users))]
+
+
+@contextlib.asynccontextmanager
+async def simple_target(args, gemini: FakeGeminiModel):
+    previous_cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as workdir:
+        os.chdir(workdir)  # simple_main keeps job_tracker.db in the working directory
+        try:
+            import simple_main
+
+            simple_main.model = gemini
+            target = Target("simple", simple_main.app, "/api/jobs", "/api/jobs/stats/summary",
+                            "/api/ai/analyze-job-description", "id",
+                            lambda description: {"job_description": description})
+            target.users = [
+                {"Authorization": f"Bearer {simple_main.create_access_token({'user_id': index + 1})}"}
+                for index in range(args.users)
+            ]
+            async with simple_main.app.router.lifespan_context(simple_main.app):
+                if args.dataset_users:
+                    from benchmarks.synthetic_dataset import SQLiteSink
+
+                    users = await preload(args, "simple", SQLiteSink("job_tracker.db"))
+                    target.users = [
+                        {"Authorization": f"Bearer {simple_main.create_access_token({'user_id': user.sql_id})}"}
+                        for user in users
+                    ]
+                yield target
+        finally:
+            os.chdir(previous_cwd)
+
+
+@contextlib.asynccontextmanager
+async def mongo_target(args, gemini: FakeGeminiModel):
+    client_factory = functools.partial(InMemoryMongoClient, latency_ms=args.mongo_latency_ms)
+    with mock.patch("app.utils.mongodb.AsyncIOMotorClient", client_factory):
+        import main_mongo
+        from app.routes import ai_career
+        from app.utils.security import create_token_response
+
+        ai_career.gemini_service.model = gemini
+        target = Target("mongo", main_mongo.app, "/api/jobs/", "/api/jobs/stats/summary",
+                        "/api/ai/analyze-job-fit", "id",
+                        lambda description: {"resume_text": RESUME_TEXT, "job_description": description})
+        tokens = [create_token_response(ObjectId(), f"bench{index}", f"bench-{index}@example.com")["access_token"]
+                  for index in range(args.users)]
+        target.users = [{"Authorization": f"Bearer {token}"} for token in tokens]
+        async with main_mongo.app.router.lifespan_context(main_mongo.app):
+            if args.dataset_users:
+                from benchmarks.synthetic_dataset import MongoSink
+
+                users = await preload(args, "mongo", MongoSink())
+                tokens = [create_token_response(user.mongo_id, user.username, user.email)["access_token"]
+                          for user in users]
+                target.users = [{"Authorization": f"Bearer {token}"} for token in tokens]
+            yield target
+
+
+@contextlib.asynccontextmanager
+async def dynamodb_target(args, gemini: FakeGeminiModel):
+    with in_memory_dynamodb():
+        from fastapi import Header
+
+        import main_dynamodb
+        from app.routes import ai_career, jobs_dynamodb
+        from app.utils.dynamodb_config import dynamodb_config
+        from app.utils.security import get_current_user_id_mongo
+        from benchmarks.bench_dynamodb import add_simulated_latency
+
+        def bench_user(x_bench_user: str = Header(...)) -> str:
+            return x_bench_user
+
+        app = main_dynamodb.app
+        app.dependency_overrides[jobs_dynamodb.get_current_user_id] = bench_user
+        app.dependency_overrides[get_current_user_id_mongo] = bench_user
+        ai_career.gemini_service.model = gemini
+        target = Target("dynamodb", app, "/api/jobs/", "/api/jobs/stats", "/api/ai/analyze-job-fit", "job_id",
+                        lambda description: {"resume_text": RESUME_TEXT, "job_description": description})
+        target.users = [{"X-Bench-User": f"bench-user-{index}"} for index in range(args.users)]
+        try:
+            async with app.router.lifespan_context(app):
+                if args.dynamodb_latency_ms:
+                    add_simulated_latency(dynamodb_config.dynamodb_client, args.dynamodb_latency_ms)
+                    add_simulated_latency(dynamodb_config.dynamodb_resource.meta.client, args.dynamodb_latency_ms)
+                if args.dataset_users:
+                    from benchmarks.synthetic_dataset import DynamoDBSink
+
+                    users = await preload(args, "dynamodb", DynamoDBSink())
+                    print("⚠️ dynamodb: moto copies the tables on every transaction, "
+                          "write latencies grow with the preloaded dataset", file=sys.stderr)
+                    target.users = [{"X-Bench-User": user.cognito_sub} for user in users]
+                yield target
+        finally:
+            app.dependency_overrides.clear()
+
+
+TARGETS = {"simple": simple_target, "mongo": mongo_target, "dynamodb": dynamodb_target}
+
+
+async def run_workload(target: Target, args, rng: random.Random) -> Recorder:
+    """Drive one booted app through every phase of the workload"""
+    recorder = Recorder()
+    transport = httpx.ASGITransport(app=target.app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=None) as client:
+        users = target.users
+
+        def job_payload(index: int) -> Dict[str, Any]:
+            return {
+                "company": f"Company {index}",
+                "position": "Software Engineer",
+                "status": "Applied",
+                "applied_date": "2026-01-15",
+                "location": "Remote",
+                "job_description": generate_text(rng, None, rng.randint(500, args.description_chars)),
+                "notes": generate_text(rng, NOTE_PHRASES, rng.randint(0, 300)) or None,
+            }
+
+        creates = [(users[index % len(users)], job_payload(index)) for index in range(args.requests)]
+        responses = await recorder.run("POST jobs", [
+            functools.partial(client.post, target.jobs_path, json=payload, headers=headers)
+            for headers, payload in creates
+        ], args.concurrency)
+        jobs = [(headers, response.json()[target.id_field]) for (headers, _), response in zip(creates, responses)
+                if response is not None and response.status_code < 300]
+        if not jobs:
+            print(f"❌ {target.name}: no job could be created, skipping the other phases", file=sys.stderr)
+            return recorder
+
+        picks = [rng.choice(jobs) for _ in range(args.requests)]
+        await recorder.run("GET jobs", [
+            functools.partial(client.get, target.jobs_path, headers=users[index % len(users)])
+            for index in range(args.requests)
+        ], args.concurrency)
+        await recorder.run("GET job", [
+            functools.partial(client.get, target.job_path(job_id), headers=headers) for headers, job_id in picks
+        ], args.concurrency)
+        await recorder.run("PUT job", [
+            functools.partial(client.put, target.job_path(job_id), headers=headers,
+                              json={"status": "Phone Screen", "notes": f"Update {index}"})
+            for index, (headers, job_id) in enumerate(picks)
+        ], args.concurrency)
+        await recorder.run("GET stats", [
+            functools.partial(client.get, target.stats_path, headers=users[index % len(users)])
+            for index in range(args.requests)
+        ], args.concurrency)
+        if args.ai_requests:
+            await recorder.run("POST ai", [
+                functools.partial(client.post, target.ai_path, headers=users[index % len(users)],
+                                  json=target.ai_payload(generate_text(rng, None, 1500)))
+                for index in range(args.ai_requests)
+            ], args.concurrency)
+        await recorder.run("DELETE job", [
+            functools.partial(client.delete, target.job_path(job_id), headers=headers) for headers, job_id in jobs
+        ], args.concurrency)
+    return recorder
+
+
+def print_results(name: str, rows: List[Dict[str, Any]], gemini: FakeGeminiModel) -> None:
+    print(f"\n📊 {name}  (Gemini: {gemini.calls} calls, {gemini.failures} failed)")
+    print(f"{'endpoint':<12} {'requests':>9} {'errors':>7} {'req/s':>9} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}")
+    for row in rows:
+        print(f"{row['endpoint']:<12} {row['requests']:>9} {row['errors']:>7} {row['requests_per_second']:>9.1f} "
+              f"{row['p50_ms']:>8.1f} {row['p95_ms']:>8.1f} {row['p99_ms']:>8.1f}")
+
+
+async def main_async(args) -> Dict[str, Any]:
+    results: Dict[str, Any] = {}
+    print(f"🏁 {args.requests} requests per endpoint, {args.concurrency} concurrent, {args.users} users, "
+          f"Gemini {args.gemini_latency_ms:g} ms / {args.gemini_failure_rate:.0%} failures")
+    for name in args.apps:
+        gemini = FakeGeminiModel(args.gemini_latency_ms, args.gemini_failure_rate, seed=args.seed)
+        # The apps log every request; keep the report readable unless asked for
+        app_output = contextlib.nullcontext() if args.verbose else contextlib.redirect_stdout(open(os.devnull, "w"))
+        try:
+            with app_output:
+                async with TARGETS[name](args, gemini) as target:
+                    recorder = await run_workload(target, args, random.Random(args.seed))
+        except ImportError as e:
+            print(f"\n⚠️ Skipping {name}: the app can't be imported ({e})")
+            results[name] = {"skipped": str(e)}
+            continue
+        rows = recorder.summary()
+        print_results(name, rows, gemini)
+        results[name] = {"endpoints": rows, "gemini_calls": gemini.calls, "gemini_failures": gemini.failures}
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the apps' endpoints in-process against local stand-ins")
+    parser.add_argument("--apps", nargs="+", choices=APPS, default=list(APPS))
+    parser.add_argument("--requests", type=int, default=300, help="Requests per endpoint")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--users", type=int, default=10)
+    parser.add_argument("--ai-requests", type=int, default=20, help="AI analysis requests (0 to skip)")
+    parser.add_argument("--description-chars", type=int, default=3000, help="Longest generated job description")
+    parser.add_argument("--gemini-latency-ms", type=float, default=800)
+    parser.add_argument("--gemini-failure-rate", type=float, default=0.0)
+    parser.add_argument("--mongo-latency-ms", type=float, default=0, help="Simulated round trip per Mongo operation")
+    parser.add_argument("--dynamodb-latency-ms", type=float, default=0, help="Simulated round trip per DynamoDB request")
+    parser.add_argument("--dataset-users", type=int, default=0,
+                        help="Preload each store with this many synthetic users (0: start empty)")
+    parser.add_argument("--dataset-jobs-per-user", type=float, default=40, help="Mean jobs per synthetic user")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--json", help="Write the results to this file")
+    parser.add_argument("--verbose", action="store_true", help="Show the apps' own log output")
+    args = parser.parse_args()
+
+    results = asyncio.run(main_async(args))
+    if args.json:
+        with open(args.json, "w") as output:
+            json.dump({"arguments": vars(args), "results": results}, output, indent=2)
+        print(f"\n💾 Results written to {args.json}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+"""
+Job Archival Benchmark
+
+Seeds one user with several years of job applications, most of the old ones
+rejected or withdrawn, then runs the same per-user reads before and after
+the archival sweep (`app.utils.job_archive`):
+
+- list: every page of the user's jobs (summary projection)
+- rejected: every page of the user's rejected jobs (per-user status index)
+- recount: rebuilding the user's counters (`reconcile_user_counters`)
+
+Reports Query response bytes and wall time per read, the sweep time, and
+the average stored size of a job in the jobs table vs. compressed in the
+archive table.
+
+Usage (from the backend directory, with a local DynamoDB running):
+    python -m benchmarks.bench_job_archive --endpoint-url http://localhost:8000 --jobs 2000 --years 6
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import time
+from datetime import datetime, timedelta
+
+from benchmarks.bench_dynamodb import add_simulated_latency, configure_environment
+from benchmarks.bench_dynamodb_projection import DESCRIPTION, NOTES, ResponseBytes
+
+
+def build_jobs(user_id: str, count: int, years: int, seed: int):
+    """Jobs spread over `years`; older ones are mostly finished"""
+    from app.utils.ids import new_ulid
+    from app.utils.models_dynamodb import JobItem, JobStatus
+
+    rng = random.Random(seed)
+    now = datetime.utcnow()
+    active = [JobStatus.APPLIED, JobStatus.PHONE_SCREEN, JobStatus.TECHNICAL_INTERVIEW]
+    jobs = []
+    for index in range(count):
+        created = now - timedelta(days=rng.uniform(0, 365 * years))
+        if created < now - timedelta(days=365):
+            status = rng.choice([JobStatus.REJECTED] * 6 + [JobStatus.WITHDRAWN] * 3 + [JobStatus.OFFER])
+        else:
+            status = rng.choice(active + [JobStatus.REJECTED])
+        stamp = created.isoformat()
+        jobs.append(JobItem(
+            user_id=user_id, job_id=new_ulid(created), company=f"Company {index}", position="Software Engineer",
+            status=status.value, location="Remote", job_description=DESCRIPTION[:5000], notes=NOTES[:1000],
+            applied_date=stamp, created_at=stamp, updated_at=stamp
+        ).set_index_keys())
+    return jobs
+
+
+async def main_async(args):
+    from app.utils.dynamodb_config import dynamodb_config
+    from app.utils.dynamodb_service import JobRepository
+    from app.utils.job_archive import archive_old_jobs
+    from app.utils.models_dynamodb import ArchivedJobItem, JobStatus
+
+    dynamodb_config.create_tables_if_not_exist()
+    repository = JobRepository()
+    user_id = "archive-user"
+    jobs = build_jobs(user_id, args.jobs, args.years, args.seed)
+    await repository.table.batch_write(put_items=[job.dict() for job in jobs])
+    await repository.reconcile_user_counters(user_id)
+
+    client = dynamodb_config.dynamodb_client
+    if args.latency_ms:
+        add_simulated_latency(client, args.latency_ms)
+    received = ResponseBytes(client)
+
+    reads = (
+        ("list", lambda: repository.get_user_jobs(user_id)),
+        ("rejected", lambda: repository.get_user_jobs_by_status_page(user_id, JobStatus.REJECTED)),
+        ("recount", lambda: repository.reconcile_user_counters(user_id)),
+    )
+
+    async def measure():
+        results = {}
+        for label, read in reads:
+            received.take()
+            start = time.perf_counter()
+            await read()
+            results[label] = ((time.perf_counter() - start) * 1000, received.take())
+        return results
+
+    try:
+        before = await measure()
+        start = time.perf_counter()
+        archived = await archive_old_jobs(args.older_than_days)
+        sweep_ms = (time.perf_counter() - start) * 1000
+        after = await measure()
+
+        stats = await repository.get_user_job_stats(user_id)
+        print(f"🗄️ {args.jobs} jobs over {args.years} years: archived {archived} in {sweep_ms:.0f} ms "
+              f"({stats['total']} active, {stats['archived']} archived)\n")
+        print(f"{'read':<9} {'before ms':>10} {'KB':>8} {'after ms':>10} {'KB':>8}")
+        for label, _ in reads:
+            (before_ms, before_bytes), (after_ms, after_bytes) = before[label], after[label]
+            print(f"{label:<9} {before_ms:>10.0f} {before_bytes / 1024:>8.0f} {after_ms:>10.0f} {after_bytes / 1024:>8.0f}")
+
+        hot_size = sum(len(json.dumps(job.dict())) for job in jobs) / len(jobs)
+        cold_size = sum(len(ArchivedJobItem.from_job_item(job).payload) for job in jobs) / len(jobs)
+        print(f"\nstored per job: {hot_size:.0f} B as an item, {cold_size:.0f} B compressed payload")
+    finally:
+        client.delete_table(TableName=dynamodb_config.jobs_table_name)
+        client.delete_table(TableName=dynamodb_config.users_table_name)
+        client.delete_table(TableName=dynamodb_config.archive_table_name)
+        dynamodb_config.shutdown()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark per-user reads before and after job archival")
+    parser.add_argument("--endpoint-url", default=os.getenv("DYNAMODB_ENDPOINT_URL", "http://localhost:8000"))
+    parser.add_argument("--jobs", type=int, default=2000)
+    parser.add_argument("--years", type=int, default=6, help="History the jobs are spread over")
+    parser.add_argument("--older-than-days", type=int, default=365)
+    parser.add_argument("--latency-ms", type=float, default=10, help="Simulated round trip per request (0 to disable)")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    configure_environment(args.endpoint_url)
+    asyncio.run(main_async(args))
+
+
+if __name__ == "__main__":
+    main()
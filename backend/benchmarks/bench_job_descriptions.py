@@ -0,0 +1,133 @@
+"""
+Job Description Split Benchmark
+
+Seeds two users with the same jobs: one in the previous layout (the
+compressed job description inline in the job item) and one split (job
+item + a separate `#DESC#<job_id>` description item, as the repository
+writes them now), then runs the same reads for both:
+
+- list: every page of the user's jobs (summary projection)
+- stats: rebuilding the user's counters (`reconcile_user_counters`)
+- detail: GetItem of every job without the description
+- detail+desc: every job with its description (`include_description=True`)
+
+Reports consumed read capacity, response bytes and wall time per read.
+Projections only trim the bytes returned; DynamoDB bills reads by the size
+of the whole item, which is what the split saves on.
+
+Usage (from the backend directory, with a local DynamoDB running):
+    python -m benchmarks.bench_job_descriptions --endpoint-url http://localhost:8000 --jobs 500
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import time
+
+from benchmarks.bench_dynamodb import add_simulated_latency, configure_environment
+from benchmarks.bench_text_compression import NOTE_PHRASES, generate_text
+
+
+class ReadCost:
+    """Sums response bytes and consumed capacity of every DynamoDB call via botocore events"""
+
+    def __init__(self, client):
+        self.bytes = 0
+        self.units = 0.0
+        client.meta.events.register("after-call.dynamodb", self._count)
+
+    def _count(self, http_response, parsed, **kwargs):
+        self.bytes += len(http_response.content)
+        capacity = parsed.get("ConsumedCapacity")
+        for entry in capacity if isinstance(capacity, list) else [capacity or {}]:
+            self.units += entry.get("CapacityUnits", 0)
+
+    def take(self):
+        taken = (self.bytes, self.units)
+        self.bytes, self.units = 0, 0.0
+        return taken
+
+
+async def main_async(args):
+    from app.utils.dynamodb_config import dynamodb_config
+    from app.utils.dynamodb_service import JobRepository, job_cache
+    from app.utils.models_dynamodb import JobItem
+    from app.utils.text_compression import stored_text
+
+    dynamodb_config.create_tables_if_not_exist()
+    repository = JobRepository()
+    layouts = {}
+    for layout in ("inline", "split"):
+        rng = random.Random(args.seed)
+        jobs = [
+            JobItem(user_id=f"{layout}-user", company=f"Company {index}", position="Software Engineer",
+                    location="Remote", job_description=generate_text(rng, None, args.description_chars),
+                    notes=generate_text(rng, NOTE_PHRASES, args.notes_chars)).set_index_keys()
+            for index in range(args.jobs)
+        ]
+        if layout == "inline":
+            items = [{**job.to_item(), "job_description": stored_text(job.job_description)} for job in jobs]
+        else:
+            items = [item for job in jobs for item in (job.to_item(), job.description_item())]
+        await repository.table.batch_write(put_items=items)
+        layouts[layout] = jobs
+
+    client = dynamodb_config.dynamodb_client
+    if args.latency_ms:
+        add_simulated_latency(client, args.latency_ms)
+    cost = ReadCost(client)
+    semaphore = asyncio.Semaphore(args.concurrency)
+
+    async def details(user_id, jobs, include_description):
+        job_cache.clear()
+
+        async def one(job):
+            async with semaphore:
+                await repository.get_job_by_id(user_id, job.job_id, include_description=include_description)
+
+        await asyncio.gather(*(one(job) for job in jobs))
+
+    reads = (
+        ("list", lambda user_id, jobs: repository.get_user_jobs(user_id)),
+        ("stats", lambda user_id, jobs: repository.reconcile_user_counters(user_id)),
+        ("detail", lambda user_id, jobs: details(user_id, jobs, False)),
+        ("detail+desc", lambda user_id, jobs: details(user_id, jobs, True)),
+    )
+
+    print(f"📄 {args.jobs} jobs per layout, {args.description_chars} char descriptions, "
+          f"{args.notes_chars} char notes, {args.latency_ms:g} ms simulated latency\n")
+    print(f"{'read':<12} {'layout':<7} {'RCU':>8} {'KB':>8} {'ms':>8}")
+    try:
+        for label, read in reads:
+            for layout, jobs in layouts.items():
+                cost.take()
+                start = time.perf_counter()
+                await read(f"{layout}-user", jobs)
+                elapsed_ms = (time.perf_counter() - start) * 1000
+                received, units = cost.take()
+                print(f"{label:<12} {layout:<7} {units:>8.1f} {received / 1024:>8.0f} {elapsed_ms:>8.0f}")
+    finally:
+        client.delete_table(TableName=dynamodb_config.jobs_table_name)
+        client.delete_table(TableName=dynamodb_config.users_table_name)
+        client.delete_table(TableName=dynamodb_config.archive_table_name)
+        dynamodb_config.shutdown()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark job reads with inline vs. separately stored descriptions")
+    parser.add_argument("--endpoint-url", default=os.getenv("DYNAMODB_ENDPOINT_URL", "http://localhost:8000"))
+    parser.add_argument("--jobs", type=int, default=500)
+    parser.add_argument("--description-chars", type=int, default=4000)
+    parser.add_argument("--notes-chars", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--latency-ms", type=float, default=10, help="Simulated round trip per request (0 to disable)")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    configure_environment(args.endpoint_url)
+    asyncio.run(main_async(args))
+
+
+if __name__ == "__main__":
+    main()
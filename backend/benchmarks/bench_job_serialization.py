@@ -0,0 +1,128 @@
+"""
+Job Serialization Microbenchmark
+
+Converts synthetic DynamoDB job items (as returned by AsyncTable) into API
+models and renders them, comparing the previous path with the current one:
+
+- detail: `JobItem(**item)` + hand-written `fromisoformat` conversion vs.
+  validating JobResponse straight from the JobItem's attributes (also
+  without the JobItem construction, as on a job cache hit)
+- list page: `JobItem(**item).to_summary()` per item vs. validating the raw
+  items with the precompiled `List[JobSummary]` TypeAdapter
+- render: the response body of a summary list with the standard library
+  `json` (JSONResponse) vs. orjson (ORJSONResponse)
+
+No DynamoDB is needed.
+
+Usage (from the backend directory):
+    python -m benchmarks.bench_job_serialization --items 10000
+"""
+
+import argparse
+import random
+import time
+from datetime import datetime, timedelta
+
+from fastapi.responses import JSONResponse
+
+from app.utils.models_dynamodb import (
+    JOB_SUMMARY_ATTRIBUTES, JOB_SUMMARY_LIST_ADAPTER, JobItem, JobResponse, JobStatus, JobSummary, JobType
+)
+from app.utils.responses import FastJSONResponse, ORJSON_AVAILABLE
+
+
+def build_items(count: int, seed: int):
+    """Raw job items with every timestamp set, some of them in UTC 'Z' form"""
+    rng = random.Random(seed)
+    statuses = [status.value for status in JobStatus]
+    job_types = [job_type.value for job_type in JobType]
+    now = datetime.utcnow()
+    items = []
+    for index in range(count):
+        created = now - timedelta(minutes=rng.randint(0, 500000))
+        stamp = created.isoformat() + ("Z" if index % 2 else "")
+        items.append({
+            "user_id": "bench-user", "job_id": f"{index:026d}", "company": f"Company {index}",
+            "position": "Software Engineer", "status": rng.choice(statuses), "applied_date": stamp,
+            "application_link": f"https://jobs.example.com/{index}", "salary_range": "$120k-$150k",
+            "location": "Remote", "job_type": rng.choice(job_types),
+            "job_description": "Build and operate distributed services. " * 20, "notes": "Follow up.",
+            "interview_date": (created + timedelta(days=7)).isoformat(),
+            "follow_up_date": (created + timedelta(days=14)).isoformat(),
+            "created_at": stamp, "updated_at": stamp, "sk": "JOB",
+            "gsi1_pk": "bench-user#Applied", "gsi1_sk": stamp,
+        })
+    return items
+
+
+def parse_timestamp(value):
+    return datetime.fromisoformat(value.replace('Z', '+00:00')) if 'Z' in value else datetime.fromisoformat(value)
+
+
+def legacy_to_response(item: JobItem) -> JobResponse:
+    """The hand-written conversion JobItem.to_response() used before"""
+    return JobResponse(
+        user_id=item.user_id, job_id=item.job_id, company=item.company, position=item.position,
+        status=JobStatus(item.status), applied_date=parse_timestamp(item.applied_date),
+        application_link=item.application_link, salary_range=item.salary_range, location=item.location,
+        job_type=JobType(item.job_type) if item.job_type else None,
+        job_description=item.job_description, notes=item.notes,
+        interview_date=parse_timestamp(item.interview_date) if item.interview_date else None,
+        follow_up_date=parse_timestamp(item.follow_up_date) if item.follow_up_date else None,
+        created_at=parse_timestamp(item.created_at), updated_at=parse_timestamp(item.updated_at)
+    )
+
+
+def legacy_to_summary(item: JobItem) -> JobSummary:
+    return JobSummary.model_validate({name: getattr(item, name) for name in JOB_SUMMARY_ATTRIBUTES})
+
+
+def best_ms(function, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        timings.append((time.perf_counter() - start) * 1000)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark job item conversion and response rendering")
+    parser.add_argument("--items", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per path (best is reported)")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    items = build_items(args.items, args.seed)
+    job_items = [JobItem(**item) for item in items]
+    summaries = JOB_SUMMARY_LIST_ADAPTER.validate_python(items)
+    body = JOB_SUMMARY_LIST_ADAPTER.dump_python(summaries, mode="json")
+
+    # Both paths must produce the same models
+    assert [legacy_to_response(item) for item in job_items[:100]] == [item.to_response() for item in job_items[:100]]
+    assert [legacy_to_summary(JobItem(**item)) for item in items[:100]] == summaries[:100]
+
+    rows = [
+        ("detail", "JobItem + fromisoformat", lambda: [legacy_to_response(JobItem(**item)) for item in items]),
+        ("detail", "JobItem + from_attributes", lambda: [JobItem(**item).to_response() for item in items]),
+        # A job cache hit already holds the JobItem
+        ("cache hit", "fromisoformat", lambda: [legacy_to_response(item) for item in job_items]),
+        ("cache hit", "from_attributes", lambda: [item.to_response() for item in job_items]),
+        ("list page", "JobItem.to_summary", lambda: [legacy_to_summary(JobItem(**item)) for item in items]),
+        ("list page", "TypeAdapter", lambda: JOB_SUMMARY_LIST_ADAPTER.validate_python(items)),
+        ("render", "json", lambda: JSONResponse(body)),
+    ]
+    if ORJSON_AVAILABLE:
+        rows.append(("render", "orjson", lambda: FastJSONResponse(body)))
+    else:
+        print("⚠️ orjson is not installed - skipping the orjson rendering row")
+
+    print(f"📦 {args.items} job items\n")
+    print(f"{'step':<10} {'path':<26} {'ms':>8} {'µs/item':>8}")
+    for step, label, run in rows:
+        elapsed = best_ms(run, args.repeat)
+        print(f"{step:<10} {label:<26} {elapsed:>8.1f} {elapsed * 1000 / args.items:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
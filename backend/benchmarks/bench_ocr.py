@@ -0,0 +1,87 @@
+"""
+OCR Throughput Benchmark
+
+Compares the resident in-process OCR engine (tesserocr) against the previous
+approach of spawning a `tesseract` subprocess per image (pytesseract).
+
+Usage (from the backend directory):
+    python -m benchmarks.bench_ocr --corpus path/to/resume_photos
+    python -m benchmarks.bench_ocr --corpus path/to/resume_photos --concurrency 4 --repeat 3
+"""
+
+import argparse
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from PIL import Image
+
+from app.utils import ocr_service
+from app.utils.ocr_service import OCREngine, preprocess_image
+
+IMAGE_EXTENSIONS = {".png", ".jpg", ".jpeg", ".bmp", ".tiff", ".webp"}
+
+
+def load_corpus(corpus_dir: Path):
+    """Load every image in the corpus directory into memory"""
+    images = []
+    for path in sorted(corpus_dir.iterdir()):
+        if path.suffix.lower() in IMAGE_EXTENSIONS:
+            with Image.open(path) as image:
+                image.load()
+                images.append((path.name, image.copy()))
+    return images
+
+
+def run(label, ocr_function, images, pool, repeat):
+    """Run OCR over the corpus on the given worker pool and print throughput"""
+    work = [image for _ in range(repeat) for _, image in images]
+
+    start = time.perf_counter()
+    characters = sum(len(text) for text in pool.map(ocr_function, work))
+    elapsed = time.perf_counter() - start
+
+    print(
+        f"{label:<34} {len(work):>6} images  {elapsed:>8.2f}s  "
+        f"{len(work) / elapsed:>7.2f} img/s  {1000 * elapsed / len(work):>8.1f} ms/img  "
+        f"{characters:>9} chars"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark OCR backends on a corpus of resume photos")
+    parser.add_argument("--corpus", type=Path, required=True, help="Directory of resume images")
+    parser.add_argument("--concurrency", type=int, default=1, help="Parallel OCR workers")
+    parser.add_argument("--repeat", type=int, default=1, help="Passes over the corpus")
+    args = parser.parse_args()
+
+    images = load_corpus(args.corpus)
+    if not images:
+        raise SystemExit(f"No images found in {args.corpus}")
+
+    print(f"📂 Corpus: {len(images)} images from {args.corpus}")
+    print(f"🧵 Concurrency: {args.concurrency}, repeat: {args.repeat}\n")
+
+    if ocr_service.PYTESSERACT_AVAILABLE:
+        pytesseract = ocr_service.pytesseract
+        with ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+            run("pytesseract (subprocess, raw)", pytesseract.image_to_string, images, pool, args.repeat)
+            run(
+                "pytesseract (subprocess, preproc)",
+                lambda image: pytesseract.image_to_string(preprocess_image(image)),
+                images, pool, args.repeat
+            )
+    else:
+        print("⚠️ pytesseract not installed - skipping subprocess baseline")
+
+    if ocr_service.TESSEROCR_AVAILABLE:
+        engine = OCREngine(workers=args.concurrency)
+        # Warm up the workers so loading language data isn't part of the timing
+        list(engine.executor.map(engine.image_to_string, [images[0][1]] * args.concurrency * 2))
+        run("tesserocr (resident, preproc)", engine.image_to_string, images, engine.executor, args.repeat)
+        engine.close()
+    else:
+        print("⚠️ tesserocr not installed - skipping resident engine")
+
+if __name__ == "__main__":
+    main()
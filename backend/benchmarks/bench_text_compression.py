@@ -0,0 +1,146 @@
+"""
+Job Text Compression Benchmark
+
+Builds a sample dataset of jobs with generated job-posting descriptions
+(500-5000 chars) and notes (0-1000 chars), stores it twice as one item per
+job - plain strings (the previous mapping) and with long texts compressed
+(`stored_text`, as job and description items hold them) - and reports per
+job:
+
+- item size as DynamoDB bills it, and the read/write capacity units that
+  size costs (eventually consistent GetItem: 0.5 RCU per 4 KB, PutItem:
+  1 WCU per 1 KB)
+- GetItem response bytes and wall time for fetching every job
+- client CPU time to turn the fetched items into JobResponse models
+  (including decompression)
+
+Usage (from the backend directory, with a local DynamoDB running):
+    python -m benchmarks.bench_text_compression --endpoint-url http://localhost:8000 --jobs 500
+"""
+
+import argparse
+import asyncio
+import math
+import os
+import random
+import time
+
+from benchmarks.bench_dynamodb import add_simulated_latency, configure_environment
+from benchmarks.bench_dynamodb_projection import ResponseBytes
+
+VERBS = ["Design", "Build", "Own", "Operate", "Scale", "Improve", "Lead", "Partner on", "Deliver", "Maintain",
+         "Automate", "Review", "Mentor engineers on", "Define the roadmap for", "Debug and fix"]
+OBJECTS = ["distributed services", "data pipelines", "our payments platform", "customer-facing APIs",
+           "the search infrastructure", "mobile release tooling", "internal developer platforms",
+           "machine learning features", "observability and alerting", "the billing system",
+           "identity and access management", "high-throughput event processing", "the design system"]
+QUALIFIERS = ["across several teams", "with a focus on reliability", "in a fast-paced environment",
+              "serving millions of users", "using Python, Go and AWS", "from prototype to production",
+              "with strong ownership", "while keeping costs under control", "in close collaboration with product",
+              "following security best practices"]
+NOTE_PHRASES = ["Recruiter reached out on LinkedIn.", "Referred by a former colleague.", "Follow up next week.",
+                "Salary expectations discussed:", "Team seems great, interview loop has", "Asked about remote policy;",
+                "Take-home assignment due", "Hiring manager mentioned", "Need to prepare system design for round"]
+
+
+def generate_text(rng: random.Random, phrases, length: int) -> str:
+    parts = []
+    while sum(len(part) + 1 for part in parts) < length:
+        if phrases is None:
+            parts.append(f"{rng.choice(VERBS)} {rng.choice(OBJECTS)} {rng.choice(QUALIFIERS)}.")
+        else:
+            parts.append(f"{rng.choice(phrases)} {rng.randint(1, 30)}")
+    return " ".join(parts)[:length]
+
+
+def item_size(item) -> int:
+    """Approximate DynamoDB item size (attribute names + values)"""
+    size = 0
+    for name, value in item.items():
+        size += len(name)
+        if isinstance(value, str):
+            size += len(value.encode("utf-8"))
+        elif isinstance(value, (bytes, bytearray)):
+            size += len(value)
+        elif isinstance(value, (int, float)):
+            size += len(str(value)) // 2 + 1
+        else:
+            size += 1  # null / bool
+    return size
+
+
+async def main_async(args):
+    from app.utils.dynamodb_config import dynamodb_config
+    from app.utils.models_dynamodb import JobItem
+    from app.utils.text_compression import stored_text
+
+    dynamodb_config.create_tables_if_not_exist()
+    table = dynamodb_config.async_jobs_table
+    rng = random.Random(args.seed)
+    jobs = [
+        JobItem(user_id="plain", company=f"Company {index}", position="Software Engineer", location="Remote",
+                job_description=generate_text(rng, None, rng.randint(500, 5000)),
+                notes=generate_text(rng, NOTE_PHRASES, rng.randint(0, 1000)) or None).set_index_keys()
+        for index in range(args.jobs)
+    ]
+    layouts = {
+        "plain": [job.dict() for job in jobs],
+        "compressed": [{**job.to_item(), "job_description": stored_text(job.job_description), "user_id": "compressed"}
+                       for job in jobs],
+    }
+    for items in layouts.values():
+        await table.batch_write(put_items=items)
+
+    client = dynamodb_config.dynamodb_client
+    if args.latency_ms:
+        add_simulated_latency(client, args.latency_ms)
+    received = ResponseBytes(client, operation="GetItem")
+    semaphore = asyncio.Semaphore(args.concurrency)
+
+    async def fetch(key):
+        async with semaphore:
+            return (await table.get_item(Key=key))["Item"]
+
+    print(f"📝 {args.jobs} jobs, average description {sum(len(job.job_description) for job in jobs) / len(jobs):.0f} chars\n")
+    print(f"{'layout':<11} {'item B':>7} {'RCU/get':>8} {'WCU/put':>8} {'GetItem KB':>11} {'fetch ms':>9} {'convert ms':>11}")
+    try:
+        for label, items in layouts.items():
+            sizes = [item_size(item) for item in items]
+            rcu = sum(math.ceil(size / 4096) * 0.5 for size in sizes) / len(sizes)
+            wcu = sum(math.ceil(size / 1024) for size in sizes) / len(sizes)
+
+            received.take()
+            start = time.perf_counter()
+            fetched = await asyncio.gather(*(fetch({"user_id": item["user_id"], "job_id": item["job_id"]})
+                                             for item in items))
+            fetch_ms = (time.perf_counter() - start) * 1000
+
+            start = time.perf_counter()
+            for item in fetched:
+                JobItem(**item).to_response()
+            convert_ms = (time.perf_counter() - start) * 1000
+
+            print(f"{label:<11} {sum(sizes) / len(sizes):>7.0f} {rcu:>8.2f} {wcu:>8.2f} "
+                  f"{received.take() / 1024:>11.0f} {fetch_ms:>9.0f} {convert_ms:>11.1f}")
+    finally:
+        client.delete_table(TableName=dynamodb_config.jobs_table_name)
+        client.delete_table(TableName=dynamodb_config.users_table_name)
+        client.delete_table(TableName=dynamodb_config.archive_table_name)
+        dynamodb_config.shutdown()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark item size and reads of plain vs compressed job texts")
+    parser.add_argument("--endpoint-url", default=os.getenv("DYNAMODB_ENDPOINT_URL", "http://localhost:8000"))
+    parser.add_argument("--jobs", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--latency-ms", type=float, default=10, help="Simulated round trip per request (0 to disable)")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    configure_environment(args.endpoint_url)
+    asyncio.run(main_async(args))
+
+
+if __name__ == "__main__":
+    main()
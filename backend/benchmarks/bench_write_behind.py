@@ -0,0 +1,96 @@
+"""
+Write-Behind Last-Login Benchmark
+
+Simulates logins/token refreshes of a set of users and compares recording
+the last login inline (one UpdateItem inside each request, the previous
+behaviour) with the write-behind buffer. Reports the time each login spends
+on the write and the UpdateItem calls sent.
+
+Usage (from the backend directory, with a local DynamoDB running):
+    python -m benchmarks.bench_write_behind --endpoint-url http://localhost:8000 --users 50 --logins 1000
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import time
+from datetime import datetime
+
+from benchmarks.bench_dynamodb import add_simulated_latency, configure_environment
+
+
+async def main_async(args):
+    from app.utils.dynamodb_config import dynamodb_config
+    from app.utils.dynamodb_service import UserRepository
+    from app.utils.write_behind import drain_write_buffers
+
+    dynamodb_config.create_tables_if_not_exist()
+    repository = UserRepository()
+    user_ids = [f"login-user-{index}" for index in range(args.users)]
+    for user_id in user_ids:
+        await repository.create_user_metadata(user_id, f"{user_id}@example.com", user_id)
+
+    client = dynamodb_config.dynamodb_client
+    if args.latency_ms:
+        add_simulated_latency(client, args.latency_ms)
+    updates = []
+    client.meta.events.register("before-call.dynamodb.UpdateItem", lambda **kwargs: updates.append(1))
+
+    async def inline(user_id):
+        # What update_last_login used to do
+        now = datetime.utcnow().isoformat()
+        await repository.table.update_item(
+            Key={'user_id': user_id},
+            UpdateExpression='SET last_login = :timestamp, updated_at = :timestamp',
+            ExpressionAttributeValues={':timestamp': now}
+        )
+
+    rng = random.Random(args.seed)
+    logins = [rng.choice(user_ids) for _ in range(args.logins)]
+    semaphore = asyncio.Semaphore(args.concurrency)
+
+    async def replay(record):
+        latencies = []
+
+        async def login(user_id):
+            async with semaphore:
+                start = time.perf_counter()
+                await record(user_id)
+                latencies.append((time.perf_counter() - start) * 1000)
+
+        await asyncio.gather(*(login(user_id) for user_id in logins))
+        return sorted(latencies)
+
+    print(f"🔑 {args.logins} logins of {args.users} users, concurrency {args.concurrency}\n")
+    print(f"{'last login':<13} {'avg ms':>8} {'p95 ms':>8} {'UpdateItem':>11}")
+    try:
+        for label, record in (("inline", inline), ("write-behind", repository.update_last_login)):
+            updates.clear()
+            latencies = await replay(record)
+            await drain_write_buffers()
+            print(f"{label:<13} {sum(latencies) / len(latencies):>8.2f} "
+                  f"{latencies[int(len(latencies) * 0.95)]:>8.2f} {len(updates):>11}")
+    finally:
+        client.delete_table(TableName=dynamodb_config.jobs_table_name)
+        client.delete_table(TableName=dynamodb_config.users_table_name)
+        client.delete_table(TableName=dynamodb_config.archive_table_name)
+        dynamodb_config.shutdown()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark inline vs write-behind last-login updates")
+    parser.add_argument("--endpoint-url", default=os.getenv("DYNAMODB_ENDPOINT_URL", "http://localhost:8000"))
+    parser.add_argument("--users", type=int, default=50)
+    parser.add_argument("--logins", type=int, default=1000)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--latency-ms", type=float, default=10, help="Simulated round trip per request (0 to disable)")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    configure_environment(args.endpoint_url)
+    asyncio.run(main_async(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,670 @@
+"""
+Local Stand-ins for Benchmarks
+
+In-process replacements for the services the apps talk to, so a whole app
+can be booted and driven without a network, credentials or a running
+database:
+
+- `InMemoryMongoClient`: Motor-compatible client keeping collections in
+  dicts. Implements the subset Beanie uses (CRUD, find with
+  filter/projection/sort/skip/limit, find_one_and_update, indexes as hash
+  lookups and unique constraints) and the common query/update operators.
+  Not a MongoDB: no aggregation, transactions or TTL expiry.
+- `in_memory_dynamodb`: moto's `mock_aws`, with the environment pointed at
+  it (uniquely named tables, fake credentials)
+- `FakeGeminiModel`: `generate_content` with configurable latency and
+  failure rate, returning a CareerAnalysis-shaped JSON answer. It blocks
+  like the real client does.
+
+Every stand-in can add a per-call latency so results look like a network
+is in between.
+
+Usage:
+    with in_memory_dynamodb():
+        ...
+    with patch("app.utils.mongodb.AsyncIOMotorClient", InMemoryMongoClient):
+        ...
+"""
+
+import asyncio
+import contextlib
+import copy
+import json
+import os
+import random
+import threading
+import time
+import uuid
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from unittest import mock
+
+from bson import ObjectId
+from pymongo import ReturnDocument
+from pymongo.errors import DuplicateKeyError
+from pymongo.results import DeleteResult, InsertManyResult, InsertOneResult, UpdateResult
+
+try:
+    from moto import mock_aws
+    from moto.core.botocore_stubber import BotocoreStubber
+    MOTO_AVAILABLE = True
+except ImportError:
+    MOTO_AVAILABLE = False
+
+_MISSING = object()
+
+
+# ---------------------------------------------------------------------------
+# MongoDB
+# ---------------------------------------------------------------------------
+
+def _get_path(document: Dict[str, Any], path: str) -> Any:
+    value: Any = document
+    for part in path.split("."):
+        if isinstance(value, dict) and part in value:
+            value = value[part]
+        else:
+            return _MISSING
+    return value
+
+
+def _set_path(document: Dict[str, Any], path: str, value: Any) -> None:
+    *parents, last = path.split(".")
+    for part in parents:
+        document = document.setdefault(part, {})
+    document[last] = value
+
+
+def _unset_path(document: Dict[str, Any], path: str) -> None:
+    *parents, last = path.split(".")
+    for part in parents:
+        document = document.get(part)
+        if not isinstance(document, dict):
+            return
+    document.pop(last, None)
+
+
+def _equals(value: Any, expected: Any) -> bool:
+    if expected is None:
+        return value is _MISSING or value is None
+    if value is _MISSING:
+        return False
+    if isinstance(value, list) and not isinstance(expected, list):
+        return expected in value
+    return value == expected
+
+
+def _compare(value: Any, operator: str, expected: Any) -> bool:
+    if value is _MISSING or value is None:
+        return False
+    try:
+        if operator == "$gt":
+            return value > expected
+        if operator == "$gte":
+            return value >= expected
+        if operator == "$lt":
+            return value < expected
+        return value <= expected
+    except TypeError:
+        return False  # MongoDB only compares values of the same type
+
+
+def _matches_condition(value: Any, condition: Any) -> bool:
+    if not (isinstance(condition, dict) and condition and all(key.startswith("$") for key in condition)):
+        return _equals(value, condition)
+    for operator, expected in condition.items():
+        if operator == "$eq":
+            matched = _equals(value, expected)
+        elif operator == "$ne":
+            matched = not _equals(value, expected)
+        elif operator in ("$gt", "$gte", "$lt", "$lte"):
+            matched = _compare(value, operator, expected)
+        elif operator == "$in":
+            matched = any(_equals(value, option) for option in expected)
+        elif operator == "$nin":
+            matched = not any(_equals(value, option) for option in expected)
+        elif operator == "$exists":
+            matched = (value is not _MISSING) == bool(expected)
+        elif operator == "$not":
+            matched = not _matches_condition(value, expected)
+        else:
+            raise NotImplementedError(f"Query operator {operator} is not supported by the in-memory store")
+        if not matched:
+            return False
+    return True
+
+
+def matches(document: Dict[str, Any], query: Optional[Dict[str, Any]]) -> bool:
+    """Whether a document matches a MongoDB query filter"""
+    for key, condition in (query or {}).items():
+        if key == "$and":
+            matched = all(matches(document, part) for part in condition)
+        elif key == "$or":
+            matched = any(matches(document, part) for part in condition)
+        elif key == "$nor":
+            matched = not any(matches(document, part) for part in condition)
+        elif key.startswith("$"):
+            raise NotImplementedError(f"Query operator {key} is not supported by the in-memory store")
+        else:
+            matched = _matches_condition(_get_path(document, key), condition)
+        if not matched:
+            return False
+    return True
+
+
+def apply_update(document: Dict[str, Any], update: Dict[str, Any], inserting: bool = False) -> Dict[str, Any]:
+    """Apply an update document ($set, $unset, $inc, $push, $setOnInsert) or replacement in place"""
+    if not any(key.startswith("$") for key in update):
+        replacement = copy.deepcopy(dict(update))
+        replacement["_id"] = document["_id"]
+        document.clear()
+        document.update(replacement)
+        return document
+
+    for operator, fields in update.items():
+        if operator == "$setOnInsert" and not inserting:
+            continue
+        for path, value in fields.items():
+            if operator in ("$set", "$setOnInsert"):
+                _set_path(document, path, copy.deepcopy(value))
+            elif operator == "$unset":
+                _unset_path(document, path)
+            elif operator == "$inc":
+                current = _get_path(document, path)
+                _set_path(document, path, (0 if current is _MISSING else current) + value)
+            elif operator == "$push":
+                current = _get_path(document, path)
+                _set_path(document, path, ([] if current is _MISSING else current) + [copy.deepcopy(value)])
+            else:
+                raise NotImplementedError(f"Update operator {operator} is not supported by the in-memory store")
+    return document
+
+
+def _project(document: Dict[str, Any], projection: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    if not projection:
+        return document
+    included = [field for field, flag in projection.items() if flag and field != "_id"]
+    if included:
+        projected = {}
+        if projection.get("_id", 1) and "_id" in document:
+            projected["_id"] = document["_id"]
+        for path in included:
+            value = _get_path(document, path)
+            if value is not _MISSING:
+                _set_path(projected, path, value)
+        return projected
+    for path in projection:
+        _unset_path(document, path)
+    return document
+
+
+def _sort_key(value: Any) -> Tuple[int, Any]:
+    return (0, 0) if value is _MISSING or value is None else (1, value)
+
+
+def _sorted(documents: List[Dict[str, Any]], sort) -> List[Dict[str, Any]]:
+    if not sort:
+        return documents
+    if isinstance(sort, str):
+        sort = [(sort, 1)]
+    # Stable sorts from the least significant key up
+    for field, direction in reversed(list(sort)):
+        documents = sorted(documents, key=lambda document: _sort_key(_get_path(document, field)),
+                           reverse=direction in (-1, "desc", "descending"))
+    return documents
+
+
+class InMemoryCursor:
+    """Async cursor over a query's results (already materialized, one round trip on first fetch)"""
+
+    def __init__(self, documents: List[Dict[str, Any]], round_trip=None):
+        self._documents = documents
+        self._position = 0
+        self._round_trip = round_trip
+
+    async def _fetch(self) -> None:
+        if self._round_trip is not None:
+            round_trip, self._round_trip = self._round_trip, None
+            await round_trip()
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self) -> Dict[str, Any]:
+        await self._fetch()
+        if self._position >= len(self._documents):
+            raise StopAsyncIteration
+        self._position += 1
+        return self._documents[self._position - 1]
+
+    async def to_list(self, length: Optional[int] = None) -> List[Dict[str, Any]]:
+        await self._fetch()
+        end = len(self._documents) if length is None else min(len(self._documents), self._position + length)
+        documents = self._documents[self._position:end]
+        self._position = end
+        return documents
+
+    async def close(self) -> None:
+        self._position = len(self._documents)
+
+
+def _index_value(value: Any) -> Any:
+    """Hashable stand-in of a value for index lookups (missing fields index as null)"""
+    if value is _MISSING:
+        return None
+    try:
+        hash(value)
+        return value
+    except TypeError:
+        return repr(value)
+
+
+class InMemoryCollection:
+    """
+    One collection: documents by _id plus the indexes created on it
+
+    Declared indexes are maintained as hash maps, so equality queries on an
+    index's first field only look at the matching documents (like an index
+    scan) and unique indexes are checked without a collection scan. Queries
+    on unindexed fields scan every document, as MongoDB would.
+    """
+
+    def __init__(self, database: "InMemoryDatabase", name: str):
+        self.database = database
+        self.name = name
+        self._documents: Dict[Any, Dict[str, Any]] = {}
+        self._indexes: Dict[str, Dict[str, Any]] = {"_id_": {"key": [("_id", 1)], "v": 2}}
+        # First field of each index -> value -> _ids (documents with array values are kept apart)
+        self._lookups: Dict[str, Dict[Any, set]] = {}
+        self._array_valued: Dict[str, set] = {}
+        # Unique index name -> (fields, key -> _id)
+        self._unique: Dict[str, Tuple[List[str], Dict[tuple, Any]]] = {}
+
+    async def _round_trip(self) -> None:
+        if self.database.client.latency_ms:
+            await asyncio.sleep(self.database.client.latency_ms / 1000)
+
+    # Indexes
+
+    async def index_information(self, **kwargs) -> Dict[str, Dict[str, Any]]:
+        return copy.deepcopy(self._indexes)
+
+    async def create_indexes(self, indexes, **kwargs) -> List[str]:
+        names = []
+        for index in indexes:
+            document = dict(index.document)
+            name = document.pop("name")
+            document["key"] = list(document["key"].items())
+            self._indexes[name] = {**document, "v": 2}
+            self._build_index(name)
+            names.append(name)
+        return names
+
+    async def drop_index(self, name: str, **kwargs) -> None:
+        self._indexes.pop(name, None)
+        self._unique.pop(name, None)
+        first_fields = {index["key"][0][0] for index in self._indexes.values()}
+        for field in set(self._lookups) - first_fields:
+            del self._lookups[field]
+            del self._array_valued[field]
+
+    async def drop(self, **kwargs) -> None:
+        self._documents.clear()
+        for lookup in self._lookups.values():
+            lookup.clear()
+        for ids in self._array_valued.values():
+            ids.clear()
+        for _, keys in self._unique.values():
+            keys.clear()
+
+    def _build_index(self, name: str) -> None:
+        fields = [field for field, _ in self._indexes[name]["key"]]
+        if fields[0] != "_id" and fields[0] not in self._lookups:
+            self._lookups[fields[0]] = {}
+            self._array_valued[fields[0]] = set()
+            for document in self._documents.values():
+                self._index_field(fields[0], document, add=True)
+        if self._indexes[name].get("unique"):
+            keys = {}
+            for document in self._documents.values():
+                keys.setdefault(self._unique_key(document, fields), document["_id"])
+            self._unique[name] = (fields, keys)
+
+    @staticmethod
+    def _unique_key(document: Dict[str, Any], fields: List[str]) -> tuple:
+        return tuple(_index_value(_get_path(document, field)) for field in fields)
+
+    def _index_field(self, field: str, document: Dict[str, Any], add: bool) -> None:
+        value = _get_path(document, field)
+        if isinstance(value, list):
+            ids = self._array_valued[field]
+        else:
+            ids = self._lookups[field].setdefault(_index_value(value), set())
+        if add:
+            ids.add(document["_id"])
+        else:
+            ids.discard(document["_id"])
+
+    def _store(self, document: Dict[str, Any]) -> None:
+        """Insert or replace a document, keeping the indexes in step"""
+        for name, (fields, keys) in self._unique.items():
+            key = self._unique_key(document, fields)
+            if keys.get(key, document["_id"]) != document["_id"]:
+                raise DuplicateKeyError(
+                    f"E11000 duplicate key error collection: {self.name} index: {name} dup key: {key}", 11000
+                )
+        previous = self._documents.get(document["_id"])
+        if previous is not None:
+            self._unindex(previous)
+        self._documents[document["_id"]] = document
+        for field in self._lookups:
+            self._index_field(field, document, add=True)
+        for fields, keys in self._unique.values():
+            keys[self._unique_key(document, fields)] = document["_id"]
+
+    def _unindex(self, document: Dict[str, Any]) -> None:
+        for field in self._lookups:
+            self._index_field(field, document, add=False)
+        for fields, keys in self._unique.values():
+            key = self._unique_key(document, fields)
+            if keys.get(key) == document["_id"]:
+                del keys[key]
+
+    def _remove(self, document: Dict[str, Any]) -> None:
+        self._unindex(document)
+        del self._documents[document["_id"]]
+
+    def _candidates(self, query: Optional[Dict[str, Any]]) -> Optional[List[Any]]:
+        """_ids an index narrows the query down to (None: scan the collection)"""
+        for field, condition in (query or {}).items():
+            if field == "$and":  # Beanie's find(a, b)
+                for clause in condition:
+                    ids = self._candidates(clause)
+                    if ids is not None:
+                        return ids
+                continue
+            if isinstance(condition, dict) and set(condition) == {"$eq"}:
+                condition = condition["$eq"]
+            elif isinstance(condition, dict) and any(key.startswith("$") for key in condition):
+                continue
+            if field == "_id":
+                return [condition]
+            if field in self._lookups:
+                return [*self._lookups[field].get(_index_value(condition), ()), *self._array_valued[field]]
+        return None
+
+    def _matching(self, query: Optional[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        ids = self._candidates(query)
+        if ids is None:
+            documents = list(self._documents.values())
+        else:
+            documents = [self._documents[_id] for _id in ids if _id in self._documents]
+        return (document for document in documents if matches(document, query))
+
+    # Writes
+
+    async def insert_one(self, document: Dict[str, Any], **kwargs) -> InsertOneResult:
+        await self._round_trip()
+        document.setdefault("_id", ObjectId())
+        if document["_id"] in self._documents:
+            raise DuplicateKeyError(f"E11000 duplicate key error collection: {self.name} index: _id_", 11000)
+        self._store(copy.deepcopy(document))
+        return InsertOneResult(document["_id"], True)
+
+    async def insert_many(self, documents, ordered: bool = True, **kwargs) -> InsertManyResult:
+        await self._round_trip()
+        inserted_ids = []
+        for document in documents:
+            document.setdefault("_id", ObjectId())
+            if document["_id"] in self._documents:
+                raise DuplicateKeyError(f"E11000 duplicate key error collection: {self.name} index: _id_", 11000)
+            self._store(copy.deepcopy(document))
+            inserted_ids.append(document["_id"])
+        return InsertManyResult(inserted_ids, True)
+
+    def _upsert(self, query: Dict[str, Any], update: Dict[str, Any]) -> Dict[str, Any]:
+        document = {
+            key: copy.deepcopy(value) for key, value in query.items()
+            if not key.startswith("$") and not (isinstance(value, dict) and any(k.startswith("$") for k in value))
+        }
+        document.setdefault("_id", ObjectId())
+        apply_update(document, update, inserting=True)
+        self._store(document)
+        return document
+
+    def _update(self, document: Dict[str, Any], update: Dict[str, Any]) -> bool:
+        updated = apply_update(copy.deepcopy(document), update)
+        if updated == document:
+            return False
+        self._store(updated)
+        return True
+
+    async def update_one(self, filter, update, upsert: bool = False, **kwargs) -> UpdateResult:
+        await self._round_trip()
+        document = next(self._matching(filter), None)
+        if document is None:
+            if upsert:
+                inserted = self._upsert(filter, update)
+                return UpdateResult({"n": 1, "nModified": 0, "upserted": inserted["_id"]}, True)
+            return UpdateResult({"n": 0, "nModified": 0}, True)
+        return UpdateResult({"n": 1, "nModified": int(self._update(document, update))}, True)
+
+    async def update_many(self, filter, update, upsert: bool = False, **kwargs) -> UpdateResult:
+        await self._round_trip()
+        documents = list(self._matching(filter))
+        if not documents and upsert:
+            inserted = self._upsert(filter, update)
+            return UpdateResult({"n": 1, "nModified": 0, "upserted": inserted["_id"]}, True)
+        modified = sum(self._update(document, update) for document in documents)
+        return UpdateResult({"n": len(documents), "nModified": modified}, True)
+
+    async def replace_one(self, filter, replacement, upsert: bool = False, **kwargs) -> UpdateResult:
+        return await self.update_one(filter, {key: value for key, value in replacement.items() if key != "_id"},
+                                     upsert=upsert)
+
+    async def find_one_and_update(self, filter, update, projection=None, sort=None, upsert: bool = False,
+                                  return_document=ReturnDocument.BEFORE, **kwargs) -> Optional[Dict[str, Any]]:
+        await self._round_trip()
+        candidates = _sorted(list(self._matching(filter)), sort)
+        if not candidates:
+            if not upsert:
+                return None
+            inserted = self._upsert(filter, update)
+            return _project(copy.deepcopy(inserted), projection) if return_document else None
+        before = copy.deepcopy(candidates[0])
+        self._update(candidates[0], update)
+        result = self._documents[before["_id"]] if return_document else before
+        return _project(copy.deepcopy(result), projection)
+
+    async def delete_one(self, filter, **kwargs) -> DeleteResult:
+        await self._round_trip()
+        document = next(self._matching(filter), None)
+        if document is not None:
+            self._remove(document)
+        return DeleteResult({"n": int(document is not None)}, True)
+
+    async def delete_many(self, filter, **kwargs) -> DeleteResult:
+        await self._round_trip()
+        documents = list(self._matching(filter))
+        for document in documents:
+            self._remove(document)
+        return DeleteResult({"n": len(documents)}, True)
+
+    # Reads
+
+    def find(self, filter=None, projection=None, skip: int = 0, limit: int = 0, sort=None,
+             **kwargs) -> InMemoryCursor:
+        documents = _sorted(list(self._matching(filter)), sort)
+        documents = documents[skip or 0:]
+        if limit:
+            documents = documents[:limit]
+        return InMemoryCursor([_project(copy.deepcopy(document), projection) for document in documents],
+                              round_trip=self._round_trip)
+
+    async def find_one(self, filter=None, projection=None, **kwargs) -> Optional[Dict[str, Any]]:
+        await self._round_trip()
+        document = next(self._matching(filter), None)
+        return None if document is None else _project(copy.deepcopy(document), projection)
+
+    async def count_documents(self, filter, **kwargs) -> int:
+        await self._round_trip()
+        return sum(1 for _ in self._matching(filter))
+
+    async def estimated_document_count(self, **kwargs) -> int:
+        await self._round_trip()
+        return len(self._documents)
+
+
+class InMemoryDatabase:
+    def __init__(self, client: "InMemoryMongoClient", name: str):
+        self.client = client
+        self.name = name
+        self._collections: Dict[str, InMemoryCollection] = {}
+
+    def __getitem__(self, name: str) -> InMemoryCollection:
+        if name not in self._collections:
+            self._collections[name] = InMemoryCollection(self, name)
+        return self._collections[name]
+
+    def get_collection(self, name: str, **kwargs) -> InMemoryCollection:
+        return self[name]
+
+    async def create_collection(self, name: str, **kwargs) -> InMemoryCollection:
+        return self[name]
+
+    async def list_collection_names(self, **kwargs) -> List[str]:
+        return list(self._collections)
+
+    async def command(self, command, **kwargs) -> Dict[str, Any]:
+        if "buildInfo" in command:
+            return {"version": "7.0.0", "ok": 1.0}
+        return {"ok": 1.0}
+
+
+class InMemoryMongoClient:
+    """
+    Stand-in for `AsyncIOMotorClient` (the connection string is ignored)
+
+    Args:
+        latency_ms: Simulated round trip awaited by every operation
+    """
+
+    append_metadata = None  # Beanie only calls it on real PyMongo clients
+
+    def __init__(self, *args, latency_ms: float = 0, **kwargs):
+        self.latency_ms = latency_ms
+        self._databases: Dict[str, InMemoryDatabase] = {}
+
+    def __getitem__(self, name: str) -> InMemoryDatabase:
+        if name not in self._databases:
+            self._databases[name] = InMemoryDatabase(self, name)
+        return self._databases[name]
+
+    def get_database(self, name: str, **kwargs) -> InMemoryDatabase:
+        return self[name]
+
+    def close(self) -> None:
+        pass
+
+
+# ---------------------------------------------------------------------------
+# DynamoDB
+# ---------------------------------------------------------------------------
+
+@contextlib.contextmanager
+def in_memory_dynamodb(region: str = "us-east-1"):
+    """
+    Run the block against moto's in-memory DynamoDB
+
+    Sets the environment the app's DynamoDB config reads (import it inside
+    the block): AWS mode with fake credentials and uniquely named tables.
+
+    moto's backend is not thread-safe (concurrent transactions copy tables
+    other threads are writing), so requests are answered one at a time, like
+    a single-threaded emulator. Latency added with `register_first`
+    handlers is still spent concurrently.
+
+    Raises:
+        RuntimeError: moto is not installed
+    """
+    if not MOTO_AVAILABLE:
+        raise RuntimeError("moto is required for the in-memory DynamoDB: pip install 'moto[dynamodb]'")
+
+    suffix = uuid.uuid4().hex[:8]
+    os.environ["USE_LOCAL_DYNAMODB"] = "false"
+    os.environ.pop("DYNAMODB_ENDPOINT_URL", None)
+    os.environ["AWS_REGION"] = region
+    os.environ["AWS_DEFAULT_REGION"] = region
+    os.environ["AWS_ACCESS_KEY_ID"] = "testing"
+    os.environ["AWS_SECRET_ACCESS_KEY"] = "testing"
+    os.environ.pop("AWS_SESSION_TOKEN", None)
+    os.environ["DYNAMODB_JOBS_TABLE"] = f"bench-jobs-{suffix}"
+    os.environ["DYNAMODB_USERS_TABLE"] = f"bench-users-{suffix}"
+    os.environ["DYNAMODB_JOBS_ARCHIVE_TABLE"] = f"bench-archive-{suffix}"
+    os.environ["ENVIRONMENT"] = "development"  # lifespan creates the tables
+
+    lock = threading.Lock()
+    answer = BotocoreStubber.__call__
+
+    def answer_serialized(self, *args, **kwargs):
+        with lock:
+            return answer(self, *args, **kwargs)
+
+    with mock_aws(), mock.patch.object(BotocoreStubber, "__call__", answer_serialized):
+        yield
+
+
+# ---------------------------------------------------------------------------
+# Gemini
+# ---------------------------------------------------------------------------
+
+class FakeGeminiResponse:
+    def __init__(self, text: str):
+        self.text = text
+
+
+class FakeGeminiModel:
+    """
+    Stand-in for `genai.GenerativeModel`
+
+    `generate_content` sleeps for the configured latency (blocking, as the
+    real client does, so event-loop stalls show up in benchmarks) and then
+    either raises or answers with a CareerAnalysis-shaped JSON document.
+
+    Args:
+        latency_ms: Mean time per call
+        failure_rate: Share of calls (0-1) that raise
+        jitter: Latency varies uniformly by +/- this share of latency_ms
+        seed: Seed for failures and jitter
+    """
+
+    def __init__(self, latency_ms: float = 800, failure_rate: float = 0.0, jitter: float = 0.25, seed: int = 42):
+        self.latency_ms = latency_ms
+        self.failure_rate = failure_rate
+        self.jitter = jitter
+        self.calls = 0
+        self.failures = 0
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def generate_content(self, prompt, **kwargs) -> FakeGeminiResponse:
+        with self._lock:
+            self.calls += 1
+            delay = self.latency_ms * (1 + self._random.uniform(-self.jitter, self.jitter))
+            fail = self._random.random() < self.failure_rate
+            if fail:
+                self.failures += 1
+        time.sleep(max(delay, 0) / 1000)
+        if fail:
+            raise RuntimeError("503 The model is overloaded. Please try again later. (simulated)")
+        return FakeGeminiResponse(json.dumps({
+            "matched_keywords": ["Python", "AWS", "REST APIs"],
+            "missing_keywords": ["Kubernetes", "Terraform"],
+            "interview_questions": [
+                {"question": "Tell me about a service you scaled.",
+                 "sample_answer": "I moved our job processing to an async worker pool and cut p95 latency in half."},
+                {"question": "How do you approach on-call incidents?",
+                 "sample_answer": "Stabilize first, then find the root cause and write a blameless postmortem."},
+            ],
+            "match_score": 72.5,
+            "analysis_summary": f"Simulated analysis of a {len(str(prompt))} character prompt.",
+        }))
@@ -0,0 +1,593 @@
+"""
+Synthetic Job Dataset
+
+Generates users with realistic job histories and bulk-loads them into the
+job stores, for benchmarks at production scale (1M+ jobs):
+
+- Jobs per user are heavy-tailed (lognormal with mean --jobs-per-user,
+  capped at --max-jobs-per-user): most users track a few dozen
+  applications, a few track thousands
+- Each job is applied for at a random time after its user signed up and
+  moves through the hiring pipeline (Applied -> Phone Screen -> Technical
+  Interview -> Final Interview -> Offer) with per-stage odds of moving on,
+  rejection, withdrawal or no answer, and waiting times between steps. The
+  status is where the job got to by --now; updated_at is its last change
+- Companies follow a Zipf-like popularity; description (300-5000 chars,
+  median ~2200) and notes (a third empty, otherwise median ~120 chars)
+  lengths are lognormal
+- Each user's data comes from a generator seeded with (--seed, user index),
+  so a seed always gives the same dataset, whichever stores it is loaded
+  into and however it is batched
+
+Stores (--targets), loaded concurrently from the same generated batches:
+
+- sqlite: the `users`, `jobs` and `job_descriptions` tables of
+  app.utils.database, which simple_main reads as well (empty database file)
+- mongo: the Beanie documents (users, jobs, job_descriptions) on the
+  in-memory stand-in, or a server with --mongo-url
+- dynamodb: job, description and counters items plus user metadata, on
+  moto, or a local DynamoDB with --dynamodb-endpoint-url
+
+In-memory stand-ins are gone when the command exits, so loading into them
+only measures load throughput; benchmarks that boot an app preload its
+store with `load_dataset` and the sinks instead (bench_endpoints
+--dataset-users). Synthetic users share the password "synthetic-password";
+benchmarks mint tokens for them rather than logging in.
+
+Usage (from the backend directory):
+    python -m benchmarks.synthetic_dataset --users 20000 --jobs-per-user 50 --targets sqlite mongo dynamodb
+    python -m benchmarks.synthetic_dataset --users 1000 --targets sqlite --sqlite-path /tmp/jobs.db --seed 7
+"""
+
+import argparse
+import asyncio
+import contextlib
+import itertools
+import math
+import os
+import random
+import sqlite3
+import time
+import uuid
+from collections import Counter
+from datetime import datetime, timedelta
+from typing import Iterator, List, Optional, Tuple
+
+from bson import ObjectId
+
+from benchmarks.bench_endpoints import percentile
+from benchmarks.bench_text_compression import NOTE_PHRASES, OBJECTS, QUALIFIERS, VERBS
+
+# bcrypt hash of "synthetic-password"
+SYNTHETIC_PASSWORD_HASH = "$2b$12$Udu/lkHcUx4.Fw6TkBtlU.qUbYr5RlG3MCn.N225ihdmJUsJfZ8wC"
+
+# Fixed default, so a seed gives the same dataset on any day
+DEFAULT_NOW = datetime(2026, 1, 1)
+_EPOCH = datetime(1970, 1, 1)
+
+BATCH_USERS = 200
+
+# Per pipeline stage: (moves on, rejected, withdrawn, mean days until it happens);
+# the remaining share never hears back and stays in the stage
+PIPELINE = [
+    ("Applied", 0.25, 0.35, 0.03, 12),
+    ("Phone Screen", 0.50, 0.30, 0.05, 7),
+    ("Technical Interview", 0.45, 0.40, 0.05, 8),
+    ("Final Interview", 0.35, 0.55, 0.05, 10),
+]
+OFFER, REJECTED, WITHDRAWN = "Offer", "Rejected", "Withdrawn"
+INTERVIEW_STAGES = {"Technical Interview", "Final Interview"}
+
+POSITIONS = ["Software Engineer", "Senior Software Engineer", "Staff Engineer", "Backend Engineer",
+             "Frontend Engineer", "Full Stack Developer", "Data Engineer", "Data Scientist",
+             "Machine Learning Engineer", "DevOps Engineer", "Site Reliability Engineer", "Engineering Manager",
+             "Product Manager", "QA Engineer", "Mobile Developer", "Security Engineer"]
+LOCATIONS = ["Remote", "New York, NY", "San Francisco, CA", "Seattle, WA", "Austin, TX", "Boston, MA",
+             "Chicago, IL", "Denver, CO", "London, UK", "Berlin, Germany", "Toronto, Canada", "Hybrid"]
+JOB_TYPES = ["Full-time"] * 8 + ["Contract", "Part-time", "Internship", "Freelance"]
+
+_names = random.Random(0)
+_SYLLABLES = ["ac", "al", "bri", "cor", "da", "el", "fin", "gen", "hal", "io", "jun", "kal", "lum", "mer",
+              "nov", "or", "pix", "quan", "ra", "sil", "tra", "ul", "vex", "wa", "xen", "yo", "zen"]
+_SUFFIXES = ["Labs", "Systems", "Technologies", "AI", "Cloud", "Health", "Pay", "Analytics", "Robotics",
+             "Networks", "Software", "Bio", "Energy", "Security", "Media", "Logistics"]
+COMPANIES = list(dict.fromkeys(
+    f"{''.join(_names.choice(_SYLLABLES) for _ in range(_names.randint(2, 3))).title()} {_names.choice(_SUFFIXES)}"
+    for _ in range(3500)
+))
+# Zipf-like popularity: the k-th company gets applications in proportion to 1/k
+_COMPANY_WEIGHTS = list(itertools.accumulate(1 / (rank + 1) for rank in range(len(COMPANIES))))
+
+DESCRIPTION_SENTENCES = [f"{verb} {obj} {qualifier}." for verb in VERBS for obj in OBJECTS for qualifier in QUALIFIERS]
+NOTE_SENTENCES = [f"{phrase} {number}" for phrase in NOTE_PHRASES for number in range(1, 31)]
+
+
+class DatasetSpec:
+    """
+    What to generate
+
+    Args:
+        users: Number of users
+        jobs_per_user: Mean jobs per user (before the cap)
+        jobs_sigma: Spread of the lognormal job count (higher = heavier tail)
+        max_jobs_per_user: Cap on a single user's jobs
+        days: Users signed up within this many days before `now`
+        seed: Seed of every user's generator
+        now: Point in time the job histories end at
+    """
+
+    def __init__(self, users: int, jobs_per_user: float = 40, jobs_sigma: float = 1.1,
+                 max_jobs_per_user: int = 5000, days: int = 730, seed: int = 42, now: datetime = DEFAULT_NOW):
+        self.users = users
+        self.jobs_per_user = jobs_per_user
+        self.jobs_sigma = jobs_sigma
+        self.max_jobs_per_user = max_jobs_per_user
+        self.days = days
+        self.seed = seed
+        self.now = now
+
+
+class SyntheticUser:
+    """A user with their ID in each store"""
+    __slots__ = ("index", "username", "email", "created_at", "sql_id", "mongo_id", "cognito_sub")
+
+    def __init__(self, index: int, created_at: datetime, mongo_id: ObjectId, cognito_sub: str):
+        self.index = index
+        self.username = f"synthetic{index}"
+        self.email = f"synthetic{index}@example.com"
+        self.created_at = created_at
+        self.sql_id = index + 1
+        self.mongo_id = mongo_id
+        self.cognito_sub = cognito_sub
+
+
+class SyntheticJob:
+    """A job application with its status history ([(status, changed_at)], oldest first)"""
+    __slots__ = ("job_id", "mongo_id", "company", "position", "location", "job_type", "salary_range",
+                 "application_link", "job_description", "notes", "history", "interview_date", "follow_up_date")
+
+    def __init__(self, **fields):
+        for name in self.__slots__:
+            setattr(self, name, fields.get(name))
+
+    @property
+    def status(self) -> str:
+        return self.history[-1][0]
+
+    @property
+    def applied_at(self) -> datetime:
+        return self.history[0][1]
+
+    @property
+    def updated_at(self) -> datetime:
+        return self.history[-1][1]
+
+
+def _object_id(rng: random.Random, at: datetime) -> ObjectId:
+    """ObjectId with the creation time (like the driver makes) and seeded random bytes"""
+    seconds = int((at - _EPOCH).total_seconds())  # naive datetimes are UTC, whatever the machine's zone
+    return ObjectId(seconds.to_bytes(4, "big") + rng.getrandbits(64).to_bytes(8, "big"))
+
+
+def _text(rng: random.Random, sentences: List[str], length: int) -> str:
+    parts, size = [], 0
+    while size < length:
+        part = rng.choice(sentences)
+        parts.append(part)
+        size += len(part) + 1
+    return " ".join(parts)[:length]
+
+
+def _lognormal_length(rng: random.Random, median: float, sigma: float, low: int, high: int) -> int:
+    return min(high, max(low, int(rng.lognormvariate(math.log(median), sigma))))
+
+
+def _history(rng: random.Random, applied_at: datetime, now: datetime) -> List[Tuple[str, datetime]]:
+    """Walk a job through the pipeline until it ends or reaches `now`"""
+    history = [("Applied", applied_at)]
+    at = applied_at
+    for stage, (_, advance, reject, withdraw, mean_days) in enumerate(PIPELINE):
+        at = at + timedelta(days=rng.expovariate(1 / mean_days))
+        roll = rng.random()
+        if at > now or roll >= advance + reject + withdraw:
+            break  # still waiting
+        if roll < advance:
+            history.append((PIPELINE[stage + 1][0] if stage + 1 < len(PIPELINE) else OFFER, at))
+        else:
+            history.append((REJECTED if roll < advance + reject else WITHDRAWN, at))
+            break
+    return history
+
+
+def synthetic_user(spec: DatasetSpec, index: int, rng: Optional[random.Random] = None) -> SyntheticUser:
+    """The user at `index` (without generating their jobs)"""
+    rng = rng or random.Random(f"{spec.seed}:{index}")
+    created_at = spec.now - timedelta(seconds=rng.uniform(86400, spec.days * 86400))
+    return SyntheticUser(index, created_at, _object_id(rng, created_at),
+                         str(uuid.UUID(int=rng.getrandbits(128), version=4)))
+
+
+def generate_user(spec: DatasetSpec, index: int) -> Tuple[SyntheticUser, List[SyntheticJob]]:
+    """The user at `index` and their jobs, oldest first (same for the same spec)"""
+    from app.utils.ids import ulid_at
+
+    rng = random.Random(f"{spec.seed}:{index}")
+    user = synthetic_user(spec, index, rng)
+
+    sigma = spec.jobs_sigma
+    count = min(spec.max_jobs_per_user, int(rng.lognormvariate(math.log(spec.jobs_per_user) - sigma ** 2 / 2, sigma)))
+    window = (spec.now - user.created_at).total_seconds()
+    applied = sorted(user.created_at + timedelta(seconds=rng.uniform(0, window)) for _ in range(count))
+
+    jobs = []
+    for applied_at in applied:
+        history = _history(rng, applied_at, spec.now)
+        interviews = [at for status, at in history if status in INTERVIEW_STAGES]
+        company = rng.choices(COMPANIES, cum_weights=_COMPANY_WEIGHTS)[0]
+        low = rng.randrange(60, 220, 10)
+        jobs.append(SyntheticJob(
+            job_id=ulid_at(applied_at, rng.getrandbits(80)),
+            mongo_id=_object_id(rng, applied_at),
+            company=company,
+            position=rng.choice(POSITIONS),
+            location=rng.choice(LOCATIONS),
+            job_type=rng.choice(JOB_TYPES),
+            salary_range=f"${low}k-${low + rng.randrange(20, 80, 10)}k" if rng.random() < 0.6 else None,
+            application_link=f"https://jobs.example.com/{company.split()[0].lower()}/{rng.getrandbits(32):08x}",
+            job_description=(_text(rng, DESCRIPTION_SENTENCES, _lognormal_length(rng, 2200, 0.5, 300, 5000))
+                             if rng.random() < 0.9 else None),
+            notes=(_text(rng, NOTE_SENTENCES, _lognormal_length(rng, 120, 0.9, 10, 1000))
+                   if rng.random() >= 0.35 else None),
+            history=history,
+            interview_date=interviews[-1] + timedelta(days=2) if interviews else None,
+            follow_up_date=applied_at + timedelta(days=14) if history[-1][0] == "Applied" else None,
+        ))
+    return user, jobs
+
+
+Batch = List[Tuple[SyntheticUser, List[SyntheticJob]]]
+
+
+def iter_batches(spec: DatasetSpec, batch_users: int = BATCH_USERS) -> Iterator[Batch]:
+    """Generated users with their jobs, `batch_users` at a time"""
+    for first in range(0, spec.users, batch_users):
+        yield [generate_user(spec, index) for index in range(first, min(first + batch_users, spec.users))]
+
+
+class DatasetSummary:
+    """Shape of a generated dataset (job counts, statuses, text lengths)"""
+
+    def __init__(self):
+        self.users = 0
+        self.jobs = 0
+        self.jobs_per_user: List[int] = []
+        self.statuses: Counter = Counter()
+        self.description_chars = 0
+        self.descriptions = 0
+        self.notes_chars = 0
+        self.notes = 0
+
+    def add(self, batch: Batch) -> None:
+        for _, jobs in batch:
+            self.users += 1
+            self.jobs += len(jobs)
+            self.jobs_per_user.append(len(jobs))
+            for job in jobs:
+                self.statuses[job.status] += 1
+                if job.job_description is not None:
+                    self.descriptions += 1
+                    self.description_chars += len(job.job_description)
+                if job.notes is not None:
+                    self.notes += 1
+                    self.notes_chars += len(job.notes)
+
+    def print(self) -> None:
+        ordered = sorted(self.jobs_per_user)
+        print(f"👥 {self.users} users, {self.jobs} jobs")
+        print(f"   jobs per user: p50 {percentile(ordered, 50):.0f}, p90 {percentile(ordered, 90):.0f}, "
+              f"p99 {percentile(ordered, 99):.0f}, max {ordered[-1] if ordered else 0}")
+        print("   statuses: " + ", ".join(f"{status} {count / max(self.jobs, 1):.1%}"
+                                         for status, count in self.statuses.most_common()))
+        print(f"   descriptions: {self.descriptions} (avg {self.description_chars / max(self.descriptions, 1):.0f} chars), "
+              f"notes: {self.notes} (avg {self.notes_chars / max(self.notes, 1):.0f} chars)")
+
+
+class DatasetSink:
+    """Writes generated batches to one store"""
+    name = "sink"
+
+    def __init__(self):
+        self.users = 0
+        self.jobs = 0
+        self.seconds = 0.0
+
+    async def write(self, batch: Batch) -> None:
+        raise NotImplementedError
+
+    async def close(self) -> None:
+        pass
+
+
+class SQLiteSink(DatasetSink):
+    """
+    The SQL schema of app.utils.database in a SQLite file (simple_main reads
+    the same users/jobs tables). The database must not have users yet.
+    """
+    name = "sqlite"
+
+    def __init__(self, path: str):
+        super().__init__()
+        from sqlalchemy import create_engine
+
+        from app.utils.database import Base
+
+        engine = create_engine(f"sqlite:///{path}")
+        Base.metadata.create_all(bind=engine)
+        engine.dispose()
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        if self.connection.execute("SELECT COUNT(*) FROM users").fetchone()[0]:
+            self.connection.close()
+            raise ValueError(f"{path} already has users; load synthetic data into an empty database")
+        self._next_job_id = 1
+
+    @staticmethod
+    def _timestamp(value: Optional[datetime]) -> Optional[str]:
+        return value.strftime("%Y-%m-%d %H:%M:%S.%f") if value else None  # SQLAlchemy's SQLite DateTime format
+
+    def _write_sync(self, batch: Batch) -> None:
+        users, jobs, descriptions = [], [], []
+        for user, user_jobs in batch:
+            users.append((user.sql_id, user.username, user.email, SYNTHETIC_PASSWORD_HASH,
+                          self._timestamp(user.created_at)))
+            for job in user_jobs:
+                job_id, self._next_job_id = self._next_job_id, self._next_job_id + 1
+                jobs.append((job_id, user.sql_id, job.company, job.position, job.status,
+                             job.applied_at.strftime("%Y-%m-%d"), job.application_link, job.notes,
+                             self._timestamp(job.applied_at), self._timestamp(job.updated_at)))
+                if job.job_description is not None:
+                    descriptions.append((job_id, job.job_description))
+        with self.connection:
+            self.connection.executemany(
+                "INSERT INTO users (id, username, email, hashed_password, created_at) VALUES (?, ?, ?, ?, ?)", users
+            )
+            self.connection.executemany(
+                "INSERT INTO jobs (id, user_id, company, position, status, applied_date, application_link, notes, "
+                "created_at, updated_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", jobs
+            )
+            self.connection.executemany(
+                "INSERT INTO job_descriptions (job_id, job_description) VALUES (?, ?)", descriptions
+            )
+        self.users += len(users)
+        self.jobs += len(jobs)
+
+    async def write(self, batch: Batch) -> None:
+        await asyncio.to_thread(self._write_sync, batch)
+
+    async def close(self) -> None:
+        self.connection.close()
+
+
+class MongoSink(DatasetSink):
+    """
+    The collections of the MongoDB app's Beanie documents (Beanie must be
+    initialized). Documents are written as Beanie stores them, without
+    building models, which would take most of the load time.
+    """
+    name = "mongo"
+
+    async def write(self, batch: Batch) -> None:
+        from app.utils.models_mongo import Job, JobDescription, User
+        from app.utils.text_compression import stored_text
+
+        users, jobs, descriptions = [], [], []
+        for user, user_jobs in batch:
+            user_id = str(user.mongo_id)
+            users.append({
+                "_id": user.mongo_id, "username": user.username, "email": user.email,
+                "hashed_password": SYNTHETIC_PASSWORD_HASH, "created_at": user.created_at,
+                "updated_at": user.created_at, "is_active": True
+            })
+            for job in user_jobs:
+                jobs.append({
+                    "_id": job.mongo_id, "user_id": user_id, "company": job.company, "position": job.position,
+                    "status": job.status, "applied_date": job.applied_at, "application_link": job.application_link,
+                    "notes": stored_text(job.notes), "created_at": job.applied_at, "updated_at": job.updated_at,
+                    "salary_range": job.salary_range, "location": job.location, "job_type": job.job_type,
+                    "interview_date": job.interview_date, "follow_up_date": job.follow_up_date
+                })
+                if job.job_description is not None:
+                    descriptions.append({
+                        "_id": job.mongo_id, "user_id": user_id,
+                        "job_description": stored_text(job.job_description), "updated_at": job.updated_at
+                    })
+        for document, documents in ((User, users), (Job, jobs), (JobDescription, descriptions)):
+            if documents:
+                await document.get_pymongo_collection().insert_many(documents, ordered=False)
+        self.users += len(users)
+        self.jobs += len(jobs)
+
+
+class DynamoDBSink(DatasetSink):
+    """
+    Job, description and counters items in the jobs table and user metadata
+    in the users table (the tables of dynamodb_config unless passed in)
+    """
+    name = "dynamodb"
+
+    def __init__(self, jobs_table=None, users_table=None):
+        super().__init__()
+        from app.utils.dynamodb_config import dynamodb_config
+
+        self.jobs_table = jobs_table or dynamodb_config.async_jobs_table
+        self.users_table = users_table or dynamodb_config.async_users_table
+
+    async def write(self, batch: Batch) -> None:
+        from app.utils.models_dynamodb import COUNTERS_JOB_ID, JobItem, UserMetadata
+
+        job_items, user_items = [], []
+        for user, user_jobs in batch:
+            counts = Counter(job.status for job in user_jobs)
+            for job in user_jobs:
+                item = JobItem(
+                    user_id=user.cognito_sub, job_id=job.job_id, company=job.company, position=job.position,
+                    status=job.status, applied_date=job.applied_at.isoformat(),
+                    application_link=job.application_link, salary_range=job.salary_range, location=job.location,
+                    job_type=job.job_type, job_description=job.job_description, notes=job.notes,
+                    interview_date=job.interview_date.isoformat() if job.interview_date else None,
+                    follow_up_date=job.follow_up_date.isoformat() if job.follow_up_date else None,
+                    created_at=job.applied_at.isoformat(), updated_at=job.updated_at.isoformat()
+                ).set_index_keys()
+                job_items.append(item.to_item())
+                description = item.description_item()
+                if description is not None:
+                    job_items.append(description)
+            job_items.append({'user_id': user.cognito_sub, 'job_id': COUNTERS_JOB_ID, **counts,
+                              'total': len(user_jobs), 'version': 1, 'updated_at': datetime.utcnow().isoformat(),
+                              'reconciled_at': datetime.utcnow().isoformat()})
+            user_items.append(UserMetadata(
+                user_id=user.cognito_sub, email=user.email, username=user.username,
+                created_at=user.created_at.isoformat(), updated_at=user.created_at.isoformat(),
+                job_count=len(user_jobs), total_applications=len(user_jobs),
+                total_interviews=sum(job.interview_date is not None for job in user_jobs),
+                total_offers=counts[OFFER], total_rejections=counts[REJECTED]
+            ).dict())
+
+        unprocessed = await self.jobs_table.batch_write(put_items=job_items)
+        unprocessed += await self.users_table.batch_write(put_items=user_items)
+        if unprocessed:
+            raise RuntimeError(f"{len(unprocessed)} item(s) could not be written")
+        self.users += len(batch)
+        self.jobs += sum(len(jobs) for _, jobs in batch)
+
+
+async def load_dataset(spec: DatasetSpec, sinks: List[DatasetSink], batch_users: int = BATCH_USERS,
+                       queue_depth: int = 4) -> DatasetSummary:
+    """
+    Generate a dataset and write it to every sink concurrently
+
+    Batches are generated on a worker thread and handed to one queue per
+    sink, so a slow store holds generation back by at most `queue_depth`
+    batches instead of the whole dataset piling up in memory.
+
+    Args:
+        spec: What to generate
+        sinks: Stores to load
+        batch_users: Users per generated batch
+        queue_depth: Batches buffered per sink
+
+    Returns:
+        DatasetSummary: Shape of the generated data (sinks record their own
+            row counts and seconds)
+
+    Raises:
+        Exception: The first error of a sink (generation stops)
+    """
+    queues = [asyncio.Queue(queue_depth) for _ in sinks]
+    errors: List[BaseException] = []
+
+    async def consume(sink: DatasetSink, queue: asyncio.Queue) -> None:
+        start = time.perf_counter()
+        while (batch := await queue.get()) is not None:
+            if errors:
+                continue  # keep draining so the producer never blocks
+            try:
+                await sink.write(batch)
+            except Exception as e:
+                errors.append(e)
+        await sink.close()
+        sink.seconds = time.perf_counter() - start
+
+    consumers = [asyncio.create_task(consume(sink, queue)) for sink, queue in zip(sinks, queues)]
+    summary = DatasetSummary()
+    batches = iter_batches(spec, batch_users)
+    try:
+        while not errors and (batch := await asyncio.to_thread(next, batches, None)) is not None:
+            summary.add(batch)
+            for queue in queues:
+                await queue.put(batch)
+    finally:
+        for queue in queues:
+            await queue.put(None)
+        await asyncio.gather(*consumers)
+    if errors:
+        raise errors[0]
+    return summary
+
+
+async def main_async(args) -> None:
+    spec = DatasetSpec(args.users, args.jobs_per_user, args.jobs_sigma, args.max_jobs_per_user, args.days,
+                       args.seed, datetime.fromisoformat(args.now))
+    sinks: List[DatasetSink] = []
+    async with contextlib.AsyncExitStack() as stack:
+        if "dynamodb" in args.targets:
+            if args.dynamodb_endpoint_url:
+                os.environ["USE_LOCAL_DYNAMODB"] = "true"
+                os.environ["DYNAMODB_ENDPOINT_URL"] = args.dynamodb_endpoint_url
+                os.environ.setdefault("AWS_ACCESS_KEY_ID", "local")
+                os.environ.setdefault("AWS_SECRET_ACCESS_KEY", "local")
+            else:
+                from benchmarks.standins import in_memory_dynamodb
+                stack.enter_context(in_memory_dynamodb())
+            from app.utils.dynamodb_config import dynamodb_config
+
+            await dynamodb_config.warm_up(create_tables=True)
+            stack.callback(dynamodb_config.shutdown)
+            print(f"📊 DynamoDB tables: {dynamodb_config.jobs_table_name}, {dynamodb_config.users_table_name}")
+            sinks.append(DynamoDBSink())
+
+        if "mongo" in args.targets:
+            from beanie import init_beanie
+
+            from app.utils.models_mongo import IdempotencyRecord, Job, JobDescription, User
+
+            if args.mongo_url:
+                from motor.motor_asyncio import AsyncIOMotorClient
+                client = AsyncIOMotorClient(args.mongo_url)
+            else:
+                from benchmarks.standins import InMemoryMongoClient
+                client = InMemoryMongoClient()
+            stack.callback(client.close)
+            await init_beanie(database=client[args.mongo_database],
+                              document_models=[User, Job, JobDescription, IdempotencyRecord])
+            sinks.append(MongoSink())
+
+        if "sqlite" in args.targets:
+            sinks.append(SQLiteSink(args.sqlite_path))
+
+        print(f"🏭 Generating {spec.users} users (seed {spec.seed}) into {', '.join(args.targets) or 'nothing'}")
+        start = time.perf_counter()
+        summary = await load_dataset(spec, sinks, args.batch_users)
+        elapsed = time.perf_counter() - start
+
+    summary.print()
+    print(f"\n⏱️ {elapsed:.1f} s total, {summary.jobs / elapsed:,.0f} jobs/s\n")
+    if sinks:
+        print(f"{'target':<10} {'users':>9} {'jobs':>10} {'seconds':>8} {'jobs/s':>9}")
+        for sink in sinks:
+            print(f"{sink.name:<10} {sink.users:>9} {sink.jobs:>10} {sink.seconds:>8.1f} "
+                  f"{sink.jobs / sink.seconds if sink.seconds else 0:>9,.0f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate a synthetic job dataset and bulk-load it into the job stores")
+    parser.add_argument("--users", type=int, default=1000)
+    parser.add_argument("--jobs-per-user", type=float, default=40, help="Mean jobs per user")
+    parser.add_argument("--jobs-sigma", type=float, default=1.1, help="Spread of jobs per user (lognormal sigma)")
+    parser.add_argument("--max-jobs-per-user", type=int, default=5000)
+    parser.add_argument("--days", type=int, default=730, help="Users signed up within this many days")
+    parser.add_argument("--now", default=DEFAULT_NOW.isoformat(), help="End of the job histories (ISO date)")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--targets", nargs="*", choices=("sqlite", "mongo", "dynamodb"), default=["sqlite"],
+                        help="Stores to load (none: only generate)")
+    parser.add_argument("--sqlite-path", default="synthetic_jobs.db")
+    parser.add_argument("--mongo-url", help="MongoDB server (default: in-memory stand-in)")
+    parser.add_argument("--mongo-database", default="job_tracker_synthetic")
+    parser.add_argument("--dynamodb-endpoint-url", help="Local DynamoDB (default: in-memory moto)")
+    parser.add_argument("--batch-users", type=int, default=BATCH_USERS)
+    args = parser.parse_args()
+
+    asyncio.run(main_async(args))
+
+
+if __name__ == "__main__":
+    main()
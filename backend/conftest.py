@@ -0,0 +1,24 @@
+"""
+Shared pytest fixtures
+
+`dynamodb` runs the DynamoDB repositories against moto's in-memory DynamoDB
+(the stand-in the benchmarks use), so these tests need no credentials or
+local emulator. Import app.utils.dynamodb_* inside tests, after the fixture
+has set the environment the config reads.
+"""
+
+import pytest
+
+
+@pytest.fixture(scope="session")
+def dynamodb():
+    """The DynamoDB config, connected to moto with the tables created"""
+    from benchmarks.standins import in_memory_dynamodb
+
+    with in_memory_dynamodb():
+        from app.utils.dynamodb_config import dynamodb_config
+
+        dynamodb_config.connect()
+        dynamodb_config.create_tables_if_not_exist()
+        yield dynamodb_config
+        dynamodb_config.shutdown()
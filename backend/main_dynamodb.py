@@ -14,9 +14,13 @@ from datetime import datetime
 import os
 
 # Import the new route modules
-from app.routes import auth_cognito, jobs_dynamodb, ai_career
+from app.routes import auth_cognito, jobs_dynamodb, ai_career, metrics
 from app.utils.dynamodb_config import dynamodb_config
 from app.utils.cognito_service import cognito_config
+from app.utils.extraction_service import shutdown_extraction_workers
+from app.utils.write_behind import drain_write_buffers
+from app.utils.dynamodb_service import idempotency_repository
+from app.utils.idempotency import configure_idempotency_store
 
 
 @asynccontextmanager
@@ -27,11 +31,15 @@ async def lifespan(app: FastAPI):
     # Startup
     print("🚀 Starting CareerVault API with DynamoDB + Cognito...")
     
+    # Idempotency-Keys of shared routes (AI analysis) live in the jobs table
+    configure_idempotency_store(idempotency_repository)
+    
     try:
-        # Initialize DynamoDB tables (development only)
-        if os.getenv("ENVIRONMENT", "development") == "development":
+        # Connect, create tables (development only) and open pooled connections off the event loop
+        create_tables = os.getenv("ENVIRONMENT", "development") == "development"
+        if create_tables:
             print("📊 Creating DynamoDB tables if they don't exist...")
-            dynamodb_config.create_tables_if_not_exist()
+        await dynamodb_config.warm_up(create_tables=create_tables)
         
         # Test Cognito connectivity
         print("🔐 Testing Cognito connectivity...")
@@ -51,6 +59,9 @@ async def lifespan(app: FastAPI):
     
     # Shutdown
     print("🛑 Shutting down CareerVault API...")
+    shutdown_extraction_workers()
+    await drain_write_buffers()  # Deferred writes still need the DynamoDB connection
+    dynamodb_config.shutdown()
     print("✅ Shutdown complete")
 
 
@@ -78,12 +89,14 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["GET", "POST", "PUT", "DELETE", "PATCH", "OPTIONS"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Token"],  # Continuation token of paginated lists
 )
 
 # Include API routers with updated modules
 app.include_router(auth_cognito.router, prefix="/auth", tags=["Authentication"])
 app.include_router(jobs_dynamodb.router, prefix="/api/jobs", tags=["Jobs"])
 app.include_router(ai_career.router, prefix="/api/ai", tags=["AI Career Assistant"])
+app.include_router(metrics.router, prefix="/metrics", tags=["Metrics"])
 
 # Root endpoint
 @app.get("/", tags=["Health Check"])
@@ -227,7 +240,8 @@ def api_info():
             "jobs": "/api/jobs",
             "ai_assistant": "/api/ai",
             "documentation": "/docs",
-            "health_check": "/health"
+            "health_check": "/health",
+            **({"metrics": "/metrics"} if metrics.METRICS_ENABLED else {})
         },
         "environment": os.getenv("ENVIRONMENT", "development"),
         "aws_region": os.getenv("AWS_DEFAULT_REGION", "ap-south-1")
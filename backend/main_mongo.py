@@ -26,6 +26,10 @@ from app.utils.mongodb import connect_to_mongo, close_mongo_connection
 from app.routes.auth import router as auth_router
 from app.routes.jobs_mongo import router as jobs_router
 from app.routes.ai_career import router as ai_career_router
+from app.routes.metrics import router as metrics_router
+from app.utils.extraction_service import shutdown_extraction_workers
+from app.utils.idempotency import configure_idempotency_store
+from app.utils.mongodb_service import idempotency_store
 
 
 @asynccontextmanager
@@ -35,12 +39,14 @@ async def lifespan(app: FastAPI):
     """
     # Startup: Connect to MongoDB
     await connect_to_mongo()
+    configure_idempotency_store(idempotency_store)
     print("🚀 Job Tracker API (MongoDB) is starting up...")
     
     yield
     
     # Shutdown: Close MongoDB connection
     await close_mongo_connection()
+    shutdown_extraction_workers()
     print("🔚 Job Tracker API (MongoDB) is shutting down...")
 
 
@@ -98,6 +104,7 @@ async def health_check():
 app.include_router(auth_router, prefix="/auth", tags=["Authentication"])
 app.include_router(jobs_router, prefix="/api/jobs", tags=["Jobs"])
 app.include_router(ai_career_router, prefix="/api/ai", tags=["AI Career Assistant"])
+app.include_router(metrics_router, prefix="/metrics", tags=["Metrics"])
 
 
 # Global exception handler
@@ -17,8 +17,9 @@ import hashlib
 import secrets
 import os
 import google.generativeai as genai
-import PyPDF2
-import io
+from app.utils.extraction_service import ExtractionError, extract_document
+from app.utils.text_compaction import compact_resume_text
+from app.routes import metrics as metrics_routes
 
 # Configuration
 SECRET_KEY = "your-secret-key-change-in-production"
@@ -50,6 +51,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Metrics (extraction budgets, ...)
+app.include_router(metrics_routes.router, prefix="/metrics", tags=["Metrics"])
+
 # Security
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 security = HTTPBearer()
@@ -192,25 +196,15 @@ def create_user(username: str, email: str, hashed_password: str):
 
 # Helper function to extract text from uploaded files
 def extract_text_from_file(file_content: bytes, filename: str) -> str:
-    """Extract text from uploaded file based on file type"""
+    """Extract text from uploaded file based on its detected type (magic bytes)"""
     try:
-        if filename.lower().endswith('.pdf'):
-            # Handle PDF files
-            pdf_file = io.BytesIO(file_content)
-            pdf_reader = PyPDF2.PdfReader(pdf_file)
-            text = ""
-            for page in pdf_reader.pages:
-                text += page.extract_text() + "\n"
-            return text.strip()
-        else:
-            # Handle text files and other formats
-            try:
-                return file_content.decode('utf-8')
-            except UnicodeDecodeError:
-                return file_content.decode('utf-8', errors='ignore')
-    except Exception as e:
+        document = extract_document(file_content, filename)
+        if document.truncated:
+            print(f"Extraction of {filename} truncated by budget: {document.truncation_reasons}")
+        return document.text.strip()
+    except ExtractionError as e:
         print(f"Error extracting text from {filename}: {e}")
-        return f"Error reading file: {filename}. Please ensure it's a valid PDF or text file."
+        return f"Error reading file: {filename}. Please ensure it's a valid PDF, Word, image or text file."
 
 # Routes
 @app.get("/")
@@ -475,6 +469,10 @@ async def analyze_resume_file(
             raise HTTPException(status_code=400, detail="Could not extract text from uploaded file. Please ensure it's a valid PDF or text file.")
         
         print(f"Extracted text length: {len(file_text)} characters")  # Debug
+
+        # Drop repeated headers/footers, page numbers and extra whitespace before prompting
+        file_text = compact_resume_text(file_text).text
+        print(f"Compacted text length: {len(file_text)} characters")  # Debug
         
         # Create an enhanced prompt for better AI analysis
         prompt = f"""
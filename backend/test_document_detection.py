@@ -0,0 +1,48 @@
+"""
+Document Type Detection Test
+
+Checks that short magic numbers (BMP's "BM", TIFF's "II*"/"MM*", "%PDF-")
+only match real headers, so plain text that happens to start with or
+mention them is still treated as text.
+
+Run with pytest, or directly: python test_document_detection.py
+"""
+
+import struct
+
+from app.utils.extraction_service import IMAGE, PDF, TEXT, detect_document_type
+
+
+def bmp(dib_header_size: int = 40) -> bytes:
+    """A 1x1 24-bit BMP"""
+    dib_header = struct.pack("<IiiHHIIiiII", dib_header_size, 1, 1, 1, 24, 0, 4, 2835, 2835, 0, 0)
+    dib_header += b"\x00" * (dib_header_size - len(dib_header))
+    pixels = b"\xff\xff\xff\x00"
+    offset = 14 + len(dib_header)
+    return b"BM" + struct.pack("<IHHI", offset + len(pixels), 0, 0, offset) + dib_header + pixels
+
+
+def test_images_are_detected():
+    assert detect_document_type(bmp()) == IMAGE
+    assert detect_document_type(bmp(124)) == IMAGE
+    assert detect_document_type(b"II*\x00" + struct.pack("<I", 8) + b"\x00" * 16) == IMAGE
+    assert detect_document_type(b"MM\x00*" + struct.pack(">I", 8) + b"\x00" * 16) == IMAGE
+
+
+def test_text_starting_like_an_image_is_text():
+    assert detect_document_type(b"BMW Group, Munich - Software Engineer 2019-2023") == TEXT
+    assert detect_document_type(b"BM" + b"x" * 100) == TEXT
+    assert detect_document_type(b"II*\x00" + struct.pack("<I", 4096) + b"\x00" * 16) is None
+
+
+def test_pdf_header_only_at_the_start():
+    assert detect_document_type(b"%PDF-1.7\n%\xe2\xe3\xcf\xd3\n") == PDF
+    assert detect_document_type(b"\xef\xbb\xbf\r\n  %PDF-1.4\n") == PDF
+    assert detect_document_type(b"Skills: can debug %PDF-1.7 headers by hand") == TEXT
+
+
+if __name__ == "__main__":
+    test_images_are_detected()
+    test_text_starting_like_an_image_is_text()
+    test_pdf_header_only_at_the_start()
+    print("🎉 Document detection tests passed!")
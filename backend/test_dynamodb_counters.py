@@ -0,0 +1,56 @@
+"""
+DynamoDB Job Counters Test
+
+Checks that per-user status counters are rebuilt from the jobs when they
+were never counted (users whose jobs predate the counters) and that jobs
+with a status outside JobStatus don't break the count.
+
+Runs against moto (see conftest.py): python -m pytest test_dynamodb_counters.py
+"""
+
+import asyncio
+import uuid
+
+
+def legacy_job(user_id: str, status: str = "Applied") -> dict:
+    """A job item written before the counters existed (no counters update)"""
+    from app.utils.models_dynamodb import JobItem
+
+    item = JobItem(user_id=user_id, company="Legacy Corp", position="Engineer").set_index_keys().to_item()
+    return {**item, "status": status}
+
+
+def test_stats_count_legacy_jobs_after_first_write(dynamodb):
+    from app.utils.dynamodb_service import JobRepository
+    from app.utils.models_dynamodb import JobCreateRequest
+
+    async def run():
+        repository = JobRepository()
+        user_id = f"user-{uuid.uuid4().hex[:8]}"
+        await repository.table.batch_write(put_items=[legacy_job(user_id) for _ in range(3)])
+
+        # The first write after deploy creates the counters item with only itself counted
+        await repository.create_job(user_id, JobCreateRequest(company="New Corp", position="Engineer"))
+        return await repository.get_user_job_stats(user_id)
+
+    stats = asyncio.run(run())
+    assert stats["total"] == 4
+    assert stats["Applied"] == 4
+
+
+def test_unknown_statuses_count_in_total_only(dynamodb):
+    from app.utils.dynamodb_service import JobRepository
+
+    async def run():
+        repository = JobRepository()
+        user_id = f"user-{uuid.uuid4().hex[:8]}"
+        await repository.table.batch_write(
+            put_items=[legacy_job(user_id), legacy_job(user_id, "Ghosted"), legacy_job(user_id, "Rejected")]
+        )
+        return await repository.reconcile_user_counters(user_id)
+
+    stats = asyncio.run(run())
+    assert stats["total"] == 3
+    assert stats["Applied"] == 1
+    assert stats["Rejected"] == 1
+    assert "Ghosted" not in stats
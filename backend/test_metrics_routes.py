@@ -0,0 +1,44 @@
+"""
+Metrics Routes Test
+
+Checks that /metrics is hidden unless METRICS_ENABLED is on, and that a
+configured METRICS_TOKEN is required as a bearer token.
+
+Run with: python -m pytest test_metrics_routes.py
+"""
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.routes import metrics as metrics_routes
+
+
+@pytest.fixture
+def client():
+    app = FastAPI()
+    app.include_router(metrics_routes.router, prefix="/metrics")
+    return TestClient(app)
+
+
+def test_metrics_are_off_by_default(client, monkeypatch):
+    monkeypatch.setattr(metrics_routes, "METRICS_ENABLED", False)
+    assert client.get("/metrics/").status_code == 404
+    assert client.get("/metrics/dynamodb").status_code == 404
+
+
+def test_metrics_require_the_token_when_set(client, monkeypatch):
+    monkeypatch.setattr(metrics_routes, "METRICS_ENABLED", True)
+    monkeypatch.setattr(metrics_routes, "METRICS_TOKEN", "s3cret")
+
+    assert client.get("/metrics/").status_code == 401
+    assert client.get("/metrics/", headers={"Authorization": "Bearer wrong"}).status_code == 401
+    response = client.get("/metrics/dynamodb", headers={"Authorization": "Bearer s3cret"})
+    assert response.status_code == 200
+    assert isinstance(response.json(), dict)
+
+
+def test_metrics_are_open_when_enabled_without_token(client, monkeypatch):
+    monkeypatch.setattr(metrics_routes, "METRICS_ENABLED", True)
+    monkeypatch.setattr(metrics_routes, "METRICS_TOKEN", "")
+    assert client.get("/metrics/").status_code == 200
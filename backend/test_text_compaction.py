@@ -0,0 +1,33 @@
+"""
+Text Compaction Test
+
+Checks that words hyphenated across a line break are joined back together
+while compounds broken at their own hyphen keep it.
+
+Run with pytest, or directly: python test_text_compaction.py
+"""
+
+from app.utils.text_compaction import compact_resume_text
+
+
+def compacted(text: str) -> str:
+    return compact_resume_text(text, mark_sections=False).text
+
+
+def test_hyphenated_words_are_joined():
+    assert compacted("Led the develop-\nment of REST APIs") == "Led the development of REST APIs"
+    assert compacted("Manage-\nment of a team of five") == "Management of a team of five"
+
+
+def test_compounds_keep_their_hyphen():
+    assert compacted("Self-\nmotivated engineer") == "Self-motivated engineer"
+    assert compacted("Worked as a full-\nstack developer") == "Worked as a full-stack developer"
+    assert compacted("Highly detail-\noriented") == "Highly detail-oriented"
+    assert compacted("Built state-of-\nthe-art tooling") == "Built state-of-the-art tooling"
+    assert compacted("Provided 24-\nhour on-call support") == "Provided 24-hour on-call support"
+
+
+if __name__ == "__main__":
+    test_hyphenated_words_are_joined()
+    test_compounds_keep_their_hyphen()
+    print("🎉 Text compaction tests passed!")
@@ -0,0 +1,76 @@
+"""
+Write-Behind Buffer Test
+
+Checks that a failed flush keeps its updates for the next one, and that a
+key failing on every flush is dropped after WRITE_BEHIND_MAX_ATTEMPTS
+instead of being retried forever.
+
+Run with pytest, or directly: python test_write_behind.py
+"""
+
+import asyncio
+
+from app.utils.write_behind import PartialFlushError, WriteBehindBuffer
+
+
+class FlakyStore:
+    """Flush function that always fails for `broken` keys"""
+
+    def __init__(self, broken=()):
+        self.broken = set(broken)
+        self.written = {}
+        self.calls = 0
+
+    async def __call__(self, updates):
+        self.calls += 1
+        failed = {key: values for key, values in updates.items() if key in self.broken}
+        self.written.update({key: values for key, values in updates.items() if key not in failed})
+        if failed:
+            raise PartialFlushError(failed)
+
+
+def test_failed_keys_are_retried_then_dropped():
+    store = FlakyStore(broken={"deleted-user"})
+    buffer = WriteBehindBuffer("test", store, window_seconds=3600, max_attempts=3)
+
+    async def run():
+        buffer.put("user-1", {"last_login": "a"})
+        buffer.put("deleted-user", {"last_login": "a"})
+        await buffer.flush()
+        assert buffer.pending == 1
+
+        await buffer.flush()
+        assert buffer.pending == 1
+        await buffer.flush()
+        assert buffer.pending == 0
+        await buffer.drain()
+
+    asyncio.run(run())
+    assert store.written == {"user-1": {"last_login": "a"}}
+    assert store.calls == 3
+
+
+def test_recovered_keys_start_counting_again():
+    store = FlakyStore(broken={"user-1"})
+    buffer = WriteBehindBuffer("test", store, window_seconds=3600, max_attempts=2)
+
+    async def run():
+        buffer.put("user-1", {"last_login": "a"})
+        await buffer.flush()
+        store.broken.clear()
+        await buffer.flush()
+
+        store.broken.add("user-1")
+        buffer.put("user-1", {"last_login": "b"})
+        await buffer.flush()
+        assert buffer.pending == 1
+        await buffer.drain()
+
+    asyncio.run(run())
+    assert store.written == {"user-1": {"last_login": "a"}}
+
+
+if __name__ == "__main__":
+    test_failed_keys_are_retried_then_dropped()
+    test_recovered_keys_start_counting_again()
+    print("🎉 Write-behind tests passed!")